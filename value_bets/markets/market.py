@@ -35,7 +35,12 @@ class Market(ABC):
     MIN_BET_SIZE = 1.0  # Minimum bet in USDC
     MAX_BET_FRACTION = 0.10  # Never bet more than 10% of bankroll
     
-    def __init__(self, sport: str = "basketball", verbose: bool = False) -> None:
+    def __init__(
+        self,
+        sport: str = "basketball",
+        verbose: bool = False,
+        trade_executor: Optional[TradeExecutorService] = None,
+    ) -> None:
         self.verbose = verbose
         if self.verbose:
             print(f"\n[MARKET INIT] Initializing {self.__class__.__name__} market handler for sport: {sport}")
@@ -48,7 +53,8 @@ class Market(ABC):
         self.polymarket = PolymarketOdds()
         if self.verbose:
             print(f"  -> Creating trade executor service...")
-        self.trade_executor = TradeExecutorService()
+        # Share the caller's executor so every market sizes against one bankroll ledger
+        self.trade_executor = trade_executor if trade_executor is not None else TradeExecutorService(sport=sport)
         if self.verbose:
             print(f"  -> {self.__class__.__name__} initialization complete")
 
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Persistent Polymarket event_slug -> Pinnacle matchup_id store.
+
+The Pinnacle matchup behind a Polymarket event never changes, so once a match is
+found it is written to SQLite and every later lookup (including after a restart)
+is a dict hit instead of a fuzzy search. All rows are loaded into memory when the
+store is opened; writes go straight through to disk (async callers run `put` and
+`delete` in a worker thread). A stored match the caller finds stale (matchup no
+longer listed, teams no longer matching) is dropped with `delete`.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class EventMatch:
+    event_slug: str
+    matchup_id: int
+    # True when the Polymarket away team is the Pinnacle home team
+    swapped: bool
+    confidence: float
+
+    def oriented(self, pinnacle_away: str, pinnacle_home: str) -> Tuple[str, str]:
+        """Pinnacle's (away, home) teams lined up with the Polymarket (away, home) teams."""
+        if self.swapped:
+            return pinnacle_home, pinnacle_away
+        return pinnacle_away, pinnacle_home
+
+
+class MatchStore:
+    """
+    Typical usage:
+      store = MatchStore(path)
+      match = store.get(event_slug)
+      if match is None:
+          ...  # fuzzy match, then
+          store.put(event_slug, matchup_id, swapped=False, confidence=1.0)
+      ...
+      store.delete(event_slug)  # the stored matchup turned out to be stale
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        # Shared between the event loop and worker threads; access is serialized by _lock
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS event_matches (
+                event_slug TEXT PRIMARY KEY,
+                matchup_id INTEGER NOT NULL,
+                swapped INTEGER NOT NULL,
+                confidence REAL NOT NULL,
+                updated_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.commit()
+        self._matches: Dict[str, EventMatch] = {}
+        for event_slug, matchup_id, swapped, confidence in self._conn.execute(
+            "SELECT event_slug, matchup_id, swapped, confidence FROM event_matches"
+        ):
+            self._matches[event_slug] = EventMatch(
+                event_slug=event_slug,
+                matchup_id=int(matchup_id),
+                swapped=bool(swapped),
+                confidence=float(confidence),
+            )
+
+    def __len__(self) -> int:
+        return len(self._matches)
+
+    def get(self, event_slug: str) -> Optional[EventMatch]:
+        return self._matches.get(event_slug)
+
+    def put(self, event_slug: str, matchup_id: int, *, swapped: bool, confidence: float) -> EventMatch:
+        match = EventMatch(
+            event_slug=event_slug,
+            matchup_id=int(matchup_id),
+            swapped=bool(swapped),
+            confidence=float(confidence),
+        )
+        if self._matches.get(event_slug) == match:
+            return match
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO event_matches (event_slug, matchup_id, swapped, confidence, updated_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (match.event_slug, match.matchup_id, int(match.swapped), match.confidence, time.time()),
+            )
+            self._conn.commit()
+            self._matches[event_slug] = match
+        return match
+
+    def delete(self, event_slug: str) -> bool:
+        """Forget a stored match; True if there was one."""
+        if event_slug not in self._matches:
+            return False
+        with self._lock:
+            self._conn.execute("DELETE FROM event_matches WHERE event_slug = ?", (event_slug,))
+            self._conn.commit()
+            return self._matches.pop(event_slug, None) is not None
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -21,14 +21,16 @@ import json
 import random
 import re
 import sys
+import threading
 import time
 from dataclasses import dataclass
-from datetime import datetime, timezone, timedelta
+from datetime import date, datetime, timezone, timedelta
 from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 from urllib.parse import urljoin, urlparse
 
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
 from playwright.sync_api import Browser, BrowserContext, Page, Playwright, sync_playwright
 
 
@@ -52,6 +54,24 @@ DEFAULT_SOCCER_MATCHUPS_URL = "https://www.pinnacle.com/en/soccer/matchups/"
 ARCADIA_SOCCER_MATCHUPS_URL = (
     "https://guest.api.arcadia.pinnacle.com/0.1/sports/29/matchups?withSpecials=false&brandId=0"
 )
+ARCADIA_API_BASE = "https://guest.api.arcadia.pinnacle.com/0.1"
+
+try:
+    import brotli  # noqa: F401  # lets requests/aiohttp decode "br" responses
+    _ARCADIA_ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    _ARCADIA_ACCEPT_ENCODING = "gzip, deflate"
+
+ARCADIA_REQUEST_HEADERS = {
+    "Accept": "application/json,text/plain,*/*",
+    "Accept-Encoding": _ARCADIA_ACCEPT_ENCODING,
+    "Referer": "https://www.pinnacle.com/",
+    "User-Agent": (
+        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/121.0.0.0 Safari/537.36"
+    ),
+}
 
 
 def _now_ms() -> int:
@@ -241,20 +261,15 @@ def _league_name_from_matchup_item(m: Dict[str, Any]) -> str:
     return _norm(str(league or ""))
 
 
-def _list_basketball_matchups_for_local_date(
-    *,
-    local_date,
-    timeout_s: float = 20.0,
-) -> List[Dict[str, Any]]:
+def _bucket_matchups_by_local_date(payload: Any) -> Dict[date, List[Dict[str, Any]]]:
     """
-    Fetch the Arcadia basketball matchups feed and filter to matchups whose startTime
-    falls on the given local_date (system local timezone).
+    Group an Arcadia matchups feed payload by the local date (system local timezone)
+    of each matchup's startTime. Matchups without a parseable startTime are dropped.
     """
-    payload = _arcadia_get_json_requests(ARCADIA_BASKETBALL_MATCHUPS_URL, timeout_s=timeout_s)
     if not isinstance(payload, list):
-        return []
+        return {}
 
-    out: List[Dict[str, Any]] = []
+    out: Dict[date, List[Dict[str, Any]]] = {}
     for m in payload:
         if not isinstance(m, dict):
             continue
@@ -265,12 +280,31 @@ def _list_basketball_matchups_for_local_date(
             st_local = st.astimezone()  # system local tz
         except Exception:
             st_local = st
-        if st_local.date() != local_date:
-            continue
-        out.append(m)
+        out.setdefault(st_local.date(), []).append(m)
     return out
 
 
+def _filter_matchups_for_local_date(payload: Any, local_date) -> List[Dict[str, Any]]:
+    """
+    Filter an Arcadia matchups feed payload to matchups whose startTime falls on
+    the given local_date (system local timezone).
+    """
+    return _bucket_matchups_by_local_date(payload).get(local_date, [])
+
+
+def _list_basketball_matchups_for_local_date(
+    *,
+    local_date,
+    timeout_s: float = 20.0,
+) -> List[Dict[str, Any]]:
+    """
+    Fetch the Arcadia basketball matchups feed and filter to matchups whose startTime
+    falls on the given local_date (system local timezone).
+    """
+    payload = _arcadia_get_json_requests(ARCADIA_BASKETBALL_MATCHUPS_URL, timeout_s=timeout_s)
+    return _filter_matchups_for_local_date(payload, local_date)
+
+
 def _list_hockey_matchups_for_local_date(
     *,
     local_date,
@@ -281,24 +315,7 @@ def _list_hockey_matchups_for_local_date(
     falls on the given local_date (system local timezone).
     """
     payload = _arcadia_get_json_requests(ARCADIA_HOCKEY_MATCHUPS_URL, timeout_s=timeout_s)
-    if not isinstance(payload, list):
-        return []
-
-    out: List[Dict[str, Any]] = []
-    for m in payload:
-        if not isinstance(m, dict):
-            continue
-        st = _parse_iso_dt(m.get("startTime"))
-        if st is None:
-            continue
-        try:
-            st_local = st.astimezone()  # system local tz
-        except Exception:
-            st_local = st
-        if st_local.date() != local_date:
-            continue
-        out.append(m)
-    return out
+    return _filter_matchups_for_local_date(payload, local_date)
 
 
 def _list_mma_matchups_for_local_date(
@@ -311,24 +328,7 @@ def _list_mma_matchups_for_local_date(
     falls on the given local_date (system local timezone).
     """
     payload = _arcadia_get_json_requests(ARCADIA_MMA_MATCHUPS_URL, timeout_s=timeout_s)
-    if not isinstance(payload, list):
-        return []
-
-    out: List[Dict[str, Any]] = []
-    for m in payload:
-        if not isinstance(m, dict):
-            continue
-        st = _parse_iso_dt(m.get("startTime"))
-        if st is None:
-            continue
-        try:
-            st_local = st.astimezone()  # system local tz
-        except Exception:
-            st_local = st
-        if st_local.date() != local_date:
-            continue
-        out.append(m)
-    return out
+    return _filter_matchups_for_local_date(payload, local_date)
 
 
 def _list_tennis_matchups_for_local_date(
@@ -341,24 +341,7 @@ def _list_tennis_matchups_for_local_date(
     falls on the given local_date (system local timezone).
     """
     payload = _arcadia_get_json_requests(ARCADIA_TENNIS_MATCHUPS_URL, timeout_s=timeout_s)
-    if not isinstance(payload, list):
-        return []
-
-    out: List[Dict[str, Any]] = []
-    for m in payload:
-        if not isinstance(m, dict):
-            continue
-        st = _parse_iso_dt(m.get("startTime"))
-        if st is None:
-            continue
-        try:
-            st_local = st.astimezone()  # system local tz
-        except Exception:
-            st_local = st
-        if st_local.date() != local_date:
-            continue
-        out.append(m)
-    return out
+    return _filter_matchups_for_local_date(payload, local_date)
 
 
 def _list_soccer_matchups_for_local_date(
@@ -371,24 +354,7 @@ def _list_soccer_matchups_for_local_date(
     falls on the given local_date (system local timezone).
     """
     payload = _arcadia_get_json_requests(ARCADIA_SOCCER_MATCHUPS_URL, timeout_s=timeout_s)
-    if not isinstance(payload, list):
-        return []
-
-    out: List[Dict[str, Any]] = []
-    for m in payload:
-        if not isinstance(m, dict):
-            continue
-        st = _parse_iso_dt(m.get("startTime"))
-        if st is None:
-            continue
-        try:
-            st_local = st.astimezone()  # system local tz
-        except Exception:
-            st_local = st
-        if st_local.date() != local_date:
-            continue
-        out.append(m)
-    return out
+    return _filter_matchups_for_local_date(payload, local_date)
 
 
 def _looks_like_matchups_page(url: str) -> bool:
@@ -557,24 +523,39 @@ def _extract_game_links_from_matchups_page(
     return out
 
 
+# Max pooled keep-alive connections to the Arcadia host; callers beyond this wait for a free one.
+ARCADIA_POOL_MAXSIZE = 6
+
+_arcadia_session: Optional[requests.Session] = None
+_arcadia_session_lock = threading.Lock()
+
+
+def _get_arcadia_session() -> requests.Session:
+    """
+    Shared keep-alive session for Arcadia, so repeated calls reuse pooled TCP/TLS
+    connections instead of handshaking on every request.
+    """
+    global _arcadia_session
+    if _arcadia_session is None:
+        with _arcadia_session_lock:
+            if _arcadia_session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=ARCADIA_POOL_MAXSIZE, pool_block=True)
+                session.mount("https://", adapter)
+                session.headers.update(ARCADIA_REQUEST_HEADERS)
+                _arcadia_session = session
+    return _arcadia_session
+
+
 def _arcadia_get_json_requests(url: str, *, timeout_s: float = 20.0) -> Optional[Any]:
     """
     Fetch JSON from Arcadia guest endpoints with retries/backoff.
     This avoids any UI/browser navigation entirely.
     """
-    headers = {
-        "Accept": "application/json,text/plain,*/*",
-        "Referer": "https://www.pinnacle.com/",
-        "User-Agent": (
-            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/121.0.0.0 Safari/537.36"
-        ),
-    }
-
+    session = _get_arcadia_session()
     for attempt in range(1, 7):
         try:
-            r = requests.get(url, headers=headers, timeout=timeout_s)
+            r = session.get(url, timeout=timeout_s)
             if r.status_code == 200:
                 try:
                     return r.json()
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Team-name index for matching Polymarket events to Pinnacle games.
+
+Matching used to run a fuzzy comparison between the Polymarket teams and every
+Pinnacle game of the day. `TeamNameIndex` is built once per matchups feed: each
+game is filed under its normalized names, name tokens, nickname (last word) and
+first keyword, plus the alias-expanded forms of those. A lookup then only runs the
+fuzzy pair check on the few games that share a key with the Polymarket teams.
+
+Games that share no token (or alias) with either Polymarket team are never
+compared; the fuzzy rules only accepted those through raw character-substring
+hits such as "la" in "atlanta".
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Callable, Dict, Generic, List, Optional, Sequence, Set, Tuple, TypeVar
+
+
+G = TypeVar("G")
+
+# (team_a, team_b, game_away, game_home) -> True if the two games are the same
+PairMatcher = Callable[[str, str, str, str], bool]
+
+# Abbreviations Polymarket titles use where Pinnacle spells the name out
+TEAM_ALIASES: Dict[str, str] = {
+    "la": "los angeles",
+    "ny": "new york",
+    "nj": "new jersey",
+    "okc": "oklahoma city",
+    "utd": "united",
+}
+
+
+def normalize_team(name: str) -> str:
+    """Lowercase and collapse whitespace."""
+    return " ".join((name or "").strip().lower().split())
+
+
+def expand_aliases(normalized: str) -> str:
+    """Replace alias tokens in an already normalized name with their long form."""
+    return " ".join(TEAM_ALIASES.get(word, word) for word in normalized.split())
+
+
+def fuzzy_team_match(t1: str, t2: str) -> bool:
+    """Fuzzy team name matching."""
+    n1 = normalize_team(t1)
+    n2 = normalize_team(t2)
+    if n1 == n2:
+        return True
+    # Check if one contains the other
+    if n1 in n2 or n2 in n1:
+        return True
+    # Check if last word matches (nickname)
+    words1 = n1.split()
+    words2 = n2.split()
+    if words1 and words2 and words1[-1] == words2[-1]:
+        # One is just nickname, or first word matches
+        if len(words1) == 1 or len(words2) == 1:
+            return True
+        if words1[0] == words2[0]:
+            return True
+    # Check if first word matches (for school/city names)
+    if words1 and words2 and words1[0] == words2[0] and len(words1[0]) > 3:
+        return True
+    # Check if all words from shorter are in longer
+    if len(words1) > 1 and len(words2) > 1:
+        shorter = words1 if len(words1) < len(words2) else words2
+        longer = words2 if len(words1) < len(words2) else words1
+        if all(word in longer for word in shorter if len(word) > 2):
+            return True
+    return False
+
+
+def fuzzy_pair_match(team_a: str, team_b: str, away: str, home: str) -> bool:
+    """Both teams fuzzy-match the game, in either orientation."""
+    return (fuzzy_team_match(team_a, away) and fuzzy_team_match(team_b, home)) or (
+        fuzzy_team_match(team_a, home) and fuzzy_team_match(team_b, away)
+    )
+
+
+def alias_team_match(t1: str, t2: str, team_matches: Callable[[str, str], bool] = fuzzy_team_match) -> bool:
+    """
+    `team_matches` on the names as given, or failing that with aliases expanded.
+    Accepts every pairing `TeamNameIndex.find_match` can produce, so re-checking a
+    stored alias match ("OKC" vs "Oklahoma City Thunder") doesn't reject it.
+    """
+    if team_matches(t1, t2):
+        return True
+    return team_matches(expand_aliases(normalize_team(t1)), expand_aliases(normalize_team(t2)))
+
+
+def _index_keys(name: str) -> Set[str]:
+    """Every key a team name is filed under: full names and tokens, raw and alias-expanded."""
+    keys: Set[str] = set()
+    normalized = normalize_team(name)
+    for form in (normalized, expand_aliases(normalized)):
+        if not form:
+            continue
+        keys.add(form)
+        keys.update(form.split())
+    return keys
+
+
+# How a match was made, most to least certain
+CONFIDENCE_EXACT = 1.0
+CONFIDENCE_FUZZY = 0.8
+CONFIDENCE_ALIAS = 0.6
+
+
+@dataclass(frozen=True)
+class TeamMatch(Generic[G]):
+    game: G
+    # True when the caller's away team is the game's home team
+    swapped: bool
+    confidence: float
+
+
+class TeamNameIndex(Generic[G]):
+    """
+    Typical usage:
+      index = TeamNameIndex(games)  # once per feed refresh
+      game = index.find_game("Celtics", "Heat", fuzzy_pair_match)
+
+    `games` are any objects with `away_team` / `home_team` attributes (or pass
+    `teams=` to read them differently). Games keep their input order, so when
+    several candidates match, the first one in the input wins as before.
+    """
+
+    def __init__(
+        self,
+        games: Sequence[G],
+        *,
+        teams: Callable[[G], Tuple[str, str]] = lambda g: (g.away_team, g.home_team),  # type: ignore[attr-defined]
+    ) -> None:
+        self.games: List[G] = list(games)
+        self._teams: List[Tuple[str, str]] = []
+        self._expanded_teams: List[Tuple[str, str]] = []
+        self._by_key: Dict[str, List[int]] = {}
+        # Unordered pair of normalized names -> game index, for exact hits
+        self._by_pair: Dict[frozenset, int] = {}
+        for i, game in enumerate(self.games):
+            away, home = teams(game)
+            away, home = str(away or ""), str(home or "")
+            self._teams.append((away, home))
+            self._expanded_teams.append((expand_aliases(normalize_team(away)), expand_aliases(normalize_team(home))))
+            if not away or not home:
+                continue
+            self._by_pair.setdefault(frozenset((normalize_team(away), normalize_team(home))), i)
+            for key in _index_keys(away) | _index_keys(home):
+                self._by_key.setdefault(key, []).append(i)
+
+    def __len__(self) -> int:
+        return len(self.games)
+
+    def candidates(self, *team_names: str) -> List[int]:
+        """Indices (input order) of games sharing at least one key with any of team_names."""
+        found: Set[int] = set()
+        for name in team_names:
+            for key in _index_keys(name):
+                found.update(self._by_key.get(key, ()))
+        return sorted(found)
+
+    def find_game(self, team_a: str, team_b: str, pair_matches: PairMatcher) -> Optional[G]:
+        """The game matching (team_a, team_b) in either orientation, or None."""
+        match = self.find_match(team_a, team_b, pair_matches)
+        return match.game if match is not None else None
+
+    def find_match(self, team_a: str, team_b: str, pair_matches: PairMatcher) -> Optional[TeamMatch[G]]:
+        """
+        Like `find_game`, but also reports orientation and how the match was made.
+
+        An exact pair of normalized names wins outright; otherwise `pair_matches` is
+        run on the key-sharing candidates, first with the names as given and then
+        with aliases expanded.
+        """
+        exact = self._by_pair.get(frozenset((normalize_team(team_a), normalize_team(team_b))))
+        if exact is not None:
+            return self._match(exact, team_a, CONFIDENCE_EXACT)
+
+        expanded_a = expand_aliases(normalize_team(team_a))
+        expanded_b = expand_aliases(normalize_team(team_b))
+        for i in self.candidates(team_a, team_b):
+            away, home = self._teams[i]
+            if not away or not home:
+                continue
+            if pair_matches(team_a, team_b, away, home):
+                return self._match(i, team_a, CONFIDENCE_FUZZY)
+            expanded_away, expanded_home = self._expanded_teams[i]
+            if (expanded_a, expanded_b, expanded_away, expanded_home) != tuple(
+                normalize_team(t) for t in (team_a, team_b, away, home)
+            ) and pair_matches(expanded_a, expanded_b, expanded_away, expanded_home):
+                return self._match(i, team_a, CONFIDENCE_ALIAS)
+        return None
+
+    def _match(self, i: int, team_a: str, confidence: float) -> TeamMatch[G]:
+        # team_a is the caller's away team; it lines up with whichever side shares more keys
+        away, home = self._teams[i]
+        keys_a = _index_keys(team_a)
+        swapped = len(keys_a & _index_keys(home)) > len(keys_a & _index_keys(away))
+        return TeamMatch(game=self.games[i], swapped=swapped, confidence=confidence)
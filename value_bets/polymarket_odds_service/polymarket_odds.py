@@ -5,6 +5,7 @@ import json
 import re
 import requests
 from py_clob_client.client import ClobClient
+from py_clob_client.clob_types import BookParams
 
 
 class PolymarketGameFinder:
@@ -21,7 +22,20 @@ class PolymarketGameFinder:
     def __init__(self) -> None:
         self.session = requests.Session()
 
-    def fetch_events_page(
+    def fetch_events_page(self, **kwargs: Any) -> List[Dict[str, Any]]:
+        """
+        Fetch one page of events from Gamma's `/events` endpoint.
+
+        Returns [] on a request error; use `request_events_page` to tell an error
+        apart from the end of the listing.
+        """
+        try:
+            return self.request_events_page(**kwargs)
+        except requests.exceptions.RequestException as e:
+            print(f"Error fetching events: {e}")
+            return []
+
+    def request_events_page(
         self,
         *,
         limit: int = 100,
@@ -31,9 +45,12 @@ class PolymarketGameFinder:
         order: str = "startTime",
         ascending: bool = False,
         tag_id: str = GAME_BETS_TAG_ID,
+        session: Optional[requests.Session] = None,
     ) -> List[Dict[str, Any]]:
         """
-        Fetch one page of events from Gamma's `/events` endpoint.
+        Fetch one page of events from Gamma's `/events` endpoint. Raises
+        `requests.RequestException` on a connection error or non-2xx status.
+        `session` defaults to this finder's (requests sessions are not thread-safe).
         """
         url = f"{self.GAMMA_API_BASE}/events"
         params = {
@@ -46,17 +63,13 @@ class PolymarketGameFinder:
             "tag_id": str(tag_id),
         }
 
-        try:
-            response = self.session.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
-            
-            if isinstance(data, list):
-                return data
-            return data.get("data", []) or []
-        except requests.exceptions.RequestException as e:
-            print(f"Error fetching events: {e}")
-            return []
+        response = (session or self.session).get(url, params=params)
+        response.raise_for_status()
+        data = response.json()
+
+        if isinstance(data, list):
+            return data
+        return data.get("data", []) or []
 
     TARGET_SLUG = "cbb-stfpa-chist-2026-01-29"
 
@@ -428,34 +441,14 @@ class PolymarketOdds:
         if isinstance(outcomes, str):
             outcomes = json.loads(outcomes)
         
-        # Step 3: Get spread data for each token using py-clob-client
+        # Step 3: Top of book for every token from a single batch book request
+        books = self._fetch_top_of_books(clob_token_ids)
         odds: List[PolymarketOdds.MarketOdds] = []
         
         for i, token_id in enumerate(clob_token_ids):
             # Get outcome label for this token
             outcome_label = outcomes[i] if i < len(outcomes) else f"Outcome {i}"
-            
-            # Use get_price for accurate best bid/ask
-            try:
-                bid_response = self.clob_client.get_price(token_id, side="BUY")
-                best_bid = float(bid_response.get("price", 0)) if bid_response else None
-            except Exception:
-                best_bid = None
-                
-            try:
-                ask_response = self.clob_client.get_price(token_id, side="SELL")
-                best_ask = float(ask_response.get("price", 0)) if ask_response else None
-            except Exception:
-                best_ask = None
-            
-            # Get order book for volume information
-            try:
-                order_book = self.clob_client.get_order_book(token_id)
-                bid_volume = float(order_book.bids[0].size) if order_book.bids else 0.0
-                ask_volume = float(order_book.asks[0].size) if order_book.asks else 0.0
-            except Exception:
-                bid_volume = 0.0
-                ask_volume = 0.0
+            best_bid, bid_volume, best_ask, ask_volume = books.get(str(token_id), (None, 0.0, None, 0.0))
             
             # Calculate spread
             if best_bid is not None and best_ask is not None:
@@ -475,3 +468,36 @@ class PolymarketOdds:
             ))
 
         return odds
+
+    def _fetch_top_of_books(self, token_ids: List[str]) -> Dict[str, tuple]:
+        """
+        Return {token_id: (best_bid, bid_volume, best_ask, ask_volume)} from one
+        `get_order_books` call. Book levels are not sorted best-first, so take the
+        max bid / min ask. Tokens missing from the response are left out.
+        """
+        try:
+            books = self.clob_client.get_order_books([BookParams(token_id=str(t)) for t in token_ids])
+        except Exception:
+            return {}
+
+        out: Dict[str, tuple] = {}
+        for book in books or []:
+            bids = _book_levels(getattr(book, "bids", None))
+            asks = _book_levels(getattr(book, "asks", None))
+            best_bid = max((p for p, _ in bids), default=None)
+            best_ask = min((p for p, _ in asks), default=None)
+            bid_volume = sum(sz for p, sz in bids if p == best_bid)
+            ask_volume = sum(sz for p, sz in asks if p == best_ask)
+            out[str(getattr(book, "asset_id", ""))] = (best_bid, float(bid_volume), best_ask, float(ask_volume))
+        return out
+
+
+def _book_levels(levels) -> List[tuple]:
+    """(price, size) floats from py-clob-client OrderSummary levels, skipping malformed ones."""
+    out = []
+    for level in levels or []:
+        try:
+            out.append((float(level.price), float(level.size)))
+        except (TypeError, ValueError, AttributeError):
+            continue
+    return out
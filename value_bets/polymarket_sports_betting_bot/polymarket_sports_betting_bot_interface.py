@@ -17,6 +17,7 @@ from typing import Dict, List, Set, Optional
 from markets.moneyline import Moneyline
 from markets.spreads import Spreads
 from markets.totals import Totals
+from trade_executor.trade_executor_service import TradeExecutorService
 
 
 class PolymarketSportsBettingBotInterface:
@@ -26,12 +27,19 @@ class PolymarketSportsBettingBotInterface:
     Orchestrates value betting across moneyline, spread, and totals markets.
     """
 
-    def __init__(self, sport: str = "basketball", verbose: bool = False) -> None:
+    def __init__(
+        self,
+        sport: str = "basketball",
+        verbose: bool = False,
+        trade_executor: Optional[TradeExecutorService] = None,
+    ) -> None:
         self.sport = sport
         self.verbose = verbose
-        self.moneyline = Moneyline(sport=sport, verbose=verbose)
-        self.spreads = Spreads(sport=sport, verbose=verbose)
-        self.totals = Totals(sport=sport, verbose=verbose)
+        # One executor (and bankroll ledger) for all markets: a fill in one is seen by the others
+        self.trade_executor = trade_executor if trade_executor is not None else TradeExecutorService(sport=sport)
+        self.moneyline = Moneyline(sport=sport, verbose=verbose, trade_executor=self.trade_executor)
+        self.spreads = Spreads(sport=sport, verbose=verbose, trade_executor=self.trade_executor)
+        self.totals = Totals(sport=sport, verbose=verbose, trade_executor=self.trade_executor)
 
     def run_all_markets(
         self,
@@ -12,6 +12,7 @@ from dataclasses import dataclass
 from py_clob_client.clob_types import OrderType
 from py_clob_client.order_builder.constants import SELL
 
+from trade_executor.bankroll_ledger import BankrollLedger
 from trade_executor.execute_trade import PolymarketTrader
 
 
@@ -30,12 +31,23 @@ class RedeemPositions:
     methods to add positions and redeem them by creating SELL orders at $1.00.
     """
     
-    def __init__(self):
-        """Initialize the RedeemPositions class and set up PolymarketTrader."""
+    # Redemption SELL price (the CLOB's maximum)
+    SELL_PRICE = 0.999
+
+    def __init__(self, ledger: Optional[BankrollLedger] = None, trader: Optional[PolymarketTrader] = None):
+        """
+        Initialize the RedeemPositions class and set up PolymarketTrader.
+
+        Args:
+            ledger: Bankroll ledger credited with redemption proceeds (pass the
+                trade executor's `ledger` so sizing sees the USDC straight away)
+            trader: Trader to sell through (a new one is created if omitted)
+        """
         self.positions: List[Position] = []
+        self.ledger = ledger
         
         # Initialize PolymarketTrader (handles client setup internally)
-        self.trader = PolymarketTrader()
+        self.trader = trader if trader is not None else PolymarketTrader()
     
     def add_position(self, position: Position) -> None:
         """
@@ -79,7 +91,7 @@ class RedeemPositions:
             # Note: Maximum price allowed is 0.999, not 1.0
             resp = self.trader.execute_trade(
                 side=SELL,
-                price=0.999,  # 99.9 cents (maximum allowed, close to $1.00)
+                price=self.SELL_PRICE,  # 99.9 cents (maximum allowed, close to $1.00)
                 size=position.number_of_shares,
                 token_id=position.token_id,
                 order_type=OrderType.FAK
@@ -107,6 +119,10 @@ class RedeemPositions:
                 if filled_size is None and status == "matched":
                     filled_size = position.number_of_shares
             
+            # Unknown fills are left to the ledger's next reconcile
+            if self.ledger is not None and filled_size is not None and filled_size > 0:
+                self.ledger.credit(filled_size * self.SELL_PRICE)
+            
             # If partially filled, add remaining position back to list
             if filled_size is not None and filled_size < position.number_of_shares:
                 remaining_shares = position.number_of_shares - filled_size
@@ -8,10 +8,10 @@ Contains common logic shared across all sports (basketball, hockey, ufc, tennis)
 import sys
 import time
 import argparse
+import requests
 import traceback
 from datetime import datetime, timedelta, timezone
 import os
-import csv
 from typing import Optional, List, Tuple, Dict, Set, Callable, Any
 from dataclasses import dataclass
 
@@ -19,6 +19,8 @@ from polymarket_sports_betting_bot.polymarket_sports_betting_bot_interface impor
     PolymarketSportsBettingBotInterface,
 )
 from trade_executor.trade_executor_service import TradeExecutorService
+from pinnacle_scraper.match_store import MatchStore
+from trade_store import TradeStore, default_trade_store
 from value_bet_helpers import (
     fetch_polymarket_events_for_date,
     fetch_market_slugs_by_event,
@@ -43,19 +45,17 @@ class SportConfig:
 
 
 class TradesCounter:
-    """Helper class to track trade counts from CSV files."""
+    """Helper class to track trade counts from the trade store."""
     
-    def __init__(self, trades_csv_path: str):
-        self.trades_csv_path = trades_csv_path
+    def __init__(self, store: TradeStore, sport: str, source: str = "value_bets"):
+        self.store = store
+        self.sport = sport
+        self.source = source
     
     def get_trade_count(self) -> int:
-        """Return the current number of trades in the CSV file."""
-        if not os.path.exists(self.trades_csv_path):
-            return 0
+        """Return the current number of this sport's trades for this source (counter lookup, no scan)."""
         try:
-            with open(self.trades_csv_path, "r", encoding="utf-8", newline="") as f:
-                reader = csv.DictReader(f)
-                return len(list(reader))
+            return self.store.trade_count(self.source, sport=self.sport)
         except Exception:
             return 0
 
@@ -66,18 +66,19 @@ class SportsValueBetsRunner:
     def __init__(self, config: SportConfig, verbose: bool = False):
         self.config = config
         self.verbose = verbose
-        self.bot = PolymarketSportsBettingBotInterface(sport=config.sport_name, verbose=verbose)
+        # Shared with every market so _check_bankroll and Kelly sizing see the same ledger
+        self.trade_executor = TradeExecutorService(sport=config.sport_name)
+        self.bot = PolymarketSportsBettingBotInterface(
+            sport=config.sport_name, verbose=verbose, trade_executor=self.trade_executor
+        )
         self.pinnacle = config.pinnacle_service_class(timeout_ms=45000)
-        self.trade_executor = TradeExecutorService()
         self.traded_markets: Set[str] = set()
         
-        # Get trades CSV path from sport directory
-        # The sport-specific value_bets.py files are in value_bets/{sport}/value_bets.py
-        # So we need to go up one level from the helper to get to value_bets/, then into {sport}/
         helper_dir = os.path.dirname(os.path.abspath(__file__))
-        sport_specific_dir = os.path.join(helper_dir, config.sport_name)
-        trades_csv_path = os.path.join(sport_specific_dir, "trades.csv")
-        self.trades_counter = TradesCounter(trades_csv_path)
+        # Trades executed by TradeExecutorService are recorded in the shared trade store
+        self.trades_counter = TradesCounter(default_trade_store(), config.sport_name)
+        # event_slug -> Pinnacle matchup_id, persisted so restarts skip re-matching
+        self.match_store = MatchStore(os.path.join(helper_dir, "event_matches.sqlite3"))
     
     def _check_bankroll(self) -> bool:
         """Check if bankroll is sufficient. Returns True if OK, False if too low."""
@@ -157,7 +158,7 @@ class SportsValueBetsRunner:
         if verbose:
             print("\n[STEP 4] Matching games between Polymarket and Pinnacle...")
         
-        matched_events = match_games(polymarket_events, pinnacle_games)
+        matched_events = match_games(polymarket_events, pinnacle_games, match_store=self.match_store)
         
         if verbose:
             print(f"  -> Found {len(matched_events)} matched games (in both Polymarket and Pinnacle)")
@@ -298,7 +299,16 @@ class SportsValueBetsRunner:
                 print("=" * 80)
             
             # Step 1: Fetch Polymarket events
-            polymarket_events = self._fetch_polymarket_events(today, tomorrow, self.verbose)
+            try:
+                polymarket_events = self._fetch_polymarket_events(today, tomorrow, self.verbose)
+            except requests.exceptions.RequestException as e:
+                # A failed listing page fails the whole scan rather than truncating it
+                if parsed_test_date:
+                    print(f"\n[TEST MODE] Polymarket event scan failed: {e}. Exiting.")
+                    return 1
+                print(f"\n[WARNING] Polymarket event scan failed: {e}. Waiting 5 minutes before retrying...")
+                time.sleep(5 * 60)
+                continue
             if not polymarket_events:
                 if parsed_test_date:
                     print("\n[TEST MODE] No Polymarket events found for test date. Exiting.")
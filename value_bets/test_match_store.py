@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Manual tests for stored event matches in the legacy matching flow.
+
+Runs `match_games_and_fetch_markets` against an in-memory `MatchStore` and a
+stub Polymarket client, so no network calls are made and event_matches.sqlite3
+is untouched.
+
+Usage:
+    python3 test_match_store.py
+    # or: python -m pytest -q test_match_store.py
+"""
+
+import sys
+import os
+from types import SimpleNamespace
+from typing import Any, Optional
+
+# Add this directory to path for imports (modules import siblings by bare name)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import value_bet_helpers
+from pinnacle_scraper.match_store import EventMatch, MatchStore
+from pinnacle_scraper.team_name_index import CONFIDENCE_ALIAS
+
+
+class CountingMatchStore(MatchStore):
+    """MatchStore that counts the writes (each one is a SQLite commit)."""
+
+    def __init__(self, path: str) -> None:
+        super().__init__(path)
+        self.puts = 0
+        self.deletes = 0
+
+    def put(self, event_slug: str, matchup_id: int, *, swapped: bool, confidence: float) -> EventMatch:
+        self.puts += 1
+        return super().put(event_slug, matchup_id, swapped=swapped, confidence=confidence)
+
+    def delete(self, event_slug: str) -> bool:
+        self.deletes += 1
+        return super().delete(event_slug)
+
+
+class StubPolymarketOdds:
+    """PolymarketOdds stand-in: no event data, so no market slugs are fetched."""
+
+    def fetch_event_by_slug(self, slug: str) -> Optional[Any]:
+        return None
+
+
+def test_alias_match_is_reused() -> None:
+    store = CountingMatchStore(":memory:")
+    games = [SimpleNamespace(matchup_id=101, away_team="Oklahoma City Thunder", home_team="Los Angeles Lakers")]
+    # "OKC" only matches "Oklahoma City Thunder" once aliases are expanded
+    events = [("nba-okc-lal-2026-01-05", "OKC", "Lakers")]
+    previous = value_bet_helpers.PolymarketOdds
+    value_bet_helpers.PolymarketOdds = StubPolymarketOdds
+    try:
+        for _ in range(3):
+            matched, _ = value_bet_helpers.match_games_and_fetch_markets(events, games, match_store=store)
+            assert [m[3].matchup_id for m in matched] == [101]
+    finally:
+        value_bet_helpers.PolymarketOdds = previous
+
+    assert store.get("nba-okc-lal-2026-01-05").confidence == CONFIDENCE_ALIAS
+    assert store.puts == 1, "stored alias match should be reused, not re-matched"
+    assert store.deletes == 0
+    print("test_alias_match_is_reused: OK")
+
+
+def main() -> int:
+    test_alias_match_is_reused()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
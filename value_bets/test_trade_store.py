@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Manual tests for the SQLite trade store.
+
+Runs `TradeStore` against an in-memory database and temporary CSV logs, so no
+existing trades.sqlite3 or CSV files are touched.
+
+Usage:
+    python3 test_trade_store.py
+    # or: python -m pytest -q test_trade_store.py
+"""
+
+import sys
+import os
+import csv
+import tempfile
+from typing import Dict, List
+
+# Add this directory to path for imports (modules import siblings by bare name)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from trade_store import TradeStore
+
+
+# Header of the legacy value_bets trades.csv log
+TRADES_FIELDS = ["ts", "event_slug", "token_id", "condition_id", "team", "side", "price",
+                 "size_requested", "size_filled", "amount", "expected_payout_per_$1", "status", "order_id"]
+
+
+def _trade_row(i: int) -> Dict[str, str]:
+    return {
+        "ts": f"2026-01-0{i + 1}T12:00:00",
+        "event_slug": f"nba-bos-nyk-2026-01-0{i + 1}",
+        "token_id": f"token-{i}",
+        "condition_id": f"cond-{i}",
+        "team": "Celtics",
+        "side": "BUY",
+        "price": "0.45",
+        "size_requested": "10",
+        "size_filled": "10",
+        "amount": "4.5",
+        "expected_payout_per_$1": "1.05",
+        "status": "matched",
+        "order_id": f"order-{i}",
+    }
+
+
+def _write_trades_csv(path: str, rows: List[Dict[str, str]]) -> None:
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=TRADES_FIELDS)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def _append_trades_csv(path: str, rows: List[Dict[str, str]]) -> None:
+    with open(path, "a", encoding="utf-8", newline="") as f:
+        csv.DictWriter(f, fieldnames=TRADES_FIELDS).writerows(rows)
+
+
+def test_import_appended_csv_only_imports_new_rows() -> None:
+    store = TradeStore(":memory:")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "trades.csv")
+        _write_trades_csv(path, [_trade_row(0), _trade_row(1)])
+        assert store.import_csv(path) == 2
+        # Unchanged file: nothing to do
+        assert store.import_csv(path) == 0
+
+        _append_trades_csv(path, [_trade_row(2)])
+        assert store.import_csv(path) == 1
+        assert store.trade_count("value_bets") == 3
+        assert [t["token_id"] for t in store.trades_since(0)] == ["token-0", "token-1", "token-2"]
+    store.close()
+    print("test_import_appended_csv_only_imports_new_rows: OK")
+
+
+def test_import_refuses_shrunk_csv() -> None:
+    store = TradeStore(":memory:")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "trades.csv")
+        _write_trades_csv(path, [_trade_row(0), _trade_row(1)])
+        assert store.import_csv(path) == 2
+
+        _write_trades_csv(path, [_trade_row(0)])
+        try:
+            store.import_csv(path)
+        except ValueError as e:
+            assert "shrank" in str(e)
+        else:
+            raise AssertionError("a shrunk CSV should not be re-imported")
+        assert store.trade_count() == 2
+    store.close()
+    print("test_import_refuses_shrunk_csv: OK")
+
+
+def test_has_traded_sees_unflushed_writes() -> None:
+    # Writer thread never wakes on its own during the test
+    store = TradeStore(":memory:", flush_interval_s=3600)
+    store.add_trade(source="value_bets", sport="nba", market_slug="nba-bos-nyk", team="Celtics", token_id="t1")
+    assert store._pending_trades, "trade should still be buffered"
+
+    assert store.has_traded("nba-bos-nyk", "Celtics")
+    assert store.has_traded("nba-bos-nyk")
+    assert not store.has_traded("nba-bos-nyk", "Knicks")
+
+    store.add_trade(source="value_bets", sport="nhl", market_slug="nhl-bos-nyr", team="Bruins", token_id="t2")
+    assert store.trade_count("value_bets", sport="nba") == 1
+    assert store.trade_count("value_bets", sport="nhl") == 1
+    assert store.trade_count("value_bets") == 2
+    store.close()
+    print("test_has_traded_sees_unflushed_writes: OK")
+
+
+def main() -> int:
+    test_import_appended_csv_only_imports_new_rows()
+    test_import_refuses_shrunk_csv()
+    test_has_traded_sees_unflushed_writes()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+In-process USDC bankroll ledger.
+
+Kelly sizing needs the current bankroll before every order, and asking the CLOB
+(`get_balance_allowance`) each time puts a network round-trip between spotting an
+edge and placing the order. The ledger keeps a local balance instead: fills debit
+it, sells/redemptions credit it, and a background thread periodically replaces it
+with the exchange's figure so drift (fees, settlements, deposits) is corrected.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class BankrollLedger:
+    """
+    Typical usage:
+      ledger = BankrollLedger(fetch_balance)  # fetch_balance() -> Optional[float]
+      ledger.start()
+      bankroll = ledger.balance()             # O(1) after the first reconcile
+      ledger.debit(price * filled_size)
+    """
+
+    # How often the background thread replaces the local balance with the API's
+    RECONCILE_INTERVAL_S = 60.0
+
+    def __init__(
+        self,
+        fetch_balance: Callable[[], Optional[float]],
+        *,
+        reconcile_interval_s: Optional[float] = None,
+    ) -> None:
+        self._fetch_balance = fetch_balance
+        self.reconcile_interval_s = (
+            self.RECONCILE_INTERVAL_S if reconcile_interval_s is None else float(reconcile_interval_s)
+        )
+        self._lock = threading.Lock()
+        # One reconcile at a time: a concurrent one would reset _pending_delta mid-fetch
+        self._reconcile_lock = threading.Lock()
+        self._balance: Optional[float] = None
+        # Debits/credits applied while a reconcile fetch is in flight
+        self._pending_delta: Optional[float] = None
+        self.last_reconciled_at: Optional[float] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def balance(self) -> Optional[float]:
+        """Current local balance. Reconciles synchronously only if it was never loaded."""
+        with self._lock:
+            balance = self._balance
+        if balance is None:
+            return self.reconcile()
+        return balance
+
+    def debit(self, amount: float) -> None:
+        """Record USDC spent (e.g. a BUY fill)."""
+        self._apply(-float(amount))
+
+    def credit(self, amount: float) -> None:
+        """Record USDC received (e.g. a SELL fill or a redemption)."""
+        self._apply(float(amount))
+
+    def _apply(self, delta: float) -> None:
+        with self._lock:
+            if self._balance is not None:
+                self._balance += delta
+            if self._pending_delta is not None:
+                self._pending_delta += delta
+
+    def reconcile(self) -> Optional[float]:
+        """
+        Replace the local balance with the API's. Fills recorded while the request
+        is in flight are re-applied on top. Returns the new balance, or the old one
+        if the fetch fails.
+        """
+        with self._reconcile_lock:
+            with self._lock:
+                self._pending_delta = 0.0
+            try:
+                fetched = self._fetch_balance()
+            except Exception:
+                logger.exception("Bankroll balance fetch failed")
+                fetched = None
+            with self._lock:
+                pending = self._pending_delta or 0.0
+                self._pending_delta = None
+                if fetched is None:
+                    return self._balance
+                drift = None if self._balance is None else (fetched + pending) - self._balance
+                self._balance = fetched + pending
+                self.last_reconciled_at = time.time()
+                balance = self._balance
+        if drift is not None and abs(drift) >= 0.01:
+            logger.info("Reconciled bankroll balance $%.2f (drift %+.2f)", balance, drift)
+        return balance
+
+    def start(self) -> None:
+        """Start the background reconcile thread (idempotent)."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="bankroll-ledger", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5.0)
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self.reconcile()
+            self._stop.wait(self.reconcile_interval_s)
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Manual tests for the bankroll ledger's reconcile.
+
+A fake `fetch_balance` blocks until released, so fills can be recorded from
+another thread while a reconcile's API request is in flight.
+
+Usage:
+    python3 test_bankroll_ledger.py
+    # or: python -m pytest -q test_bankroll_ledger.py
+"""
+
+import sys
+import os
+import threading
+from typing import List, Optional
+
+# Add repo root to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from value_bets.trade_executor.bankroll_ledger import BankrollLedger
+
+
+class BlockingBalance:
+    """fetch_balance stand-in: returns scripted balances, each call waiting for `release`."""
+
+    def __init__(self, balances: List[float]) -> None:
+        self.balances = list(balances)
+        self.release = threading.Event()
+        self.entered = threading.Event()
+        self.calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def __call__(self) -> Optional[float]:
+        with self._lock:
+            self.calls += 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        self.entered.set()
+        try:
+            assert self.release.wait(5.0), "fetch never released"
+            return self.balances.pop(0)
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+def _reconcile_in_thread(ledger: BankrollLedger) -> threading.Thread:
+    thread = threading.Thread(target=ledger.reconcile, daemon=True)
+    thread.start()
+    return thread
+
+
+def test_fills_during_fetch_are_reapplied() -> None:
+    fetch = BlockingBalance([50.0, 100.0])
+    ledger = BankrollLedger(fetch)
+    fetch.release.set()
+    assert ledger.balance() == 50.0
+
+    fetch.release.clear()
+    fetch.entered.clear()
+    reconciling = _reconcile_in_thread(ledger)
+    assert fetch.entered.wait(5.0)
+    # Fills land while the API request is in flight; the fetched figure predates them
+    debiting = threading.Thread(target=ledger.debit, args=(7.5,))
+    debiting.start()
+    debiting.join()
+    ledger.credit(2.5)
+    assert ledger.balance() == 45.0
+
+    fetch.release.set()
+    reconciling.join(5.0)
+    assert not reconciling.is_alive()
+    # fetched + pending
+    assert ledger.balance() == 100.0 - 7.5 + 2.5
+    assert ledger._pending_delta is None
+    print("test_fills_during_fetch_are_reapplied: OK")
+
+
+def test_concurrent_reconciles_are_serialized() -> None:
+    # Second fetch already reflects the debit recorded during the first
+    fetch = BlockingBalance([100.0, 90.0])
+    ledger = BankrollLedger(fetch)
+
+    first = _reconcile_in_thread(ledger)
+    assert fetch.entered.wait(5.0)
+    ledger.debit(10.0)
+    second = _reconcile_in_thread(ledger)
+    # The second reconcile must not start its fetch (and reset the pending fills) mid-flight
+    second.join(0.1)
+    assert second.is_alive()
+    assert fetch.calls == 1
+
+    fetch.release.set()
+    first.join(5.0)
+    second.join(5.0)
+    assert not first.is_alive() and not second.is_alive()
+    assert fetch.calls == 2
+    assert fetch.max_in_flight == 1
+    assert ledger.balance() == 90.0
+    print("test_concurrent_reconciles_are_serialized: OK")
+
+
+def main() -> int:
+    test_fills_during_fetch_are_reapplied()
+    test_concurrent_reconciles_are_serialized()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
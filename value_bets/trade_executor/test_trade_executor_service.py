@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Manual tests for the trade executor: how it records fills in the trade store,
+and how the legacy markets share its bankroll ledger.
+
+The process-wide store is swapped for an in-memory one, and the service runs
+against a stub trader, so no orders are sent and trades.sqlite3 is untouched.
+
+Usage:
+    python3 test_trade_executor_service.py
+    # or: python -m pytest -q test_trade_executor_service.py
+"""
+
+import sys
+import os
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator
+
+# Add value_bets to path for imports (modules import siblings by bare name)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import trade_store
+from trade_store import TradeStore
+from py_clob_client.clob_types import OrderType
+from py_clob_client.order_builder.constants import BUY
+from markets.moneyline import Moneyline
+from markets.spreads import Spreads
+from redeem_positions import Position, RedeemPositions
+from trade_executor.trade_executor_service import TradeExecutionResult, TradeExecutorService
+
+
+class StubTrader:
+    """PolymarketTrader stand-in: a fixed balance, and every order fully matched."""
+
+    def get_usdc_balance(self) -> float:
+        return 100.0
+
+    def execute_trade(self, **kwargs: Any) -> Dict[str, Any]:
+        return {"status": "matched", "orderID": "order-1", "success": True}
+
+
+@contextmanager
+def _in_memory_trade_store() -> Iterator[TradeStore]:
+    store = TradeStore(":memory:", flush_interval_s=3600)
+    previous = trade_store._default_store
+    trade_store._default_store = store
+    try:
+        yield store
+    finally:
+        trade_store._default_store = previous
+        store.close()
+
+
+def test_successful_trade_is_counted_for_its_sport() -> None:
+    with _in_memory_trade_store() as store:
+        service = TradeExecutorService(trader=StubTrader(), sport="nba")
+        try:
+            result = TradeExecutionResult(
+                ok=True,
+                token_id="token-1",
+                side="BUY",
+                price=0.45,
+                size=10.0,
+                order_type=OrderType.GTC,
+                team="Celtics",
+                game="Celtics vs Knicks",
+                response={"status": "matched", "orderID": "order-1", "success": True},
+                filled_size=10.0,
+                event_slug="nba-bos-nyk-2026-01-01",
+                condition_id="cond-1",
+            )
+            service._append_successful_trade(result)
+
+            assert store.trade_count("value_bets", sport="nba") == 1
+            assert store.trade_count("value_bets", sport="nhl") == 0
+        finally:
+            service.ledger.stop()
+    print("test_successful_trade_is_counted_for_its_sport: OK")
+
+
+def test_markets_share_one_ledger() -> None:
+    with _in_memory_trade_store():
+        service = TradeExecutorService(trader=StubTrader(), sport="basketball")
+        # No background reconcile resetting the balance mid-test
+        service.ledger.stop()
+        moneyline = Moneyline(sport="basketball", trade_executor=service)
+        spreads = Spreads(sport="basketball", trade_executor=service)
+        assert moneyline.trade_executor.ledger is spreads.trade_executor.ledger
+        assert spreads.trade_executor.get_usdc_balance() == 100.0
+
+        # A fill in one market is visible to the other's sizing at once
+        result = moneyline.trade_executor.execute_trade(
+            token_id="token-1", side=BUY, price=0.5, size=20.0, order_type=OrderType.FAK
+        )
+        assert result.ok
+        assert spreads.calculate_bet_size(0.6, 0.5)[2] == 90.0
+
+        # So is a redemption's payout
+        redeemer = RedeemPositions(ledger=service.ledger, trader=StubTrader())
+        redeemer.redeem_position(Position(token_id="token-2", number_of_shares=10.0))
+        assert abs(moneyline.trade_executor.get_usdc_balance() - (90.0 + 10.0 * RedeemPositions.SELL_PRICE)) < 1e-9
+    print("test_markets_share_one_ledger: OK")
+
+
+def main() -> int:
+    test_successful_trade_is_counted_for_its_sport()
+    test_markets_share_one_ledger()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -14,16 +14,16 @@ Credentials are read from `config_local.py` (optional) or env vars:
 
 from __future__ import annotations
 
-import csv
 import traceback
 from dataclasses import dataclass
-import os
 from datetime import datetime, timezone
 from typing import Any, Optional
 
 from py_clob_client.clob_types import OrderType
 from py_clob_client.order_builder.constants import BUY, SELL
 
+from trade_store import default_trade_store
+from .bankroll_ledger import BankrollLedger
 from .execute_trade import PolymarketTrader
 
 
@@ -60,9 +60,11 @@ class TradeExecutionResult:
 
 
 class TradeExecutorService:
-    def __init__(self, trader: Optional[PolymarketTrader] = None) -> None:
+    def __init__(self, trader: Optional[PolymarketTrader] = None, sport: Optional[str] = None) -> None:
         # Don't raise on init; keep it safe for callers.
         self._trader = trader
+        # Recorded on every trade so per-sport runners can count their own
+        self.sport = sport
         self._init_error: Optional[str] = None
         if trader is None:
             try:
@@ -70,16 +72,29 @@ class TradeExecutorService:
             except Exception as e:
                 self._trader = None
                 self._init_error = str(e)
+        # Local bankroll: fills debit/credit it, a background thread reconciles with the API
+        self.ledger = BankrollLedger(self._fetch_usdc_balance)
+        if self._trader is not None:
+            self.ledger.start()
 
     def get_usdc_balance(self) -> Optional[float]:
         """
-        Best-effort fetch of current collateral (USDC) balance.
-        Returns None if unavailable.
+        Current collateral (USDC) balance from the local ledger (no network call
+        once the ledger has loaded). Returns None if unavailable.
         """
         if self._trader is None:
             if self._init_error:
                 print(f"Trade executor not initialized: {self._init_error}")
             return None
+        return self.ledger.balance()
+
+    def _fetch_usdc_balance(self) -> Optional[float]:
+        """
+        Best-effort fetch of current collateral (USDC) balance from the API.
+        Returns None if unavailable.
+        """
+        if self._trader is None:
+            return None
         try:
             balance = self._trader.get_usdc_balance()
             return float(balance)
@@ -119,17 +134,10 @@ class TradeExecutorService:
             condition_id=condition_id,
         )
 
-    @staticmethod
-    def _trades_csv_path() -> str:
-        # Write next to `value_bets/value_bets.py`
-        value_bets_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
-        return os.path.join(value_bets_root, "trades.csv")
-
-    @classmethod
-    def _append_successful_trade(cls, result: TradeExecutionResult) -> None:
+    def _append_successful_trade(self, result: TradeExecutionResult) -> None:
         """
-        Best-effort append of a successful trade to a CSV log file.
-        Never raises.
+        Best-effort record of a successful trade in the trade store (buffered;
+        written by its background thread). Never raises.
         """
         try:
             ts = datetime.now(timezone.utc).isoformat()
@@ -163,7 +171,7 @@ class TradeExecutorService:
             team = (result.team or "").strip() or "UNKNOWN_TEAM"
             game = (result.game or "").strip() if result.game else ""
 
-            # Ensure tx_hashes is a string for CSV.
+            # Ensure tx_hashes is a string (as in the CSV log this replaces).
             if isinstance(tx_hashes, (list, tuple, dict)):
                 tx_hashes_s = str(tx_hashes)
             elif tx_hashes is None:
@@ -198,17 +206,27 @@ class TradeExecutorService:
                 "condition_id": ("" if result.condition_id is None else str(result.condition_id)),
             }
 
-            path = cls._trades_csv_path()
-            fieldnames = list(row.keys())
-            needs_header = (not os.path.exists(path)) or (os.path.getsize(path) == 0)
-            with open(path, "a", encoding="utf-8", newline="") as f:
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                if needs_header:
-                    writer.writeheader()
-                writer.writerow(row)
-        except Exception:
-            # Intentionally swallow all logging errors
-            return
+            default_trade_store().add_trade(
+                source="value_bets",
+                ts=ts,
+                sport=self.sport,
+                event_slug=result.event_slug,
+                token_id=str(result.token_id),
+                condition_id=result.condition_id,
+                team=team,
+                side=str(result.side),
+                price=result.price,
+                size=actual_size,
+                cost=amount,
+                expected_payout_per_1=result.expected_payout_per_1,
+                status=None if status is None else str(status),
+                order_id=None if order_id is None else str(order_id),
+                data=row,
+            )
+        except Exception as e:
+            # Recording must never fail the trade, but don't hide why it was lost
+            print(f"Error recording trade for token {result.token_id}: {e}")
+            traceback.print_exc()
 
     def execute_trade(
         self,
@@ -324,6 +342,13 @@ class TradeExecutorService:
                 # If no explicit matched amount but status is "matched", assume full fill
                 if filled_size is None and resp.get("status") == "matched":
                     filled_size = size
+
+            # Unknown fill is booked as the full size; the next reconcile corrects it
+            notional = price * (filled_size if filled_size is not None else size)
+            if side == BUY:
+                self.ledger.debit(notional)
+            else:
+                self.ledger.credit(notional)
             
             result = TradeExecutionResult(
                 ok=True,
@@ -0,0 +1,515 @@
+#!/usr/bin/env python3
+"""
+SQLite store for executed trades and value bet opportunities.
+
+Replaces the append-only CSV logs (trades.csv, successful_trades.csv,
+value_bets.csv, attempted_value_bets_*.csv). Rows are buffered in memory and a
+background thread writes them in one transaction per batch, so callers on the
+trading path never wait for disk. Reads flush pending rows first.
+
+Lookups the bots make every loop are index or primary-key hits:
+  - trade_count(source, sport): per-source and per-(source, sport) counters maintained
+    in the same transaction as the inserts
+  - has_traded(market_slug, team): index on (market_slug, team)
+  - trades/opportunities by token_id or time: indexes on token_id and ts
+
+Each row keeps its original fields as JSON in `data`, so nothing from the CSVs is lost.
+
+Import existing CSVs (idempotent; files already imported are skipped):
+  python value_bets/trade_store.py import value_bets/*.csv value_bets_new/successful_trades.csv
+"""
+
+from __future__ import annotations
+
+import argparse
+import atexit
+import csv
+import json
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+
+DEFAULT_DB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "trades.sqlite3")
+
+_TRADE_COLUMNS = (
+    "ts", "source", "sport", "market", "market_slug", "event_slug", "token_id", "condition_id",
+    "team", "side", "price", "size", "cost", "expected_payout_per_1", "status", "order_id", "data",
+)
+_OPPORTUNITY_COLUMNS = (
+    "ts", "kind", "event_slug", "market_slug", "token_id", "outcome", "line",
+    "true_prob", "price", "expected_payout_per_1", "executed", "error", "data",
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS trades (
+    id INTEGER PRIMARY KEY,
+    ts REAL NOT NULL,
+    source TEXT NOT NULL,
+    sport TEXT,
+    market TEXT,
+    market_slug TEXT,
+    event_slug TEXT,
+    token_id TEXT,
+    condition_id TEXT,
+    team TEXT,
+    side TEXT,
+    price REAL,
+    size REAL,
+    cost REAL,
+    expected_payout_per_1 REAL,
+    status TEXT,
+    order_id TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_trades_market_team ON trades (market_slug, team);
+CREATE INDEX IF NOT EXISTS idx_trades_token ON trades (token_id);
+CREATE INDEX IF NOT EXISTS idx_trades_ts ON trades (ts);
+
+CREATE TABLE IF NOT EXISTS trade_counts (
+    source TEXT PRIMARY KEY,
+    n INTEGER NOT NULL
+);
+
+-- sport is '' for trades recorded without one
+CREATE TABLE IF NOT EXISTS sport_trade_counts (
+    source TEXT NOT NULL,
+    sport TEXT NOT NULL,
+    n INTEGER NOT NULL,
+    PRIMARY KEY (source, sport)
+);
+
+CREATE TABLE IF NOT EXISTS opportunities (
+    id INTEGER PRIMARY KEY,
+    ts REAL NOT NULL,
+    kind TEXT NOT NULL,
+    event_slug TEXT,
+    market_slug TEXT,
+    token_id TEXT,
+    outcome TEXT,
+    line REAL,
+    true_prob REAL,
+    price REAL,
+    expected_payout_per_1 REAL,
+    executed INTEGER,
+    error TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_opportunities_market ON opportunities (market_slug);
+CREATE INDEX IF NOT EXISTS idx_opportunities_token ON opportunities (token_id);
+CREATE INDEX IF NOT EXISTS idx_opportunities_ts ON opportunities (ts);
+
+CREATE TABLE IF NOT EXISTS imported_files (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime REAL NOT NULL,
+    kind TEXT NOT NULL,
+    rows INTEGER NOT NULL,
+    imported_at REAL NOT NULL
+);
+"""
+
+
+def _float_or_none(value: Any) -> Optional[float]:
+    if value is None or value == "":
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _timestamp(value: Any) -> float:
+    """ISO datetime/date string (naive = local time) or epoch number -> epoch seconds."""
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, datetime):
+        return value.timestamp()
+    if isinstance(value, str) and value:
+        try:
+            return datetime.fromisoformat(value).timestamp()
+        except ValueError:
+            pass
+    return time.time()
+
+
+class TradeStore:
+    """
+    Typical usage:
+      store = TradeStore(path)
+      store.add_trade(source="value_bets_new", market_slug=slug, team=team, token_id=token_id, ...)
+      if store.has_traded(slug, team):
+          ...
+      store.close()  # flushes pending rows
+    """
+
+    # Rows buffered before the writer thread is woken early
+    BATCH_SIZE = 200
+    # Max time a buffered row waits before being written
+    FLUSH_INTERVAL_S = 1.0
+
+    def __init__(self, path: str = DEFAULT_DB_PATH, *, flush_interval_s: Optional[float] = None) -> None:
+        self.path = path
+        self.flush_interval_s = self.FLUSH_INTERVAL_S if flush_interval_s is None else float(flush_interval_s)
+        self._lock = threading.Lock()
+        # Shared between callers and the writer thread; access is serialized by _lock
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        has_sport_counts = self._conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sport_trade_counts'"
+        ).fetchone()
+        self._conn.executescript(_SCHEMA)
+        if not has_sport_counts:
+            # Stores created before the per-sport counters: count the existing trades once
+            self._conn.execute(
+                "INSERT INTO sport_trade_counts (source, sport, n) "
+                "SELECT source, COALESCE(sport, ''), COUNT(*) FROM trades GROUP BY source, COALESCE(sport, '')"
+            )
+        self._conn.commit()
+        self._pending_trades: List[Tuple[Any, ...]] = []
+        self._pending_opportunities: List[Tuple[Any, ...]] = []
+        self._pending_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="trade-store-writer", daemon=True)
+        self._thread.start()
+
+    # -- writes -----------------------------------------------------------------
+
+    def add_trade(
+        self,
+        *,
+        source: str,
+        ts: Any = None,
+        sport: Optional[str] = None,
+        market: Optional[str] = None,
+        market_slug: Optional[str] = None,
+        event_slug: Optional[str] = None,
+        token_id: Optional[str] = None,
+        condition_id: Optional[str] = None,
+        team: Optional[str] = None,
+        side: Optional[str] = None,
+        price: Optional[float] = None,
+        size: Optional[float] = None,
+        cost: Optional[float] = None,
+        expected_payout_per_1: Optional[float] = None,
+        status: Optional[str] = None,
+        order_id: Optional[str] = None,
+        data: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Buffer one executed trade. Never blocks on disk."""
+        row = (
+            _timestamp(ts), source, sport, market, market_slug or None, event_slug or None,
+            token_id or None, condition_id or None, team, side, _float_or_none(price),
+            _float_or_none(size), _float_or_none(cost), _float_or_none(expected_payout_per_1),
+            status or None, order_id or None, json.dumps(data or {}, default=str),
+        )
+        self._buffer(self._pending_trades, row)
+
+    def add_opportunity(
+        self,
+        *,
+        kind: str,
+        ts: Any = None,
+        event_slug: Optional[str] = None,
+        market_slug: Optional[str] = None,
+        token_id: Optional[str] = None,
+        outcome: Optional[str] = None,
+        line: Optional[float] = None,
+        true_prob: Optional[float] = None,
+        price: Optional[float] = None,
+        expected_payout_per_1: Optional[float] = None,
+        executed: Optional[bool] = None,
+        error: Optional[str] = None,
+        data: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Buffer one value bet opportunity (found, or attempted with `executed` set)."""
+        row = (
+            _timestamp(ts), kind, event_slug or None, market_slug or None, token_id or None, outcome,
+            _float_or_none(line), _float_or_none(true_prob), _float_or_none(price),
+            _float_or_none(expected_payout_per_1), None if executed is None else int(bool(executed)),
+            error or None, json.dumps(data or {}, default=str),
+        )
+        self._buffer(self._pending_opportunities, row)
+
+    def _buffer(self, pending: List[Tuple[Any, ...]], row: Tuple[Any, ...]) -> None:
+        with self._pending_lock:
+            pending.append(row)
+            size = len(self._pending_trades) + len(self._pending_opportunities)
+        if size >= self.BATCH_SIZE:
+            self._wake.set()
+
+    def flush(self) -> int:
+        """Write buffered rows in one transaction. Returns the number of rows written."""
+        # Held across swap and commit so a reader's flush never overtakes a batch in flight
+        with self._lock:
+            with self._conn:
+                return self._write_pending_locked()
+
+    def _write_pending_locked(self) -> int:
+        """Insert the buffered rows into the open transaction (caller holds _lock)."""
+        with self._pending_lock:
+            trades, self._pending_trades = self._pending_trades, []
+            opportunities, self._pending_opportunities = self._pending_opportunities, []
+        if trades:
+            counts: Dict[str, int] = {}
+            sport_counts: Dict[Tuple[str, str], int] = {}
+            for row in trades:
+                counts[row[1]] = counts.get(row[1], 0) + 1
+                key = (row[1], row[2] or "")
+                sport_counts[key] = sport_counts.get(key, 0) + 1
+            self._conn.executemany(
+                f"INSERT INTO trades ({', '.join(_TRADE_COLUMNS)}) "
+                f"VALUES ({', '.join('?' for _ in _TRADE_COLUMNS)})",
+                trades,
+            )
+            self._conn.executemany(
+                "INSERT INTO trade_counts (source, n) VALUES (?, ?) "
+                "ON CONFLICT(source) DO UPDATE SET n = n + excluded.n",
+                counts.items(),
+            )
+            self._conn.executemany(
+                "INSERT INTO sport_trade_counts (source, sport, n) VALUES (?, ?, ?) "
+                "ON CONFLICT(source, sport) DO UPDATE SET n = n + excluded.n",
+                [(source, sport, n) for (source, sport), n in sport_counts.items()],
+            )
+        if opportunities:
+            self._conn.executemany(
+                f"INSERT INTO opportunities ({', '.join(_OPPORTUNITY_COLUMNS)}) "
+                f"VALUES ({', '.join('?' for _ in _OPPORTUNITY_COLUMNS)})",
+                opportunities,
+            )
+        return len(trades) + len(opportunities)
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self._wake.wait(self.flush_interval_s)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                print(f"[WARNING] [TradeStore] Batch write failed: {e}")
+
+    # -- reads ------------------------------------------------------------------
+
+    def _query(self, sql: str, params: Tuple[Any, ...] = ()) -> List[Tuple[Any, ...]]:
+        self.flush()
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    def trade_count(self, source: Optional[str] = None, sport: Optional[str] = None) -> int:
+        """Trades recorded overall, for one source, or for one source's sport."""
+        if sport is not None:
+            if source is None:
+                rows = self._query("SELECT COALESCE(SUM(n), 0) FROM sport_trade_counts WHERE sport = ?", (sport,))
+            else:
+                rows = self._query(
+                    "SELECT n FROM sport_trade_counts WHERE source = ? AND sport = ?", (source, sport)
+                )
+        elif source is None:
+            rows = self._query("SELECT COALESCE(SUM(n), 0) FROM trade_counts")
+        else:
+            rows = self._query("SELECT n FROM trade_counts WHERE source = ?", (source,))
+        return int(rows[0][0]) if rows else 0
+
+    def has_traded(self, market_slug: str, team: Optional[str] = None) -> bool:
+        if team is None:
+            rows = self._query("SELECT 1 FROM trades WHERE market_slug = ? LIMIT 1", (market_slug,))
+        else:
+            rows = self._query(
+                "SELECT 1 FROM trades WHERE market_slug = ? AND team = ? LIMIT 1", (market_slug, team)
+            )
+        return bool(rows)
+
+    def trades_for_token(self, token_id: str) -> List[Dict[str, Any]]:
+        rows = self._query(
+            f"SELECT {', '.join(_TRADE_COLUMNS)} FROM trades WHERE token_id = ? ORDER BY ts", (token_id,)
+        )
+        return [dict(zip(_TRADE_COLUMNS, row)) for row in rows]
+
+    def trades_since(self, since_ts: float) -> List[Dict[str, Any]]:
+        rows = self._query(
+            f"SELECT {', '.join(_TRADE_COLUMNS)} FROM trades WHERE ts >= ? ORDER BY ts", (float(since_ts),)
+        )
+        return [dict(zip(_TRADE_COLUMNS, row)) for row in rows]
+
+    def opportunity_count(self, since_ts: Optional[float] = None) -> int:
+        if since_ts is None:
+            rows = self._query("SELECT COUNT(*) FROM opportunities")
+        else:
+            rows = self._query("SELECT COUNT(*) FROM opportunities WHERE ts >= ?", (float(since_ts),))
+        return int(rows[0][0])
+
+    # -- CSV import ---------------------------------------------------------------
+
+    @staticmethod
+    def _csv_kind(path: str, fieldnames: List[str]) -> Optional[str]:
+        fields = set(fieldnames)
+        if "size_filled" in fields:
+            return "trades"
+        if "bet_time" in fields:
+            return "successful_trades"
+        if "executed" in fields and "timestamp" in fields:
+            name = os.path.splitext(os.path.basename(path))[0]
+            market = name[len("attempted_value_bets_"):] if name.startswith("attempted_value_bets_") else "unknown"
+            return f"attempted_{market}"
+        if "ev_percent" in fields:
+            return "value_bet"
+        return None
+
+    def _import_row(self, kind: str, row: Dict[str, str]) -> None:
+        if kind == "trades":
+            self.add_trade(
+                source="value_bets",
+                ts=row.get("ts"),
+                event_slug=row.get("event_slug"),
+                token_id=row.get("token_id"),
+                condition_id=row.get("condition_id"),
+                team=row.get("team"),
+                side=row.get("side"),
+                price=row.get("price"),
+                size=row.get("size_filled") or row.get("size_requested"),
+                cost=row.get("amount"),
+                expected_payout_per_1=row.get("expected_payout_per_$1"),
+                status=row.get("status"),
+                order_id=row.get("order_id"),
+                data=row,
+            )
+        elif kind == "successful_trades":
+            self.add_trade(
+                source="value_bets_new",
+                ts=row.get("bet_time"),
+                sport=row.get("sport"),
+                market=row.get("market"),
+                market_slug=row.get("market_slug"),
+                token_id=row.get("token_id"),
+                condition_id=row.get("condition_id"),
+                team=row.get("team"),
+                side="BUY",
+                price=row.get("price"),
+                size=row.get("tokens"),
+                cost=row.get("bet_amount") or row.get("cost_usd"),
+                expected_payout_per_1=row.get("ev") or row.get("expected_payout_per_1"),
+                data=row,
+            )
+        elif kind == "value_bet":
+            price = _float_or_none(row.get("polymarket_odds"))
+            true_prob = _float_or_none(row.get("sportsbook_prob"))
+            self.add_opportunity(
+                kind=kind,
+                ts=row.get("date"),
+                event_slug=row.get("event_slug"),
+                market_slug=row.get("market_slug"),
+                outcome=row.get("outcome"),
+                true_prob=true_prob,
+                price=price,
+                expected_payout_per_1=(true_prob / price) if price and true_prob is not None else None,
+                data=row,
+            )
+        else:
+            self.add_opportunity(
+                kind=kind,
+                ts=row.get("timestamp"),
+                event_slug=row.get("event_slug"),
+                market_slug=row.get("market_slug"),
+                token_id=row.get("token_id"),
+                outcome=row.get("outcome"),
+                line=row.get("line"),
+                true_prob=row.get("true_prob"),
+                price=row.get("polymarket_ask"),
+                expected_payout_per_1=row.get("expected_payout_per_1"),
+                executed=(row.get("executed") == "YES"),
+                error=row.get("error"),
+                data=row,
+            )
+
+    def import_csv(self, path: str) -> int:
+        """
+        Import one of the legacy CSV logs (kind detected from its header).
+
+        The logs are append-only: a file that grew since its last import only has
+        its new rows imported. Returns rows imported; 0 if nothing was appended.
+        """
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+        previous = self._query("SELECT size, mtime, rows FROM imported_files WHERE path = ?", (path,))
+        already_imported = 0
+        if previous:
+            size, mtime, already_imported = previous[0]
+            if size == stat.st_size and mtime == stat.st_mtime:
+                return 0
+            if stat.st_size < size:
+                raise ValueError(f"{path} shrank since it was imported ({size} -> {stat.st_size} bytes); not re-importing")
+        with open(path, "r", encoding="utf-8", newline="") as f:
+            reader = csv.DictReader(f)
+            kind = self._csv_kind(path, list(reader.fieldnames or []))
+            if kind is None:
+                raise ValueError(f"Unrecognized CSV layout: {path}")
+            # Rows and the imported_files record commit together, so a crash can't re-import the file
+            with self._lock:
+                count = 0
+                for index, row in enumerate(reader):
+                    if index < already_imported:
+                        continue
+                    self._import_row(kind, row)
+                    count += 1
+                with self._conn:
+                    self._write_pending_locked()
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO imported_files (path, size, mtime, kind, rows, imported_at) "
+                        "VALUES (?, ?, ?, ?, ?, ?)",
+                        (path, stat.st_size, stat.st_mtime, kind, already_imported + count, time.time()),
+                    )
+        return count
+
+    def close(self) -> None:
+        self._stop.set()
+        self._wake.set()
+        self._thread.join(timeout=5.0)
+        self.flush()
+        with self._lock:
+            self._conn.close()
+
+
+_default_store: Optional[TradeStore] = None
+_default_store_lock = threading.Lock()
+
+
+def default_trade_store() -> TradeStore:
+    """Process-wide store at DEFAULT_DB_PATH (opened on first use, flushed and closed at exit)."""
+    global _default_store
+    with _default_store_lock:
+        if _default_store is None:
+            _default_store = TradeStore(DEFAULT_DB_PATH)
+            atexit.register(_default_store.close)
+        return _default_store
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Trade/opportunity store utilities")
+    sub = parser.add_subparsers(dest="command", required=True)
+    import_parser = sub.add_parser("import", help="Import legacy CSV logs")
+    import_parser.add_argument("paths", nargs="+")
+    import_parser.add_argument("--db", default=DEFAULT_DB_PATH)
+    args = parser.parse_args()
+
+    store = TradeStore(args.db)
+    try:
+        for path in args.paths:
+            try:
+                count = store.import_csv(path)
+            except (OSError, ValueError) as e:
+                print(f"[WARNING] Skipped {path}: {e}")
+                continue
+            print(f"{path}: {count} rows imported")
+        print(f"trades: {store.trade_count()}, opportunities: {store.opportunity_count()}")
+    finally:
+        store.close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -6,10 +6,11 @@ Shared helper functions for value betting bots.
 from datetime import datetime, date, timezone
 from typing import List, Tuple, Dict, Optional, Any, Union
 import sys
-import os
 import re
+import threading
+import time
 import requests
-import csv
+from concurrent.futures import ThreadPoolExecutor
 from polymarket_sports_betting_bot.value_bet_service import ValueBet, SpreadValueBet, TotalsValueBet
 
 from polymarket_odds_service.polymarket_odds import (
@@ -17,19 +18,9 @@ from polymarket_odds_service.polymarket_odds import (
     PolymarketMarketExtractor,
     PolymarketOdds,
 )
-
-
-def _get_log_file_path(market_type: str) -> str:
-    """Get the path to the log file for a specific market type."""
-    value_bets_root = os.path.dirname(os.path.abspath(__file__))
-    filename = f"attempted_value_bets_{market_type}.csv"
-    return os.path.join(value_bets_root, filename)
-
-
-def _get_value_bets_csv_path() -> str:
-    """Get the path to the value_bets.csv file."""
-    value_bets_root = os.path.dirname(os.path.abspath(__file__))
-    return os.path.join(value_bets_root, "value_bets.csv")
+from pinnacle_scraper.match_store import MatchStore
+from pinnacle_scraper.team_name_index import TeamNameIndex, alias_team_match
+from trade_store import default_trade_store
 
 
 def _sanitize_error_message(error: Optional[str]) -> Optional[str]:
@@ -65,8 +56,8 @@ def _sanitize_error_message(error: Optional[str]) -> Optional[str]:
     return error.strip()[:200]
 
 
-def _log_value_bet_to_file(
-    path: str,
+def _log_value_bet_to_store(
+    kind: str,
     value_bet: Union[ValueBet, SpreadValueBet, TotalsValueBet, Any],
     away_team: str,
     home_team: str,
@@ -79,8 +70,7 @@ def _log_value_bet_to_file(
     prop_type: Optional[str],
     player_name: Optional[str],
 ) -> None:
-    """Helper function to write a value bet to a CSV file."""
-    file_exists = os.path.exists(path)
+    """Helper function to record an attempted value bet in the trade store."""
     timestamp = datetime.now().isoformat()
     
     # Sanitize error message to prevent exceptions from being logged
@@ -105,19 +95,22 @@ def _log_value_bet_to_file(
         'error': sanitized_error or '',
     }
     
-    fieldnames = [
-        'timestamp', 'event_slug', 'market_slug',
-        'away_team', 'home_team', 'outcome', 'player_name', 'prop_type', 'line',
-        'true_prob', 'polymarket_ask', 'expected_payout_per_1', 'edge_pct',
-        'token_id', 'executed', 'error'
-    ]
-    
     try:
-        with open(path, 'a', encoding='utf-8', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            if not file_exists:
-                writer.writeheader()
-            writer.writerow(row)
+        default_trade_store().add_opportunity(
+            kind=kind,
+            ts=timestamp,
+            event_slug=event_slug,
+            market_slug=market_slug,
+            token_id=value_bet.token_id,
+            outcome=str(outcome),
+            line=line,
+            true_prob=value_bet.true_prob,
+            price=value_bet.polymarket_best_ask,
+            expected_payout_per_1=value_bet.expected_payout_per_1,
+            executed=executed,
+            error=sanitized_error,
+            data=row,
+        )
     except Exception as e:
         print(f"[WARNING] Failed to log attempted value bet: {e}")
 
@@ -131,10 +124,9 @@ def log_attempted_moneyline_bet(
     executed: bool = False,
     error: Optional[str] = None,
 ) -> None:
-    """Log an attempted moneyline value bet to attempted_value_bets_moneyline.csv."""
-    path = _get_log_file_path('moneyline')
-    _log_value_bet_to_file(
-        path=path,
+    """Log an attempted moneyline value bet in the trade store."""
+    _log_value_bet_to_store(
+        kind='attempted_moneyline',
         value_bet=value_bet,
         away_team=away_team,
         home_team=home_team,
@@ -158,10 +150,9 @@ def log_attempted_spread_bet(
     executed: bool = False,
     error: Optional[str] = None,
 ) -> None:
-    """Log an attempted spread value bet to attempted_value_bets_spreads.csv."""
-    path = _get_log_file_path('spreads')
-    _log_value_bet_to_file(
-        path=path,
+    """Log an attempted spread value bet in the trade store."""
+    _log_value_bet_to_store(
+        kind='attempted_spreads',
         value_bet=value_bet,
         away_team=away_team,
         home_team=home_team,
@@ -185,10 +176,9 @@ def log_attempted_totals_bet(
     executed: bool = False,
     error: Optional[str] = None,
 ) -> None:
-    """Log an attempted totals value bet to attempted_value_bets_totals.csv."""
-    path = _get_log_file_path('totals')
-    _log_value_bet_to_file(
-        path=path,
+    """Log an attempted totals value bet in the trade store."""
+    _log_value_bet_to_store(
+        kind='attempted_totals',
         value_bet=value_bet,
         away_team=away_team,
         home_team=home_team,
@@ -214,7 +204,7 @@ def log_value_bet(
     market_slug: str,
 ) -> None:
     """
-    Log a value bet to value_bets.csv.
+    Record a value bet in the trade store.
     
     This logs all value bets found, regardless of whether they were executed.
     
@@ -226,9 +216,6 @@ def log_value_bet(
         event_slug: Polymarket event slug
         market_slug: Polymarket market slug
     """
-    path = _get_value_bets_csv_path()
-    file_exists = os.path.exists(path)
-    
     # Extract outcome based on value bet type
     if isinstance(value_bet, ValueBet):
         outcome = value_bet.team
@@ -264,17 +251,18 @@ def log_value_bet(
         'ev_percent': f"{ev_percent:.2f}",
     }
     
-    fieldnames = [
-        'event_name', 'outcome', 'date', 'event_slug', 'market_slug',
-        'polymarket_odds', 'sportsbook_prob', 'ev_percent'
-    ]
-    
     try:
-        with open(path, 'a', encoding='utf-8', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            if not file_exists:
-                writer.writeheader()
-            writer.writerow(row)
+        default_trade_store().add_opportunity(
+            kind='value_bet',
+            event_slug=event_slug,
+            market_slug=market_slug,
+            token_id=value_bet.token_id,
+            outcome=outcome,
+            true_prob=value_bet.true_prob,
+            price=value_bet.polymarket_best_ask,
+            expected_payout_per_1=value_bet.expected_payout_per_1,
+            data=row,
+        )
     except Exception as e:
         print(f"[WARNING] Failed to log value bet: {e}")
 
@@ -482,6 +470,79 @@ def is_slug_basketball(slug_lower: str, include_nba: bool = True, include_ncaa:
     return is_basketball
 
 
+# Gamma listing pages fetched concurrently per wave
+_EVENT_PAGE_WAVE_SIZE = 5
+# Attempts per listing page before the scan fails (1s, 2s backoff in between)
+_EVENT_PAGE_ATTEMPTS = 3
+# Statuses worth another attempt; any other error status fails the scan at once
+_EVENT_PAGE_RETRY_STATUSES = (408, 425, 429, 500, 502, 503, 504)
+
+
+def _iter_active_event_pages(
+    finder: PolymarketGameFinder,
+    *,
+    stop_before_local_date: date,
+    max_pages: int = 100,
+    page_size: int = 100,
+):
+    """
+    Yield pages of active events (startTime descending), fetched in concurrent waves.
+
+    Stops after the first page that reaches an event whose local start date is before
+    stop_before_local_date, since every later page is earlier still. A page that
+    still fails after retries raises `requests.RequestException` instead of being
+    taken for the end of the listing, so a scan is never silently truncated.
+    """
+    # requests.Session is not thread-safe: one per pool worker
+    local = threading.local()
+    sessions: List[requests.Session] = []
+    sessions_lock = threading.Lock()
+
+    def _session() -> requests.Session:
+        session = getattr(local, "session", None)
+        if session is None:
+            session = local.session = requests.Session()
+            with sessions_lock:
+                sessions.append(session)
+        return session
+
+    def _fetch(page: int) -> List[Dict[str, Any]]:
+        for attempt in range(_EVENT_PAGE_ATTEMPTS):
+            try:
+                return finder.request_events_page(
+                    limit=page_size,
+                    offset=page * page_size,
+                    active=True,
+                    closed=False,
+                    order="startTime",
+                    ascending=False,
+                    session=_session(),
+                )
+            except requests.exceptions.RequestException as e:
+                status = getattr(e.response, "status_code", None)
+                if attempt >= _EVENT_PAGE_ATTEMPTS - 1 or (status is not None and status not in _EVENT_PAGE_RETRY_STATUSES):
+                    raise
+                time.sleep(2 ** attempt)
+        return []
+
+    try:
+        with ThreadPoolExecutor(max_workers=_EVENT_PAGE_WAVE_SIZE) as pool:
+            for wave_start in range(0, max_pages, _EVENT_PAGE_WAVE_SIZE):
+                wave = range(wave_start, min(wave_start + _EVENT_PAGE_WAVE_SIZE, max_pages))
+                for events in pool.map(_fetch, wave):
+                    if not events:
+                        return
+                    yield events
+                    for event in events:
+                        # Same parse as the date filter (startTime, falling back to startDate)
+                        start = finder._parse_start_time(event)
+                        if start is not None and start.astimezone().date() < stop_before_local_date:
+                            return
+    finally:
+        for session in sessions:
+            session.close()
+
+
 def fetch_polymarket_events_for_date(
     target_date: date,
     whitelisted_prefixes: Optional[List[str]] = None,
@@ -510,18 +571,7 @@ def fetch_polymarket_events_for_date(
     # Fetch events pages (active only; do not search inactive events)
     if verbose:
         print(f"  Searching active events...")
-    for page in range(100):  # Search up to 100 pages
-        events = finder.fetch_events_page(
-            limit=100,
-            offset=page * 100,
-            active=True,
-            closed=False,
-            order="startTime",
-            ascending=False,
-        )
-        if not events:
-            break
-
+    for events in _iter_active_event_pages(finder, stop_before_local_date=target_date):
         for event in events:
             # Check if event is on target date
             start = finder._parse_start_time(event)
@@ -688,6 +738,7 @@ def match_games_and_fetch_markets(
     polymarket_events: List[Tuple[str, str, str]],
     pinnacle_games: List,
     verbose: bool = False,
+    match_store: Optional[MatchStore] = None,
 ) -> Tuple[List[Tuple[str, str, str, object]], Dict[str, Dict[str, List[str]]]]:
     """
     Match Polymarket events with Pinnacle games by team names, and fetch market slugs for matched events.
@@ -696,6 +747,8 @@ def match_games_and_fetch_markets(
         polymarket_events: List of (event_slug, away_team, home_team) tuples
         pinnacle_games: List of Pinnacle GameInfo objects
         verbose: If True, print detailed logs about fetching events
+        match_store: Persistent event_slug -> matchup_id store, consulted before
+            fuzzy matching and updated with new matches
     
     Returns:
         Tuple of:
@@ -709,51 +762,64 @@ def match_games_and_fetch_markets(
     matched = []
     market_slugs_map = {}
     odds_service = PolymarketOdds()
+    index = TeamNameIndex(pinnacle_games)
+    games_by_matchup_id = {getattr(g, "matchup_id", None): g for g in pinnacle_games}
 
     for event_slug, pm_away, pm_home in polymarket_events:
         if verbose:
             print(f"  [MATCH] Trying to match Polymarket: {pm_away} @ {pm_home}")
-        # Try to find matching Pinnacle game
-        for pinnacle_game in pinnacle_games:
-            pin_away = pinnacle_game.away_team
-            pin_home = pinnacle_game.home_team
-            
-            if not pin_away or not pin_home:
-                continue
-            
-            # Use strict game matching that ensures both teams match together
-            game_matches = games_match(pm_away, pm_home, pin_away, pin_home)
-            
-            if verbose and not game_matches:
-                # Only print first few non-matches to avoid spam
-                if len([g for g in pinnacle_games if g == pinnacle_game]) <= 3:
-                    print(f"    [NO MATCH] vs Pinnacle: {pin_away} @ {pin_home}")
-                    print(f"      pm_away vs pin_away: {teams_match_strict(pm_away, pin_away)}")
-                    print(f"      pm_home vs pin_home: {teams_match_strict(pm_home, pin_home)}")
-                    print(f"      pm_away vs pin_home: {teams_match_strict(pm_away, pin_home)}")
-                    print(f"      pm_home vs pin_away: {teams_match_strict(pm_home, pin_away)}")
-            
-            if game_matches:
+        pinnacle_game = None
+        stored = match_store.get(event_slug) if match_store is not None else None
+        if stored is not None:
+            pinnacle_game = games_by_matchup_id.get(stored.matchup_id)
+            if pinnacle_game is not None:
+                pin_a, pin_b = stored.oriented(pinnacle_game.away_team, pinnacle_game.home_team)
+                # Alias-aware, like the index lookup that stored it
+                if not (
+                    alias_team_match(pm_away, pin_a, teams_match_strict)
+                    and alias_team_match(pm_home, pin_b, teams_match_strict)
+                ):
+                    # The matchup now lists other teams: drop it and match again
+                    if verbose:
+                        print(f"    [STALE MATCH] matchup_id={stored.matchup_id}: {pinnacle_game.away_team} @ {pinnacle_game.home_team}")
+                    match_store.delete(event_slug)
+                    pinnacle_game = None
+                elif verbose:
+                    print(f"    [STORED MATCH] matchup_id={stored.matchup_id}")
+        if pinnacle_game is None:
+            # Only Pinnacle games sharing a name token with the Polymarket teams are compared
+            found = index.find_match(pm_away, pm_home, games_match)
+            if found is None:
                 if verbose:
-                    print(f"    [MATCH FOUND!] Pinnacle: {pin_away} @ {pin_home}")
-                # Use Pinnacle team names and include the full Pinnacle game object
-                matched.append((event_slug, pin_away, pin_home, pinnacle_game))
-                
-                # Fetch event data temporarily to extract market slugs
-                try:
-                    event = odds_service.fetch_event_by_slug(event_slug)
-                    if event:
-                        markets = {
-                            "moneyline": [event_slug],
-                            "spreads": PolymarketMarketExtractor.spread_market_slugs_from_event(event),
-                            "totals": PolymarketMarketExtractor.totals_market_slugs_from_event(event),
-                            "totals_games": PolymarketMarketExtractor.totals_games_market_slugs_from_event(event),
-                            "totals_sets": PolymarketMarketExtractor.totals_sets_market_slugs_from_event(event),
-                        }
-                        market_slugs_map[event_slug] = markets
-                except Exception:
-                    pass
-                break
+                    print(f"    [NO MATCH] among {len(index.candidates(pm_away, pm_home))} candidate Pinnacle games")
+                continue
+            pinnacle_game = found.game
+            if match_store is not None and getattr(pinnacle_game, "matchup_id", None) is not None:
+                match_store.put(
+                    event_slug, pinnacle_game.matchup_id, swapped=found.swapped, confidence=found.confidence
+                )
+
+        pin_away = pinnacle_game.away_team
+        pin_home = pinnacle_game.home_team
+        if verbose:
+            print(f"    [MATCH FOUND!] Pinnacle: {pin_away} @ {pin_home}")
+        # Use Pinnacle team names and include the full Pinnacle game object
+        matched.append((event_slug, pin_away, pin_home, pinnacle_game))
+
+        # Fetch event data temporarily to extract market slugs
+        try:
+            event = odds_service.fetch_event_by_slug(event_slug)
+            if event:
+                markets = {
+                    "moneyline": [event_slug],
+                    "spreads": PolymarketMarketExtractor.spread_market_slugs_from_event(event),
+                    "totals": PolymarketMarketExtractor.totals_market_slugs_from_event(event),
+                    "totals_games": PolymarketMarketExtractor.totals_games_market_slugs_from_event(event),
+                    "totals_sets": PolymarketMarketExtractor.totals_sets_market_slugs_from_event(event),
+                }
+                market_slugs_map[event_slug] = markets
+        except Exception:
+            pass
     
     return matched, market_slugs_map
 
@@ -763,6 +829,7 @@ def match_games(
     polymarket_events: List[Tuple[str, str, str]],
     pinnacle_games: List,
     verbose: bool = False,
+    match_store: Optional[MatchStore] = None,
 ) -> List[Tuple[str, str, str, object]]:
     """
     Match Polymarket events with Pinnacle games by team names (backwards-compatible).
@@ -771,5 +838,7 @@ def match_games(
     Returns:
         List of (event_slug, away_team, home_team, pinnacle_game) tuples for matched games.
     """
-    matched, _ = match_games_and_fetch_markets(polymarket_events, pinnacle_games, verbose=verbose)
+    matched, _ = match_games_and_fetch_markets(
+        polymarket_events, pinnacle_games, verbose=verbose, match_store=match_store
+    )
     return matched
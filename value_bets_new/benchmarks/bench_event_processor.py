@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Benchmark: scalar vs batch value bet evaluation in EventProcessor.
+
+Builds a synthetic cycle of (team, MarketOdds, SportsbookOdds) candidates, checks
+that `process_two_outcome_events` accepts exactly what the scalar
+`process_two_outcome_event` loop accepts, then times both paths.
+
+Usage:
+    python3 bench_event_processor.py
+    python3 bench_event_processor.py --candidates 5000 --repeat 5
+"""
+
+import sys
+import os
+import argparse
+import random
+import time
+from typing import List, Tuple
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from value_bets_new.constants import MarketOdds, SportsbookOdds, ValueBet
+from value_bets_new.event_processor import EventProcessor
+
+
+TEAMS = [
+    ("Boston Celtics", "Miami Heat"),
+    ("Los Angeles Lakers", "Golden State Warriors"),
+    ("New York Knicks", "Brooklyn Nets"),
+    ("Denver Nuggets", "Phoenix Suns"),
+    ("Dallas Mavericks", "Houston Rockets"),
+]
+
+Candidate = Tuple[str, MarketOdds, SportsbookOdds]
+
+
+def build_candidates(n: int, seed: int = 7) -> List[Candidate]:
+    """Two Polymarket outcomes per game, both priced against the same Pinnacle pair."""
+    rng = random.Random(seed)
+    candidates: List[Candidate] = []
+    while len(candidates) < n:
+        away, home = rng.choice(TEAMS)
+        q_away = rng.uniform(0.15, 0.85)
+        q_home = 1.04 - q_away
+        sportsbook_odds = SportsbookOdds(
+            outcome_1=away,
+            outcome_2=home,
+            outcome_1_cost_to_win_1=q_away,
+            outcome_2_cost_to_win_1=q_home,
+        )
+        for team, q in ((away.split()[-1], q_away), (home.split()[-1], q_home)):
+            # Polymarket asks scattered around the devigged price
+            best_ask = round(min(0.99, max(0.01, q / 1.04 + rng.uniform(-0.06, 0.04))), 2)
+            market_odds = MarketOdds(
+                token_id=f"token-{len(candidates)}",
+                team_name=team,
+                best_bid=best_ask - 0.01,
+                bid_volume=100.0,
+                best_ask=best_ask,
+                ask_volume=100.0,
+                spread=0.01,
+            )
+            candidates.append((team, market_odds, sportsbook_odds))
+    return candidates[:n]
+
+
+def run_scalar(processor: EventProcessor, candidates: List[Candidate]) -> List[ValueBet]:
+    out: List[ValueBet] = []
+    for team, market_odds, sportsbook_odds in candidates:
+        value_bet = processor.process_two_outcome_event(team, market_odds, sportsbook_odds)
+        if value_bet is not None:
+            out.append(value_bet)
+    return out
+
+
+def run_batch(processor: EventProcessor, candidates: List[Candidate]) -> List[ValueBet]:
+    return processor.process_two_outcome_events(candidates)
+
+
+def time_best_of(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark EventProcessor scalar vs batch evaluation")
+    parser.add_argument("--candidates", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    processor = EventProcessor()
+    candidates = build_candidates(args.candidates)
+
+    # Logging is left unconfigured, so both paths' debug lines stop at the level check.
+    scalar_bets = run_scalar(processor, candidates)
+    batch_bets = run_batch(processor, candidates)
+    if [(b.token_id, round(b.expected_payout_per_1, 12)) for b in scalar_bets] != [
+        (b.token_id, round(b.expected_payout_per_1, 12)) for b in batch_bets
+    ]:
+        print("MISMATCH between scalar and batch results")
+        return 1
+
+    scalar_s = time_best_of(lambda: run_scalar(processor, candidates), args.repeat)
+    batch_s = time_best_of(lambda: run_batch(processor, candidates), args.repeat)
+
+    print(f"candidates: {len(candidates)}, accepted: {len(batch_bets)}")
+    print(f"scalar: {scalar_s * 1000:.2f} ms ({len(candidates) / scalar_s:,.0f} candidates/s)")
+    print(f"batch:  {batch_s * 1000:.2f} ms ({len(candidates) / batch_s:,.0f} candidates/s)")
+    print(f"speedup: {scalar_s / batch_s:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,355 @@
+#!/usr/bin/env python3
+"""
+Deterministic fixtures for the benchmarks, shaped like the live payloads:
+
+- Arcadia matchups feed (`/sports/{id}/matchups`): one item per game plus the
+  special/prop items the feed carries alongside them
+- Arcadia straight markets (`/matchups/{id}/markets/related/straight`): moneyline,
+  spread and total markets for every period, main and alternate lines
+- Gamma events (`/events`): NBA and ATP events with their moneyline, spread,
+  totals, first-half and tennis set/game markets
+
+Everything is generated from a seed, so runs and baselines compare like for like.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from value_bets.pinnacle_scraper.pinnacle_odds_scraper import ARCADIA_API_BASE
+
+
+FIXTURE_START = datetime(2026, 1, 25, 0, 30, tzinfo=timezone.utc)
+
+NBA_TEAMS: List[Tuple[str, str]] = [
+    ("Boston Celtics", "bos"),
+    ("Miami Heat", "mia"),
+    ("Los Angeles Lakers", "lal"),
+    ("Golden State Warriors", "gsw"),
+    ("New York Knicks", "nyk"),
+    ("Brooklyn Nets", "bkn"),
+    ("Denver Nuggets", "den"),
+    ("Phoenix Suns", "phx"),
+    ("Dallas Mavericks", "dal"),
+    ("Houston Rockets", "hou"),
+    ("Milwaukee Bucks", "mil"),
+    ("Philadelphia 76ers", "phi"),
+    ("Los Angeles Clippers", "lac"),
+    ("Sacramento Kings", "sac"),
+    ("Oklahoma City Thunder", "okc"),
+    ("Minnesota Timberwolves", "min"),
+    ("Cleveland Cavaliers", "cle"),
+    ("Orlando Magic", "orl"),
+    ("Memphis Grizzlies", "mem"),
+    ("New Orleans Pelicans", "nop"),
+]
+
+NCAA_TEAMS: List[str] = [
+    "Gonzaga Bulldogs", "Georgia Bulldogs", "Duke Blue Devils", "North Carolina Tar Heels",
+    "Kansas Jayhawks", "Kansas State Wildcats", "Kentucky Wildcats", "Arizona Wildcats",
+    "Michigan Wolverines", "Michigan State Spartans", "San Diego State Aztecs", "Iowa State Cyclones",
+]
+
+# (Polymarket name, Pinnacle name) pairs the matcher sees every cycle: true matches and
+# near misses that share a location or nickname
+TEAM_NAME_PAIRS: List[Tuple[str, str]] = [
+    ("Celtics", "Boston Celtics"),
+    ("Heat", "Miami Heat"),
+    ("Lakers", "Los Angeles Lakers"),
+    ("Lakers", "Los Angeles Clippers"),
+    ("Warriors", "Golden State Warriors"),
+    ("76ers", "Philadelphia 76ers"),
+    ("Timberwolves", "Minnesota Timberwolves"),
+    ("Thunder", "Oklahoma City Thunder"),
+    ("Gonzaga Bulldogs", "Gonzaga"),
+    ("Gonzaga Bulldogs", "Georgia Bulldogs"),
+    ("Kansas St. Wildcats", "Kansas State"),
+    ("Kentucky Wildcats", "Arizona Wildcats"),
+    ("Michigan St.", "Michigan State Spartans"),
+    ("Dinamo Minsk", "Yunost Minsk"),
+    ("Carlos Alcaraz", "Alcaraz C."),
+    ("Jannik Sinner", "Novak Djokovic"),
+]
+
+ATP_PLAYERS: List[Tuple[str, str]] = [
+    ("Jannik Sinner", "sinner"),
+    ("Carlos Alcaraz", "alcaraz"),
+    ("Novak Djokovic", "djokovic"),
+    ("Alexander Zverev", "zverev"),
+    ("Taylor Fritz", "fritz"),
+    ("Daniil Medvedev", "medvedev"),
+]
+
+
+def _american(rng: random.Random, fair: float, vig: float = 0.025) -> int:
+    """American price for a side with probability `fair`, plus a bookmaker margin."""
+    p = min(0.97, max(0.03, fair * (1 + vig)))
+    if p >= 0.5:
+        return -int(round(100 * p / (1 - p)))
+    return int(round(100 * (1 - p) / p))
+
+
+def arcadia_matchups_feed(
+    n_games: int = 120,
+    *,
+    seed: int = 11,
+    start: datetime = FIXTURE_START,
+    days: int = 4,
+) -> List[Dict[str, Any]]:
+    """
+    A basketball matchups feed: NBA and NCAA games spread over `days` days, each
+    followed by a few special items (props with a parent) like the live feed.
+    """
+    rng = random.Random(seed)
+    names = [name for name, _ in NBA_TEAMS]
+    feed: List[Dict[str, Any]] = []
+    for i in range(n_games):
+        nba = i % 3 != 2
+        pool = names if nba else NCAA_TEAMS
+        away, home = rng.sample(pool, 2)
+        start_time = start + timedelta(minutes=rng.randrange(0, days * 24 * 60, 30))
+        matchup_id = 1_600_000_000 + i * 7
+        feed.append({
+            "id": matchup_id,
+            "type": "matchup",
+            "isLive": False,
+            "startTime": start_time.strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "league": {"id": 487 if nba else 493, "name": "NBA" if nba else "NCAA", "sport": {"id": 4, "name": "Basketball"}},
+            "participants": [
+                {"alignment": "away", "name": away, "order": 0},
+                {"alignment": "home", "name": home, "order": 1},
+            ],
+            "periods": [{"period": p, "status": 1} for p in (0, 1, 3)],
+            "status": "pending",
+        })
+        for k in range(rng.randint(1, 4)):
+            feed.append({
+                "id": matchup_id + k + 1,
+                "type": "special",
+                "parentId": matchup_id,
+                "startTime": start_time.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                "league": {"id": 487, "name": "NBA"},
+                "participants": [
+                    {"alignment": "neutral", "name": "Over", "order": 0},
+                    {"alignment": "neutral", "name": "Under", "order": 1},
+                ],
+                "special": {"category": "Player Props", "description": f"Prop {k}"},
+            })
+    return feed
+
+
+def arcadia_straight_markets(matchup_id: int, *, seed: int = 13) -> List[Dict[str, Any]]:
+    """
+    Straight markets for one NBA game: moneyline/spread/total for full game,
+    halves and quarters, with the alternate spread and total ladders.
+    """
+    rng = random.Random(seed + matchup_id)
+    p_home = rng.uniform(0.3, 0.75)
+    spread = round((p_home - 0.5) * 28 * 2) / 2 + 0.5
+    total = round(rng.uniform(205, 240)) + 0.5
+    markets: List[Dict[str, Any]] = []
+    for period, scale in ((0, 1.0), (1, 0.5), (2, 0.5), (3, 0.25), (4, 0.25), (5, 0.25), (6, 0.25)):
+        key = f"s;{period}"
+        markets.append({
+            "matchupId": matchup_id, "key": f"{key};m", "type": "moneyline", "period": period,
+            "status": "open", "cutoffAt": FIXTURE_START.isoformat(),
+            "prices": [
+                {"designation": "home", "price": _american(rng, p_home)},
+                {"designation": "away", "price": _american(rng, 1 - p_home)},
+            ],
+        })
+        ladder = [0.0] if period else [-3.0, -2.0, -1.0, 0.0, 1.0, 2.0, 3.0]
+        for offset in ladder:
+            pts = round(spread * scale * 2) / 2 + offset
+            if pts == int(pts):
+                pts += 0.5
+            markets.append({
+                "matchupId": matchup_id, "key": f"{key};s;{pts}", "type": "spread", "period": period,
+                "isAlternate": offset != 0.0, "status": "open",
+                "prices": [
+                    {"designation": "home", "points": -pts, "price": _american(rng, 0.5 - offset * 0.03)},
+                    {"designation": "away", "points": pts, "price": _american(rng, 0.5 + offset * 0.03)},
+                ],
+            })
+        for offset in ladder:
+            pts = round(total * scale * 2) / 2 + offset * 2
+            if pts == int(pts):
+                pts += 0.5
+            markets.append({
+                "matchupId": matchup_id, "key": f"{key};ou;{pts}", "type": "total", "period": period,
+                "isAlternate": offset != 0.0, "status": "open",
+                "prices": [
+                    {"designation": "over", "points": pts, "price": _american(rng, 0.5 - offset * 0.04)},
+                    {"designation": "under", "points": pts, "price": _american(rng, 0.5 + offset * 0.04)},
+                ],
+            })
+        markets.append({
+            "matchupId": matchup_id, "key": f"{key};tt;home", "type": "team_total", "period": period,
+            "status": "open",
+            "prices": [
+                {"designation": "over", "points": round(total * scale / 2) + 0.5, "price": -110},
+                {"designation": "under", "points": round(total * scale / 2) + 0.5, "price": -110},
+            ],
+        })
+    # The live endpoint doesn't order main before alternate markets
+    rng.shuffle(markets)
+    return markets
+
+
+def first_local_date(feed: List[Dict[str, Any]]) -> date:
+    """Local date of the first game in the feed (the date the lookups ask for)."""
+    start = datetime.strptime(feed[0]["startTime"], "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=timezone.utc)
+    return start.astimezone().date()
+
+
+def _gamma_market(
+    slug: str,
+    question: str,
+    outcomes: List[str],
+    *,
+    sports_market_type: str,
+    line: Optional[float] = None,
+    rng: random.Random,
+) -> Dict[str, Any]:
+    ask = round(rng.uniform(0.2, 0.8), 2)
+    market: Dict[str, Any] = {
+        "id": str(rng.randrange(500_000, 900_000)),
+        "question": question,
+        "conditionId": "0x" + "".join(rng.choice("0123456789abcdef") for _ in range(64)),
+        "slug": slug,
+        "outcomes": json.dumps(outcomes),
+        "outcomePrices": json.dumps([str(ask), str(round(1 - ask, 2))]),
+        "clobTokenIds": json.dumps([str(rng.getrandbits(250)) for _ in outcomes]),
+        "sportsMarketType": sports_market_type,
+        "active": True,
+        "closed": False,
+        "acceptingOrders": True,
+        "bestBid": round(ask - 0.01, 2),
+        "bestAsk": ask,
+        "volume": str(round(rng.uniform(1_000, 400_000), 2)),
+        "liquidity": str(round(rng.uniform(500, 60_000), 2)),
+    }
+    if line is not None:
+        market["line"] = line
+    return market
+
+
+def gamma_nba_event(index: int = 0, *, seed: int = 17) -> Dict[str, Any]:
+    """An NBA game event with full-game and first-half moneyline/spread/total ladders."""
+    rng = random.Random(seed + index)
+    (away, away_abbr), (home, home_abbr) = rng.sample(NBA_TEAMS, 2)
+    day = (FIXTURE_START + timedelta(days=index % 4)).date().isoformat()
+    base = f"nba-{away_abbr}-{home_abbr}-{day}"
+    away_short, home_short = away.split()[-1], home.split()[-1]
+    markets = [_gamma_market(base, f"{away_short} vs. {home_short}", [away_short, home_short], sports_market_type="moneyline", rng=rng)]
+    for pts in (1.5, 2.5, 3.5, 4.5, 5.5, 6.5, 7.5, 8.5):
+        for side, team in (("home", home_short), ("away", away_short)):
+            markets.append(_gamma_market(
+                f"{base}-spread-{side}-{int(pts)}pt5",
+                f"Spread: {team} (-{pts})",
+                [team, away_short if team == home_short else home_short],
+                sports_market_type="spreads",
+                line=-pts,
+                rng=rng,
+            ))
+    for pts in range(205, 241, 3):
+        markets.append(_gamma_market(
+            f"{base}-total-{pts}pt5", f"{away_short} vs. {home_short}: O/U {pts}.5", ["Over", "Under"],
+            sports_market_type="totals", line=pts + 0.5, rng=rng,
+        ))
+    markets.append(_gamma_market(
+        f"{base}-1h-moneyline", f"1H Moneyline: {away_short} vs. {home_short}", [away_short, home_short],
+        sports_market_type="first_half_moneyline", rng=rng,
+    ))
+    for pts in (1.5, 2.5, 3.5):
+        markets.append(_gamma_market(
+            f"{base}-1h-spread-home-{int(pts)}pt5", f"1H Spread: {home_short} (-{pts})", [home_short, away_short],
+            sports_market_type="first_half_spreads", line=-pts, rng=rng,
+        ))
+    for pts in (108, 111, 114):
+        markets.append(_gamma_market(
+            f"{base}-1h-total-{pts}pt5", f"1H O/U {pts}.5", ["Over", "Under"],
+            sports_market_type="first_half_totals", line=pts + 0.5, rng=rng,
+        ))
+    for player in ("points", "rebounds", "assists"):
+        markets.append(_gamma_market(
+            f"{base}-{player}-leader", f"{away_short} vs. {home_short}: {player} leader?", ["Yes", "No"],
+            sports_market_type="player_props", rng=rng,
+        ))
+    return {
+        "id": str(40_000 + index),
+        "slug": base,
+        "title": f"{away_short} vs. {home_short}",
+        "startTime": (FIXTURE_START + timedelta(days=index % 4)).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "active": True,
+        "closed": False,
+        "markets": markets,
+    }
+
+
+def gamma_tennis_event(index: int = 0, *, seed: int = 19) -> Dict[str, Any]:
+    """An ATP match event with match/set totals, set handicaps and first-set markets."""
+    rng = random.Random(seed + index)
+    (p1, s1), (p2, s2) = rng.sample(ATP_PLAYERS, 2)
+    day = (FIXTURE_START + timedelta(days=index % 4)).date().isoformat()
+    base = f"atp-{s1}-{s2}-{day}"
+    markets = [_gamma_market(base, f"{p1} vs. {p2}", [p1, p2], sports_market_type="moneyline", rng=rng)]
+    for pts in range(19, 27):
+        markets.append(_gamma_market(
+            f"{base}-match-total-{pts}pt5", f"Total games O/U {pts}.5", ["Over", "Under"],
+            sports_market_type="tennis_match_totals", line=pts + 0.5, rng=rng,
+        ))
+    markets.append(_gamma_market(
+        f"{base}-set-totals-2pt5", "Total sets O/U 2.5", ["Over", "Under"],
+        sports_market_type="tennis_set_totals", line=2.5, rng=rng,
+    ))
+    for pts in (1.5, 2.5, 3.5, 4.5):
+        markets.append(_gamma_market(
+            f"{base}-spread-away-{int(pts)}pt5", f"Game handicap: {p2} (-{pts})", [p2, p1],
+            sports_market_type="tennis_game_handicap", line=-pts, rng=rng,
+        ))
+    for pts in (8, 9, 10):
+        markets.append(_gamma_market(
+            f"{base}-first-set-total-{pts}pt5", f"1st set games O/U {pts}.5", ["Over", "Under"],
+            sports_market_type="tennis_first_set_totals", line=pts + 0.5, rng=rng,
+        ))
+    markets.append(_gamma_market(
+        f"{base}-first-set-winner", f"1st set winner: {p1} vs. {p2}", [p1, p2],
+        sports_market_type="tennis_first_set_winner", rng=rng,
+    ))
+    return {
+        "id": str(80_000 + index),
+        "slug": base,
+        "title": f"{p1} vs. {p2}",
+        "startTime": (FIXTURE_START + timedelta(days=index % 4)).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "active": True,
+        "closed": False,
+        "markets": markets,
+    }
+
+
+def market_slugs(events: List[Dict[str, Any]]) -> List[str]:
+    """Every market slug in the events (the inputs `_extract_line_from_market_slug` sees)."""
+    return [m["slug"] for event in events for m in event["markets"]]
+
+
+class FixtureArcadiaHttp:
+    """
+    Serves the Arcadia fixtures through the `AsyncHttpClient.get_json` interface, so
+    the odds services run their real parsing and caching with no network.
+    """
+
+    def __init__(self, matchups_url: str, feed: List[Dict[str, Any]]) -> None:
+        self.payloads: Dict[str, Any] = {matchups_url: feed}
+        for item in feed:
+            if item.get("type") == "matchup":
+                mid = item["id"]
+                self.payloads[f"{ARCADIA_API_BASE}/matchups/{mid}/markets/related/straight"] = (
+                    arcadia_straight_markets(mid)
+                )
+
+    async def get_json(self, url: str, **kwargs: Any) -> Any:
+        return self.payloads.get(url)
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Timing and allocation measurement for the benchmark suite.
+
+Each benchmark is one operation (a function, or a coroutine function for the async
+paths). `measure` reports:
+  - ops/sec: best of `repeat` timed runs, each sized to last about `min_time_s`
+  - peak bytes/op: tracemalloc high-water mark of one operation above what was
+    live before it (everything the call allocates at once, freed or not)
+  - retained bytes/op: memory still held after many operations, per operation
+    (caches and leaks; ~0 for pure functions)
+
+Baselines are JSON keyed by benchmark name; `compare` flags throughput drops and
+allocation growth beyond the given tolerances. Raw ops/sec only mean something on
+the machine that recorded them, so every run also times `calibration_ops_per_s`
+(a fixed pure-Python loop) and baseline throughput is scaled by the ratio of the
+two calibrations before comparing.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gc
+import json
+import platform
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    name: str
+    fn: Callable[[], Any]  # one operation; a coroutine function when is_async
+    is_async: bool = False
+    # Optional sanity check on fn's result, run once before timing
+    check: Optional[Callable[[Any], bool]] = None
+
+
+@dataclass(frozen=True)
+class BenchResult:
+    name: str
+    ops_per_s: float
+    peak_bytes_per_op: int
+    retained_bytes_per_op: float
+
+    @property
+    def us_per_op(self) -> float:
+        return 1e6 / self.ops_per_s if self.ops_per_s > 0 else float("inf")
+
+
+def _batch_runner(bench: Benchmark, loop: Optional[asyncio.AbstractEventLoop]) -> Callable[[int], None]:
+    fn = bench.fn
+    if not bench.is_async:
+        def run(n: int) -> None:
+            for _ in range(n):
+                fn()
+        return run
+
+    async def batch(n: int) -> None:
+        for _ in range(n):
+            await fn()
+
+    def run_async(n: int) -> None:
+        loop.run_until_complete(batch(n))  # type: ignore[union-attr]
+    return run_async
+
+
+def _time_ops(run: Callable[[int], None], *, min_time_s: float, repeat: int) -> float:
+    # Grow the batch until one run takes min_time_s, then keep the best of `repeat` runs
+    n = 1
+    while True:
+        start = time.perf_counter()
+        run(n)
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time_s or n >= 1 << 24:
+            break
+        n = max(n * 2, int(n * min_time_s / max(elapsed, 1e-9) * 1.1))
+    best = elapsed / n
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        run(n)
+        best = min(best, (time.perf_counter() - start) / n)
+    return 1.0 / best if best > 0 else float("inf")
+
+
+def _single_op_peak(bench: Benchmark, loop: Optional[asyncio.AbstractEventLoop]) -> int:
+    """Peak traced bytes of one operation above what was live before it."""
+    if bench.is_async:
+        async def one() -> int:
+            before = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            await bench.fn()
+            return tracemalloc.get_traced_memory()[1] - before
+        return loop.run_until_complete(one())  # type: ignore[union-attr]
+    before = tracemalloc.get_traced_memory()[0]
+    tracemalloc.reset_peak()
+    bench.fn()
+    return tracemalloc.get_traced_memory()[1] - before
+
+
+def _allocations(bench: Benchmark, loop: Optional[asyncio.AbstractEventLoop], *, ops: int) -> tuple[int, float]:
+    run = _batch_runner(bench, loop)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        run(1)  # allocate lazily built caches before measuring
+        peak = min(_single_op_peak(bench, loop) for _ in range(5))
+        gc.collect()
+        before = tracemalloc.get_traced_memory()[0]
+        run(ops)
+        gc.collect()
+        retained = (tracemalloc.get_traced_memory()[0] - before) / ops
+    finally:
+        tracemalloc.stop()
+    return peak, retained
+
+
+def measure(bench: Benchmark, *, min_time_s: float = 0.2, repeat: int = 5, alloc_ops: int = 200) -> BenchResult:
+    loop = asyncio.new_event_loop() if bench.is_async else None
+    try:
+        if bench.check is not None:
+            result = loop.run_until_complete(bench.fn()) if loop is not None else bench.fn()
+            if not bench.check(result):
+                raise AssertionError(f"{bench.name}: unexpected result {result!r}")
+        ops_per_s = _time_ops(_batch_runner(bench, loop), min_time_s=min_time_s, repeat=repeat)
+        peak, retained = _allocations(bench, loop, ops=alloc_ops)
+    finally:
+        if loop is not None:
+            loop.close()
+    return BenchResult(
+        name=bench.name,
+        ops_per_s=ops_per_s,
+        peak_bytes_per_op=int(peak),
+        retained_bytes_per_op=round(retained, 1),
+    )
+
+
+_CALIBRATION_WORDS = [f"team{i} city{i % 7} club{i % 3}" for i in range(64)]
+
+
+def _calibration_op() -> int:
+    # String normalizing, splitting and dict lookups: the same kind of work as the benchmarks
+    seen: Dict[str, int] = {}
+    for name in _CALIBRATION_WORDS:
+        for word in " ".join(name.strip().lower().split()).split():
+            seen[word] = seen.get(word, 0) + 1
+    return len(seen)
+
+
+def calibration_ops_per_s(*, min_time_s: float = 0.2, repeat: int = 5) -> float:
+    """Speed of this machine/interpreter on a fixed workload, for scaling baselines."""
+    bench = Benchmark("calibration", _calibration_op)
+    return _time_ops(_batch_runner(bench, None), min_time_s=min_time_s, repeat=repeat)
+
+
+def load_baseline_doc(path: str) -> Dict[str, Any]:
+    """The whole baselines file ({} if there is none)."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def load_baselines(path: str) -> Dict[str, Dict[str, Any]]:
+    return load_baseline_doc(path).get("benchmarks", {})
+
+
+def save_baselines(
+    path: str,
+    results: List[BenchResult],
+    *,
+    calibration_ops_per_s: float,
+    merge: bool = True,
+) -> None:
+    """
+    Write results with the calibration they were measured under. Merged entries
+    recorded under another calibration are rescaled to this one.
+    """
+    benchmarks: Dict[str, Dict[str, Any]] = {}
+    if merge:
+        previous = load_baseline_doc(path)
+        scale = speed_scale(previous.get("calibration_ops_per_s"), calibration_ops_per_s)
+        for name, entry in previous.get("benchmarks", {}).items():
+            entry = dict(entry)
+            entry["ops_per_s"] = round(float(entry.get("ops_per_s") or 0) * scale, 1)
+            benchmarks[name] = entry
+    for r in results:
+        entry = asdict(r)
+        entry.pop("name")
+        entry["ops_per_s"] = round(entry["ops_per_s"], 1)
+        benchmarks[r.name] = entry
+    doc = {
+        "recorded_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "machine": f"{platform.system()} {platform.machine()}",
+        "calibration_ops_per_s": round(calibration_ops_per_s, 1),
+        "benchmarks": dict(sorted(benchmarks.items())),
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(doc, f, indent=2)
+        f.write("\n")
+
+
+def speed_scale(baseline_calibration: Optional[float], calibration: float) -> float:
+    """Factor turning baseline ops/sec into this machine's (1.0 if the baseline has no calibration)."""
+    if not baseline_calibration or calibration <= 0:
+        return 1.0
+    return calibration / float(baseline_calibration)
+
+
+def compare(
+    result: BenchResult,
+    baseline: Optional[Dict[str, Any]],
+    *,
+    speed_tolerance: float,
+    alloc_tolerance: float,
+    speed_scale: float = 1.0,
+) -> List[str]:
+    """
+    Regressions of `result` against its baseline entry (empty if none or no baseline).
+    Baseline ops/sec are multiplied by `speed_scale` first.
+    """
+    if not baseline:
+        return []
+    problems: List[str] = []
+    base_ops = float(baseline.get("ops_per_s") or 0) * speed_scale
+    if base_ops > 0 and result.ops_per_s < base_ops * (1 - speed_tolerance):
+        problems.append(f"ops/sec {result.ops_per_s:,.0f} < baseline {base_ops:,.0f} (-{(1 - result.ops_per_s / base_ops) * 100:.0f}%)")
+    base_peak = int(baseline.get("peak_bytes_per_op") or 0)
+    # Small absolute slack so tiny allocations don't flap on interpreter noise
+    if result.peak_bytes_per_op > base_peak * (1 + alloc_tolerance) + 256:
+        problems.append(f"peak bytes/op {result.peak_bytes_per_op:,} > baseline {base_peak:,}")
+    return problems
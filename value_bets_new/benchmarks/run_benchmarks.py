@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for the parsing and matching paths every cycle runs through.
+
+Covers Arcadia market parsing and matchup date filtering, Pinnacle game lookup and
+totals extraction, Polymarket market slug extraction and line parsing, value bet
+evaluation and strict team matching. Fixtures are generated deterministically
+(see fixtures.py); the Pinnacle lookups run against them through a fixture HTTP
+client, so the real caches and parsers are exercised with no network.
+
+Each benchmark reports ops/sec and allocations (tracemalloc peak and retained
+bytes per operation) and is compared against the committed baselines.json.
+
+Usage:
+    python3 run_benchmarks.py                      # run all; exit 1 on a regression
+    python3 run_benchmarks.py -k slug              # only names containing "slug"
+    python3 run_benchmarks.py --no-check           # report only, always exit 0
+    python3 run_benchmarks.py --update-baseline    # re-record baselines.json
+
+Throughput is compared after scaling the baselines by a calibration loop timed in
+the same run (see harness.py), so the committed numbers hold on other machines.
+Re-record and commit baselines.json when a change is meant to move the numbers.
+"""
+
+import sys
+import os
+import argparse
+from typing import Callable, List
+
+# Add repo root, plus the package dirs the bots run from (their modules import siblings by bare name)
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.join(_REPO_ROOT, "value_bets"))
+sys.path.insert(0, os.path.join(_REPO_ROOT, "value_bets_new"))
+sys.path.insert(0, _REPO_ROOT)
+
+from value_bets.pinnacle_scraper.pinnacle_odds_scraper import (
+    ARCADIA_BASKETBALL_MATCHUPS_URL,
+    _arcadia_markets_to_rows,
+    _filter_matchups_for_local_date,
+)
+from value_bets_new.benchmarks import fixtures
+from value_bets_new.benchmarks.bench_event_processor import build_candidates
+from value_bets_new.benchmarks.harness import (
+    Benchmark,
+    BenchResult,
+    calibration_ops_per_s,
+    compare,
+    load_baseline_doc,
+    measure,
+    save_baselines,
+    speed_scale,
+)
+from value_bets_new.constants import Sport
+from value_bets_new.event_processor import EventProcessor
+from value_bets_new.pinnacle_odds_interface import PinnacleSportsbookOddsInterface
+from value_bets_new.rewrite_later import PolymarketMarketExtractor
+from value_bets_new.value_bets_orchestrator import _extract_line_from_market_slug
+from value_bet_helpers import teams_match_strict
+
+
+DEFAULT_BASELINES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines.json")
+
+
+def build_benchmarks() -> List[Benchmark]:
+    feed = fixtures.arcadia_matchups_feed()
+    game = feed[0]
+    away_full, home_full = (p["name"] for p in game["participants"])
+    markets = fixtures.arcadia_straight_markets(game["id"])
+    local_date = fixtures.first_local_date(feed)
+
+    # Polymarket-style short names against Pinnacle's full names; odds re-parsed on every call
+    pinnacle = PinnacleSportsbookOddsInterface(
+        Sport.BASKETBALL,
+        http=fixtures.FixtureArcadiaHttp(ARCADIA_BASKETBALL_MATCHUPS_URL, feed),  # type: ignore[arg-type]
+        odds_freshness_s=0,
+    )
+    away_short, home_short = away_full.split()[-1], home_full.split()[-1]
+
+    nba_event = fixtures.gamma_nba_event()
+    atp_event = fixtures.gamma_tennis_event()
+    slugs = fixtures.market_slugs([fixtures.gamma_nba_event(i) for i in range(5)] + [fixtures.gamma_tennis_event(i) for i in range(5)])
+    candidates = build_candidates(200)
+    processor = EventProcessor()
+    name_pairs = fixtures.TEAM_NAME_PAIRS
+
+    def extract_lines() -> List[object]:
+        return [_extract_line_from_market_slug(slug) for slug in slugs]
+
+    def evaluate_candidates() -> List[object]:
+        out = []
+        for team, market_odds, sportsbook_odds in candidates:
+            value_bet = processor.process_two_outcome_event(team, market_odds, sportsbook_odds)
+            if value_bet is not None:
+                out.append(value_bet)
+        return out
+
+    def match_names() -> List[bool]:
+        return [teams_match_strict(a, b) for a, b in name_pairs]
+
+    def slug_bench(name: str, extract: Callable[[dict], List[str]], event: dict) -> Benchmark:
+        return Benchmark(
+            f"PolymarketMarketExtractor.{name}[{event['slug'].split('-')[0]}, {len(event['markets'])} markets]",
+            lambda: extract(event),
+            check=bool,
+        )
+
+    return [
+        Benchmark(
+            f"_arcadia_markets_to_rows[{len(markets)} markets]",
+            lambda: _arcadia_markets_to_rows(markets, away=away_full, home=home_full),
+            check=bool,
+        ),
+        Benchmark(
+            f"_filter_matchups_for_local_date[{len(feed)} feed items]",
+            lambda: _filter_matchups_for_local_date(feed, local_date),
+            check=bool,
+        ),
+        Benchmark(
+            "PinnacleSportsbookOddsInterface._find_game_and_rows",
+            lambda: pinnacle._find_game_and_rows(away_short, home_short, local_date),
+            is_async=True,
+            check=lambda result: result is not None and bool(result[2]),
+        ),
+        Benchmark(
+            "PinnacleSportsbookOddsInterface._get_totals_odds_by_type[totals]",
+            lambda: pinnacle._get_totals_odds_by_type(away_short, home_short, local_date, "totals"),
+            is_async=True,
+            check=bool,
+        ),
+        slug_bench("spread_market_slugs_from_event", PolymarketMarketExtractor.spread_market_slugs_from_event, nba_event),
+        slug_bench("totals_market_slugs_from_event", PolymarketMarketExtractor.totals_market_slugs_from_event, nba_event),
+        slug_bench("totals_games_market_slugs_from_event", PolymarketMarketExtractor.totals_games_market_slugs_from_event, atp_event),
+        slug_bench("totals_sets_market_slugs_from_event", PolymarketMarketExtractor.totals_sets_market_slugs_from_event, atp_event),
+        Benchmark(f"_extract_line_from_market_slug[{len(slugs)} slugs]", extract_lines, check=any),
+        Benchmark(
+            f"EventProcessor.process_two_outcome_event[{len(candidates)} candidates]",
+            evaluate_candidates,
+            check=bool,
+        ),
+        Benchmark(f"teams_match_strict[{len(name_pairs)} pairs]", match_names, check=any),
+    ]
+
+
+def _format_row(result: BenchResult, problems: List[str]) -> str:
+    status = "REGRESSED: " + "; ".join(problems) if problems else ""
+    return (
+        f"{result.name:<78} {result.ops_per_s:>12,.0f} {result.us_per_op:>10.2f} "
+        f"{result.peak_bytes_per_op / 1024:>10.1f} {result.retained_bytes_per_op:>10.1f}  {status}"
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the hot parsing and matching paths")
+    parser.add_argument("-k", "--filter", default="", help="Only run benchmarks whose name contains this")
+    parser.add_argument("--min-time", type=float, default=0.2, help="Seconds per timed run (default 0.2)")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per benchmark; the best is kept")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINES, help="Baselines JSON (default: baselines.json)")
+    parser.add_argument("--update-baseline", action="store_true", help="Write these results to the baselines file")
+    parser.add_argument("--no-check", action="store_true", help="Exit 0 even if a benchmark regressed")
+    parser.add_argument("--speed-tolerance", type=float, default=0.30, help="Allowed ops/sec drop (default 0.30)")
+    parser.add_argument("--alloc-tolerance", type=float, default=0.10, help="Allowed peak bytes growth (default 0.10)")
+    args = parser.parse_args()
+
+    benchmarks = [b for b in build_benchmarks() if args.filter.lower() in b.name.lower()]
+    if not benchmarks:
+        print(f"No benchmarks match {args.filter!r}")
+        return 1
+    baseline_doc = {} if args.update_baseline else load_baseline_doc(args.baseline)
+    baselines = baseline_doc.get("benchmarks", {})
+    if not args.update_baseline and not baselines and not args.no_check:
+        print(f"No baselines in {args.baseline}; record them with --update-baseline")
+        return 1
+    calibration = calibration_ops_per_s(min_time_s=args.min_time, repeat=args.repeat)
+    scale = speed_scale(baseline_doc.get("calibration_ops_per_s"), calibration)
+    if baselines:
+        print(f"Calibration {calibration:,.0f} ops/sec; baseline throughput scaled by {scale:.2f}")
+
+    print(f"{'benchmark':<78} {'ops/sec':>12} {'us/op':>10} {'peak KiB':>10} {'retained B':>10}")
+    results: List[BenchResult] = []
+    regressions = 0
+    for bench in benchmarks:
+        result = measure(bench, min_time_s=args.min_time, repeat=args.repeat)
+        problems = compare(
+            result,
+            baselines.get(bench.name),
+            speed_tolerance=args.speed_tolerance,
+            alloc_tolerance=args.alloc_tolerance,
+            speed_scale=scale,
+        )
+        regressions += bool(problems)
+        results.append(result)
+        print(_format_row(result, problems))
+
+    if args.update_baseline:
+        save_baselines(args.baseline, results, calibration_ops_per_s=calibration)
+        print(f"Baselines written to {args.baseline}")
+    elif baselines:
+        missing = [r.name for r in results if r.name not in baselines]
+        if missing:
+            print(f"No baseline for: {', '.join(missing)}")
+        print(f"{regressions} regression(s) against {args.baseline}")
+    return 1 if regressions and not args.no_check else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Small async caching helpers.
+
+`AsyncTTLCache` keeps recently fetched payloads for a fixed time-to-live, bounded
+by entry count (least recently used entries are evicted first). Concurrent
+lookups of the same missing key share a single in-flight fetch instead of each
+issuing their own request.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+
+class _FetchAbandoned(Exception):
+    """Set on a shared fetch whose caller was cancelled, so its waiters retry instead."""
+
+
+class AsyncTTLCache:
+    """
+    TTL + size-bounded cache with request coalescing.
+
+    Typical usage:
+      cache = AsyncTTLCache(ttl_s=30.0, max_entries=512)
+      event = await cache.get_or_fetch(slug, lambda: http.get_json(url))
+
+    Failed fetches (exceptions) are not cached; every waiter sees the exception.
+    Cancelling the caller that runs a fetch only cancels that caller: a waiter
+    takes the fetch over.
+    """
+
+    def __init__(self, *, ttl_s: float, max_entries: int = 1024) -> None:
+        if ttl_s <= 0:
+            raise ValueError(f"ttl_s must be > 0, got {ttl_s}")
+        if max_entries <= 0:
+            raise ValueError(f"max_entries must be > 0, got {max_entries}")
+        self.ttl_s = float(ttl_s)
+        self.max_entries = int(max_entries)
+        # key -> (expires_at_monotonic, value); ordered oldest-used first
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._in_flight: Dict[Hashable, asyncio.Future] = {}
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for key, or None if missing/expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl_s, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """Drop one key, or everything if key is None."""
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+
+    async def get_or_fetch(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Return the cached value for key, calling `fetch()` on a miss.
+
+        If a fetch for the same key is already running, wait for it instead of
+        starting another one.
+        """
+        while True:
+            value = self.get(key)
+            if value is not None:
+                self.hits += 1
+                return value
+
+            pending = self._in_flight.get(key)
+            if pending is None:
+                break
+            self.coalesced += 1
+            try:
+                return await asyncio.shield(pending)
+            except _FetchAbandoned:
+                # The fetching caller was cancelled: start the fetch again (or join whoever did)
+                continue
+
+        self.misses += 1
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        try:
+            value = await fetch()
+        except asyncio.CancelledError:
+            future.set_exception(_FetchAbandoned())
+            future.exception()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved so an exception nobody else awaited isn't reported as unhandled
+            future.exception()
+            raise
+        else:
+            if value is not None:
+                self.put(key, value)
+            future.set_result(value)
+            return value
+        finally:
+            self._in_flight.pop(key, None)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
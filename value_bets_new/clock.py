@@ -0,0 +1,23 @@
+#!/usr/bin/env python3
+"""
+Wall clock for the event time-window checks (which games are upcoming/started).
+
+Live runs read the system clock. A replay shifts it back to when its corpus was
+recorded (`set_offset`), so recorded events fall inside the same windows they did
+when they were captured.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+_offset = timedelta(0)
+
+
+def utcnow() -> datetime:
+    return datetime.now(timezone.utc) + _offset
+
+
+def set_offset(offset_s: float) -> None:
+    global _offset
+    _offset = timedelta(seconds=float(offset_s))
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from enum import Enum
-from typing import Optional, Dict, List, TYPE_CHECKING
+from typing import Optional, Dict, List, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from value_bets_new.polymarket import PolymarketEvent
@@ -32,6 +32,8 @@ class MarketOdds:
     ask_volume: float
     spread: Optional[float]
     condition_id: Optional[str] = None
+    # Ask side as (price, size), cheapest first; empty when depth wasn't fetched
+    ask_levels: Tuple[Tuple[float, float], ...] = ()
     
 @dataclass(frozen=True)
 class SportsbookOdds:
@@ -103,6 +105,8 @@ class ValueBet:
     polymarket_best_ask: float
     expected_payout_per_1: float  # expected payout for a $1 stake (gross, before fees)
     condition_id: Optional[str] = None
+    # Ask side at evaluation time, cheapest first, used to size the order against depth
+    ask_levels: Tuple[Tuple[float, float], ...] = ()
 
     def to_string(self, decimals: int = 4) -> str:
         fmt = f".{max(0, int(decimals))}f"
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
 import math
-from typing import Optional
+import logging
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
 
 from value_bets_new.constants import MarketOdds, SportsbookOdds, ValueBet
 
+logger = logging.getLogger(__name__)
+
 
 class EventProcessor:
     def __init__(self) -> None:
@@ -13,118 +18,245 @@ class EventProcessor:
         self.max_expected_payout_per_1 = 1.10
 
     def process_two_outcome_event(self, team_name : str, polymarket_odds: MarketOdds, sportsbook_odds: SportsbookOdds ) -> Optional[ValueBet]:
-        print(f"[DEBUG] [EventProcessor] Processing value bet evaluation for team: {team_name}")
-        print(f"[DEBUG] [EventProcessor] Polymarket best_ask: {polymarket_odds.best_ask}")
+        priced = self.price_two_outcome_event(team_name, polymarket_odds, sportsbook_odds)
+        if priced is None:
+            return None
+        p_true, expected_payout = priced
+        return self.accept_priced_event(team_name, polymarket_odds, p_true, expected_payout)
+
+    def price_two_outcome_event(
+        self,
+        team_name: str,
+        polymarket_odds: MarketOdds,
+        sportsbook_odds: SportsbookOdds,
+    ) -> Optional[Tuple[float, float]]:
+        """(true probability, expected payout per $1) at the best ask, or None if it can't be priced."""
+        logger.debug("Processing value bet evaluation for team: %s", team_name)
+        logger.debug("Polymarket best_ask: %s", polymarket_odds.best_ask)
         
         if polymarket_odds.best_ask is None or polymarket_odds.best_ask <= 0:
-            print(f"[DEBUG] [EventProcessor] REJECTED: best_ask is None or <= 0")
+            logger.debug("REJECTED: best_ask is None or <= 0")
             return None
         
         # Calculate true probability for this team
-        print(f"[DEBUG] [EventProcessor] Calculating true probability for team: {team_name}")
-        print(f"[DEBUG] [EventProcessor] Sportsbook outcome_1: {sportsbook_odds.outcome_1} (cost_to_win_1: {sportsbook_odds.outcome_1_cost_to_win_1})")
-        print(f"[DEBUG] [EventProcessor] Sportsbook outcome_2: {sportsbook_odds.outcome_2} (cost_to_win_1: {sportsbook_odds.outcome_2_cost_to_win_1})")
+        logger.debug("Calculating true probability for team: %s", team_name)
+        logger.debug("Sportsbook outcome_1: %s (cost_to_win_1: %s)", sportsbook_odds.outcome_1, sportsbook_odds.outcome_1_cost_to_win_1)
+        logger.debug("Sportsbook outcome_2: %s (cost_to_win_1: %s)", sportsbook_odds.outcome_2, sportsbook_odds.outcome_2_cost_to_win_1)
         p_true = self._true_prob_for_outcome(team_name, sportsbook_odds)
-        print(f"[DEBUG] [EventProcessor] Calculated true probability: {p_true}")
+        logger.debug("Calculated true probability: %s", p_true)
         
         if p_true is None:
-            print(f"[DEBUG] [EventProcessor] REJECTED: p_true is None (team name didn't match)")
-            print("\n\n\n")
-            print(f"[DEBUG] [EventProcessor] Team name from Polymarket: '{team_name}'")
-            print(f"[DEBUG] [EventProcessor] Sportsbook outcome_1: '{sportsbook_odds.outcome_1}'")
-            print(f"[DEBUG] [EventProcessor] Sportsbook outcome_2: '{sportsbook_odds.outcome_2}'")
-            print("\n\n\n")
-            return None
-        
-        if p_true < self.min_true_prob:
-            print(f"[DEBUG] [EventProcessor] REJECTED: p_true ({p_true:.4f}) < min_true_prob ({self.min_true_prob})")
+            logger.debug("REJECTED: p_true is None (team name didn't match)")
+            logger.debug("Team name from Polymarket: '%s'", team_name)
+            logger.debug("Sportsbook outcome_1: '%s'", sportsbook_odds.outcome_1)
+            logger.debug("Sportsbook outcome_2: '%s'", sportsbook_odds.outcome_2)
             return None
         
         payout_per_1 = 1.0 / polymarket_odds.best_ask  # $ payout if the $1 stake wins
-        print(f"[DEBUG] [EventProcessor] Payout per $1: {payout_per_1:.4f}")
+        logger.debug("Payout per $1: %.4f", payout_per_1)
         expected_payout = float(p_true) * float(payout_per_1)
-        print(f"[DEBUG] [EventProcessor] Expected payout: {expected_payout:.4f} (p_true={p_true:.4f} * payout_per_1={payout_per_1:.4f})")
-        
+        logger.debug("Expected payout: %.4f (p_true=%.4f * payout_per_1=%.4f)", expected_payout, p_true, payout_per_1)
+        return float(p_true), expected_payout
+
+    def accept_priced_event(
+        self,
+        team_name: str,
+        polymarket_odds: MarketOdds,
+        p_true: float,
+        expected_payout: float,
+    ) -> Optional[ValueBet]:
+        """Apply the probability and payout limits to a priced outcome; a ValueBet if it passes."""
+        if p_true < self.min_true_prob:
+            logger.debug("REJECTED: p_true (%.4f) < min_true_prob (%s)", p_true, self.min_true_prob)
+            return None
+
         if expected_payout < self.min_expected_payout_per_1:
-            print(f"[DEBUG] [EventProcessor] REJECTED: expected_payout ({expected_payout:.4f}) < min_expected_payout_per_1 ({self.min_expected_payout_per_1})")
+            logger.debug("REJECTED: expected_payout (%.4f) < min_expected_payout_per_1 (%s)", expected_payout, self.min_expected_payout_per_1)
             return None
         
         if expected_payout > self.max_expected_payout_per_1:
-            print(f"[DEBUG] [EventProcessor] REJECTED: expected_payout ({expected_payout:.4f}) > max_expected_payout_per_1 ({self.max_expected_payout_per_1})")
+            logger.debug("REJECTED: expected_payout (%.4f) > max_expected_payout_per_1 (%s)", expected_payout, self.max_expected_payout_per_1)
             return None
 
-        print(f"[DEBUG] [EventProcessor] VALUE BET ACCEPTED! Creating ValueBet object...")
+        logger.debug("VALUE BET ACCEPTED! Creating ValueBet object...")
         value_bet = ValueBet(
             team=team_name,
             token_id=polymarket_odds.token_id,
-            true_prob=float(p_true),
+            true_prob=p_true,
             polymarket_best_ask=polymarket_odds.best_ask,
             expected_payout_per_1=expected_payout,
             condition_id=polymarket_odds.condition_id,
+            ask_levels=polymarket_odds.ask_levels,
         )
         return value_bet
 
+    def process_two_outcome_events(
+        self,
+        candidates: Sequence[Tuple[str, MarketOdds, SportsbookOdds]],
+    ) -> List[ValueBet]:
+        """Batch version of `process_two_outcome_event`: the accepted ValueBets, in candidate order."""
+        return [value_bet for _, value_bet in self.evaluate_two_outcome_events(candidates) if value_bet is not None]
+
+    def evaluate_two_outcome_events(
+        self,
+        candidates: Sequence[Tuple[str, MarketOdds, SportsbookOdds]],
+    ) -> List[Tuple[Optional[Tuple[float, float]], Optional[ValueBet]]]:
+        """
+        Price and filter many candidates at once.
+
+        Team names are matched to a sportsbook side once per distinct
+        (team, outcome_1, outcome_2); pricing and filtering then run as one
+        vectorized pass in `evaluate_columns`. Returns, per candidate, what the
+        scalar path gives: `price_two_outcome_event`'s (true probability, expected
+        payout) or None, and the accepted ValueBet or None. No per-candidate logging.
+        """
+        n = len(candidates)
+        if n == 0:
+            return []
+        best_ask = np.full(n, np.nan)
+        q1 = np.full(n, np.nan)
+        q2 = np.full(n, np.nan)
+        side = np.full(n, -1, dtype=np.int8)
+        side_cache: Dict[Tuple[str, str, str], int] = {}
+        for i, (team_name, polymarket_odds, sportsbook_odds) in enumerate(candidates):
+            key = (team_name, sportsbook_odds.outcome_1, sportsbook_odds.outcome_2)
+            matched = side_cache.get(key)
+            if matched is None:
+                if self._team_matches(team_name, sportsbook_odds.outcome_1):
+                    matched = 0
+                elif self._team_matches(team_name, sportsbook_odds.outcome_2):
+                    matched = 1
+                else:
+                    matched = -1
+                side_cache[key] = matched
+            side[i] = matched
+            best_ask[i] = _as_float(polymarket_odds.best_ask)
+            q1[i] = _as_float(sportsbook_odds.outcome_1_cost_to_win_1)
+            q2[i] = _as_float(sportsbook_odds.outcome_2_cost_to_win_1)
+
+        accepted, p_true, expected_payout = self.evaluate_columns(best_ask, q1, q2, side)
+        priced = np.isfinite(expected_payout)
+
+        # Plain lists: per-element numpy indexing would cost more than the pricing
+        results: List[Tuple[Optional[Tuple[float, float]], Optional[ValueBet]]] = []
+        for (team_name, polymarket_odds, _), is_priced, is_accepted, p, payout in zip(
+            candidates, priced.tolist(), accepted.tolist(), p_true.tolist(), expected_payout.tolist(),
+        ):
+            if not is_priced:
+                results.append((None, None))
+            elif not is_accepted:
+                results.append(((p, payout), None))
+            else:
+                results.append(((p, payout), ValueBet(
+                    team=team_name,
+                    token_id=polymarket_odds.token_id,
+                    true_prob=p,
+                    polymarket_best_ask=polymarket_odds.best_ask,
+                    expected_payout_per_1=payout,
+                    condition_id=polymarket_odds.condition_id,
+                    ask_levels=polymarket_odds.ask_levels,
+                )))
+        logger.debug("Batch evaluated %s candidates, priced %s, accepted %s", n, int(priced.sum()), int(accepted.sum()))
+        return results
+
+    def evaluate_columns(
+        self,
+        best_ask: np.ndarray,
+        q1: np.ndarray,
+        q2: np.ndarray,
+        side: np.ndarray,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Devig, price and filter columnar candidates in one pass.
+
+        best_ask, q1, q2 are float arrays (NaN for missing); side is 0 when the
+        Polymarket team is sportsbook outcome_1, 1 for outcome_2 and -1 for no match.
+        Returns (accepted mask, true probability, expected payout per $1). Rejection
+        rules are the same as `process_two_outcome_event`.
+        """
+        best_ask = np.asarray(best_ask, dtype=float)
+        q1 = np.asarray(q1, dtype=float)
+        q2 = np.asarray(q2, dtype=float)
+        side = np.asarray(side)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            devig_ok = np.isfinite(q1) & np.isfinite(q2) & (q1 > 0) & (q2 > 0)
+            total = q1 + q2
+            p_true = np.where(side == 0, q1 / total, np.where(side == 1, q2 / total, np.nan))
+            p_true = np.where(devig_ok, p_true, np.nan)
+
+            ask_ok = np.isfinite(best_ask) & (best_ask > 0)
+            expected_payout = np.where(ask_ok, p_true * (1.0 / best_ask), np.nan)
+
+        # NaN fails every comparison, so unmatched / invalid rows drop out here.
+        accepted = (
+            (p_true >= self.min_true_prob)
+            & (expected_payout >= self.min_expected_payout_per_1)
+            & (expected_payout <= self.max_expected_payout_per_1)
+        )
+        return accepted, p_true, expected_payout
 
     def _true_prob_for_outcome(self, team_name: str, sportsbook_odds: SportsbookOdds) -> Optional[float]:
-        print(f"[DEBUG] [EventProcessor] _true_prob_for_outcome: team_name={team_name}")
-        print(f"[DEBUG] [EventProcessor] Devigging odds: q1={sportsbook_odds.outcome_1_cost_to_win_1}, q2={sportsbook_odds.outcome_2_cost_to_win_1}")
+        logger.debug("_true_prob_for_outcome: team_name=%s", team_name)
+        logger.debug("Devigging odds: q1=%s, q2=%s", sportsbook_odds.outcome_1_cost_to_win_1, sportsbook_odds.outcome_2_cost_to_win_1)
         devigged_odds = self._devig(sportsbook_odds.outcome_1_cost_to_win_1, sportsbook_odds.outcome_2_cost_to_win_1)
         if devigged_odds is None:
-            print(f"[DEBUG] [EventProcessor] Devig failed - returned None")
+            logger.debug("Devig failed - returned None")
             return None
         p_outcome_1, p_outcome_2 = devigged_odds
-        print(f"[DEBUG] [EventProcessor] Devigged probabilities: p_outcome_1={p_outcome_1:.4f}, p_outcome_2={p_outcome_2:.4f}")
-        
-        def _team_matches(t1: str, t2: str) -> bool:
-            """Fuzzy team name matching."""
-            n1 = " ".join(t1.lower().strip().split())
-            n2 = " ".join(t2.lower().strip().split())
-            if n1 == n2:
-                return True
-            # Check if one contains the other
-            if n1 in n2 or n2 in n1:
-                return True
-            # Check if last word matches (nickname)
-            words1 = n1.split()
-            words2 = n2.split()
-            if words1 and words2 and words1[-1] == words2[-1]:
-                # One is just nickname, or first word matches
-                if len(words1) == 1 or len(words2) == 1:
-                    return True
-                if words1[0] == words2[0]:
-                    return True
-            # Check if first word matches (for school/city names)
-            if words1 and words2 and words1[0] == words2[0] and len(words1[0]) > 3:
-                return True
-            # Check if all words from shorter are in longer
-            if len(words1) > 1 and len(words2) > 1:
-                shorter = words1 if len(words1) < len(words2) else words2
-                longer = words2 if len(words1) < len(words2) else words1
-                if all(word in longer for word in shorter if len(word) > 2):
-                    return True
-            return False
+        logger.debug("Devigged probabilities: p_outcome_1=%.4f, p_outcome_2=%.4f", p_outcome_1, p_outcome_2)
         
         # Determine which probability corresponds to the team using fuzzy matching
-        print(f"[DEBUG] [EventProcessor] Checking if '{team_name}' matches outcome_1: '{sportsbook_odds.outcome_1}'")
-        match_1 = _team_matches(team_name, sportsbook_odds.outcome_1)
-        print(f"[DEBUG] [EventProcessor] Match with outcome_1: {match_1}")
+        logger.debug("Checking if '%s' matches outcome_1: '%s'", team_name, sportsbook_odds.outcome_1)
+        match_1 = self._team_matches(team_name, sportsbook_odds.outcome_1)
+        logger.debug("Match with outcome_1: %s", match_1)
         
         if match_1:
-            print(f"[DEBUG] [EventProcessor] Returning p_outcome_1: {p_outcome_1:.4f}")
+            logger.debug("Returning p_outcome_1: %.4f", p_outcome_1)
             return p_outcome_1
         
-        print(f"[DEBUG] [EventProcessor] Checking if '{team_name}' matches outcome_2: '{sportsbook_odds.outcome_2}'")
-        match_2 = _team_matches(team_name, sportsbook_odds.outcome_2)
-        print(f"[DEBUG] [EventProcessor] Match with outcome_2: {match_2}")
+        logger.debug("Checking if '%s' matches outcome_2: '%s'", team_name, sportsbook_odds.outcome_2)
+        match_2 = self._team_matches(team_name, sportsbook_odds.outcome_2)
+        logger.debug("Match with outcome_2: %s", match_2)
         
         if match_2:
-            print(f"[DEBUG] [EventProcessor] Returning p_outcome_2: {p_outcome_2:.4f}")
+            logger.debug("Returning p_outcome_2: %.4f", p_outcome_2)
             return p_outcome_2
         
-        print(f"[DEBUG] [EventProcessor] No match found for team '{team_name}' with either outcome")
+        logger.debug("No match found for team '%s' with either outcome", team_name)
         return None
 
 
+    @staticmethod
+    def _team_matches(t1: str, t2: str) -> bool:
+        """Fuzzy team name matching."""
+        n1 = " ".join(t1.lower().strip().split())
+        n2 = " ".join(t2.lower().strip().split())
+        if n1 == n2:
+            return True
+        # Check if one contains the other
+        if n1 in n2 or n2 in n1:
+            return True
+        # Check if last word matches (nickname)
+        words1 = n1.split()
+        words2 = n2.split()
+        if words1 and words2 and words1[-1] == words2[-1]:
+            # One is just nickname, or first word matches
+            if len(words1) == 1 or len(words2) == 1:
+                return True
+            if words1[0] == words2[0]:
+                return True
+        # Check if first word matches (for school/city names)
+        if words1 and words2 and words1[0] == words2[0] and len(words1[0]) > 3:
+            return True
+        # Check if all words from shorter are in longer
+        if len(words1) > 1 and len(words2) > 1:
+            shorter = words1 if len(words1) < len(words2) else words2
+            longer = words2 if len(words1) < len(words2) else words1
+            if all(word in longer for word in shorter if len(word) > 2):
+                return True
+        return False
+
     @staticmethod
     def _devig(q1: float, q2: float) -> Optional[tuple[float, float]]:
         """
@@ -150,4 +282,12 @@ class EventProcessor:
         total = q1 + q2
         if total <= 0:
             return None
-        return (q1 / total), (q2 / total)
\ No newline at end of file
+        return (q1 / total), (q2 / total)
+
+
+def _as_float(value: object) -> float:
+    """float(value), or NaN when missing or not numeric."""
+    try:
+        return float(value)  # type: ignore[arg-type]
+    except (TypeError, ValueError):
+        return math.nan
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Cross-sport Gamma event scanner.
+
+Pages the Gamma game events listing once per cycle, routes each event to its
+sport(s) by slug prefix and publishes the per-sport lists. Sport workers wait
+for the next published scan instead of each paging the same listing.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+from value_bets_new import tracing
+from value_bets_new.constants import MarketType
+from value_bets_new.polymarket import PolymarketEvent, PolymarketInterface
+
+logger = logging.getLogger(__name__)
+
+
+class GammaEventScanner:
+    """
+    Typical usage:
+      scanner = GammaEventScanner(polymarket_interface, prefixes_by_sport, markets_by_sport)
+      asyncio.create_task(scanner.run())
+      version, events = await scanner.next_events(Sport.BASKETBALL, after_version=0)
+    """
+
+    # Delay between the end of one scan and the start of the next
+    SCAN_INTERVAL_S = 10.0
+    # Wait before retrying after a failed scan to avoid rapid error loops
+    ERROR_RETRY_S = 60.0
+
+    def __init__(
+        self,
+        polymarket_interface: PolymarketInterface,
+        prefixes_by_sport: Dict[Any, List[str]],
+        markets_by_sport: Dict[Any, List[MarketType]],
+    ) -> None:
+        self.polymarket_interface = polymarket_interface
+        self.prefixes_by_sport = prefixes_by_sport
+        self.markets_by_sport = markets_by_sport
+        self.version = 0
+        self._events_by_sport: Dict[Any, List[PolymarketEvent]] = {}
+        self._condition: Optional[asyncio.Condition] = None
+
+    def _get_condition(self) -> asyncio.Condition:
+        """Get or create the condition in the current event loop."""
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        return self._condition
+
+    async def scan_once(self) -> Dict[Any, List[PolymarketEvent]]:
+        """Run one scan and publish its results to waiting sport workers."""
+        with tracing.span("gamma_scan", scan=self.version + 1):
+            events_by_sport = await self.polymarket_interface.fetch_polymarket_events_by_sport(
+                self.prefixes_by_sport,
+                self.markets_by_sport,
+            )
+        condition = self._get_condition()
+        async with condition:
+            self._events_by_sport = events_by_sport
+            self.version += 1
+            condition.notify_all()
+        counts = {getattr(sport, "value", sport): len(events) for sport, events in events_by_sport.items()}
+        logger.info("Scan %s published: %s", self.version, counts)
+        return events_by_sport
+
+    async def run(self) -> None:
+        while True:
+            try:
+                await self.scan_once()
+            except Exception as e:
+                logger.exception("Exception during scan: %s", e)
+                await asyncio.sleep(self.ERROR_RETRY_S)
+                continue
+            await asyncio.sleep(self.SCAN_INTERVAL_S)
+
+    async def next_events(self, sport: Any, after_version: int) -> Tuple[int, List[PolymarketEvent]]:
+        """
+        Wait for a scan newer than `after_version` and return (version, events for sport).
+        Workers that fall behind skip straight to the latest scan.
+        """
+        condition = self._get_condition()
+        async with condition:
+            await condition.wait_for(lambda: self.version > after_version)
+            return self.version, list(self._events_by_sport.get(sport, []))
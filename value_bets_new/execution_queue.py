@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Order execution stage.
+
+Value bets found by the evaluation loop are submitted here instead of being
+traded inline. A fixed pool of workers drains a priority queue ordered by
+expected payout (highest first), then by time to start (soonest first), so a
+marginal edge never holds a better one behind it while signing and posting.
+
+Each value bet has a key (e.g. (market_slug, team)); resubmitting a key that is
+still queued replaces the queued request, and a request whose key is already
+being executed by another worker is skipped (the next cycle re-evaluates it
+against the fill). Requests older than `max_age_s` when a
+worker picks them up are dropped rather than traded on stale prices.
+
+Latency from spotting to order start (queue wait) and to order completion is
+sampled for `stats()`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import logging
+import math
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Deque, Dict, Hashable, Optional, Set
+
+from value_bets_new import clock
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ExecutionRequest:
+    key: Hashable
+    expected_payout_per_1: float
+    start_time: Optional[datetime]
+    payload: Any
+    spotted_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def age_s(self) -> float:
+        return time.monotonic() - self.spotted_at
+
+
+def _percentile(samples: Deque[float], q: float) -> Optional[float]:
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+class ExecutionQueue:
+    """
+    Typical usage:
+      queue = ExecutionQueue(execute)  # async def execute(request) -> None
+      asyncio.create_task(queue.run())
+      await queue.submit(ExecutionRequest(key, value_bet.expected_payout_per_1, start_time, payload))
+    """
+
+    # Orders signed/posted at once; the CLOB client calls run in worker threads
+    CONCURRENCY = 2
+    # Opportunities waiting longer than this are dropped; the next cycle re-evaluates them
+    MAX_AGE_S = 5.0
+    # Latency samples kept for percentiles
+    LATENCY_SAMPLES = 1000
+
+    def __init__(
+        self,
+        execute: Callable[[ExecutionRequest], Awaitable[None]],
+        *,
+        concurrency: Optional[int] = None,
+        max_age_s: Optional[float] = None,
+        on_drop: Optional[Callable[[ExecutionRequest], None]] = None,
+    ) -> None:
+        self.execute = execute
+        self.concurrency = self.CONCURRENCY if concurrency is None else int(concurrency)
+        self.max_age_s = self.MAX_AGE_S if max_age_s is None else float(max_age_s)
+        self.on_drop = on_drop
+        self._queue: Optional[asyncio.PriorityQueue] = None
+        self._pending: Dict[Hashable, ExecutionRequest] = {}
+        # Keys a worker is currently executing; a second order for one would duplicate it
+        self._executing: Set[Hashable] = set()
+        # Tie-breaker so equal priorities run in submission order
+        self._seq = itertools.count()
+        self._wait_s: Deque[float] = deque(maxlen=self.LATENCY_SAMPLES)
+        self._total_s: Deque[float] = deque(maxlen=self.LATENCY_SAMPLES)
+        self._counts = {"submitted": 0, "executed": 0, "failed": 0, "dropped_stale": 0, "superseded": 0, "skipped_in_flight": 0}
+
+    def _get_queue(self) -> asyncio.PriorityQueue:
+        """Get or create the queue in the current event loop."""
+        if self._queue is None:
+            self._queue = asyncio.PriorityQueue()
+        return self._queue
+
+    @staticmethod
+    def _priority(request: ExecutionRequest) -> tuple:
+        if request.start_time is not None:
+            seconds_to_start = (request.start_time - clock.utcnow()).total_seconds()
+        else:
+            seconds_to_start = math.inf
+        return (-request.expected_payout_per_1, seconds_to_start)
+
+    async def submit(self, request: ExecutionRequest) -> None:
+        previous = self._pending.get(request.key)
+        if previous is not None:
+            self._counts["superseded"] += 1
+        self._pending[request.key] = request
+        self._counts["submitted"] += 1
+        await self._get_queue().put((self._priority(request), next(self._seq), request))
+
+    async def run(self) -> None:
+        await asyncio.gather(*(self._worker() for _ in range(self.concurrency)))
+
+    async def _worker(self) -> None:
+        queue = self._get_queue()
+        while True:
+            _, _, request = await queue.get()
+            try:
+                if self._pending.get(request.key) is not request:
+                    # Replaced by a newer submission for the same key
+                    continue
+                del self._pending[request.key]
+                wait_s = request.age_s
+                if wait_s > self.max_age_s:
+                    self._counts["dropped_stale"] += 1
+                    logger.info("Dropped stale request %s (%.2fs old)", request.key, wait_s)
+                    if self.on_drop is not None:
+                        self.on_drop(request)
+                    continue
+                if request.key in self._executing:
+                    self._counts["skipped_in_flight"] += 1
+                    logger.debug("Skipped %s: an order for it is already in flight", request.key)
+                    if self.on_drop is not None:
+                        self.on_drop(request)
+                    continue
+                self._wait_s.append(wait_s)
+                self._executing.add(request.key)
+                try:
+                    await self.execute(request)
+                    self._counts["executed"] += 1
+                except Exception as e:
+                    self._counts["failed"] += 1
+                    logger.exception("Execution failed for %s: %s", request.key, e)
+                finally:
+                    self._executing.discard(request.key)
+                self._total_s.append(request.age_s)
+            finally:
+                queue.task_done()
+
+    def stats(self) -> Dict[str, Any]:
+        def _ms(value: Optional[float]) -> Optional[float]:
+            return None if value is None else round(value * 1000.0, 1)
+
+        return {
+            **self._counts,
+            "queued": len(self._pending),
+            "executing": len(self._executing),
+            "wait_p50_ms": _ms(_percentile(self._wait_s, 0.50)),
+            "wait_p99_ms": _ms(_percentile(self._wait_s, 0.99)),
+            "total_p50_ms": _ms(_percentile(self._total_s, 0.50)),
+            "total_p99_ms": _ms(_percentile(self._total_s, 0.99)),
+        }
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Shared async HTTP transport for the value bets bot.
+
+One pooled aiohttp session (keep-alive connections, cached DNS) is shared by the
+Gamma, CLOB and Arcadia clients. Concurrency is capped per host, so a slow
+endpoint only queues its own requests instead of stalling every sport task.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import logging
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+import aiohttp
+
+from value_bets_new import metrics, tracing
+
+logger = logging.getLogger(__name__)
+
+_REQUESTS = metrics.counter(
+    "value_bets_http_requests_total",
+    "HTTP request attempts by host, method and status (\"error\" for connection errors and timeouts)",
+    ("host", "method", "status"),
+)
+_LATENCY = metrics.histogram(
+    "value_bets_http_request_duration_seconds",
+    "HTTP request attempt latency by host, from acquiring the per-host slot to the decoded body",
+    ("host",),
+)
+
+
+# (method, url, params, json_body, status, payload, elapsed_s); payload is the decoded
+# JSON for 2xx responses and the (truncated) body text otherwise.
+ResponseHook = Callable[[str, str, Optional[Dict[str, str]], Any, int, Any, float], None]
+
+
+# Max concurrent in-flight requests per host. Hosts not listed use `default_host_limit`.
+DEFAULT_HOST_LIMITS: Dict[str, int] = {
+    "gamma-api.polymarket.com": 8,
+    "clob.polymarket.com": 16,
+    "guest.api.arcadia.pinnacle.com": 6,
+}
+
+
+def _exponential_backoff(attempt: int) -> float:
+    """1s, 2s, 4s, ... (attempt is 0-based)."""
+    return float(2 ** attempt)
+
+
+class HttpStatusError(Exception):
+    """Raised for a non-2xx response that is not (or no longer) retried."""
+
+    def __init__(self, status: int, url: str, body: str = "") -> None:
+        super().__init__(f"HTTP {status} for {url}")
+        self.status = status
+        self.url = url
+        self.body = body
+
+
+class AsyncHttpClient:
+    """
+    Pooled async JSON client.
+
+    The aiohttp session is created lazily on first use so the client can be
+    constructed outside of a running event loop (e.g. in `__init__` methods).
+
+    `rewrite_url` maps each request URL before it is sent (e.g. to a local replay
+    server) and `on_response` sees every final response under its original URL
+    (e.g. to record it); see http_replay.py.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_connections: int = 64,
+        host_limits: Optional[Dict[str, int]] = None,
+        default_host_limit: int = 8,
+        timeout_s: float = 20.0,
+        keepalive_s: float = 60.0,
+        rewrite_url: Optional[Callable[[str], str]] = None,
+        on_response: Optional[ResponseHook] = None,
+    ) -> None:
+        self.max_connections = int(max_connections)
+        self.host_limits = dict(DEFAULT_HOST_LIMITS if host_limits is None else host_limits)
+        self.default_host_limit = int(default_host_limit)
+        self.timeout_s = float(timeout_s)
+        self.keepalive_s = float(keepalive_s)
+        self.rewrite_url = rewrite_url
+        self.on_response = on_response
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        # request id -> (method, host, path, monotonic start) while it holds a host slot
+        self._in_flight: Dict[int, Tuple[str, str, str, float]] = {}
+        self._request_ids = itertools.count(1)
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_connections,
+                limit_per_host=max(self.host_limits.values(), default=self.default_host_limit),
+                keepalive_timeout=self.keepalive_s,
+                ttl_dns_cache=300,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout_s),
+            )
+        return self._session
+
+    def _semaphore(self, host: str) -> asyncio.Semaphore:
+        sem = self._semaphores.get(host)
+        if sem is None:
+            sem = asyncio.Semaphore(self.host_limits.get(host, self.default_host_limit))
+            self._semaphores[host] = sem
+        return sem
+
+    async def request_json(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Optional[Dict[str, str]] = None,
+        json_body: Any = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout_s: Optional[float] = None,
+        max_retries: int = 3,
+        retry_statuses: Iterable[int] = (),
+        backoff_s: Callable[[int], float] = _exponential_backoff,
+    ) -> Any:
+        """
+        Send a request and return the decoded JSON body.
+
+        Connection errors and timeouts are retried up to `max_retries` attempts,
+        as are responses whose status is in `retry_statuses`. Any other non-2xx
+        response raises `HttpStatusError` immediately. Backoff sleeps are
+        awaited outside the per-host slot so they never block other requests.
+        """
+        original_url = url
+        if self.rewrite_url is not None:
+            url = self.rewrite_url(url)
+        host = urlsplit(url).hostname or ""
+        original_parts = urlsplit(original_url)
+        retry_statuses = tuple(retry_statuses)
+        timeout = aiohttp.ClientTimeout(total=timeout_s) if timeout_s is not None else None
+
+        metric_host = original_parts.hostname or ""
+        for attempt in range(max_retries):
+            last_attempt = attempt >= max_retries - 1
+            request_id = next(self._request_ids)
+            status = "error"
+            try:
+                # Pool wait included: it is part of the latency the caller sees
+                with tracing.http_span(metric_host, method.upper(), original_parts.path):
+                    async with self._semaphore(host):
+                        started = time.monotonic()
+                        self._in_flight[request_id] = (method.upper(), metric_host, original_parts.path, started)
+                        session = self._get_session()
+                        async with session.request(
+                            method.upper(),
+                            url,
+                            params=params,
+                            json=json_body,
+                            headers=headers,
+                            timeout=timeout,
+                        ) as resp:
+                            status = str(resp.status)
+                            if 200 <= resp.status < 300:
+                                payload = await resp.json(content_type=None)
+                                if self.on_response is not None:
+                                    self.on_response(method.upper(), original_url, params, json_body, resp.status, payload, time.monotonic() - started)
+                                return payload
+                            body = await resp.text()
+                            if resp.status not in retry_statuses or last_attempt:
+                                if self.on_response is not None:
+                                    self.on_response(method.upper(), original_url, params, json_body, resp.status, body[:500], time.monotonic() - started)
+                                raise HttpStatusError(resp.status, original_url, body[:500])
+                logger.debug("HTTP %s for %s (attempt %s/%s), retrying...", resp.status, url, attempt + 1, max_retries)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                if last_attempt:
+                    logger.warning("Connection error after %s attempts: %r", max_retries, e)
+                    raise
+                logger.debug("Connection error (attempt %s/%s): %r. Retrying...", attempt + 1, max_retries, e)
+            finally:
+                entry = self._in_flight.pop(request_id, None)
+                if entry is not None:
+                    _REQUESTS.inc(host=metric_host, method=method.upper(), status=status)
+                    _LATENCY.observe(time.monotonic() - entry[3], host=metric_host)
+            await asyncio.sleep(backoff_s(attempt))
+        return None
+
+    def in_flight(self) -> List[Dict[str, Any]]:
+        """Requests currently holding a host slot, oldest first."""
+        now = time.monotonic()
+        return [
+            {"method": method, "host": host, "path": path, "age_ms": round((now - started) * 1000, 1)}
+            for method, host, path, started in sorted(self._in_flight.values(), key=lambda r: r[3])
+        ]
+
+    def in_flight_by_host(self) -> Dict[str, int]:
+        counts: Dict[str, int] = {}
+        for _, host, _, _ in self._in_flight.values():
+            counts[host] = counts.get(host, 0) + 1
+        return counts
+
+    async def get_json(self, url: str, **kwargs: Any) -> Any:
+        return await self.request_json("GET", url, **kwargs)
+
+    async def post_json(self, url: str, body: Any, **kwargs: Any) -> Any:
+        return await self.request_json("POST", url, json_body=body, **kwargs)
+
+    async def ws_connect(self, url: str, **kwargs: Any) -> aiohttp.ClientWebSocketResponse:
+        """Open a websocket on the pooled session (caller closes it)."""
+        return await self._get_session().ws_connect(url, **kwargs)
+
+    async def close(self) -> None:
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
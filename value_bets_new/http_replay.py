@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+Record and replay the bot's HTTP traffic (Gamma, CLOB and Arcadia).
+
+Recording: `HttpRecorder.record` is an `AsyncHttpClient.on_response` hook that
+appends every response to a gzip-compressed JSONL corpus. Payloads identical to
+an earlier one (unchanged Gamma pages, empty books) are stored once and referenced
+by hash afterwards.
+
+Replay: `ReplayServer` is a local aiohttp server that answers requests from a
+corpus. `AsyncHttpClient(rewrite_url=server.rewrite_url)` sends
+`https://gamma-api.polymarket.com/events?...` to
+`http://127.0.0.1:<port>/gamma-api.polymarket.com/events?...`, where it is matched
+by method, URL, query and JSON body.
+
+- speed > 0: a replay clock runs `speed` times faster than the recording. Each
+  request gets the latest recording of that request at the replay clock's time,
+  delayed by its recorded latency / speed.
+- speed == 0: the n-th request for a key gets the n-th recording, with no delays,
+  so cycles run as fast as the bot can process them.
+
+`ReplayTrader` stands in for `PolymarketTrader` offline: every order fills in
+full and nothing is sent anywhere.
+
+Typical usage (see value_bets_orchestrator.py --record/--replay):
+  recorder = HttpRecorder("corpus.jsonl.gz")
+  http = AsyncHttpClient(on_response=recorder.record)
+  ...
+  server = ReplayServer(ReplayCorpus.load("corpus.jsonl.gz"), speed=10.0)
+  await server.start()
+  http = AsyncHttpClient(rewrite_url=server.rewrite_url)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import bisect
+import gzip
+import hashlib
+import json
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+from aiohttp import web
+
+logger = logging.getLogger(__name__)
+
+
+CORPUS_FORMAT = "http-replay"
+CORPUS_VERSION = 1
+
+
+def _canonical_json(value: Any) -> str:
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
+
+
+def request_key(method: str, url: str, params: Optional[Dict[str, Any]] = None, json_body: Any = None) -> str:
+    """
+    Identity of a request for matching recordings: method, host, path, the sorted
+    query (URL query and `params` merged) and a hash of the JSON body.
+    """
+    parts = urlsplit(url)
+    query = parse_qsl(parts.query, keep_blank_values=True)
+    query.extend((str(k), str(v)) for k, v in (params or {}).items())
+    key = f"{method.upper()} {parts.hostname}{parts.path}"
+    if query:
+        key += "?" + urlencode(sorted(query))
+    if json_body is not None:
+        key += " #" + hashlib.sha1(_canonical_json(json_body).encode("utf-8")).hexdigest()[:16]
+    return key
+
+
+class HttpRecorder:
+    """Writes responses seen by an AsyncHttpClient to a gzip JSONL corpus."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._file = gzip.open(path, "wt", encoding="utf-8")
+        self._started = time.monotonic()
+        self._payload_hashes: set[str] = set()
+        self.recorded = 0
+        self._file.write(_canonical_json({
+            "format": CORPUS_FORMAT,
+            "version": CORPUS_VERSION,
+            "recorded_at": time.time(),
+        }) + "\n")
+
+    def record(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, str]],
+        json_body: Any,
+        status: int,
+        payload: Any,
+        elapsed_s: float,
+    ) -> None:
+        if self._file.closed:
+            return
+        entry: Dict[str, Any] = {
+            "t": round(time.monotonic() - self._started, 4),
+            "key": request_key(method, url, params, json_body),
+            "status": status,
+            "elapsed_s": round(elapsed_s, 4),
+        }
+        encoded = _canonical_json(payload)
+        digest = hashlib.sha1(encoded.encode("utf-8")).hexdigest()
+        if digest in self._payload_hashes:
+            entry["ref"] = digest
+        else:
+            self._payload_hashes.add(digest)
+            entry["hash"] = digest
+            entry["payload"] = payload
+        self._file.write(_canonical_json(entry) + "\n")
+        self.recorded += 1
+
+    def close(self) -> None:
+        if not self._file.closed:
+            self._file.close()
+            logger.info("Recorded %s responses (%s distinct payloads) to %s", self.recorded, len(self._payload_hashes), self.path)
+
+
+@dataclass(frozen=True)
+class RecordedResponse:
+    t: float
+    status: int
+    elapsed_s: float
+    payload: Any
+
+
+class ReplayCorpus:
+    """Recorded responses grouped by request key, in recording order."""
+
+    def __init__(self, responses: Dict[str, List[RecordedResponse]], recorded_at: Optional[float] = None) -> None:
+        self.responses = responses
+        # Epoch time the recording started (None for corpora built in memory)
+        self.recorded_at = recorded_at
+        self._times = {key: [r.t for r in recorded] for key, recorded in responses.items()}
+
+    @classmethod
+    def load(cls, path: str) -> "ReplayCorpus":
+        payloads: Dict[str, Any] = {}
+        responses: Dict[str, List[RecordedResponse]] = {}
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            header = json.loads(f.readline() or "{}")
+            if header.get("format") != CORPUS_FORMAT:
+                raise ValueError(f"{path} is not an {CORPUS_FORMAT} corpus")
+            for line in f:
+                entry = json.loads(line)
+                if "payload" in entry:
+                    payloads[entry["hash"]] = entry["payload"]
+                    payload = entry["payload"]
+                else:
+                    payload = payloads[entry["ref"]]
+                responses.setdefault(entry["key"], []).append(RecordedResponse(
+                    t=float(entry["t"]),
+                    status=int(entry["status"]),
+                    elapsed_s=float(entry["elapsed_s"]),
+                    payload=payload,
+                ))
+        return cls(responses, recorded_at=header.get("recorded_at"))
+
+    def __len__(self) -> int:
+        return sum(len(recorded) for recorded in self.responses.values())
+
+    def at(self, key: str, t: float) -> Optional[RecordedResponse]:
+        """Latest recording of key made at or before t (the first one if t precedes them all)."""
+        recorded = self.responses.get(key)
+        if not recorded:
+            return None
+        i = bisect.bisect_right(self._times[key], t) - 1
+        return recorded[max(i, 0)]
+
+    def nth(self, key: str, n: int) -> Optional[RecordedResponse]:
+        """n-th recording of key (the last one once they run out)."""
+        recorded = self.responses.get(key)
+        if not recorded:
+            return None
+        return recorded[min(n, len(recorded) - 1)]
+
+
+class ReplayServer:
+    """Local HTTP stand-in for the recorded hosts."""
+
+    def __init__(self, corpus: ReplayCorpus, *, speed: float = 1.0, host: str = "127.0.0.1", port: int = 0) -> None:
+        self.corpus = corpus
+        self.speed = float(speed)
+        self.host = host
+        self.port = port
+        self._runner: Optional[web.AppRunner] = None
+        self._started: Optional[float] = None
+        self._served_counts: Dict[str, int] = {}
+        self.served = 0
+        self.missing = 0
+
+    async def start(self) -> None:
+        app = web.Application()
+        app.router.add_route("*", "/{host}/{path:.*}", self._handle)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        # Resolve the ephemeral port when port=0
+        self.port = site._server.sockets[0].getsockname()[1]  # type: ignore[union-attr]
+        self._started = time.monotonic()
+        logger.info("Replaying %s responses on http://%s:%s (speed %s)", len(self.corpus), self.host, self.port, self.speed)
+
+    def rewrite_url(self, url: str) -> str:
+        parts = urlsplit(url)
+        rewritten = f"http://{self.host}:{self.port}/{parts.hostname}{parts.path}"
+        return rewritten + (f"?{parts.query}" if parts.query else "")
+
+    def _select(self, key: str) -> Optional[RecordedResponse]:
+        if self.speed <= 0:
+            n = self._served_counts.get(key, 0)
+            self._served_counts[key] = n + 1
+            return self.corpus.nth(key, n)
+        elapsed = time.monotonic() - (self._started or time.monotonic())
+        return self.corpus.at(key, elapsed * self.speed)
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        raw = await request.read()
+        json_body = json.loads(raw) if raw else None
+        url = f"https://{request.match_info['host']}/{request.match_info['path']}"
+        if request.query_string:
+            url += f"?{request.query_string}"
+        key = request_key(request.method, url, None, json_body)
+        recorded = self._select(key)
+        if recorded is None:
+            self.missing += 1
+            logger.debug("No recording for %s", key)
+            return web.json_response({"error": "not recorded", "key": key}, status=404)
+        if self.speed > 0 and recorded.elapsed_s > 0:
+            await asyncio.sleep(recorded.elapsed_s / self.speed)
+        self.served += 1
+        if 200 <= recorded.status < 300:
+            return web.json_response(recorded.payload, status=recorded.status)
+        return web.Response(text=str(recorded.payload), status=recorded.status)
+
+    def stats(self) -> Dict[str, int]:
+        return {"served": self.served, "missing": self.missing}
+
+    async def close(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+
+class ReplayTrader:
+    """Offline stand-in for PolymarketTrader: fills every order in full, sends nothing."""
+
+    def __init__(self, bankroll: float = 1000.0) -> None:
+        self.bankroll = float(bankroll)
+        self.orders: List[Tuple[str, float, float, str]] = []
+
+    def prewarm(self, token_ids: Iterable[str]) -> int:
+        return 0
+
+    def execute_trade(self, side, price, size, token_id, order_type=None):
+        self.orders.append((str(side), float(price), float(size), str(token_id)))
+        return {
+            "success": True,
+            "status": "matched",
+            "orderID": f"replay-{len(self.orders)}",
+            "matchedAmount": str(size),
+        }
+
+    def get_usdc_balance(self) -> float:
+        return self.bankroll
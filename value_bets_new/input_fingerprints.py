@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Change detection for value bet evaluation inputs.
+
+Each (market_slug, outcome) is evaluated from the Polymarket top of book, its
+ask ladder (execution sizes the order against it) and the Pinnacle price
+pair/line. `InputFingerprints` remembers the last inputs seen per key and bumps
+a version only when they move, so the polling loop can skip outcomes whose
+inputs are unchanged since the previous cycle.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Dict, Hashable, Optional, Tuple
+
+from value_bets_new.constants import MarketOdds, SportsbookOdds
+
+
+Fingerprint = Tuple[object, ...]
+
+
+def evaluation_fingerprint(market_odds: MarketOdds, sportsbook_odds: SportsbookOdds) -> Fingerprint:
+    """Everything `EventProcessor` and the depth sizing of its value bets read for one outcome."""
+    return (
+        market_odds.team_name,
+        market_odds.best_bid,
+        market_odds.bid_volume,
+        market_odds.best_ask,
+        market_odds.ask_volume,
+        # Liquidity arriving behind the best ask can turn a too-thin fill into a tradeable one
+        market_odds.ask_levels,
+        sportsbook_odds.outcome_1,
+        sportsbook_odds.outcome_2,
+        sportsbook_odds.outcome_1_cost_to_win_1,
+        sportsbook_odds.outcome_2_cost_to_win_1,
+        sportsbook_odds.point,
+    )
+
+
+class InputFingerprints:
+    """
+    Typical usage:
+      fingerprints = InputFingerprints()
+      if fingerprints.update((market_slug, team), evaluation_fingerprint(odds, book_odds)):
+          ...  # inputs moved: evaluate
+    """
+
+    def __init__(self, max_entries: int = 20000) -> None:
+        self.max_entries = int(max_entries)
+        # key -> (version, fingerprint), least recently updated first
+        self._entries: "OrderedDict[Hashable, Tuple[int, Fingerprint]]" = OrderedDict()
+        self.changed = 0
+        self.unchanged = 0
+
+    def update(self, key: Hashable, fingerprint: Fingerprint) -> bool:
+        """Record the latest inputs for key. True if they differ from the previous ones."""
+        entry = self._entries.get(key)
+        if entry is not None and entry[1] == fingerprint:
+            self._entries.move_to_end(key)
+            self.unchanged += 1
+            return False
+        version = entry[0] + 1 if entry is not None else 1
+        self._entries[key] = (version, fingerprint)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        self.changed += 1
+        return True
+
+    def version(self, key: Hashable) -> Optional[int]:
+        entry = self._entries.get(key)
+        return entry[0] if entry is not None else None
+
+    def invalidate(self, key: Hashable) -> None:
+        """Force the next `update` for key to report a change (e.g. after a failed trade)."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            # Keep the version so it stays monotonic per key
+            self._entries[key] = (entry[0], ())
+
+    def stats(self) -> Dict[str, int]:
+        return {"entries": len(self._entries), "changed": self.changed, "unchanged": self.unchanged}
+
+    def __len__(self) -> int:
+        return len(self._entries)
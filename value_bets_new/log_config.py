@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Logging setup for the value bets bot.
+
+Modules log through `logging.getLogger(__name__)` with %-style arguments, so a
+message below the effective level costs one level check and is never formatted.
+`configure_logging` installs a single QueueHandler on the root logger that
+enqueues records unformatted; a QueueListener thread does the formatting and I/O
+(so log arguments should be values that are not mutated afterwards):
+
+- a console handler with human-readable lines
+- a size-rotated JSONL file whose rotated segments are gzip-compressed
+
+Levels can be set per module (logger name), e.g.
+  configure_logging("INFO", module_levels={"value_bets_new.event_processor": "DEBUG"})
+or through VALUE_BETS_LOG_LEVELS="value_bets_new.event_processor=DEBUG,value_bets_new.http_client=WARNING".
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import shutil
+from datetime import datetime, timezone
+from typing import Dict, Optional, Union
+
+
+DEFAULT_LOG_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "logs")
+LOG_LEVELS_ENV = "VALUE_BETS_LOG_LEVELS"
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+class JsonlFormatter(logging.Formatter):
+    """One JSON object per line. Structured fields come from `extra={"fields": {...}}`."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        fields = getattr(record, "fields", None)
+        if isinstance(fields, dict):
+            entry.update(fields)
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """Enqueue the record untouched; the listener thread does the %-formatting."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def _gzip_namer(name: str) -> str:
+    return name + ".gz"
+
+
+def _gzip_rotator(source: str, dest: str) -> None:
+    with open(source, "rb") as src, gzip.open(dest, "wb") as dst:
+        shutil.copyfileobj(src, dst)
+    os.remove(source)
+
+
+def gzip_rotating_file_handler(path: str, *, max_bytes: int, backup_count: int) -> logging.Handler:
+    """RotatingFileHandler whose rotated segments are written as `<path>.N.gz`."""
+    handler = logging.handlers.RotatingFileHandler(
+        path, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8", delay=True
+    )
+    handler.namer = _gzip_namer
+    handler.rotator = _gzip_rotator
+    return handler
+
+
+def parse_module_levels(spec: Optional[str]) -> Dict[str, str]:
+    """"a.b=DEBUG,c=WARNING" -> {"a.b": "DEBUG", "c": "WARNING"}. Malformed entries are ignored."""
+    levels: Dict[str, str] = {}
+    for item in (spec or "").split(","):
+        name, sep, level = item.partition("=")
+        if sep and name.strip() and level.strip():
+            levels[name.strip()] = level.strip().upper()
+    return levels
+
+
+def configure_logging(
+    level: Union[int, str] = "INFO",
+    *,
+    module_levels: Optional[Dict[str, Union[int, str]]] = None,
+    log_dir: Optional[str] = DEFAULT_LOG_DIR,
+    log_file: str = "value_bets.jsonl",
+    console: bool = True,
+    max_bytes: int = 20 * 1024 * 1024,
+    backup_count: int = 10,
+) -> None:
+    """
+    Route all logging through a background queue. Safe to call again (the previous
+    listener is stopped first). `log_dir=None` disables the JSONL file.
+    """
+    global _listener
+    shutdown_logging()
+
+    handlers = []
+    if console:
+        console_handler = logging.StreamHandler()
+        console_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s [%(name)s] %(message)s"))
+        handlers.append(console_handler)
+    if log_dir is not None:
+        os.makedirs(log_dir, exist_ok=True)
+        file_handler = gzip_rotating_file_handler(
+            os.path.join(log_dir, log_file), max_bytes=max_bytes, backup_count=backup_count
+        )
+        file_handler.setFormatter(JsonlFormatter())
+        handlers.append(file_handler)
+
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(_DeferredQueueHandler(log_queue))
+    root.setLevel(level if isinstance(level, int) else level.upper())
+
+    levels: Dict[str, Union[int, str]] = dict(parse_module_levels(os.environ.get(LOG_LEVELS_ENV)))
+    levels.update(module_levels or {})
+    for name, module_level in levels.items():
+        logging.getLogger(name).setLevel(module_level if isinstance(module_level, int) else module_level.upper())
+
+    _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+
+
+def shutdown_logging() -> None:
+    """Flush queued records and stop the listener thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
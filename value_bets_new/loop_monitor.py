@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+Event-loop lag and blocking-call detector.
+
+A heartbeat callback rescheduled every `interval_s` on the loop measures
+scheduling lag (how late it ran). A watchdog thread checks the heartbeat: once it
+is overdue by `block_threshold_s`, something is blocking the loop (a sync
+`requests` call, `time.sleep`, heavy parsing). While the block lasts the watchdog
+samples the loop thread's stack and attributes the blocked time to the innermost
+frame in our own code, e.g. `value_bets_new/polymarket.py`, so the module
+responsible shows up even when the time is spent inside a library.
+
+Each block is logged with its duration, culprit and the stack from its first
+sample; `stats()` keeps lag percentiles and blocked seconds per module.
+
+Typical usage (inside the running loop):
+  monitor = LoopMonitor(block_threshold_s=0.1)
+  monitor.start()
+  ...
+  logger.info("%s", monitor.stats())
+  monitor.stop()
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import sys
+import sysconfig
+import threading
+import time
+import traceback
+from collections import deque
+from dataclasses import dataclass
+from types import FrameType
+from typing import Deque, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_STDLIB_DIR = sysconfig.get_paths()["stdlib"]
+
+
+@dataclass(frozen=True)
+class BlockEvent:
+    started_at: float  # epoch seconds
+    duration_s: float  # how late the heartbeat ran (a lower bound on the blocking call)
+    culprit: str  # module (path relative to the repo when it is ours)
+    location: str  # "file:line in function" of the culprit frame
+    stack: str  # loop thread stack at the first sample
+
+
+class LoopMonitor:
+    # Heartbeat period; lag is measured once per beat
+    INTERVAL_S = 0.1
+    # Overdue heartbeat beyond this counts as a blocked loop
+    BLOCK_THRESHOLD_S = 0.1
+    # Watchdog polling (and stack sampling) period
+    CHECK_INTERVAL_S = 0.02
+    # Lag samples kept for the percentiles, and block events kept for reports
+    LAG_WINDOW = 3000
+    MAX_EVENTS = 200
+    # Frames included in a captured stack
+    STACK_LIMIT = 30
+
+    def __init__(
+        self,
+        *,
+        interval_s: float = INTERVAL_S,
+        block_threshold_s: float = BLOCK_THRESHOLD_S,
+        check_interval_s: float = CHECK_INTERVAL_S,
+        code_root: str = REPO_ROOT,
+    ) -> None:
+        self.interval_s = float(interval_s)
+        self.block_threshold_s = float(block_threshold_s)
+        self.check_interval_s = float(check_interval_s)
+        self.code_root = os.path.abspath(code_root) + os.sep
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_id: Optional[int] = None
+        self._handle: Optional[asyncio.TimerHandle] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        # Monotonic time the next heartbeat is due (written by the loop, read by the watchdog)
+        self._due = 0.0
+        self._lags: Deque[float] = deque(maxlen=self.LAG_WINDOW)
+        self._lock = threading.Lock()
+        self.events: Deque[BlockEvent] = deque(maxlen=self.MAX_EVENTS)
+        self.block_count = 0
+        self.blocked_s_by_module: Dict[str, float] = {}
+        self._culprit_cache: Dict[str, bool] = {}
+
+    # -- loop side --------------------------------------------------------------
+
+    def start(self) -> None:
+        """Start monitoring the running loop (call from inside it)."""
+        if self._loop is not None:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._stop.clear()
+        self._due = time.monotonic() + self.interval_s
+        self._handle = self._loop.call_later(self.interval_s, self._beat)
+        self._watchdog = threading.Thread(target=self._watch, name="loop-monitor", daemon=True)
+        self._watchdog.start()
+
+    def _beat(self) -> None:
+        now = time.monotonic()
+        self._lags.append(max(0.0, now - self._due))
+        self._due = now + self.interval_s
+        if not self._stop.is_set() and self._loop is not None:
+            self._handle = self._loop.call_later(self.interval_s, self._beat)
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        if self._watchdog is not None:
+            self._watchdog.join(timeout=1.0)
+            self._watchdog = None
+        self._loop = None
+
+    # -- watchdog side ----------------------------------------------------------
+
+    def _is_ours(self, filename: str) -> bool:
+        ours = self._culprit_cache.get(filename)
+        if ours is None:
+            path = os.path.abspath(filename)
+            ours = (
+                path.startswith(self.code_root)
+                and "site-packages" not in path
+                and path != os.path.abspath(__file__)
+            )
+            self._culprit_cache[filename] = ours
+        return ours
+
+    def _culprit(self, frame: FrameType) -> Tuple[str, str]:
+        """(module, location) of the innermost frame in our code, else the innermost non-stdlib frame."""
+        fallback: Optional[FrameType] = None
+        f: Optional[FrameType] = frame
+        while f is not None:
+            filename = f.f_code.co_filename
+            if self._is_ours(filename):
+                break
+            if fallback is None and not os.path.abspath(filename).startswith(_STDLIB_DIR):
+                fallback = f
+            f = f.f_back
+        chosen = f or fallback or frame
+        filename = os.path.abspath(chosen.f_code.co_filename)
+        module = filename[len(self.code_root):] if filename.startswith(self.code_root) else filename
+        return module, f"{os.path.basename(filename)}:{chosen.f_lineno} in {chosen.f_code.co_name}"
+
+    def _sample(self) -> Optional[FrameType]:
+        return sys._current_frames().get(self._loop_thread_id)  # type: ignore[arg-type]
+
+    def _watch(self) -> None:
+        episode_due: Optional[float] = None
+        episode_started_at = 0.0
+        stack = ""
+        # module -> sampled blocked seconds, and the first location seen in it
+        attributed: Dict[str, float] = {}
+        locations: Dict[str, str] = {}
+        last_sample = 0.0
+        while not self._stop.wait(self.check_interval_s):
+            now = time.monotonic()
+            due = self._due
+            overdue = now - due
+            if episode_due is not None and due != episode_due:
+                # Heartbeat ran again: the block is over
+                self._finish_episode(episode_started_at, due - self.interval_s - episode_due, stack, attributed, locations)
+                episode_due, attributed, locations = None, {}, {}
+            if episode_due is None and overdue > self.block_threshold_s:
+                frame = self._sample()
+                if frame is None:
+                    continue
+                module, location = self._culprit(frame)
+                stack = "".join(traceback.format_stack(frame, limit=self.STACK_LIMIT))
+                del frame
+                episode_due = due
+                episode_started_at = time.time() - overdue
+                # Time up to detection goes to the first sample's culprit
+                attributed = {module: overdue}
+                locations = {module: location}
+                last_sample = now
+            elif episode_due is not None:
+                frame = self._sample()
+                if frame is not None:
+                    module, location = self._culprit(frame)
+                    del frame
+                    attributed[module] = attributed.get(module, 0.0) + (now - last_sample)
+                    locations.setdefault(module, location)
+                last_sample = now
+
+    def _finish_episode(
+        self,
+        started_at: float,
+        duration_s: float,
+        stack: str,
+        attributed: Dict[str, float],
+        locations: Dict[str, str],
+    ) -> None:
+        sampled = sum(attributed.values())
+        culprit = max(attributed.items(), key=lambda kv: kv[1])[0]
+        duration_s = max(duration_s, sampled)
+        event = BlockEvent(
+            started_at=started_at,
+            duration_s=duration_s,
+            culprit=culprit,
+            location=locations[culprit],
+            stack=stack,
+        )
+        # Scale sampled time to the measured duration so per-module totals add up
+        scale = duration_s / sampled if sampled > 0 else 1.0
+        with self._lock:
+            self.events.append(event)
+            self.block_count += 1
+            for module, seconds in attributed.items():
+                self.blocked_s_by_module[module] = self.blocked_s_by_module.get(module, 0.0) + seconds * scale
+        logger.warning(
+            "Event loop blocked (heartbeat %.0fms late) by %s (%s)\n%s",
+            duration_s * 1000, culprit, event.location, stack.rstrip(),
+        )
+
+    # -- reporting --------------------------------------------------------------
+
+    def stats(self) -> Dict[str, object]:
+        lags = sorted(self._lags)
+        with self._lock:
+            blocked = {mod: round(s, 3) for mod, s in sorted(self.blocked_s_by_module.items(), key=lambda kv: -kv[1])}
+            blocks = self.block_count
+        if not lags:
+            return {"lag_samples": 0, "blocks": blocks, "blocked_s_by_module": blocked}
+        return {
+            "lag_samples": len(lags),
+            "lag_p50_ms": round(lags[len(lags) // 2] * 1000, 2),
+            "lag_p99_ms": round(lags[min(len(lags) - 1, int(0.99 * len(lags)))] * 1000, 2),
+            "lag_max_ms": round(lags[-1] * 1000, 2),
+            "blocks": blocks,
+            "blocked_s_by_module": blocked,
+        }
+
+    def recent_events(self, limit: int = 10) -> List[BlockEvent]:
+        with self._lock:
+            return list(self.events)[-limit:]
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Live order books from the Polymarket CLOB market websocket.
+
+`MarketStream` keeps an L2 book per subscribed token_id and calls back whenever a
+token's best ask changes, so value bets can be re-evaluated as soon as the price
+moves instead of on the next polling cycle.
+
+Updates for a token are coalesced: while a callback for a token is running,
+further changes only mark it dirty, and the callback runs once more afterwards
+with the latest book.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Set
+
+import aiohttp
+
+from value_bets_new.http_client import AsyncHttpClient
+from value_bets_new.order_book import OrderBookL2, TopOfBook
+
+logger = logging.getLogger(__name__)
+
+
+CLOB_MARKET_WS_URL = "wss://ws-subscriptions-clob.polymarket.com/ws/market"
+
+BestAskCallback = Callable[[str, TopOfBook], Awaitable[None]]
+
+
+class MarketStream:
+    """
+    Typical usage:
+      stream = MarketStream(http, on_best_ask_change=callback)
+      task = asyncio.create_task(stream.run())
+      await stream.subscribe(token_ids)
+      ...
+      await stream.close()
+    """
+
+    # The server drops idle connections; it expects a literal "PING" text frame.
+    PING_INTERVAL_S = 10.0
+    RECONNECT_DELAY_S = 2.0
+
+    def __init__(
+        self,
+        http: AsyncHttpClient,
+        *,
+        on_best_ask_change: BestAskCallback,
+        url: str = CLOB_MARKET_WS_URL,
+    ) -> None:
+        self.http = http
+        self.url = url
+        self.on_best_ask_change = on_best_ask_change
+        self.books: Dict[str, OrderBookL2] = {}
+        self._subscribed: Set[str] = set()
+        self._ws: Optional[aiohttp.ClientWebSocketResponse] = None
+        self._closed = False
+        self._has_tokens: Optional[asyncio.Event] = None
+        self._last_best_ask: Dict[str, Optional[float]] = {}
+        self._dirty: Set[str] = set()
+        self._dispatch_tasks: Dict[str, asyncio.Task] = {}
+
+    def _get_has_tokens(self) -> asyncio.Event:
+        """Get or create the wakeup event in the current event loop."""
+        if self._has_tokens is None:
+            self._has_tokens = asyncio.Event()
+        return self._has_tokens
+
+    def top_of_book(self, token_id: str) -> Optional[TopOfBook]:
+        book = self.books.get(token_id)
+        return book.top_of_book() if book is not None else None
+
+    async def subscribe(self, token_ids: Iterable[str]) -> None:
+        """Add tokens to the subscription. Already-subscribed tokens are ignored."""
+        new_ids = [str(t) for t in token_ids if str(t) not in self._subscribed]
+        if not new_ids:
+            return
+        self._subscribed.update(new_ids)
+        self._get_has_tokens().set()
+        ws = self._ws
+        if ws is not None and not ws.closed:
+            try:
+                await ws.send_str(json.dumps({"assets_ids": new_ids, "operation": "subscribe"}))
+            except ConnectionError:
+                # The reader loop reconnects and resubscribes everything.
+                pass
+
+    async def run(self) -> None:
+        """Connect, (re)subscribe and consume updates until `close()` is called."""
+        while not self._closed:
+            await self._get_has_tokens().wait()
+            if self._closed:
+                break
+            try:
+                await self._run_connection()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("Connection error: %r", e)
+            # Books are stale once the connection drops; the next snapshot rebuilds them.
+            self.books.clear()
+            self._last_best_ask.clear()
+            if not self._closed:
+                await asyncio.sleep(self.RECONNECT_DELAY_S)
+
+    async def _run_connection(self) -> None:
+        ws = await self.http.ws_connect(self.url)
+        self._ws = ws
+        ping_task = asyncio.create_task(self._ping_loop(ws))
+        try:
+            await ws.send_str(json.dumps({"assets_ids": sorted(self._subscribed), "type": "market"}))
+            logger.info("Connected, subscribed to %s tokens", len(self._subscribed))
+            async for msg in ws:
+                if msg.type == aiohttp.WSMsgType.TEXT:
+                    self._handle_text(msg.data)
+                elif msg.type in (aiohttp.WSMsgType.CLOSED, aiohttp.WSMsgType.ERROR):
+                    break
+        finally:
+            ping_task.cancel()
+            self._ws = None
+            if not ws.closed:
+                await ws.close()
+
+    async def _ping_loop(self, ws: aiohttp.ClientWebSocketResponse) -> None:
+        while not ws.closed:
+            await asyncio.sleep(self.PING_INTERVAL_S)
+            try:
+                await ws.send_str("PING")
+            except ConnectionError:
+                return
+
+    def _handle_text(self, data: str) -> None:
+        if data == "PONG":
+            return
+        try:
+            payload = json.loads(data)
+        except ValueError:
+            return
+        messages = payload if isinstance(payload, list) else [payload]
+        for message in messages:
+            if isinstance(message, dict):
+                self._handle_message(message)
+
+    def _handle_message(self, message: Dict[str, Any]) -> None:
+        event_type = message.get("event_type")
+        if event_type == "book":
+            token_id = str(message.get("asset_id") or "")
+            if not token_id:
+                return
+            book = self.books.setdefault(token_id, OrderBookL2())
+            # Older payloads name the sides buys/sells
+            book.apply_snapshot(
+                message.get("bids", message.get("buys")),
+                message.get("asks", message.get("sells")),
+            )
+            self._maybe_dispatch(token_id)
+        elif event_type == "price_change":
+            touched: Set[str] = set()
+            # Current format: one entry per changed level, each carrying its asset_id
+            for change in message.get("price_changes") or []:
+                token_id = str(change.get("asset_id") or "")
+                if self._apply_change(token_id, change):
+                    touched.add(token_id)
+            # Older format: one asset_id with a list of changes
+            if message.get("changes"):
+                token_id = str(message.get("asset_id") or "")
+                for change in message.get("changes") or []:
+                    if self._apply_change(token_id, change):
+                        touched.add(token_id)
+            for token_id in touched:
+                self._maybe_dispatch(token_id)
+
+    def _apply_change(self, token_id: str, change: Dict[str, Any]) -> bool:
+        book = self.books.get(token_id)
+        if book is None:
+            # No snapshot yet; the "book" message will carry the full state.
+            return False
+        try:
+            book.apply_change(str(change.get("side") or ""), float(change.get("price")), float(change.get("size")))
+        except (TypeError, ValueError):
+            return False
+        return True
+
+    def _maybe_dispatch(self, token_id: str) -> None:
+        best_ask = self.books[token_id].top_of_book().best_ask
+        if token_id in self._last_best_ask and self._last_best_ask[token_id] == best_ask:
+            return
+        self._last_best_ask[token_id] = best_ask
+        self._dirty.add(token_id)
+        if token_id not in self._dispatch_tasks:
+            self._dispatch_tasks[token_id] = asyncio.create_task(self._dispatch(token_id))
+
+    async def _dispatch(self, token_id: str) -> None:
+        try:
+            while token_id in self._dirty:
+                self._dirty.discard(token_id)
+                tob = self.top_of_book(token_id)
+                if tob is None:
+                    break
+                try:
+                    await self.on_best_ask_change(token_id, tob)
+                except Exception as e:
+                    logger.exception("Callback error for %s: %r", token_id, e)
+        finally:
+            self._dispatch_tasks.pop(token_id, None)
+
+    async def close(self) -> None:
+        self._closed = True
+        self._get_has_tokens().set()
+        ws = self._ws
+        if ws is not None and not ws.closed:
+            await ws.close()
+        for task in list(self._dispatch_tasks.values()):
+            task.cancel()
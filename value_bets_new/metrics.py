@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+Process-wide counters and histograms in the Prometheus text exposition format.
+
+Instruments are registered once at import time by the modules that update them
+(`counter(...)`, `histogram(...)`) and are cheap to update from the event loop or
+worker threads. State that already lives elsewhere (cache hit counts, queue depth,
+pending redemptions) is not copied into instruments: a collector callback reads it
+when the registry is rendered, so scrapes always see the current values.
+
+Typical usage:
+  REQUESTS = metrics.counter("value_bets_http_requests_total", "HTTP requests", ("host", "status"))
+  REQUESTS.inc(host="clob.polymarket.com", status="200")
+
+  metrics.register_collector(lambda: [
+      metrics.Sample("value_bets_redemptions_pending", "gauge", "Positions awaiting redemption", {}, len(manager)),
+  ])
+  text = metrics.render()
+"""
+
+from __future__ import annotations
+
+import bisect
+import logging
+import math
+import threading
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Request latencies: a few ms (cached, local) up to the 20s client timeout
+LATENCY_BUCKETS_S: Tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0)
+# Cycle durations: a cached cycle takes ms, a cold one with every Arcadia lookup many seconds
+CYCLE_BUCKETS_S: Tuple[float, ...] = (0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+LabelValues = Tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class Sample:
+    """One collected value: name, type (counter/gauge), help, labels and value."""
+    name: str
+    kind: str
+    help: str
+    labels: Mapping[str, str]
+    value: float
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if math.isnan(value):
+        return "NaN"
+    if value == int(value) and abs(value) < 1e15:
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: Iterable[Tuple[str, str]]) -> str:
+    parts = [f'{k}="{_escape(str(v))}"' for k, v in labels]
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+class _Instrument:
+    kind = ""
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Mapping[str, object]) -> LabelValues:
+        if len(labels) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def render(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_Instrument):
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()) -> None:
+        super().__init__(name, help, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: object) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: object) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [
+            f"{self.name}{_format_labels(zip(self.labelnames, key))} {_format_value(v)}"
+            for key, v in items
+        ]
+
+
+class Histogram(_Instrument):
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = (), *, buckets: Sequence[float] = LATENCY_BUCKETS_S) -> None:
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # label values -> [per-bucket counts (non-cumulative, last is +Inf), sum, count]
+        self._series: Dict[LabelValues, list] = {}
+
+    def observe(self, value: float, **labels: object) -> None:
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = sorted((key, (list(s[0]), s[1], s[2])) for key, s in self._series.items())
+        lines: List[str] = []
+        for key, (counts, total, count) in items:
+            labels = list(zip(self.labelnames, key))
+            cumulative = 0
+            for bound, n in zip(self.buckets + (math.inf,), counts):
+                cumulative += n
+                lines.append(f"{self.name}_bucket{_format_labels(labels + [('le', _format_value(bound))])} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(labels)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{_format_labels(labels)} {count}")
+        return lines
+
+
+Collector = Callable[[], Iterable[Sample]]
+
+
+class Registry:
+    def __init__(self) -> None:
+        self._instruments: Dict[str, _Instrument] = {}
+        self._collectors: List[Collector] = []
+        self._lock = threading.Lock()
+
+    def _register(self, instrument: _Instrument) -> _Instrument:
+        with self._lock:
+            existing = self._instruments.get(instrument.name)
+            if existing is not None:
+                # A module loaded twice (as __main__ and by package name) shares the first registration
+                if type(existing) is not type(instrument) or existing.labelnames != instrument.labelnames:
+                    raise ValueError(f"Metric {instrument.name} already registered with a different shape")
+                return existing
+            self._instruments[instrument.name] = instrument
+            return instrument
+
+    def counter(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, help, labelnames))  # type: ignore[return-value]
+
+    def histogram(self, name: str, help: str, labelnames: Sequence[str] = (), *, buckets: Sequence[float] = LATENCY_BUCKETS_S) -> Histogram:
+        return self._register(Histogram(name, help, labelnames, buckets=buckets))  # type: ignore[return-value]
+
+    def register_collector(self, collector: Collector) -> Collector:
+        with self._lock:
+            self._collectors.append(collector)
+        return collector
+
+    def unregister_collector(self, collector: Collector) -> None:
+        with self._lock:
+            if collector in self._collectors:
+                self._collectors.remove(collector)
+
+    def render(self) -> str:
+        with self._lock:
+            instruments = sorted(self._instruments.values(), key=lambda i: i.name)
+            collectors = list(self._collectors)
+        lines: List[str] = []
+        for instrument in instruments:
+            lines.append(f"# HELP {instrument.name} {instrument.help}")
+            lines.append(f"# TYPE {instrument.name} {instrument.kind}")
+            lines.extend(instrument.render())
+        # Collected samples are grouped by name so each family gets one HELP/TYPE header
+        families: Dict[str, Tuple[str, str, List[Sample]]] = {}
+        for collector in collectors:
+            try:
+                samples = list(collector())
+            except Exception as e:
+                logger.warning("Metrics collector %r failed: %s", collector, e)
+                continue
+            for sample in samples:
+                families.setdefault(sample.name, (sample.kind, sample.help, []))[2].append(sample)
+        for name in sorted(families):
+            kind, help, samples = families[name]
+            lines.append(f"# HELP {name} {help}")
+            lines.append(f"# TYPE {name} {kind}")
+            for sample in samples:
+                lines.append(f"{name}{_format_labels(sorted(sample.labels.items()))} {_format_value(sample.value)}")
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+
+def counter(name: str, help: str, labelnames: Sequence[str] = ()) -> Counter:
+    return REGISTRY.counter(name, help, labelnames)
+
+
+def histogram(name: str, help: str, labelnames: Sequence[str] = (), *, buckets: Sequence[float] = LATENCY_BUCKETS_S) -> Histogram:
+    return REGISTRY.histogram(name, help, labelnames, buckets=buckets)
+
+
+def register_collector(collector: Collector) -> Collector:
+    return REGISTRY.register_collector(collector)
+
+
+def unregister_collector(collector: Collector) -> None:
+    REGISTRY.unregister_collector(collector)
+
+
+def render() -> str:
+    return REGISTRY.render()
+
+
+def samples_from_stats(
+    prefix: str,
+    stats: Mapping[str, object],
+    *,
+    counters: Iterable[str] = (),
+    labels: Optional[Mapping[str, str]] = None,
+    help: str = "",
+) -> List[Sample]:
+    """
+    Turn a component's `stats()` dict into samples named `{prefix}_{key}`: keys in
+    `counters` are monotonic counts (exported with a `_total` suffix), other numeric
+    keys are gauges. Non-numeric and None values are skipped.
+    """
+    counter_keys = set(counters)
+    out: List[Sample] = []
+    for key, value in stats.items():
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            continue
+        if key in counter_keys:
+            out.append(Sample(f"{prefix}_{key}_total", "counter", help or f"{prefix} {key}", dict(labels or {}), float(value)))
+        else:
+            out.append(Sample(f"{prefix}_{key}", "gauge", help or f"{prefix} {key}", dict(labels or {}), float(value)))
+    return out
+
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Order book helpers for Polymarket CLOB books.
+
+CLOB book levels are not sorted best-first (bids come back in ascending price
+order, asks in descending order), so best bid/ask are computed as the max bid /
+min ask rather than read from index 0.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class TopOfBook:
+    best_bid: Optional[float]
+    bid_volume: float
+    best_ask: Optional[float]
+    ask_volume: float
+    # Every ask level as (price, size), cheapest first, for depth-aware sizing
+    ask_levels: Tuple[Tuple[float, float], ...] = ()
+
+    @property
+    def spread(self) -> Optional[float]:
+        if self.best_bid is None or self.best_ask is None:
+            return None
+        return self.best_ask - self.best_bid
+
+
+EMPTY_TOP_OF_BOOK = TopOfBook(best_bid=None, bid_volume=0.0, best_ask=None, ask_volume=0.0)
+
+
+def _field(obj: Any, name: str) -> Any:
+    """Read a field from a JSON dict or a py-clob-client summary object."""
+    if isinstance(obj, dict):
+        return obj.get(name)
+    return getattr(obj, name, None)
+
+
+def parse_levels(levels: Optional[Iterable[Any]]) -> List[Tuple[float, float]]:
+    """Convert raw book levels to (price, size) tuples, skipping malformed entries."""
+    out: List[Tuple[float, float]] = []
+    for level in levels or []:
+        try:
+            out.append((float(_field(level, "price")), float(_field(level, "size"))))
+        except (TypeError, ValueError):
+            continue
+    return out
+
+
+def top_of_book(book: Any) -> TopOfBook:
+    """
+    Best bid/ask and the size resting at each, from one CLOB book.
+
+    Accepts the JSON dict returned by `/book` / `/books` or a py-clob-client
+    `OrderBookSummary`. Returns EMPTY_TOP_OF_BOOK for a missing book.
+    """
+    if book is None:
+        return EMPTY_TOP_OF_BOOK
+
+    bids = parse_levels(_field(book, "bids"))
+    asks = parse_levels(_field(book, "asks"))
+
+    best_bid: Optional[float] = None
+    bid_volume = 0.0
+    if bids:
+        best_bid = max(price for price, _ in bids)
+        bid_volume = sum(size for price, size in bids if price == best_bid)
+
+    best_ask: Optional[float] = None
+    ask_volume = 0.0
+    if asks:
+        best_ask = min(price for price, _ in asks)
+        ask_volume = sum(size for price, size in asks if price == best_ask)
+
+    return TopOfBook(
+        best_bid=best_bid,
+        bid_volume=bid_volume,
+        best_ask=best_ask,
+        ask_volume=ask_volume,
+        ask_levels=_sorted_asks(asks),
+    )
+
+
+def _sorted_asks(asks: Iterable[Tuple[float, float]]) -> Tuple[Tuple[float, float], ...]:
+    """Merge duplicate prices and sort cheapest first, dropping empty levels."""
+    merged: Dict[float, float] = {}
+    for price, size in asks:
+        if size > 0:
+            merged[price] = merged.get(price, 0.0) + size
+    return tuple(sorted(merged.items()))
+
+
+class OrderBookL2:
+    """
+    In-memory price-level book for one token, maintained from websocket updates.
+
+    Levels are stored as {price: size}; a size of 0 removes the level.
+    """
+
+    def __init__(self) -> None:
+        self.bids: Dict[float, float] = {}
+        self.asks: Dict[float, float] = {}
+
+    def apply_snapshot(self, bids: Optional[Iterable[Any]], asks: Optional[Iterable[Any]]) -> None:
+        self.bids = {price: size for price, size in parse_levels(bids) if size > 0}
+        self.asks = {price: size for price, size in parse_levels(asks) if size > 0}
+
+    def apply_change(self, side: str, price: float, size: float) -> None:
+        """Set the size at one level. side is "BUY" (bids) or "SELL" (asks)."""
+        levels = self.bids if str(side).upper() == "BUY" else self.asks
+        if size > 0:
+            levels[price] = size
+        else:
+            levels.pop(price, None)
+
+    def top_of_book(self) -> TopOfBook:
+        best_bid = max(self.bids) if self.bids else None
+        best_ask = min(self.asks) if self.asks else None
+        return TopOfBook(
+            best_bid=best_bid,
+            bid_volume=self.bids.get(best_bid, 0.0) if best_bid is not None else 0.0,
+            best_ask=best_ask,
+            ask_volume=self.asks.get(best_ask, 0.0) if best_ask is not None else 0.0,
+            ask_levels=tuple(sorted(self.asks.items())),
+        )
+
+
+@dataclass(frozen=True)
+class DepthFill:
+    """A buy that walks the ask side: `size` tokens for `cost`, no level above `limit_price`."""
+    size: float
+    cost: float
+    limit_price: float
+
+    @property
+    def vwap(self) -> float:
+        return self.cost / self.size if self.size > 0 else 0.0
+
+    def expected_payout_per_1(self, true_prob: float) -> float:
+        """Expected payout per $1 staked at this fill's average price."""
+        return true_prob / self.vwap if self.vwap > 0 else 0.0
+
+
+def walk_asks(ask_levels: Iterable[Tuple[float, float]], size: float) -> Optional[DepthFill]:
+    """
+    Cost of buying exactly `size` tokens against cheapest-first ask levels.
+    Returns None if the book can't fill the whole size.
+    """
+    remaining = float(size)
+    cost = 0.0
+    limit_price = 0.0
+    for price, level_size in ask_levels:
+        if remaining <= 0:
+            break
+        take = min(remaining, level_size)
+        cost += take * price
+        remaining -= take
+        limit_price = price
+    if remaining > 1e-9 or size <= 0:
+        return None
+    return DepthFill(size=float(size), cost=cost, limit_price=limit_price)
+
+
+def max_profitable_fill(
+    ask_levels: Iterable[Tuple[float, float]],
+    *,
+    true_prob: float,
+    min_expected_payout_per_1: float,
+    max_cost: float,
+) -> Optional[DepthFill]:
+    """
+    Largest buy whose VWAP still clears `min_expected_payout_per_1` and whose cost
+    stays within `max_cost`.
+
+    Walking cheapest-first, the VWAP only rises with size, so the answer takes whole
+    levels until either bound binds and then the exact partial amount of the level
+    where it does. Returns None when not even the first token qualifies.
+    """
+    if true_prob <= 0 or min_expected_payout_per_1 <= 0 or max_cost <= 0:
+        return None
+    # Highest average price that still clears the payout bound
+    max_vwap = true_prob / min_expected_payout_per_1
+    size = 0.0
+    cost = 0.0
+    limit_price = 0.0
+    for price, level_size in ask_levels:
+        if level_size <= 0:
+            continue
+        take = level_size
+        if price > max_vwap:
+            # (cost + price * x) / (size + x) <= max_vwap
+            take = min(take, (max_vwap * size - cost) / (price - max_vwap))
+        take = min(take, (max_cost - cost) / price)
+        if take <= 0:
+            break
+        size += take
+        cost += take * price
+        limit_price = price
+        if take < level_size:
+            break
+    if size <= 0:
+        return None
+    return DepthFill(size=size, cost=cost, limit_price=limit_price)
@@ -8,11 +8,16 @@ Arcadia guest endpoints via `pinnacle_odds_service.PinnacleBasketballOddsService
 
 from __future__ import annotations
 
-from datetime import date
-from typing import Optional
+import asyncio
+from datetime import date, timedelta
+from typing import Dict, Optional
 
-from value_bets_new.pinnacle_odds_service import PinnacleBasketballOddsService, PinnacleHockeyOddsService, PinnacleMMAOddsService, PinnacleTennisOddsService, PinnacleSoccerOddsService
+from value_bets_new import tracing
+from value_bets_new.pinnacle_odds_service import DEFAULT_ODDS_FRESHNESS_S, PinnacleBasketballOddsService, PinnacleHockeyOddsService, PinnacleMMAOddsService, PinnacleTennisOddsService, PinnacleSoccerOddsService
 from value_bets_new.constants import Sport, SportsbookOdds, HandicapOdds, TotalOdds
+from value_bets_new.http_client import AsyncHttpClient
+from value_bets.pinnacle_scraper.match_store import MatchStore
+from value_bets.pinnacle_scraper.team_name_index import alias_team_match, fuzzy_pair_match
 
 def _cost_to_win_1(decimal_odds: float) -> Optional[float]:
     try:
@@ -34,108 +39,111 @@ class PinnacleSportsbookOddsInterface:
     Supports multiple sports via service parameter.
     """
 
-    def __init__(self, sport: Sport, timeout_ms: int = 45000) -> None:
+    def __init__(
+        self,
+        sport: Sport,
+        timeout_ms: int = 45000,
+        http: Optional[AsyncHttpClient] = None,
+        odds_freshness_s: float = DEFAULT_ODDS_FRESHNESS_S,
+        match_store: Optional[MatchStore] = None,
+    ) -> None:
         """
         Initialize the interface.
 
         Args:
             sport: Sport enum value (Sport.BASKETBALL, Sport.HOCKEY, Sport.UFC, or Sport.TENNIS).
             timeout_ms: Timeout for API requests
+            http: Shared async HTTP client (if omitted, the running loop's shared Arcadia
+                client is used; call `close()` when done with it)
+            odds_freshness_s: How long a game's odds snapshot is shared across market types
+                (0 re-fetches on every call)
+            match_store: Persistent event_slug -> matchup_id store consulted before fuzzy matching
         """
         self.sport = sport
+        self.match_store = match_store
+        kwargs = dict(timeout_ms=timeout_ms, http=http, odds_freshness_s=odds_freshness_s)
         if sport == Sport.HOCKEY:
-            self._svc = PinnacleHockeyOddsService(timeout_ms=timeout_ms)
+            self._svc = PinnacleHockeyOddsService(**kwargs)
         elif sport == Sport.BASKETBALL:
-            self._svc = PinnacleBasketballOddsService(timeout_ms=timeout_ms)
+            self._svc = PinnacleBasketballOddsService(**kwargs)
         elif sport == Sport.UFC:
-            self._svc = PinnacleMMAOddsService(timeout_ms=timeout_ms)
+            self._svc = PinnacleMMAOddsService(**kwargs)
         elif sport == Sport.TENNIS:
-            self._svc = PinnacleTennisOddsService(timeout_ms=timeout_ms)
+            self._svc = PinnacleTennisOddsService(**kwargs)
         elif sport == Sport.SOCCER:
-            self._svc = PinnacleSoccerOddsService(timeout_ms=timeout_ms)
+            self._svc = PinnacleSoccerOddsService(**kwargs)
         else:
             raise ValueError(
                 f"Unsupported sport: {sport}. Must be Sport.BASKETBALL, Sport.HOCKEY, Sport.UFC, Sport.TENNIS, or Sport.SOCCER"
             )
 
-    def _find_game_and_rows(
+    def cache_stats(self) -> Dict[str, Dict[str, int]]:
+        return self._svc.cache_stats()
+
+    async def close(self) -> None:
+        """Close the loop's shared Arcadia client unless an `http` client was passed in."""
+        await self._svc.close()
+
+    @tracing.traced("pinnacle_lookup")
+    async def _find_game_and_rows(
         self,
         team_a: str,
         team_b: str,
         play_date: date,
+        *,
+        event_slug: Optional[str] = None,
     ) -> Optional[tuple[str, str, list]]:
         """
         Find the matching game and return (away_team, home_team, market_rows).
         Returns None if game not found or odds fetch fails.
+
+        With an event_slug and a match store, a previously found matchup is reused
+        as long as it is still listed and its teams still match in the stored
+        orientation; otherwise it is dropped and the game is matched again. New
+        matches are recorded.
         """
-        # Try both the play_date and the day before (in case of timezone differences)
-        from datetime import timedelta
+        # Try the play_date and the days either side (in case of timezone differences)
         dates_to_try = [play_date, play_date - timedelta(days=1), play_date + timedelta(days=1)]
-        games = []
-        for local_date in dates_to_try:
-            date_games = self._svc.list_games_for_date(local_date)
-            games.extend(date_games)
-
-        ta = _norm(team_a)
-        tb = _norm(team_b)
-
-        def _team_matches(t1: str, t2: str) -> bool:
-            """Fuzzy team name matching."""
-            n1 = _norm(t1)
-            n2 = _norm(t2)
-            if n1 == n2:
-                return True
-            # Check if one contains the other
-            if n1 in n2 or n2 in n1:
-                return True
-            # Check if last word matches (nickname)
-            words1 = n1.split()
-            words2 = n2.split()
-            if words1 and words2 and words1[-1] == words2[-1]:
-                # One is just nickname, or first word matches
-                if len(words1) == 1 or len(words2) == 1:
-                    return True
-                if words1[0] == words2[0]:
-                    return True
-            # Check if first word matches (for school/city names)
-            if words1 and words2 and words1[0] == words2[0] and len(words1[0]) > 3:
-                return True
-            # Check if all words from shorter are in longer
-            if len(words1) > 1 and len(words2) > 1:
-                shorter = words1 if len(words1) < len(words2) else words2
-                longer = words2 if len(words1) < len(words2) else words1
-                if all(word in longer for word in shorter if len(word) > 2):
-                    return True
-            return False
-        
+
         match = None
-        for g in games:
-            a = _norm(g.away_team)
-            h = _norm(g.home_team)
-            
-            # Try exact match first
-            if (a == ta and h == tb) or (a == tb and h == ta) or (h == ta and a == tb) or (h == tb and a == ta):
-                match = g
-                break
-            
-            # Try fuzzy match - check all combinations
-            ta_matches_a = _team_matches(ta, a)
-            ta_matches_h = _team_matches(ta, h)
-            tb_matches_a = _team_matches(tb, a)
-            tb_matches_h = _team_matches(tb, h)
-            
-            if (ta_matches_a and tb_matches_h) or \
-               (ta_matches_h and tb_matches_a) or \
-               (tb_matches_a and ta_matches_h) or \
-               (tb_matches_h and ta_matches_a):
-                match = g
-                break
+        stored = self.match_store.get(event_slug) if self.match_store is not None and event_slug else None
+        if stored is not None:
+            for game in await asyncio.gather(
+                *(self._svc.game_by_matchup_id_async(stored.matchup_id, local_date) for local_date in dates_to_try)
+            ):
+                if game is not None:
+                    match = game
+                    break
+            if match is not None:
+                pinnacle_a, pinnacle_b = stored.oriented(match.away_team, match.home_team)
+                # Alias-aware, like the index lookup that stored it
+                if not (alias_team_match(team_a, pinnacle_a) and alias_team_match(team_b, pinnacle_b)):
+                    match = None
+            if match is None:
+                # Not listed any more or re-pointed at other teams: match from scratch
+                await asyncio.to_thread(self.match_store.delete, event_slug)
+
+        if match is None:
+            indexes = await asyncio.gather(
+                *(self._svc.team_index_for_date_async(local_date) for local_date in dates_to_try)
+            )
+            for index in indexes:
+                found = index.find_match(team_a, team_b, fuzzy_pair_match)
+                if found is not None:
+                    match = found.game
+                    if self.match_store is not None and event_slug:
+                        # SQLite commit: keep it off the event loop
+                        await asyncio.to_thread(
+                            self.match_store.put,
+                            event_slug, match.matchup_id, swapped=found.swapped, confidence=found.confidence,
+                        )
+                    break
 
         if match is None:
             return None
 
         try:
-            res = self._svc.get_game_odds(match.matchup_id, game_info=match)
+            res = await self._svc.get_game_odds_async(match.matchup_id, game_info=match)
         except Exception:
             return None
 
@@ -143,14 +151,16 @@ class PinnacleSportsbookOddsInterface:
         rows = [r for r in (res.markets or []) if int(r.period or 0) == 0 and not bool(r.is_alternate or False)]
         return match.away_team, match.home_team, rows
 
-    def get_moneyline_odds(
+    async def get_moneyline_odds(
         self,
         team_a: str,
         team_b: str,
         play_date: date,
+        *,
+        event_slug: Optional[str] = None,
     ) -> Optional[SportsbookOdds]:
         """Fetch moneyline odds for a game."""
-        result = self._find_game_and_rows(team_a, team_b, play_date)
+        result = await self._find_game_and_rows(team_a, team_b, play_date, event_slug=event_slug)
         if result is None:
             return None
 
@@ -178,14 +188,16 @@ class PinnacleSportsbookOddsInterface:
                 )
         return None
 
-    def get_spread_odds(
+    async def get_spread_odds(
         self,
         team_a: str,
         team_b: str,
         play_date: date,
+        *,
+        event_slug: Optional[str] = None,
     ) -> Optional[list[HandicapOdds]]:
         """Fetch spread odds for a game. Returns None if no odds are available."""
-        result = self._find_game_and_rows(team_a, team_b, play_date)
+        result = await self._find_game_and_rows(team_a, team_b, play_date, event_slug=event_slug)
         if result is None:
             return None
 
@@ -255,12 +267,14 @@ class PinnacleSportsbookOddsInterface:
             return pt > 5.5
         return False
 
-    def _get_totals_odds_by_type(
+    async def _get_totals_odds_by_type(
         self,
         team_a: str,
         team_b: str,
         play_date: date,
         totals_market_type: str,
+        *,
+        event_slug: Optional[str] = None,
     ) -> Optional[list[TotalOdds]]:
         """
         Fetch totals (over/under) odds for a game, filtered by totals market type.
@@ -268,7 +282,7 @@ class PinnacleSportsbookOddsInterface:
         Only returns lines ending in .5. Returns None if no odds are available.
         For tennis, type='total' rows are split by line: <=5.5 -> sets, >5.5 -> games.
         """
-        result = self._find_game_and_rows(team_a, team_b, play_date)
+        result = await self._find_game_and_rows(team_a, team_b, play_date, event_slug=event_slug)
         if result is None:
             return None
 
@@ -314,45 +328,55 @@ class PinnacleSportsbookOddsInterface:
             )
         return out if out else None
 
-    def get_totals_odds(
+    async def get_totals_odds(
         self,
         team_a: str,
         team_b: str,
         play_date: date,
+        *,
+        event_slug: Optional[str] = None,
     ) -> Optional[list[TotalOdds]]:
         """Fetch generic totals (over/under) odds. Use totals_games/totals_sets for tennis."""
-        return self._get_totals_odds_by_type(team_a, team_b, play_date, "totals")
+        return await self._get_totals_odds_by_type(team_a, team_b, play_date, "totals", event_slug=event_slug)
 
-    def get_totals_games_odds(
+    async def get_totals_games_odds(
         self,
         team_a: str,
         team_b: str,
         play_date: date,
+        *,
+        event_slug: Optional[str] = None,
     ) -> Optional[list[TotalOdds]]:
         """Fetch total games (over/under) odds for tennis."""
-        return self._get_totals_odds_by_type(team_a, team_b, play_date, "totals_games")
+        return await self._get_totals_odds_by_type(team_a, team_b, play_date, "totals_games", event_slug=event_slug)
 
-    def get_totals_sets_odds(
+    async def get_totals_sets_odds(
         self,
         team_a: str,
         team_b: str,
         play_date: date,
+        *,
+        event_slug: Optional[str] = None,
     ) -> Optional[list[TotalOdds]]:
         """Fetch total sets (over/under) odds for tennis."""
-        return self._get_totals_odds_by_type(team_a, team_b, play_date, "totals_sets")
+        return await self._get_totals_odds_by_type(team_a, team_b, play_date, "totals_sets", event_slug=event_slug)
 
-    def get_moneyline_spread_totals_odds(
+    async def get_moneyline_spread_totals_odds(
         self,
         team_a: str,
         team_b: str,
         play_date: date,
+        *,
+        event_slug: Optional[str] = None,
     ) -> tuple[Optional[SportsbookOdds], Optional[list[HandicapOdds]], Optional[list[TotalOdds]]]:
         """
         Fetch all odds (moneyline, spreads, totals) for a game.
-        Convenience method that calls all three individual methods.
+        Convenience method that runs all three individual methods concurrently.
         """
-        moneyline = self.get_moneyline_odds(team_a, team_b, play_date)
-        spreads = self.get_spread_odds(team_a, team_b, play_date)
-        totals = self.get_totals_odds(team_a, team_b, play_date)
+        moneyline, spreads, totals = await asyncio.gather(
+            self.get_moneyline_odds(team_a, team_b, play_date, event_slug=event_slug),
+            self.get_spread_odds(team_a, team_b, play_date, event_slug=event_slug),
+            self.get_totals_odds(team_a, team_b, play_date, event_slug=event_slug),
+        )
         return moneyline, spreads, totals
 
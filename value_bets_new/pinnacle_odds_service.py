@@ -8,38 +8,54 @@ This module exposes a stable interface for callers to:
   - fetch odds for a specific matchup id
 
 It reuses the Arcadia plumbing implemented in `pinnacle_odds_scraper.py`.
+Every service has a blocking API (`list_games_for_date` / `get_game_odds`) and an
+async one (`*_async`) that goes through the shared `AsyncHttpClient`.
 """
 
 from __future__ import annotations
 
 import sys
 import os
+import random
+import asyncio
+import weakref
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import date, datetime, timedelta, timezone
-from typing import Dict, List, Optional, Literal
+from typing import Any, Dict, List, Optional, Literal
 
 import pandas as pd
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from value_bets_new import clock
+from value_bets_new.cache import AsyncTTLCache
 from value_bets_new.constants import Sport
+from value_bets_new.http_client import AsyncHttpClient
 from value_bets.pinnacle_scraper.pinnacle_odds_scraper import (
+    ARCADIA_API_BASE,
+    ARCADIA_BASKETBALL_MATCHUPS_URL,
+    ARCADIA_HOCKEY_MATCHUPS_URL,
+    ARCADIA_MMA_MATCHUPS_URL,
+    ARCADIA_REQUEST_HEADERS,
+    ARCADIA_SOCCER_MATCHUPS_URL,
+    ARCADIA_TENNIS_MATCHUPS_URL,
     OddsRow,
+    _arcadia_extract_teams_from_related,
+    _arcadia_markets_to_rows,
+    _arcadia_get_json_requests,
+    _bucket_matchups_by_local_date,
     _format_dt_local,
     _format_dt_utc,
     _league_name_from_matchup_item,
-    _list_basketball_matchups_for_local_date,
-    _list_hockey_matchups_for_local_date,
-    _list_mma_matchups_for_local_date,
-    _list_tennis_matchups_for_local_date,
-    _list_soccer_matchups_for_local_date,
     _norm,
     _parse_iso_dt,
     _scrape_arcadia_matchup_id,
     _teams_from_matchup_item,
     _to_float,
 )
+from value_bets.pinnacle_scraper.team_name_index import TeamNameIndex
 
 
 @dataclass(frozen=True)
@@ -77,57 +93,134 @@ class GameOddsResult:
         return pd.DataFrame([m.to_dict() for m in self.markets])
 
 
-class PinnacleBasketballOddsService:
+# How long a matchup's parsed odds snapshot is reused. Moneyline, every spread slug
+# and every totals slug of a game are priced within a few seconds of each other.
+DEFAULT_ODDS_FRESHNESS_S = 10.0
+
+# One client per event loop: its aiohttp session and semaphores are bound to the loop they were created on
+_shared_http: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncHttpClient]" = weakref.WeakKeyDictionary()
+
+
+def _shared_arcadia_http() -> AsyncHttpClient:
+    """Pooled client for the running loop, shared by every service that wasn't handed one explicitly."""
+    loop = asyncio.get_running_loop()
+    http = _shared_http.get(loop)
+    if http is None:
+        http = _shared_http[loop] = AsyncHttpClient()
+    return http
+
+
+async def close_shared_arcadia_http() -> None:
+    """Close the running loop's shared client, if one was created (the next use opens a new one)."""
+    http = _shared_http.pop(asyncio.get_running_loop(), None)
+    if http is not None:
+        await http.close()
+
+
+# Same retry policy as `_arcadia_get_json_requests`, but with non-blocking sleeps.
+_ARCADIA_RETRY_STATUSES = (408, 425, 429, 500, 502, 503, 504)
+_ARCADIA_MAX_ATTEMPTS = 6
+
+
+async def _arcadia_get_json_async(http: AsyncHttpClient, url: str, *, timeout_s: float) -> Optional[Any]:
     """
-    Programmatic interface for callers.
+    Fetch JSON from an Arcadia guest endpoint. Returns None if all attempts fail.
+    """
+    try:
+        return await http.get_json(
+            url,
+            headers=ARCADIA_REQUEST_HEADERS,
+            timeout_s=timeout_s,
+            max_retries=_ARCADIA_MAX_ATTEMPTS,
+            retry_statuses=_ARCADIA_RETRY_STATUSES,
+            backoff_s=lambda attempt: random.uniform(0.4 * (attempt + 1), 1.0 * (attempt + 1)),
+        )
+    except Exception:
+        return None
 
-    Typical usage:
-      svc = PinnacleBasketballOddsService()
-      games = svc.list_games_for_date(date.today())
-      result = svc.get_game_odds(games[0].matchup_id, game_info=games[0])
+
+class _PinnacleOddsService:
+    """
+    Shared implementation for the per-sport services below.
+
+    Subclasses provide the sport's Arcadia matchups feed (`MATCHUPS_URL`) and
+    `_league_sort_key`.
     """
 
-    def __init__(self, *, timeout_ms: int = 45000) -> None:
+    MATCHUPS_URL: str = ""
+
+    # One date-bucketed copy of each sport's matchups feed, shared by every service
+    # instance: the play_date-1/play_date/play_date+1 lookups for every market of
+    # every game read the same download until it expires.
+    MATCHUPS_FEED_TTL_S = 60.0
+    _matchups_feed_cache = AsyncTTLCache(ttl_s=MATCHUPS_FEED_TTL_S, max_entries=16)
+    # (MATCHUPS_URL, local_date) -> (feed bucket the index was built from, index, games by matchup_id),
+    # least recently used first. A refreshed feed yields new bucket lists, so the index is rebuilt
+    # once per refresh.
+    _team_indexes: "OrderedDict[tuple, tuple]" = OrderedDict()
+    # Enough for every sport's play_date-1..+1 window across a few days; past dates age out
+    TEAM_INDEXES_MAX = 64
+
+    def __init__(
+        self,
+        *,
+        timeout_ms: int = 45000,
+        http: Optional[AsyncHttpClient] = None,
+        odds_freshness_s: float = DEFAULT_ODDS_FRESHNESS_S,
+    ) -> None:
         self.timeout_ms = int(timeout_ms)
+        self._http = http
+        # matchup_id -> GameOddsResult; None disables snapshot reuse (odds_freshness_s <= 0)
+        self._odds_cache: Optional[AsyncTTLCache] = (
+            AsyncTTLCache(ttl_s=odds_freshness_s, max_entries=512) if odds_freshness_s > 0 else None
+        )
+
+    @property
+    def http(self) -> AsyncHttpClient:
+        """The client passed in, or the running loop's shared one (resolved per call)."""
+        return self._http if self._http is not None else _shared_arcadia_http()
+
+    async def close(self) -> None:
+        """Close the loop's shared client if this service uses it; a client passed in stays open."""
+        if self._http is None:
+            await close_shared_arcadia_http()
+
+    @property
+    def _timeout_s(self) -> float:
+        return max(1.0, float(self.timeout_ms) / 1000.0)
 
     @staticmethod
     def _league_sort_key(league: str) -> tuple[int, str]:
-        """
-        Priority: NBA first, NCAA second, then everything else alphabetically.
-        """
-        l = _norm(str(league or ""))
-        u = l.upper()
-        if u == "NBA" or u.startswith("NBA "):
-            return (0, l.lower())
-        if u == "NCAA" or u.startswith("NCAA "):
-            return (1, l.lower())
-        return (2, l.lower())
-
-    def list_games_for_date(
+        raise NotImplementedError
+
+    def _matchups_for_local_date(self, local_date) -> List[Dict[str, Any]]:
+        buckets = self._matchups_feed_cache.get(self.MATCHUPS_URL)
+        if buckets is None:
+            payload = _arcadia_get_json_requests(self.MATCHUPS_URL, timeout_s=self._timeout_s)
+            if not isinstance(payload, list):
+                return []
+            buckets = _bucket_matchups_by_local_date(payload)
+            self._matchups_feed_cache.put(self.MATCHUPS_URL, buckets)
+        return buckets.get(local_date, [])
+
+    async def _matchups_for_local_date_async(self, local_date) -> List[Dict[str, Any]]:
+        async def _fetch_buckets() -> Optional[Dict[date, List[Dict[str, Any]]]]:
+            payload = await _arcadia_get_json_async(self.http, self.MATCHUPS_URL, timeout_s=self._timeout_s)
+            if not isinstance(payload, list):
+                return None  # not cached; the next lookup retries
+            return _bucket_matchups_by_local_date(payload)
+
+        buckets = await self._matchups_feed_cache.get_or_fetch(self.MATCHUPS_URL, _fetch_buckets)
+        return (buckets or {}).get(local_date, [])
+
+    def _games_from_matchup_items(
         self,
-        local_date,
-        *,
-        game_status: Literal["started", "notstarted", "all"] = "all"
+        items: List[Dict[str, Any]],
+        game_status: Literal["started", "notstarted", "all"],
     ) -> List[GameInfo]:
-        """
-        List games for a given local date.
-
-        Args:
-            local_date: Local date to fetch games for
-            game_status: Filter by game status:
-                - "started": Only games that have already started
-                - "notstarted": Only games that haven't started yet
-                - "all": All games (default)
-
-        Returns:
-            List of GameInfo objects, sorted by league (NBA first, then NCAA, then alphabetical),
-            then by start time.
-        """
-        timeout_s = max(1.0, float(self.timeout_ms) / 1000.0)
-        items = _list_basketball_matchups_for_local_date(local_date=local_date, timeout_s=timeout_s)
         out: List[GameInfo] = []
-        now_utc = datetime.now(timezone.utc)
-        
+        now_utc = clock.utcnow()
+
         for m in items:
             try:
                 mid = int(m.get("id"))
@@ -137,7 +230,7 @@ class PinnacleBasketballOddsService:
             if st is None:
                 continue
             st_utc = st.astimezone(timezone.utc)
-            
+
             # Filter by game status
             if game_status == "started":
                 if st_utc >= now_utc:
@@ -145,7 +238,7 @@ class PinnacleBasketballOddsService:
             elif game_status == "notstarted":
                 if st_utc < now_utc:
                     continue  # Skip games that have started
-            
+
             away, home = _teams_from_matchup_item(m)
             league = _league_name_from_matchup_item(m)
             date_local, time_local = _format_dt_local(st)
@@ -170,40 +263,31 @@ class PinnacleBasketballOddsService:
         )
         return out
 
-    def get_game_odds(self, matchup_id: int, *, game_info: Optional[GameInfo] = None) -> GameOddsResult:
-        away = game_info.away_team if game_info else ""
-        home = game_info.home_team if game_info else ""
-        league = game_info.league if game_info else ""
-        st = game_info.start_time_utc if game_info else None
-
-        data, _df = _scrape_arcadia_matchup_id(
-            int(matchup_id),
-            away_team=away,
-            home_team=home,
-            league=league,
-            start_time_utc=st,
-            timeout_ms=self.timeout_ms,
-        )
-        if not data.get("ok"):
-            raise RuntimeError(str(data.get("error") or "Failed to fetch odds"))
-
+    @staticmethod
+    def _game_odds_from_markets(
+        matchup_id: int,
+        market_dicts: List[Dict[str, Any]],
+        *,
+        game_info: Optional[GameInfo],
+        away_team: str,
+        home_team: str,
+        league: str,
+    ) -> GameOddsResult:
         if game_info is None:
             # Synthesize minimal info; start time unknown (set to now).
-            away2 = _norm(str(data.get("away_team") or ""))
-            home2 = _norm(str(data.get("home_team") or ""))
-            now = datetime.now(timezone.utc)
+            now = clock.utcnow()
             game_info = GameInfo(
                 matchup_id=int(matchup_id),
-                away_team=away2,
-                home_team=home2,
-                league=_norm(str(data.get("league") or "")),
+                away_team=_norm(away_team),
+                home_team=_norm(home_team),
+                league=_norm(league),
                 start_time_utc=now,
                 start_date_local="",
                 start_time_local="",
             )
 
         markets: List[OddsRow] = []
-        for d in data.get("markets") or []:
+        for d in market_dicts or []:
             if not isinstance(d, dict):
                 continue
             try:
@@ -227,67 +311,6 @@ class PinnacleBasketballOddsService:
 
         return GameOddsResult(game=game_info, markets=markets)
 
-
-class PinnacleInterface:
-    """Unified interface for fetching Pinnacle games across all sports."""
-    
-    def __init__(self, *, timeout_ms: int = 45000) -> None:
-        self.timeout_ms = timeout_ms
-        self._service_map = {
-            Sport.BASKETBALL: PinnacleBasketballOddsService(timeout_ms=timeout_ms),
-            Sport.HOCKEY: PinnacleHockeyOddsService(timeout_ms=timeout_ms),
-            Sport.TENNIS: PinnacleTennisOddsService(timeout_ms=timeout_ms),
-            Sport.UFC: PinnacleMMAOddsService(timeout_ms=timeout_ms),
-            Sport.SOCCER: PinnacleSoccerOddsService(timeout_ms=timeout_ms),
-        }
-    
-    def fetch_pinnacle_games(self, sport: Sport) -> List[GameInfo]:
-        """
-        Fetch Pinnacle games for today and tomorrow for the given sport.
-        
-        Args:
-            sport: Sport enum value
-            
-        Returns:
-            List of GameInfo objects for today and tomorrow
-        """
-        service = self._service_map.get(sport)
-        if service is None:
-            return []
-        
-        today = date.today()
-        tomorrow = today + timedelta(days=1)
-        
-        games_today = service.list_games_for_date(today, game_status="all")
-        games_tomorrow = service.list_games_for_date(tomorrow, game_status="all")
-        
-        return games_today + games_tomorrow
-
-
-class PinnacleHockeyOddsService:
-    """
-    Programmatic interface for hockey (NHL) callers.
-
-    Typical usage:
-      svc = PinnacleHockeyOddsService()
-      games = svc.list_games_for_date(date.today())
-      result = svc.get_game_odds(games[0].matchup_id, game_info=games[0])
-    """
-
-    def __init__(self, *, timeout_ms: int = 45000) -> None:
-        self.timeout_ms = int(timeout_ms)
-
-    @staticmethod
-    def _league_sort_key(league: str) -> tuple[int, str]:
-        """
-        Priority: NHL first, then everything else alphabetically.
-        """
-        l = _norm(str(league or ""))
-        u = l.upper()
-        if u == "NHL" or u.startswith("NHL "):
-            return (0, l.lower())
-        return (1, l.lower())
-
     def list_games_for_date(
         self,
         local_date,
@@ -295,7 +318,7 @@ class PinnacleHockeyOddsService:
         game_status: Literal["started", "notstarted", "all"] = "all"
     ) -> List[GameInfo]:
         """
-        List hockey games for a given local date.
+        List games for a given local date.
 
         Args:
             local_date: Local date to fetch games for
@@ -305,57 +328,77 @@ class PinnacleHockeyOddsService:
                 - "all": All games (default)
 
         Returns:
-            List of GameInfo objects, sorted by league (NHL first, then alphabetical),
+            List of GameInfo objects, sorted by league priority (see `_league_sort_key`),
             then by start time.
         """
-        timeout_s = max(1.0, float(self.timeout_ms) / 1000.0)
-        items = _list_hockey_matchups_for_local_date(local_date=local_date, timeout_s=timeout_s)
-        out: List[GameInfo] = []
-        now_utc = datetime.now(timezone.utc)
-        
-        for m in items:
-            try:
-                mid = int(m.get("id"))
-            except Exception:
-                continue
-            st = _parse_iso_dt(m.get("startTime"))
-            if st is None:
-                continue
-            st_utc = st.astimezone(timezone.utc)
-            
-            # Filter by game status
-            if game_status == "started":
-                if st_utc >= now_utc:
-                    continue  # Skip games that haven't started
-            elif game_status == "notstarted":
-                if st_utc < now_utc:
-                    continue  # Skip games that have started
-            
-            away, home = _teams_from_matchup_item(m)
-            league = _league_name_from_matchup_item(m)
-            date_local, time_local = _format_dt_local(st)
-            out.append(
-                GameInfo(
-                    matchup_id=mid,
-                    away_team=_norm(away),
-                    home_team=_norm(home),
-                    league=league,
-                    start_time_utc=st_utc,
-                    start_date_local=date_local,
-                    start_time_local=time_local,
-                )
-            )
-        out.sort(
-            key=lambda g: (
-                self._league_sort_key(g.league),
-                g.start_date_local,
-                g.start_time_local,
-                g.matchup_id,
-            )
-        )
-        return out
+        items = self._matchups_for_local_date(local_date)
+        return self._games_from_matchup_items(items, game_status)
+
+    async def list_games_for_date_async(
+        self,
+        local_date,
+        *,
+        game_status: Literal["started", "notstarted", "all"] = "all"
+    ) -> List[GameInfo]:
+        """Async variant of `list_games_for_date`."""
+        items = await self._matchups_for_local_date_async(local_date)
+        return self._games_from_matchup_items(items, game_status)
+
+    async def _team_index_entry_async(self, local_date) -> tuple:
+        items = await self._matchups_for_local_date_async(local_date)
+        key = (self.MATCHUPS_URL, local_date)
+        entry = self._team_indexes.get(key)
+        if entry is None or entry[0] is not items:
+            index = TeamNameIndex(self._games_from_matchup_items(items, "all"))
+            entry = (items, index, {g.matchup_id: g for g in index.games})
+            self._team_indexes[key] = entry
+        self._team_indexes.move_to_end(key)
+        while len(self._team_indexes) > self.TEAM_INDEXES_MAX:
+            self._team_indexes.popitem(last=False)
+        return entry
+
+    async def team_index_for_date_async(self, local_date) -> TeamNameIndex[GameInfo]:
+        """Team-name index over every game on `local_date`, built once per feed refresh."""
+        return (await self._team_index_entry_async(local_date))[1]
+
+    async def game_by_matchup_id_async(self, matchup_id: int, local_date) -> Optional[GameInfo]:
+        """The game with `matchup_id` on `local_date` in the current feed, if it is listed."""
+        return (await self._team_index_entry_async(local_date))[2].get(int(matchup_id))
 
     def get_game_odds(self, matchup_id: int, *, game_info: Optional[GameInfo] = None) -> GameOddsResult:
+        """
+        Odds for one matchup. Snapshots younger than `odds_freshness_s` are reused
+        instead of re-fetching; failures raise and are never cached.
+        """
+        if self._odds_cache is None:
+            return self._fetch_game_odds(matchup_id, game_info=game_info)
+        cached = self._odds_cache.get(int(matchup_id))
+        if cached is not None:
+            return cached
+        result = self._fetch_game_odds(matchup_id, game_info=game_info)
+        self._odds_cache.put(int(matchup_id), result)
+        return result
+
+    async def get_game_odds_async(self, matchup_id: int, *, game_info: Optional[GameInfo] = None) -> GameOddsResult:
+        """
+        Async variant of `get_game_odds`. Concurrent requests for the same matchup
+        share a single in-flight fetch.
+        """
+        if self._odds_cache is None:
+            return await self._fetch_game_odds_async(matchup_id, game_info=game_info)
+        return await self._odds_cache.get_or_fetch(
+            int(matchup_id),
+            lambda: self._fetch_game_odds_async(matchup_id, game_info=game_info),
+        )
+
+    def cache_stats(self) -> Dict[str, Dict[str, int]]:
+        """Matchups feed cache (shared by every sport) and this service's odds snapshot cache."""
+        stats = {"matchups_feed": self._matchups_feed_cache.stats()}
+        if self._odds_cache is not None:
+            stats["odds"] = self._odds_cache.stats()
+        return stats
+
+    def _fetch_game_odds(self, matchup_id: int, *, game_info: Optional[GameInfo] = None) -> GameOddsResult:
         away = game_info.away_team if game_info else ""
         home = game_info.home_team if game_info else ""
         league = game_info.league if game_info else ""
@@ -372,269 +415,122 @@ class PinnacleHockeyOddsService:
         if not data.get("ok"):
             raise RuntimeError(str(data.get("error") or "Failed to fetch odds"))
 
-        if game_info is None:
-            # Synthesize minimal info; start time unknown (set to now).
-            away2 = _norm(str(data.get("away_team") or ""))
-            home2 = _norm(str(data.get("home_team") or ""))
-            now = datetime.now(timezone.utc)
-            game_info = GameInfo(
-                matchup_id=int(matchup_id),
-                away_team=away2,
-                home_team=home2,
-                league=_norm(str(data.get("league") or "")),
-                start_time_utc=now,
-                start_date_local="",
-                start_time_local="",
-            )
-
-        markets: List[OddsRow] = []
-        for d in data.get("markets") or []:
-            if not isinstance(d, dict):
-                continue
-            try:
-                markets.append(
-                    OddsRow(
-                        away_team=str(d.get("away_team") or game_info.away_team),
-                        home_team=str(d.get("home_team") or game_info.home_team),
-                        market_type=str(d.get("market_type") or ""),
-                        period=int(d.get("period") or 0),
-                        period_label=str(d.get("period_label") or ""),
-                        is_alternate=bool(d.get("is_alternate") or False),
-                        selection=str(d.get("selection") or ""),
-                        line=_to_float(d.get("line")),
-                        odds=_to_float(d.get("odds")),
-                        american_price=_to_float(d.get("american_price")),
-                        raw={},
-                    )
-                )
-            except Exception:
-                continue
-
-        return GameOddsResult(game=game_info, markets=markets)
-
+        return self._game_odds_from_markets(
+            int(matchup_id),
+            data.get("markets") or [],
+            game_info=game_info,
+            away_team=str(data.get("away_team") or ""),
+            home_team=str(data.get("home_team") or ""),
+            league=str(data.get("league") or ""),
+        )
 
-class PinnacleInterface:
-    """Unified interface for fetching Pinnacle games across all sports."""
-    
-    def __init__(self, *, timeout_ms: int = 45000) -> None:
-        self.timeout_ms = timeout_ms
-        self._service_map = {
-            Sport.BASKETBALL: PinnacleBasketballOddsService(timeout_ms=timeout_ms),
-            Sport.HOCKEY: PinnacleHockeyOddsService(timeout_ms=timeout_ms),
-            Sport.TENNIS: PinnacleTennisOddsService(timeout_ms=timeout_ms),
-            Sport.UFC: PinnacleMMAOddsService(timeout_ms=timeout_ms),
-            Sport.SOCCER: PinnacleSoccerOddsService(timeout_ms=timeout_ms),
-        }
-    
-    def fetch_pinnacle_games(self, sport: Sport) -> List[GameInfo]:
+    async def _fetch_game_odds_async(self, matchup_id: int, *, game_info: Optional[GameInfo] = None) -> GameOddsResult:
         """
-        Fetch Pinnacle games for today and tomorrow for the given sport.
-        
-        Args:
-            sport: Sport enum value
-            
-        Returns:
-            List of GameInfo objects for today and tomorrow
+        Mirrors `_scrape_arcadia_matchup_id`: the listing-provided team names are used
+        when available, and /related is only fetched if they are missing.
         """
-        service = self._service_map.get(sport)
-        if service is None:
-            return []
-        
-        today = date.today()
-        tomorrow = today + timedelta(days=1)
-        
-        games_today = service.list_games_for_date(today, game_status="all")
-        games_tomorrow = service.list_games_for_date(tomorrow, game_status="all")
-        
-        return games_today + games_tomorrow
+        mid = int(matchup_id)
+        markets_url = f"{ARCADIA_API_BASE}/matchups/{mid}/markets/related/straight"
+        markets_payload = await _arcadia_get_json_async(self.http, markets_url, timeout_s=self._timeout_s)
+
+        away = _norm(game_info.away_team if game_info else "")
+        home = _norm(game_info.home_team if game_info else "")
+        if not away or not home:
+            related_url = f"{ARCADIA_API_BASE}/matchups/{mid}/related"
+            related_payload = await _arcadia_get_json_async(self.http, related_url, timeout_s=self._timeout_s)
+            away2, home2 = _arcadia_extract_teams_from_related(related_payload)
+            away = away or _norm(away2 or "")
+            home = home or _norm(home2 or "")
+
+        if not away or not home or markets_payload is None:
+            raise RuntimeError("Failed to fetch/parse Arcadia odds for matchup")
+
+        rows = _arcadia_markets_to_rows(markets_payload, away=away, home=home)
+        return self._game_odds_from_markets(
+            mid,
+            [r.to_dict() for r in rows],
+            game_info=game_info,
+            away_team=away,
+            home_team=home,
+            league="",
+        )
 
 
-class PinnacleMMAOddsService:
+class PinnacleBasketballOddsService(_PinnacleOddsService):
     """
-    Programmatic interface for MMA/UFC callers.
+    Programmatic interface for callers.
 
     Typical usage:
-      svc = PinnacleMMAOddsService()
+      svc = PinnacleBasketballOddsService()
       games = svc.list_games_for_date(date.today())
       result = svc.get_game_odds(games[0].matchup_id, game_info=games[0])
     """
 
-    def __init__(self, *, timeout_ms: int = 45000) -> None:
-        self.timeout_ms = int(timeout_ms)
+    MATCHUPS_URL = ARCADIA_BASKETBALL_MATCHUPS_URL
 
     @staticmethod
     def _league_sort_key(league: str) -> tuple[int, str]:
         """
-        Priority: UFC first, then everything else alphabetically.
+        Priority: NBA first, NCAA second, then everything else alphabetically.
         """
         l = _norm(str(league or ""))
         u = l.upper()
-        if u == "UFC" or u.startswith("UFC "):
+        if u == "NBA" or u.startswith("NBA "):
             return (0, l.lower())
-        return (1, l.lower())
+        if u == "NCAA" or u.startswith("NCAA "):
+            return (1, l.lower())
+        return (2, l.lower())
 
-    def list_games_for_date(
-        self,
-        local_date,
-        *,
-        game_status: Literal["started", "notstarted", "all"] = "all"
-    ) -> List[GameInfo]:
-        """
-        List MMA games for a given local date.
 
-        Args:
-            local_date: Local date to fetch games for
-            game_status: Filter by game status:
-                - "started": Only games that have already started
-                - "notstarted": Only games that haven't started yet
-                - "all": All games (default)
+class PinnacleHockeyOddsService(_PinnacleOddsService):
+    """
+    Programmatic interface for hockey (NHL) callers.
 
-        Returns:
-            List of GameInfo objects, sorted by league (UFC first, then alphabetical),
-            then by start time.
-        """
-        timeout_s = max(1.0, float(self.timeout_ms) / 1000.0)
-        items = _list_mma_matchups_for_local_date(local_date=local_date, timeout_s=timeout_s)
-        out: List[GameInfo] = []
-        now_utc = datetime.now(timezone.utc)
-        
-        for m in items:
-            try:
-                mid = int(m.get("id"))
-            except Exception:
-                continue
-            st = _parse_iso_dt(m.get("startTime"))
-            if st is None:
-                continue
-            st_utc = st.astimezone(timezone.utc)
-            
-            # Filter by game status
-            if game_status == "started":
-                if st_utc >= now_utc:
-                    continue  # Skip games that haven't started
-            elif game_status == "notstarted":
-                if st_utc < now_utc:
-                    continue  # Skip games that have started
-            
-            away, home = _teams_from_matchup_item(m)
-            league = _league_name_from_matchup_item(m)
-            date_local, time_local = _format_dt_local(st)
-            out.append(
-                GameInfo(
-                    matchup_id=mid,
-                    away_team=_norm(away),
-                    home_team=_norm(home),
-                    league=league,
-                    start_time_utc=st_utc,
-                    start_date_local=date_local,
-                    start_time_local=time_local,
-                )
-            )
-        out.sort(
-            key=lambda g: (
-                self._league_sort_key(g.league),
-                g.start_date_local,
-                g.start_time_local,
-                g.matchup_id,
-            )
-        )
-        return out
+    Typical usage:
+      svc = PinnacleHockeyOddsService()
+      games = svc.list_games_for_date(date.today())
+      result = svc.get_game_odds(games[0].matchup_id, game_info=games[0])
+    """
 
-    def get_game_odds(self, matchup_id: int, *, game_info: Optional[GameInfo] = None) -> GameOddsResult:
-        away = game_info.away_team if game_info else ""
-        home = game_info.home_team if game_info else ""
-        league = game_info.league if game_info else ""
-        st = game_info.start_time_utc if game_info else None
+    MATCHUPS_URL = ARCADIA_HOCKEY_MATCHUPS_URL
 
-        data, _df = _scrape_arcadia_matchup_id(
-            int(matchup_id),
-            away_team=away,
-            home_team=home,
-            league=league,
-            start_time_utc=st,
-            timeout_ms=self.timeout_ms,
-        )
-        if not data.get("ok"):
-            raise RuntimeError(str(data.get("error") or "Failed to fetch odds"))
+    @staticmethod
+    def _league_sort_key(league: str) -> tuple[int, str]:
+        """
+        Priority: NHL first, then everything else alphabetically.
+        """
+        l = _norm(str(league or ""))
+        u = l.upper()
+        if u == "NHL" or u.startswith("NHL "):
+            return (0, l.lower())
+        return (1, l.lower())
 
-        if game_info is None:
-            # Synthesize minimal info; start time unknown (set to now).
-            away2 = _norm(str(data.get("away_team") or ""))
-            home2 = _norm(str(data.get("home_team") or ""))
-            now = datetime.now(timezone.utc)
-            game_info = GameInfo(
-                matchup_id=int(matchup_id),
-                away_team=away2,
-                home_team=home2,
-                league=_norm(str(data.get("league") or "")),
-                start_time_utc=now,
-                start_date_local="",
-                start_time_local="",
-            )
 
-        markets: List[OddsRow] = []
-        for d in data.get("markets") or []:
-            if not isinstance(d, dict):
-                continue
-            try:
-                markets.append(
-                    OddsRow(
-                        away_team=str(d.get("away_team") or game_info.away_team),
-                        home_team=str(d.get("home_team") or game_info.home_team),
-                        market_type=str(d.get("market_type") or ""),
-                        period=int(d.get("period") or 0),
-                        period_label=str(d.get("period_label") or ""),
-                        is_alternate=bool(d.get("is_alternate") or False),
-                        selection=str(d.get("selection") or ""),
-                        line=_to_float(d.get("line")),
-                        odds=_to_float(d.get("odds")),
-                        american_price=_to_float(d.get("american_price")),
-                        raw={},
-                    )
-                )
-            except Exception:
-                continue
+class PinnacleMMAOddsService(_PinnacleOddsService):
+    """
+    Programmatic interface for MMA/UFC callers.
 
-        return GameOddsResult(game=game_info, markets=markets)
+    Typical usage:
+      svc = PinnacleMMAOddsService()
+      games = svc.list_games_for_date(date.today())
+      result = svc.get_game_odds(games[0].matchup_id, game_info=games[0])
+    """
 
+    MATCHUPS_URL = ARCADIA_MMA_MATCHUPS_URL
 
-class PinnacleInterface:
-    """Unified interface for fetching Pinnacle games across all sports."""
-    
-    def __init__(self, *, timeout_ms: int = 45000) -> None:
-        self.timeout_ms = timeout_ms
-        self._service_map = {
-            Sport.BASKETBALL: PinnacleBasketballOddsService(timeout_ms=timeout_ms),
-            Sport.HOCKEY: PinnacleHockeyOddsService(timeout_ms=timeout_ms),
-            Sport.TENNIS: PinnacleTennisOddsService(timeout_ms=timeout_ms),
-            Sport.UFC: PinnacleMMAOddsService(timeout_ms=timeout_ms),
-            Sport.SOCCER: PinnacleSoccerOddsService(timeout_ms=timeout_ms),
-        }
-    
-    def fetch_pinnacle_games(self, sport: Sport) -> List[GameInfo]:
+    @staticmethod
+    def _league_sort_key(league: str) -> tuple[int, str]:
         """
-        Fetch Pinnacle games for today and tomorrow for the given sport.
-        
-        Args:
-            sport: Sport enum value
-            
-        Returns:
-            List of GameInfo objects for today and tomorrow
+        Priority: UFC first, then everything else alphabetically.
         """
-        service = self._service_map.get(sport)
-        if service is None:
-            return []
-        
-        today = date.today()
-        tomorrow = today + timedelta(days=1)
-        
-        games_today = service.list_games_for_date(today, game_status="all")
-        games_tomorrow = service.list_games_for_date(tomorrow, game_status="all")
-        
-        return games_today + games_tomorrow
+        l = _norm(str(league or ""))
+        u = l.upper()
+        if u == "UFC" or u.startswith("UFC "):
+            return (0, l.lower())
+        return (1, l.lower())
 
 
-class PinnacleTennisOddsService:
+class PinnacleTennisOddsService(_PinnacleOddsService):
     """
     Programmatic interface for Tennis (ATP/WTA) callers.
 
@@ -644,8 +540,7 @@ class PinnacleTennisOddsService:
       result = svc.get_game_odds(games[0].matchup_id, game_info=games[0])
     """
 
-    def __init__(self, *, timeout_ms: int = 45000) -> None:
-        self.timeout_ms = int(timeout_ms)
+    MATCHUPS_URL = ARCADIA_TENNIS_MATCHUPS_URL
 
     @staticmethod
     def _league_sort_key(league: str) -> tuple[int, str]:
@@ -660,131 +555,8 @@ class PinnacleTennisOddsService:
             return (1, l.lower())
         return (2, l.lower())
 
-    def list_games_for_date(
-        self,
-        local_date,
-        *,
-        game_status: Literal["started", "notstarted", "all"] = "all"
-    ) -> List[GameInfo]:
-        """
-        List tennis matches for a given local date.
-
-        Args:
-            local_date: Local date to fetch matches for
-            game_status: Filter by game status:
-                - "started": Only matches that have already started
-                - "notstarted": Only matches that haven't started yet
-                - "all": All matches (default)
-
-        Returns:
-            List of GameInfo objects, sorted by league (ATP first, then WTA, then alphabetical),
-            then by start time.
-        """
-        timeout_s = max(1.0, float(self.timeout_ms) / 1000.0)
-        items = _list_tennis_matchups_for_local_date(local_date=local_date, timeout_s=timeout_s)
-        out: List[GameInfo] = []
-        now_utc = datetime.now(timezone.utc)
-        
-        for m in items:
-            try:
-                mid = int(m.get("id"))
-            except Exception:
-                continue
-            st = _parse_iso_dt(m.get("startTime"))
-            if st is None:
-                continue
-            st_utc = st.astimezone(timezone.utc)
-            
-            # Filter by game status
-            if game_status == "started":
-                if st_utc >= now_utc:
-                    continue  # Skip matches that haven't started
-            elif game_status == "notstarted":
-                if st_utc < now_utc:
-                    continue  # Skip matches that have started
-            
-            away, home = _teams_from_matchup_item(m)
-            league = _league_name_from_matchup_item(m)
-            date_local, time_local = _format_dt_local(st)
-            out.append(
-                GameInfo(
-                    matchup_id=mid,
-                    away_team=_norm(away),
-                    home_team=_norm(home),
-                    league=league,
-                    start_time_utc=st_utc,
-                    start_date_local=date_local,
-                    start_time_local=time_local,
-                )
-            )
-        out.sort(
-            key=lambda g: (
-                self._league_sort_key(g.league),
-                g.start_date_local,
-                g.start_time_local,
-                g.matchup_id,
-            )
-        )
-        return out
-
-    def get_game_odds(self, matchup_id: int, *, game_info: Optional[GameInfo] = None) -> GameOddsResult:
-        away = game_info.away_team if game_info else ""
-        home = game_info.home_team if game_info else ""
-        league = game_info.league if game_info else ""
-        st = game_info.start_time_utc if game_info else None
 
-        data, _df = _scrape_arcadia_matchup_id(
-            int(matchup_id),
-            away_team=away,
-            home_team=home,
-            league=league,
-            start_time_utc=st,
-            timeout_ms=self.timeout_ms,
-        )
-        if not data.get("ok"):
-            raise RuntimeError(str(data.get("error") or "Failed to fetch odds"))
-
-        if game_info is None:
-            # Synthesize minimal info; start time unknown (set to now).
-            away2 = _norm(str(data.get("away_team") or ""))
-            home2 = _norm(str(data.get("home_team") or ""))
-            now = datetime.now(timezone.utc)
-            game_info = GameInfo(
-                matchup_id=int(matchup_id),
-                away_team=away2,
-                home_team=home2,
-                league=_norm(str(data.get("league") or "")),
-                start_time_utc=now,
-                start_date_local="",
-                start_time_local="",
-            )
-
-        markets: List[OddsRow] = []
-        for d in data.get("markets") or []:
-            if not isinstance(d, dict):
-                continue
-            try:
-                markets.append(
-                    OddsRow(
-                        away_team=str(d.get("away_team") or game_info.away_team),
-                        home_team=str(d.get("home_team") or game_info.home_team),
-                        market_type=str(d.get("market_type") or ""),
-                        period=int(d.get("period") or 0),
-                        period_label=str(d.get("period_label") or ""),
-                        is_alternate=bool(d.get("is_alternate") or False),
-                        selection=str(d.get("selection") or ""),
-                        line=_to_float(d.get("line")),
-                        odds=_to_float(d.get("odds")),
-                        american_price=_to_float(d.get("american_price")),
-                        raw={},
-                    )
-                )
-            except Exception:
-                continue
-
-        return GameOddsResult(game=game_info, markets=markets)
-
-class PinnacleSoccerOddsService:
+class PinnacleSoccerOddsService(_PinnacleOddsService):
     """
     Programmatic interface for Soccer callers.
 
@@ -794,8 +566,7 @@ class PinnacleSoccerOddsService:
       result = svc.get_game_odds(games[0].matchup_id, game_info=games[0])
     """
 
-    def __init__(self, *, timeout_ms: int = 45000) -> None:
-        self.timeout_ms = int(timeout_ms)
+    MATCHUPS_URL = ARCADIA_SOCCER_MATCHUPS_URL
 
     @staticmethod
     def _league_sort_key(league: str) -> tuple[int, str]:
@@ -811,145 +582,31 @@ class PinnacleSoccerOddsService:
                 return (0, l.lower())
         return (1, l.lower())
 
-    def list_games_for_date(
-        self,
-        local_date,
-        *,
-        game_status: Literal["started", "notstarted", "all"] = "all"
-    ) -> List[GameInfo]:
-        """
-        List soccer games for a given local date.
-
-        Args:
-            local_date: Local date to fetch games for
-            game_status: Filter by game status:
-                - "started": Only games that have already started
-                - "notstarted": Only games that haven't started yet
-                - "all": All games (default)
-
-        Returns:
-            List of GameInfo objects, sorted by league (major leagues first, then alphabetical),
-            then by start time.
-        """
-        timeout_s = max(1.0, float(self.timeout_ms) / 1000.0)
-        items = _list_soccer_matchups_for_local_date(local_date=local_date, timeout_s=timeout_s)
-        out: List[GameInfo] = []
-        now_utc = datetime.now(timezone.utc)
-        
-        for m in items:
-            try:
-                mid = int(m.get("id"))
-            except Exception:
-                continue
-            st = _parse_iso_dt(m.get("startTime"))
-            if st is None:
-                continue
-            st_utc = st.astimezone(timezone.utc)
-            
-            # Filter by game status
-            if game_status == "started":
-                if st_utc >= now_utc:
-                    continue  # Skip games that haven't started
-            elif game_status == "notstarted":
-                if st_utc < now_utc:
-                    continue  # Skip games that have started
-            
-            away, home = _teams_from_matchup_item(m)
-            league = _league_name_from_matchup_item(m)
-            date_local, time_local = _format_dt_local(st)
-            out.append(
-                GameInfo(
-                    matchup_id=mid,
-                    away_team=_norm(away),
-                    home_team=_norm(home),
-                    league=league,
-                    start_time_utc=st_utc,
-                    start_date_local=date_local,
-                    start_time_local=time_local,
-                )
-            )
-        out.sort(
-            key=lambda g: (
-                self._league_sort_key(g.league),
-                g.start_date_local,
-                g.start_time_local,
-                g.matchup_id,
-            )
-        )
-        return out
-
-    def get_game_odds(self, matchup_id: int, *, game_info: Optional[GameInfo] = None) -> GameOddsResult:
-        away = game_info.away_team if game_info else ""
-        home = game_info.home_team if game_info else ""
-        league = game_info.league if game_info else ""
-        st = game_info.start_time_utc if game_info else None
-
-        data, _df = _scrape_arcadia_matchup_id(
-            int(matchup_id),
-            away_team=away,
-            home_team=home,
-            league=league,
-            start_time_utc=st,
-            timeout_ms=self.timeout_ms,
-        )
-        if not data.get("ok"):
-            raise RuntimeError(str(data.get("error") or "Failed to fetch odds"))
-
-        if game_info is None:
-            # Synthesize minimal info; start time unknown (set to now).
-            away2 = _norm(str(data.get("away_team") or ""))
-            home2 = _norm(str(data.get("home_team") or ""))
-            now = datetime.now(timezone.utc)
-            game_info = GameInfo(
-                matchup_id=int(matchup_id),
-                away_team=away2,
-                home_team=home2,
-                league=_norm(str(data.get("league") or "")),
-                start_time_utc=now,
-                start_date_local="",
-                start_time_local="",
-            )
-
-        markets: List[OddsRow] = []
-        for d in data.get("markets") or []:
-            if not isinstance(d, dict):
-                continue
-            try:
-                markets.append(
-                    OddsRow(
-                        away_team=str(d.get("away_team") or game_info.away_team),
-                        home_team=str(d.get("home_team") or game_info.home_team),
-                        market_type=str(d.get("market_type") or ""),
-                        period=int(d.get("period") or 0),
-                        period_label=str(d.get("period_label") or ""),
-                        is_alternate=bool(d.get("is_alternate") or False),
-                        selection=str(d.get("selection") or ""),
-                        line=_to_float(d.get("line")),
-                        odds=_to_float(d.get("odds")),
-                        american_price=_to_float(d.get("american_price")),
-                        raw={},
-                    )
-                )
-            except Exception:
-                continue
-
-        return GameOddsResult(game=game_info, markets=markets)
-
-
-
 
 class PinnacleInterface:
     """Unified interface for fetching Pinnacle games across all sports."""
     
-    def __init__(self, *, timeout_ms: int = 45000) -> None:
+    def __init__(
+        self,
+        *,
+        timeout_ms: int = 45000,
+        http: Optional[AsyncHttpClient] = None,
+        odds_freshness_s: float = DEFAULT_ODDS_FRESHNESS_S,
+    ) -> None:
         self.timeout_ms = timeout_ms
+        kwargs = dict(timeout_ms=timeout_ms, http=http, odds_freshness_s=odds_freshness_s)
         self._service_map = {
-            Sport.BASKETBALL: PinnacleBasketballOddsService(timeout_ms=timeout_ms),
-            Sport.HOCKEY: PinnacleHockeyOddsService(timeout_ms=timeout_ms),
-            Sport.TENNIS: PinnacleTennisOddsService(timeout_ms=timeout_ms),
-            Sport.UFC: PinnacleMMAOddsService(timeout_ms=timeout_ms),
-            Sport.SOCCER: PinnacleSoccerOddsService(timeout_ms=timeout_ms),
+            Sport.BASKETBALL: PinnacleBasketballOddsService(**kwargs),
+            Sport.HOCKEY: PinnacleHockeyOddsService(**kwargs),
+            Sport.TENNIS: PinnacleTennisOddsService(**kwargs),
+            Sport.UFC: PinnacleMMAOddsService(**kwargs),
+            Sport.SOCCER: PinnacleSoccerOddsService(**kwargs),
         }
+
+    async def close(self) -> None:
+        """Close the loop's shared Arcadia client unless an `http` client was passed in."""
+        for service in self._service_map.values():
+            await service.close()
     
     def fetch_pinnacle_games(self, sport: Sport) -> List[GameInfo]:
         """
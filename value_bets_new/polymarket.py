@@ -8,18 +8,23 @@ from __future__ import annotations
 import sys
 import os
 import json
-import requests
-import time
+import asyncio
+import logging
 from datetime import date, datetime, timezone
 from typing import List, Dict, Any, Optional
-from py_clob_client.client import ClobClient
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from value_bets_new import clock
+from value_bets_new.cache import AsyncTTLCache
 from value_bets_new.constants import MarketType, MarketOdds
+from value_bets_new.http_client import AsyncHttpClient, HttpStatusError
+from value_bets_new.order_book import EMPTY_TOP_OF_BOOK, TopOfBook, top_of_book
 from value_bets_new.rewrite_later import PolymarketMarketExtractor, PolymarketGameFinder
 
+logger = logging.getLogger(__name__)
+
 
 class PolymarketEvent:
     def __init__(
@@ -29,12 +34,15 @@ class PolymarketEvent:
         home_team: str,
         play_date: date,
         market_slugs_by_event: Dict[MarketType, List[str]],
+        start_time: Optional[datetime] = None,
     ) -> None:
         self.event_slug = event_slug
         self.away_team = away_team
         self.home_team = home_team
         self.play_date = play_date
         self.market_slugs_by_event = market_slugs_by_event
+        # UTC kick-off time from Gamma's startTime, when known
+        self.start_time = start_time
 
     def __str__(self) -> str:
         return f"{self.away_team} @ {self.home_team} - {self.event_slug}"
@@ -44,47 +52,72 @@ class PolymarketEvent:
 
 
 class PolymarketInterface:
-    def __init__(self) -> None:
+    # Event payloads are reused by slug discovery and by every market slug's odds lookup
+    # within one orchestrator cycle; the TTL is short enough that market lists stay fresh.
+    EVENT_CACHE_TTL_S = 30.0
+    EVENT_CACHE_MAX_ENTRIES = 2048
+    # Max token ids per POST /books request
+    BOOKS_BATCH_SIZE = 50
+    # Gamma listing pagination: pages per concurrent wave, page size and hard page cap
+    SCAN_WAVE_SIZE = 5
+    SCAN_PAGE_SIZE = 100
+    SCAN_MAX_PAGES = 100
+    # Transient Gamma statuses retried per listing page; a page that still fails fails the scan
+    SCAN_RETRY_STATUSES = (408, 425, 429, 500, 502, 503, 504)
+
+    def __init__(self, http: Optional[AsyncHttpClient] = None) -> None:
         self.game_finder = PolymarketGameFinder()
         self.GAMMA_API_BASE = "https://gamma-api.polymarket.com"
         self.CLOB_API_BASE = "https://clob.polymarket.com"
-        self.session = requests.Session()
-        self.clob_client = ClobClient(
-            host=self.CLOB_API_BASE,
-            chain_id=137  # Polygon mainnet
+        # Shared pooled client; connection errors are retried with 1s, 2s, 4s backoff,
+        # HTTP errors (4xx, 5xx) are not transient and raise HttpStatusError.
+        self.http = http if http is not None else AsyncHttpClient()
+        self._event_cache = AsyncTTLCache(
+            ttl_s=self.EVENT_CACHE_TTL_S,
+            max_entries=self.EVENT_CACHE_MAX_ENTRIES,
         )
-    
-    def _retry_request(self, method: str, url: str, max_retries: int = 3, **kwargs) -> Optional[requests.Response]:
+
+    async def _get_json(self, url: str, **kwargs) -> Any:
+        try:
+            return await self.http.get_json(url, **kwargs)
+        except HttpStatusError as e:
+            logger.warning("HTTP error: %s", e)
+            raise
+
+    async def _fetch_event_by_slug(self, event_slug: str) -> Optional[Dict[str, Any]]:
+        """Fetch a Gamma event payload, at most once per EVENT_CACHE_TTL_S for each slug."""
+        url = f"{self.GAMMA_API_BASE}/events/slug/{event_slug}"
+        return await self._event_cache.get_or_fetch(event_slug, lambda: self._get_json(url))
+
+    def event_cache_stats(self) -> Dict[str, int]:
+        return self._event_cache.stats()
+
+    async def _fetch_events_page(self, *, limit: int, offset: int) -> List[Dict[str, Any]]:
         """
-        Retry HTTP requests with exponential backoff for connection errors.
-        
-        Args:
-            method: HTTP method ('get', 'post', etc.)
-            url: URL to request
-            max_retries: Maximum number of retry attempts
-            **kwargs: Additional arguments to pass to requests method
-            
-        Returns:
-            Response object or None if all retries failed
+        Async equivalent of `PolymarketGameFinder.fetch_events_page` for active, open game events.
+
+        `[]` means the listing ended. Fetch errors raise (after the client's retries)
+        rather than looking like an empty page, so a scan is never silently truncated.
         """
-        for attempt in range(max_retries):
-            try:
-                response = getattr(self.session, method.lower())(url, **kwargs)
-                response.raise_for_status()
-                return response
-            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
-                if attempt < max_retries - 1:
-                    wait_time = 2 ** attempt  # Exponential backoff: 1s, 2s, 4s
-                    print(f"[DEBUG] [PolymarketInterface] Connection error (attempt {attempt + 1}/{max_retries}): {e}. Retrying in {wait_time}s...")
-                    time.sleep(wait_time)
-                else:
-                    print(f"[DEBUG] [PolymarketInterface] Connection error after {max_retries} attempts: {e}")
-                    raise
-            except requests.exceptions.HTTPError as e:
-                # Don't retry HTTP errors (4xx, 5xx) - these are not transient
-                print(f"[DEBUG] [PolymarketInterface] HTTP error: {e}")
-                raise
-        return None
+        params = {
+            "tag_id": self.game_finder.GAME_BETS_TAG_ID,
+            "active": "true",
+            "closed": "false",
+            "limit": str(limit),
+            "offset": str(offset),
+            "order": "startTime",
+            "ascending": "false",
+        }
+        data = await self._get_json(
+            f"{self.GAMMA_API_BASE}/events",
+            params=params,
+            retry_statuses=self.SCAN_RETRY_STATUSES,
+        )
+        if data is None:
+            raise RuntimeError(f"Gamma events page at offset {offset} returned no payload")
+        if isinstance(data, list):
+            return data
+        return (data or {}).get("data", []) or []
 
     def _within_time_contraints(self, event: Dict[str, Any]) -> bool:
         """
@@ -97,7 +130,7 @@ class PolymarketInterface:
         if start_time is None:
             return False
 
-        now = datetime.now(timezone.utc)
+        now = clock.utcnow()
         # Ensure start_time is timezone-aware and convert to UTC for comparison
         if start_time.tzinfo is None:
             start_time = start_time.replace(tzinfo=timezone.utc)
@@ -114,120 +147,198 @@ class PolymarketInterface:
 
         return True
 
-    def fetch_polymarket_events(
+    @staticmethod
+    def _is_tennis(whitelisted_prefixes: List[str]) -> bool:
+        prefixes = str(whitelisted_prefixes).lower()
+        return "tennis" in prefixes or "atp" in prefixes or "wta" in prefixes
+
+    @staticmethod
+    def _matches_prefixes(event_slug: str, whitelisted_prefixes: List[str]) -> Optional[str]:
+        """
+        Return the first whitelisted league prefix (e.g. "nba", "ufc", "atp") the slug
+        starts with or contains with dashes (for tennis/other formats), else None.
+        """
+        slug_lower = event_slug.lower()
+        for prefix in whitelisted_prefixes:
+            prefix_lower = prefix.lower()
+            if (slug_lower.startswith(prefix_lower + "-") or 
+                f"-{prefix_lower}-" in slug_lower or 
+                slug_lower.startswith(prefix_lower)):
+                return prefix
+        return None
+
+    def _event_candidate(
         self,
+        event: Dict[str, Any],
         whitelisted_prefixes: List[str],
-        markets: List[MarketType],
-    ) -> List[PolymarketEvent]:
-        """Fetch Polymarket events for today and tomorrow."""
-        polymarket_events = []
-        events_checked = 0
-        events_filtered_by_prefix = 0
-        events_filtered_by_time = 0
-        events_filtered_by_title = 0
+        counters: Dict[str, int],
+    ) -> Optional[tuple[str, str, str, date, datetime]]:
+        """
+        Apply the time/prefix/title filters to one Gamma event.
+        Returns (event_slug, away_team, home_team, play_date, start_time) or None if filtered out.
+        """
+        is_tennis = self._is_tennis(whitelisted_prefixes)
+        counters["checked"] += 1
+        event_slug = event.get("slug")
         
-        for page in range(100):  # Search up to 100 pages
-            events = self.game_finder.fetch_events_page(
-                limit=100,
-                offset=page * 100,
-                active=True,
-                closed=False,
-                order="startTime",
-                ascending=False,
-            )
-            if not events:
-                break
+        # Debug: Log all event slugs for tennis debugging
+        if is_tennis and event_slug:
+            logger.debug("Checking event slug: '%s'", event_slug)
+        
+        if not self._within_time_contraints(event):
+            counters["time"] += 1
+            if event_slug and is_tennis:
+                logger.debug("Event '%s' FILTERED - time constraints", event_slug)
+            return None
 
-            for event in events:
-                events_checked += 1
-                event_slug = event.get("slug")
-                
-                # Debug: Log all event slugs for tennis debugging
-                if ("tennis" in str(whitelisted_prefixes).lower() or "atp" in str(whitelisted_prefixes).lower() or "wta" in str(whitelisted_prefixes).lower()) and event_slug:
-                    print(f"[DEBUG] [Tennis] Checking event slug: '{event_slug}'")
-                
-                if not self._within_time_contraints(event):
-                    events_filtered_by_time += 1
-                    if event_slug and ("tennis" in str(whitelisted_prefixes).lower() or "atp" in str(whitelisted_prefixes).lower() or "wta" in str(whitelisted_prefixes).lower()):
-                        print(f"[DEBUG] [Tennis] Event '{event_slug}' FILTERED - time constraints")
-                    continue
+        if not event_slug:
+            return None
 
-                if not event_slug:
-                    continue
+        # Filter by whitelisted league prefixes (e.g. "nba-", "ufc-", "atp-", "wta-", etc)
+        prefix = self._matches_prefixes(event_slug, whitelisted_prefixes)
+        if prefix is None:
+            counters["prefix"] += 1
+            if is_tennis:
+                logger.debug("Event '%s' FILTERED - doesn't match prefixes %s", event_slug, whitelisted_prefixes)
+            return None
+        if is_tennis:
+            logger.debug("Event '%s' MATCHED prefix '%s'", event_slug, prefix)
 
-                # Filter by whitelisted league prefixes (e.g. "nba-", "ufc-", "atp-", "wta-", etc)
-                # Check if slug starts with prefix or contains it with dashes (for tennis/other formats)
-                matches_prefix = False
-                for prefix in whitelisted_prefixes:
-                    slug_lower = event_slug.lower()
-                    prefix_lower = prefix.lower()
-                    if (slug_lower.startswith(prefix_lower + "-") or 
-                        f"-{prefix_lower}-" in slug_lower or 
-                        slug_lower.startswith(prefix_lower)):
-                        matches_prefix = True
-                        if "tennis" in str(whitelisted_prefixes).lower() or "atp" in str(whitelisted_prefixes).lower() or "wta" in str(whitelisted_prefixes).lower():
-                            print(f"[DEBUG] [Tennis] Event '{event_slug}' MATCHED prefix '{prefix}'")
-                        break
-                if not matches_prefix:
-                    events_filtered_by_prefix += 1
-                    if "tennis" in str(whitelisted_prefixes).lower() or "atp" in str(whitelisted_prefixes).lower() or "wta" in str(whitelisted_prefixes).lower():
-                        print(f"[DEBUG] [Tennis] Event '{event_slug}' FILTERED - doesn't match prefixes {whitelisted_prefixes}")
-                    continue
+        event_title = event.get("title")
+        if not event_title:
+            counters["title"] += 1
+            if is_tennis:
+                logger.debug("Event '%s' FILTERED - no title", event_slug)
+            return None
 
-                event_title = event.get("title")
-                if not event_title:
-                    events_filtered_by_title += 1
-                    if "tennis" in str(whitelisted_prefixes).lower() or "atp" in str(whitelisted_prefixes).lower() or "wta" in str(whitelisted_prefixes).lower():
-                        print(f"[DEBUG] [Tennis] Event '{event_slug}' FILTERED - no title")
-                    continue
+        parts = event_title.replace(" vs. ", " @ ").replace(" vs ", " @ ").split(" @ ", 1)
+        if len(parts) != 2:
+            counters["title"] += 1
+            if is_tennis:
+                logger.debug("Event '%s' FILTERED - title doesn't parse: '%s'", event_slug, event_title)
+            return None
 
-                parts = event_title.replace(" vs. ", " @ ").replace(" vs ", " @ ").split(" @ ", 1)
-                if len(parts) != 2:
-                    events_filtered_by_title += 1
-                    if "tennis" in str(whitelisted_prefixes).lower() or "atp" in str(whitelisted_prefixes).lower() or "wta" in str(whitelisted_prefixes).lower():
-                        print(f"[DEBUG] [Tennis] Event '{event_slug}' FILTERED - title doesn't parse: '{event_title}'")
-                    continue
+        away_team = parts[0]
+        home_team = parts[1]
 
-                away_team = parts[0]
-                home_team = parts[1]
+        # Extract play_date from event start time
+        start_time = self.game_finder._parse_start_time(event)
+        if start_time is None:
+            if is_tennis:
+                logger.debug("Event '%s' FILTERED - no start_time", event_slug)
+            return None
+        # Convert to date object
+        if start_time.tzinfo is None:
+            start_time = start_time.replace(tzinfo=timezone.utc)
+        start_time = start_time.astimezone(timezone.utc)
+        play_date = start_time.date()
 
-                # Extract play_date from event start time
-                start_time = self.game_finder._parse_start_time(event)
-                if start_time is None:
-                    if "tennis" in str(whitelisted_prefixes).lower() or "atp" in str(whitelisted_prefixes).lower() or "wta" in str(whitelisted_prefixes).lower():
-                        print(f"[DEBUG] [Tennis] Event '{event_slug}' FILTERED - no start_time")
-                    continue
-                # Convert to date object
-                if start_time.tzinfo is None:
-                    start_time = start_time.replace(tzinfo=timezone.utc)
-                play_date = start_time.astimezone(timezone.utc).date()
-
-                # Market slugs by market type
-                market_slugs_by_event = self._fetch_polymarket_market_slugs_given_event_slug(event_slug, markets)
-
-                polymarket_event = PolymarketEvent(
-                    event_slug=event_slug,
-                    away_team=away_team,
-                    home_team=home_team,
-                    play_date=play_date,
-                    market_slugs_by_event=market_slugs_by_event,
-                )
-                polymarket_events.append(polymarket_event)
-        
-        # Debug logging for tennis
-        if "tennis" in str(whitelisted_prefixes).lower() or "atp" in str(whitelisted_prefixes).lower() or "wta" in str(whitelisted_prefixes).lower():
-            print(f"[DEBUG] [Tennis] Summary - Events checked: {events_checked}, filtered by time: {events_filtered_by_time}, filtered by prefix: {events_filtered_by_prefix}, filtered by title: {events_filtered_by_title}, found: {len(polymarket_events)}")
+        return event_slug, away_team, home_team, play_date, start_time
+
+    def _page_reaches_before(self, events: List[Dict[str, Any]], cutoff: datetime) -> bool:
+        """
+        True if a startTime-descending page contains an event starting before cutoff,
+        i.e. every later page is outside the window too. Start times are parsed like
+        `_within_time_contraints` does, so stopping and filtering agree.
+        """
+        for event in events:
+            start_time = self.game_finder._parse_start_time(event)
+            if start_time is None:
+                continue
+            if start_time.tzinfo is None:
+                start_time = start_time.replace(tzinfo=timezone.utc)
+            if start_time < cutoff:
+                return True
+        return False
+
+    async def _scan_events(self, *, not_before: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """
+        Page through the Gamma game events listing once.
 
+        Pages are fetched SCAN_WAVE_SIZE at a time. The listing is ordered by startTime
+        descending, so the scan stops after the first page that reaches events starting
+        before `not_before` (default: now, matching `_within_time_contraints`).
+        A page that fails to load raises, failing the whole scan instead of cutting it short.
+        """
+        cutoff = not_before or clock.utcnow()
+        all_events: List[Dict[str, Any]] = []
+        for wave_start in range(0, self.SCAN_MAX_PAGES, self.SCAN_WAVE_SIZE):
+            pages = await asyncio.gather(*[
+                self._fetch_events_page(limit=self.SCAN_PAGE_SIZE, offset=page * self.SCAN_PAGE_SIZE)
+                for page in range(wave_start, min(wave_start + self.SCAN_WAVE_SIZE, self.SCAN_MAX_PAGES))
+            ])
+            for events in pages:
+                if not events:
+                    return all_events
+                all_events.extend(events)
+                if self._page_reaches_before(events, cutoff):
+                    return all_events
+        return all_events
+
+    async def fetch_polymarket_events_by_sport(
+        self,
+        prefixes_by_sport: Dict[Any, List[str]],
+        markets_by_sport: Dict[Any, List[MarketType]],
+    ) -> Dict[Any, List[PolymarketEvent]]:
+        """
+        Scan the Gamma listing once and route each event to every sport whose
+        whitelisted prefixes it matches. Keys are whatever the caller uses for sports.
+        """
+        events = await self._scan_events()
+
+        candidates_by_sport: Dict[Any, list] = {}
+        for sport, whitelisted_prefixes in prefixes_by_sport.items():
+            counters = {"checked": 0, "time": 0, "prefix": 0, "title": 0}
+            candidates = []
+            for event in events:
+                candidate = self._event_candidate(event, whitelisted_prefixes, counters)
+                if candidate is not None:
+                    candidates.append(candidate)
+            candidates_by_sport[sport] = candidates
+
+            # Debug logging for tennis
+            if self._is_tennis(whitelisted_prefixes):
+                logger.debug("Summary - Events checked: %s, filtered by time: %s, filtered by prefix: %s, filtered by title: %s, found: %s", counters['checked'], counters['time'], counters['prefix'], counters['title'], len(candidates))
+
+        # Market slugs by market type, fetched concurrently for all matching events
+        jobs = [
+            (sport, candidate)
+            for sport, candidates in candidates_by_sport.items()
+            for candidate in candidates
+        ]
+        market_slugs = await asyncio.gather(*[
+            self._fetch_polymarket_market_slugs_given_event_slug(candidate[0], markets_by_sport[sport])
+            for sport, candidate in jobs
+        ], return_exceptions=True)
+
+        polymarket_events: Dict[Any, List[PolymarketEvent]] = {sport: [] for sport in prefixes_by_sport}
+        for (sport, (event_slug, away_team, home_team, play_date, start_time)), market_slugs_by_event in zip(jobs, market_slugs):
+            if isinstance(market_slugs_by_event, Exception):
+                # One bad event shouldn't drop every sport's results for this scan
+                logger.debug("Failed to fetch markets for '%s': %s", event_slug, market_slugs_by_event)
+                continue
+            polymarket_events[sport].append(PolymarketEvent(
+                event_slug=event_slug,
+                away_team=away_team,
+                home_team=home_team,
+                play_date=play_date,
+                market_slugs_by_event=market_slugs_by_event,
+                start_time=start_time,
+            ))
         return polymarket_events
+
+    async def fetch_polymarket_events(
+        self,
+        whitelisted_prefixes: List[str],
+        markets: List[MarketType],
+    ) -> List[PolymarketEvent]:
+        """Fetch Polymarket events for today and tomorrow."""
+        by_sport = await self.fetch_polymarket_events_by_sport({0: whitelisted_prefixes}, {0: markets})
+        return by_sport[0]
     
-    def _fetch_polymarket_market_slugs_given_event_slug(self, event_slug : str, markets: List[MarketType]) -> Dict[MarketType, List[str]]:
+    async def _fetch_polymarket_market_slugs_given_event_slug(self, event_slug : str, markets: List[MarketType]) -> Dict[MarketType, List[str]]:
 
-        url = f"{self.GAMMA_API_BASE}/events/slug/{event_slug}"
-        
-        response = self._retry_request('get', url)
-        if response is None:
-            return {}
-        event = response.json()
+        event = await self._fetch_event_by_slug(event_slug)
 
         if not event:
             return {}
@@ -248,25 +359,12 @@ class PolymarketInterface:
 
         return market_slugs
 
-    def retrieve_polymarket_odds(self, event_slug: str, market_slug: str) -> List[MarketOdds]:
+    @staticmethod
+    def _market_tokens(event_data: Dict[str, Any], event_slug: str, market_slug: str) -> tuple[Optional[str], List[str], List[str]]:
         """
-        Fetch bid-ask spread data for a Polymarket market using event slug and market slug.
-        
-        Args:
-            event_slug: The event slug (e.g., "nba-bos-mia-2026-01-15")
-            market_slug: The market slug within the event (e.g., "winner" or "spread-home-4pt5")
-            
-        Returns:
-            List of MarketOdds containing spread data for each token in the market
+        Find the market matching market_slug and return (condition_id, clob_token_ids, outcomes).
+        Raises ValueError if the market or its tokens are missing.
         """
-        # Step 1: Fetch the event using the gamma API
-        event_url = f"{self.GAMMA_API_BASE}/events/slug/{event_slug}"
-        response = self._retry_request('get', event_url)
-        if response is None:
-            raise ValueError(f"Failed to fetch event '{event_slug}' after retries")
-        event_data = response.json()
-        
-        # Step 2: Find the market matching the market_slug and extract clobTokenIds
         markets = event_data.get("markets", [])
         target_market = None
         for market in markets:
@@ -296,51 +394,109 @@ class PolymarketInterface:
         outcomes = target_market.get("outcomes", [])
         if isinstance(outcomes, str):
             outcomes = json.loads(outcomes)
-        
-        # Step 3: Get spread data for each token using py-clob-client
+
+        return condition_id, [str(t) for t in clob_token_ids], list(outcomes or [])
+
+    @staticmethod
+    def _market_odds_from_books(
+        condition_id: Optional[str],
+        clob_token_ids: List[str],
+        outcomes: List[str],
+        books: Dict[str, TopOfBook],
+    ) -> List[MarketOdds]:
         odds: List[MarketOdds] = []
-        
         for i, token_id in enumerate(clob_token_ids):
             # Get outcome label for this token
             outcome_label = outcomes[i] if i < len(outcomes) else f"Outcome {i}"
-            
-            # Use get_price for accurate best bid/ask
-            try:
-                bid_response = self.clob_client.get_price(token_id, side="BUY")
-                best_bid = float(bid_response.get("price", 0)) if bid_response else None
-            except Exception:
-                best_bid = None
-                
-            try:
-                ask_response = self.clob_client.get_price(token_id, side="SELL")
-                best_ask = float(ask_response.get("price", 0)) if ask_response else None
-            except Exception:
-                best_ask = None
-            
-            # Get order book for volume information
-            try:
-                order_book = self.clob_client.get_order_book(token_id)
-                bid_volume = float(order_book.bids[0].size) if order_book.bids else 0.0
-                ask_volume = float(order_book.asks[0].size) if order_book.asks else 0.0
-            except Exception:
-                bid_volume = 0.0
-                ask_volume = 0.0
-            
-            # Calculate spread
-            if best_bid is not None and best_ask is not None:
-                spread = best_ask - best_bid
-            else:
-                spread = None
-            
+            tob = books.get(token_id, EMPTY_TOP_OF_BOOK)
             odds.append(MarketOdds(
                 token_id=token_id,
                 team_name=outcome_label,
-                best_bid=best_bid,
-                bid_volume=bid_volume,
-                best_ask=best_ask,
-                ask_volume=ask_volume,
-                spread=spread,
-                condition_id=condition_id
+                best_bid=tob.best_bid,
+                bid_volume=tob.bid_volume,
+                best_ask=tob.best_ask,
+                ask_volume=tob.ask_volume,
+                spread=tob.spread,
+                condition_id=condition_id,
+                ask_levels=tob.ask_levels,
             ))
-
         return odds
+
+    async def retrieve_polymarket_odds(self, event_slug: str, market_slug: str) -> List[MarketOdds]:
+        """
+        Fetch bid-ask spread data for a Polymarket market using event slug and market slug.
+        
+        Args:
+            event_slug: The event slug (e.g., "nba-bos-mia-2026-01-15")
+            market_slug: The market slug within the event (e.g., "winner" or "spread-home-4pt5")
+            
+        Returns:
+            List of MarketOdds containing spread data for each token in the market
+        """
+        # Step 1: Fetch the event using the gamma API
+        event_data = await self._fetch_event_by_slug(event_slug)
+        if not event_data:
+            raise ValueError(f"Failed to fetch event '{event_slug}' after retries")
+        
+        # Step 2: Find the market matching the market_slug and extract clobTokenIds
+        condition_id, clob_token_ids, outcomes = self._market_tokens(event_data, event_slug, market_slug)
+        
+        # Step 3: Top of book for every token from one batch book request
+        books = await self.fetch_books(clob_token_ids)
+        return self._market_odds_from_books(condition_id, clob_token_ids, outcomes, books)
+
+    async def retrieve_polymarket_event_odds(self, event_slug: str, market_slugs: List[str]) -> Dict[str, List[MarketOdds]]:
+        """
+        Fetch odds for several markets of one event, pricing every token in a single batch request.
+
+        Returns a dict keyed by market slug. Markets that can't be found/parsed are logged and omitted.
+        """
+        event_data = await self._fetch_event_by_slug(event_slug)
+        if not event_data:
+            raise ValueError(f"Failed to fetch event '{event_slug}' after retries")
+
+        parsed: Dict[str, tuple[Optional[str], List[str], List[str]]] = {}
+        for market_slug in market_slugs:
+            try:
+                parsed[market_slug] = self._market_tokens(event_data, event_slug, market_slug)
+            except ValueError as e:
+                logger.debug("Skipping market: %s", e)
+
+        token_ids = list(dict.fromkeys(t for _, tokens, _ in parsed.values() for t in tokens))
+        books = await self.fetch_books(token_ids)
+        return {
+            market_slug: self._market_odds_from_books(condition_id, tokens, outcomes, books)
+            for market_slug, (condition_id, tokens, outcomes) in parsed.items()
+        }
+
+    async def fetch_books(self, token_ids: List[str]) -> Dict[str, TopOfBook]:
+        """
+        Top of book per token via the CLOB batch endpoint (POST /books).
+
+        A failed batch leaves its tokens out of the result; callers treat missing
+        tokens as an empty book.
+        """
+        chunks = [
+            token_ids[i:i + self.BOOKS_BATCH_SIZE]
+            for i in range(0, len(token_ids), self.BOOKS_BATCH_SIZE)
+        ]
+        responses = await asyncio.gather(
+            *[
+                self.http.post_json(f"{self.CLOB_API_BASE}/books", [{"token_id": t} for t in chunk])
+                for chunk in chunks
+            ],
+            return_exceptions=True,
+        )
+
+        books: Dict[str, TopOfBook] = {}
+        for chunk, response in zip(chunks, responses):
+            if isinstance(response, Exception) or not isinstance(response, list):
+                logger.warning("Batch book request failed for %s tokens: %r", len(chunk), response)
+                continue
+            for book in response:
+                if not isinstance(book, dict):
+                    continue
+                asset_id = book.get("asset_id")
+                if asset_id is not None:
+                    books[str(asset_id)] = top_of_book(book)
+        return books
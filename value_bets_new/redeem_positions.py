@@ -2,19 +2,33 @@
 """
 Redeem positions module.
 
-Provides a function to redeem a position by creating SELL orders at $1.00,
-looping until the position is fully redeemed or 12 hours have passed.
+Filled positions are handed to one `RedemptionManager`, which sells them at
+$0.999 once the market has effectively resolved. All open positions share one
+trader and one loop: their books are fetched in a single batched `/books`
+request, and a SELL is only attempted for tokens that have bids at the
+redemption price. The queue is persisted to SQLite so positions survive a
+restart; the writes run in worker threads, never on the event loop.
 """
 
-from typing import Optional
-from dataclasses import dataclass
+from __future__ import annotations
+
 import asyncio
-from datetime import datetime, timedelta
+import logging
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
 
 from py_clob_client.clob_types import OrderType
 from py_clob_client.order_builder.constants import SELL
 
 from trade_executor.execute_trade import PolymarketTrader
+from value_bets.trade_executor.bankroll_ledger import BankrollLedger
+from value_bets_new.order_book import TopOfBook
+from value_bets_new.polymarket import PolymarketInterface
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass
@@ -24,94 +38,240 @@ class Position:
     number_of_shares: float
 
 
-async def redeem_position(position: Position) -> Optional[dict]:
+@dataclass
+class PendingRedemption:
+    token_id: str
+    remaining_shares: float
+    added_at: float
+    attempts: int = 0
+
+
+def filled_size_from_response(resp: Any, remaining_shares: float) -> Optional[float]:
+    """Shares filled by a FAK SELL, or None if the response doesn't say."""
+    if not isinstance(resp, dict):
+        return None
+    matched = resp.get("matchedAmount") or resp.get("matched_amount") or resp.get("filledAmount") or resp.get("filled_amount")
+    if matched is not None:
+        try:
+            return float(matched)
+        except (ValueError, TypeError):
+            pass
+    if resp.get("status") == "matched":
+        return remaining_shares
+    return None
+
+
+class RedemptionManager:
     """
-    Redeem a position by creating SELL orders at maximum price (0.999 = 99.9 cents).
-    
-    Loops until the position is successfully redeemed. If the order is only
-    partially filled, continues looping until fully filled, or until 12 hours
-    have passed. Sleeps for 30 minutes after every iteration of the loop.
-    
-    Args:
-        position: Position object with token_id and number_of_shares
-        
-    Returns:
-        The response dictionary from the final successful order, or None if
-        the 12-hour timeout was reached.
+    Typical usage:
+      manager = RedemptionManager(polymarket_interface, db_path=path, ledger=ledger)
+      asyncio.create_task(manager.run())
+      await manager.add(Position(token_id, shares))
     """
-    
-    if position.number_of_shares <= 0:
-        raise ValueError(f"number_of_shares must be > 0, got {position.number_of_shares}")
-    
-    if not position.token_id or not position.token_id.strip():
-        raise ValueError("token_id cannot be empty")
-    
-    trader = PolymarketTrader()
-    start_time = datetime.now()
-    max_duration = timedelta(hours=12)
-    remaining_shares = position.number_of_shares
-    
-    while True:
-        elapsed_time = datetime.now() - start_time
-        if elapsed_time >= max_duration:
-            print(f"Timeout reached: 12 hours have passed. Remaining shares: {remaining_shares:.2f}")
-            return None
-        
+
+    # Sell price for a resolved (or all but resolved) winning token
+    SELL_PRICE = 0.999
+    # One batched book check for every pending token per interval, unless woken earlier
+    CHECK_INTERVAL_S = 60.0
+    # Positions not redeemed within this window are dropped (losing or unsellable tokens)
+    MAX_AGE_S = 12 * 60 * 60
+
+    def __init__(
+        self,
+        polymarket_interface: PolymarketInterface,
+        *,
+        db_path: str,
+        ledger: Optional[BankrollLedger] = None,
+        trader: Optional[PolymarketTrader] = None,
+    ) -> None:
+        self.polymarket_interface = polymarket_interface
+        self.ledger = ledger
+        self._trader = trader
+        self._wake: Optional[asyncio.Event] = None
+        self._lock = threading.Lock()
+        # Shared between the event loop and worker threads; access is serialized by _lock
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS pending_redemptions (
+                token_id TEXT PRIMARY KEY,
+                remaining_shares REAL NOT NULL,
+                added_at REAL NOT NULL,
+                attempts INTEGER NOT NULL
+            )
+            """
+        )
+        self._conn.commit()
+        self._pending: Dict[str, PendingRedemption] = {}
+        for token_id, remaining_shares, added_at, attempts in self._conn.execute(
+            "SELECT token_id, remaining_shares, added_at, attempts FROM pending_redemptions"
+        ):
+            self._pending[token_id] = PendingRedemption(
+                token_id=token_id,
+                remaining_shares=float(remaining_shares),
+                added_at=float(added_at),
+                attempts=int(attempts),
+            )
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def token_ids(self) -> List[str]:
+        return list(self._pending)
+
+    def pending(self) -> List[PendingRedemption]:
+        """Snapshot of the pending positions, oldest first."""
+        return sorted(self._pending.values(), key=lambda p: p.added_at)
+
+    def _get_wake(self) -> asyncio.Event:
+        """Get or create the wake event in the current event loop."""
+        if self._wake is None:
+            self._wake = asyncio.Event()
+        return self._wake
+
+    def _persist(self, token_id: str) -> None:
+        """
+        Write the token's current in-memory state (or delete its row if it is no longer
+        pending). Blocking; called through asyncio.to_thread. Writing the current state
+        rather than a snapshot means whichever thread runs last leaves the row up to date.
+        """
+        with self._lock:
+            pending = self._pending.get(token_id)
+            if pending is None:
+                self._conn.execute("DELETE FROM pending_redemptions WHERE token_id = ?", (token_id,))
+            else:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO pending_redemptions (token_id, remaining_shares, added_at, attempts) "
+                    "VALUES (?, ?, ?, ?)",
+                    (pending.token_id, pending.remaining_shares, pending.added_at, pending.attempts),
+                )
+            self._conn.commit()
+
+    async def _save(self, pending: PendingRedemption) -> None:
+        await asyncio.to_thread(self._persist, pending.token_id)
+
+    async def _remove(self, token_id: str) -> None:
+        self._pending.pop(token_id, None)
+        await asyncio.to_thread(self._persist, token_id)
+
+    async def add(self, position: Position) -> None:
+        """Queue a filled position. Shares for a token already pending are added to it."""
+        if position.number_of_shares <= 0:
+            raise ValueError(f"number_of_shares must be > 0, got {position.number_of_shares}")
+        if not position.token_id or not position.token_id.strip():
+            raise ValueError("token_id cannot be empty")
+        pending = self._pending.get(position.token_id)
+        if pending is None:
+            pending = PendingRedemption(
+                token_id=position.token_id,
+                remaining_shares=float(position.number_of_shares),
+                added_at=time.time(),
+            )
+            self._pending[position.token_id] = pending
+        else:
+            pending.remaining_shares += float(position.number_of_shares)
+            # A new fill restarts the redemption window
+            pending.added_at = time.time()
+        await self._save(pending)
+
+    def on_book(self, token_id: str, tob: TopOfBook) -> None:
+        """Live book update (e.g. from MarketStream): wake the loop if a pending token is redeemable."""
+        if token_id in self._pending and tob.best_bid is not None and tob.best_bid >= self.SELL_PRICE:
+            self._get_wake().set()
+
+    def wake(self) -> None:
+        self._get_wake().set()
+
+    async def run(self) -> None:
+        wake = self._get_wake()
+        logger.info("Starting with %s pending positions", len(self._pending))
+        while True:
+            try:
+                await self.check_once()
+            except Exception as e:
+                logger.exception("Check failed: %s", e)
+            try:
+                await asyncio.wait_for(wake.wait(), timeout=self.CHECK_INTERVAL_S)
+            except asyncio.TimeoutError:
+                pass
+            wake.clear()
+
+    async def check_once(self) -> int:
+        """Check every pending token's book in one batch and sell the redeemable ones. Returns sells attempted."""
+        now = time.time()
+        for pending in [p for p in self._pending.values() if now - p.added_at >= self.MAX_AGE_S]:
+            logger.info(
+                "Giving up on %s after %.1fh. Remaining shares: %.2f",
+                pending.token_id, (now - pending.added_at) / 3600, pending.remaining_shares,
+            )
+            await self._remove(pending.token_id)
+        if not self._pending:
+            return 0
+
+        books = await self.polymarket_interface.fetch_books(list(self._pending))
+        ready = [
+            pending
+            for token_id, pending in list(self._pending.items())
+            if (tob := books.get(token_id)) is not None
+            and tob.best_bid is not None
+            and tob.best_bid >= self.SELL_PRICE
+        ]
+        if not ready:
+            return 0
+
+        trader = await self._get_trader()
+        if trader is None:
+            return 0
+        for pending in ready:
+            await self._sell(trader, pending)
+        return len(ready)
+
+    async def _get_trader(self) -> Optional[PolymarketTrader]:
+        if self._trader is None:
+            try:
+                # Client construction (API key derivation) is blocking
+                self._trader = await asyncio.to_thread(PolymarketTrader.shared)
+            except Exception as e:
+                logger.error("Trader unavailable: %s", e)
+                return None
+        return self._trader
+
+    async def _sell(self, trader: PolymarketTrader, pending: PendingRedemption) -> None:
+        pending.attempts += 1
         try:
-            resp = trader.execute_trade(
+            resp = await asyncio.to_thread(
+                trader.execute_trade,
                 side=SELL,
-                price=0.999,  # 99.9 cents (maximum allowed, close to $1.00)
-                size=remaining_shares,
-                token_id=position.token_id,
-                order_type=OrderType.FAK
+                price=self.SELL_PRICE,
+                size=pending.remaining_shares,
+                token_id=pending.token_id,
+                order_type=OrderType.FAK,
             )
-            
-            filled_size: Optional[float] = None
-            status = None
-            
-            if isinstance(resp, dict):
-                status = resp.get("status")
-                
-                if status == "delayed":
-                    print(f"Order delayed. Waiting 30 minutes before retrying. Remaining shares: {remaining_shares:.2f}")
-                    await asyncio.sleep(30 * 60)  # Sleep for 30 minutes
-                    continue
-                
-                matched = resp.get("matchedAmount") or resp.get("matched_amount") or resp.get("filledAmount") or resp.get("filled_amount")
-                if matched is not None:
-                    try:
-                        filled_size = float(matched)
-                    except (ValueError, TypeError):
-                        filled_size = None
-                
-                if filled_size is None and status == "matched":
-                    filled_size = remaining_shares
-            
-            if filled_size is not None:
-                if filled_size >= remaining_shares:
-                    print(f"Position fully redeemed: {filled_size:.2f} shares")
-                    return resp
-                else:
-                    remaining_shares = remaining_shares - filled_size
-                    print(f"Partial fill: {filled_size:.2f} shares filled. "
-                          f"Remaining: {remaining_shares:.2f} shares. Waiting 30 minutes before retrying.")
-                    await asyncio.sleep(30 * 60)  # Sleep for 30 minutes
-                    continue
-            else:
-                print(f"Order status: {status}. Waiting 30 minutes before retrying. Remaining shares: {remaining_shares:.2f}")
-                await asyncio.sleep(30 * 60)  # Sleep for 30 minutes
-                continue
-                
         except Exception as e:
-            error_msg = str(e)
-            if "orderbook" in error_msg.lower() and "does not exist" in error_msg.lower():
-                print(f"Orderbook does not exist (market may be closed/expired). Waiting 30 minutes before retrying.")
-            elif "market not found" in error_msg.lower() or "404" in error_msg:
-                print(f"Market not found (invalid token_id: {position.token_id}). Waiting 30 minutes before retrying.")
-            elif "400" in error_msg:
-                print(f"Bad request: {error_msg}. Waiting 30 minutes before retrying.")
-            else:
-                print(f"Error: {error_msg}. Waiting 30 minutes before retrying.")
-            
-            await asyncio.sleep(30 * 60)  # Sleep for 30 minutes
-            continue
+            logger.warning("Sell failed for %s: %s", pending.token_id, e)
+            await self._save(pending)
+            return
+
+        filled_size = filled_size_from_response(resp, pending.remaining_shares)
+        if filled_size is None:
+            status = resp.get("status") if isinstance(resp, dict) else None
+            logger.debug("Order status for %s: %s. Remaining shares: %.2f", pending.token_id, status, pending.remaining_shares)
+            await self._save(pending)
+            return
+
+        if self.ledger is not None:
+            self.ledger.credit(filled_size * self.SELL_PRICE)
+        if filled_size >= pending.remaining_shares:
+            logger.info("Position fully redeemed: %s (%.2f shares)", pending.token_id, filled_size)
+            await self._remove(pending.token_id)
+            return
+        pending.remaining_shares -= filled_size
+        logger.info(
+            "Partial fill for %s: %.2f shares filled. Remaining: %.2f shares",
+            pending.token_id, filled_size, pending.remaining_shares,
+        )
+        await self._save(pending)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -2,9 +2,14 @@ from dataclasses import dataclass
 from typing import List, Optional, Dict, Any
 from datetime import date, datetime
 import json
+import logging
 import re
 import requests
 from py_clob_client.client import ClobClient
+
+logger = logging.getLogger(__name__)
+
+
 class PolymarketMarketExtractor:
     """Helper class for extracting market information from Polymarket events."""
 
@@ -187,14 +192,14 @@ class PolymarketGameFinder:
             except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
                 if attempt < max_retries - 1:
                     wait_time = 2 ** attempt  # Exponential backoff: 1s, 2s, 4s
-                    print(f"[DEBUG] [PolymarketGameFinder] Connection error (attempt {attempt + 1}/{max_retries}): {e}. Retrying in {wait_time}s...")
+                    logger.debug("Connection error (attempt %s/%s): %s. Retrying in %ss...", attempt + 1, max_retries, e, wait_time)
                     time.sleep(wait_time)
                 else:
-                    print(f"[DEBUG] [PolymarketGameFinder] Connection error after {max_retries} attempts: {e}")
+                    logger.debug("Connection error after %s attempts: %s", max_retries, e)
                     raise
             except requests.exceptions.HTTPError as e:
                 # Don't retry HTTP errors (4xx, 5xx) - these are not transient
-                print(f"[DEBUG] [PolymarketGameFinder] HTTP error: {e}")
+                logger.debug("HTTP error: %s", e)
                 raise
         return None
 
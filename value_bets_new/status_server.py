@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+Embedded status server for the orchestrator (FastAPI on uvicorn, same event loop).
+
+Endpoints:
+  /metrics              Prometheus text: HTTP, cycle and evaluation instruments plus
+                        cache, queue, loop and redemption state collected per scrape
+  /status               Overview: uptime, per-sport cycles, execution queue, event loop
+  /status/cycles        Per-sport cycle state
+  /status/caches        Cache entries, hits, misses and hit rates
+  /status/http          In-flight HTTP requests, oldest first
+  /status/redemptions   Positions waiting to be redeemed
+  /status/edges         Latest priced outcomes (?limit=, ?sport=, ?value_bets_only=)
+  /healthz              Liveness
+
+Handlers only read in-memory state, so they never wait on the bot's own work. The
+server binds its socket up front: a port in use is logged and the bot keeps running
+without it.
+
+Typical usage:
+  server = StatusServer(orchestrator, host="127.0.0.1", port=9108)
+  await server.start()
+  ...
+  await server.close()
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import socket
+import time
+from dataclasses import asdict
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional
+
+import uvicorn
+from fastapi import FastAPI, Query
+from fastapi.responses import PlainTextResponse
+
+from value_bets_new import metrics
+
+if TYPE_CHECKING:
+    from value_bets_new.value_bets_orchestrator import ValueBetsOrchestrator
+
+logger = logging.getLogger(__name__)
+
+
+def _hit_rate(stats: Dict[str, int]) -> Optional[float]:
+    """Share of lookups served without a new fetch (coalesced waiters count as hits)."""
+    served = stats.get("hits", 0) + stats.get("coalesced", 0)
+    total = served + stats.get("misses", 0)
+    return round(served / total, 4) if total else None
+
+
+def cache_stats(orchestrator: "ValueBetsOrchestrator") -> Dict[str, Dict[str, Any]]:
+    """cache name -> its stats() plus hit_rate."""
+    caches: Dict[str, Dict[str, Any]] = {"gamma_events": orchestrator.polymarket_interface.event_cache_stats()}
+    for sport, interface in orchestrator.pinnacle_odds_interfaces.items():
+        stats = interface.cache_stats()
+        # The matchups feed cache is shared by every sport's service
+        caches.setdefault("pinnacle_matchups_feed", stats["matchups_feed"])
+        if "odds" in stats:
+            caches[f"pinnacle_odds:{sport.value}"] = stats["odds"]
+    for stats in caches.values():
+        stats["hit_rate"] = _hit_rate(stats)
+    inputs = orchestrator.input_fingerprints.stats()
+    checked = inputs["changed"] + inputs["unchanged"]
+    caches["evaluation_inputs"] = {
+        **inputs,
+        "hit_rate": round(inputs["unchanged"] / checked, 4) if checked else None,
+    }
+    return caches
+
+
+def cycle_status(orchestrator: "ValueBetsOrchestrator") -> Dict[str, Dict[str, Any]]:
+    now = time.time()
+    out: Dict[str, Dict[str, Any]] = {}
+    for sport, state in orchestrator.cycle_state.items():
+        entry = asdict(state)
+        entry["seconds_since_last_cycle"] = (
+            round(now - state.last_cycle_at, 1) if state.last_cycle_at is not None else None
+        )
+        out[sport.value] = entry
+    return out
+
+
+def orchestrator_samples(orchestrator: "ValueBetsOrchestrator") -> List[metrics.Sample]:
+    """Collector for state the orchestrator's components already count."""
+    Sample = metrics.Sample
+    samples: List[metrics.Sample] = [
+        Sample("value_bets_start_time_seconds", "gauge", "Orchestrator start time (epoch seconds)", {}, orchestrator.started_at),
+    ]
+    for name, stats in cache_stats(orchestrator).items():
+        if name == "evaluation_inputs":
+            continue
+        cache, _, sport = name.partition(":")
+        labels = {"cache": cache, **({"sport": sport} if sport else {})}
+        samples.extend(metrics.samples_from_stats(
+            "value_bets_cache", stats, counters=("hits", "misses", "coalesced"), labels=labels,
+            help="Async TTL cache lookups and size",
+        ))
+    samples.extend(metrics.samples_from_stats(
+        "value_bets_evaluation_inputs", orchestrator.input_fingerprints.stats(), counters=("changed", "unchanged"),
+        help="Evaluation input fingerprints (unchanged inputs skip evaluation)",
+    ))
+    samples.extend(metrics.samples_from_stats(
+        "value_bets_execution_queue", orchestrator.execution_queue.stats(),
+        counters=("submitted", "executed", "failed", "dropped_stale", "superseded", "skipped_in_flight"),
+        help="Execution queue requests and latency (ms percentiles over recent requests)",
+    ))
+    loop_stats = orchestrator.loop_monitor.stats()
+    samples.extend(metrics.samples_from_stats(
+        "value_bets_event_loop", loop_stats, counters=("blocks",),
+        help="Event loop heartbeat lag (ms percentiles) and blocking episodes",
+    ))
+    for module, seconds in loop_stats.get("blocked_s_by_module", {}).items():  # type: ignore[union-attr]
+        samples.append(Sample(
+            "value_bets_event_loop_blocked_seconds_total", "counter",
+            "Event loop blocked time attributed to the module on the loop thread's stack", {"module": module}, seconds,
+        ))
+    for host, count in orchestrator.http.in_flight_by_host().items():
+        samples.append(Sample("value_bets_http_in_flight", "gauge", "HTTP requests holding a host slot", {"host": host}, count))
+    pending = orchestrator.redemptions.pending()
+    samples.append(Sample("value_bets_redemptions_pending", "gauge", "Positions waiting to be redeemed", {}, len(pending)))
+    samples.append(Sample(
+        "value_bets_redemptions_pending_shares", "gauge", "Shares waiting to be redeemed", {},
+        sum(p.remaining_shares for p in pending),
+    ))
+    for sport, state in orchestrator.cycle_state.items():
+        labels = {"sport": sport.value}
+        samples.append(Sample("value_bets_cycle_events", "gauge", "Events in the sport's latest scan", labels, state.events))
+        if state.last_cycle_at is not None:
+            samples.append(Sample(
+                "value_bets_cycle_last_completed_timestamp_seconds", "gauge",
+                "When the sport's last cycle finished (epoch seconds)", labels, state.last_cycle_at,
+            ))
+    return samples
+
+
+def create_app(orchestrator: "ValueBetsOrchestrator") -> FastAPI:
+    app = FastAPI(title="value_bets status", docs_url=None, redoc_url=None, openapi_url=None)
+
+    @app.get("/healthz")
+    async def healthz() -> Dict[str, Any]:
+        return {"ok": True, "uptime_s": round(time.time() - orchestrator.started_at, 1)}
+
+    @app.get("/metrics")
+    async def prometheus_metrics() -> PlainTextResponse:
+        return PlainTextResponse(metrics.render(), media_type=metrics.CONTENT_TYPE)
+
+    @app.get("/status")
+    async def status() -> Dict[str, Any]:
+        return {
+            "uptime_s": round(time.time() - orchestrator.started_at, 1),
+            "cycles": cycle_status(orchestrator),
+            "execution_queue": orchestrator.execution_queue.stats(),
+            "event_loop": orchestrator.loop_monitor.stats(),
+            "http_in_flight": orchestrator.http.in_flight_by_host(),
+            "redemptions_pending": len(orchestrator.redemptions),
+            "stream_enabled": orchestrator.market_stream is not None,
+        }
+
+    @app.get("/status/cycles")
+    async def cycles() -> Dict[str, Dict[str, Any]]:
+        return cycle_status(orchestrator)
+
+    @app.get("/status/caches")
+    async def caches() -> Dict[str, Dict[str, Any]]:
+        return cache_stats(orchestrator)
+
+    @app.get("/status/http")
+    async def http_in_flight() -> Dict[str, Any]:
+        return {"by_host": orchestrator.http.in_flight_by_host(), "requests": orchestrator.http.in_flight()}
+
+    @app.get("/status/redemptions")
+    async def redemptions() -> List[Dict[str, Any]]:
+        now = time.time()
+        return [
+            {**asdict(p), "age_s": round(now - p.added_at, 1)}
+            for p in orchestrator.redemptions.pending()
+        ]
+
+    @app.get("/status/edges")
+    async def edges(
+        limit: int = Query(50, ge=1, le=1000),
+        sport: Optional[str] = None,
+        value_bets_only: bool = False,
+    ) -> List[Dict[str, Any]]:
+        selected: Iterable[Any] = reversed(orchestrator.recent_edges)
+        if sport is not None:
+            selected = (e for e in selected if e.sport == sport)
+        if value_bets_only:
+            selected = (e for e in selected if e.value_bet)
+        out: List[Dict[str, Any]] = []
+        for edge in selected:
+            out.append(asdict(edge))
+            if len(out) >= limit:
+                break
+        return out
+
+    return app
+
+
+class _EmbeddedServer(uvicorn.Server):
+    # The orchestrator owns SIGINT/SIGTERM; uvicorn would otherwise swallow them until it exits
+    def capture_signals(self):  # type: ignore[override]
+        return contextlib.nullcontext()
+
+
+class StatusServer:
+    def __init__(self, orchestrator: "ValueBetsOrchestrator", *, host: str = "127.0.0.1", port: int = 9108) -> None:
+        self.orchestrator = orchestrator
+        self.host = host
+        self.port = int(port)
+        self._server: Optional[_EmbeddedServer] = None
+        self._task: Optional[asyncio.Task] = None
+        self._collector: Optional[metrics.Collector] = None
+
+    async def start(self) -> None:
+        if self._task is not None:
+            return
+        # Bind here so a busy port is an OSError we can log (uvicorn would sys.exit)
+        sock = socket.socket(socket.AF_INET6 if ":" in self.host else socket.AF_INET, socket.SOCK_STREAM)
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            sock.bind((self.host, self.port))
+        except OSError as e:
+            logger.error("Status server disabled: cannot bind %s:%s (%s)", self.host, self.port, e)
+            sock.close()
+            return
+        self.port = sock.getsockname()[1]
+        self._collector = metrics.register_collector(lambda: orchestrator_samples(self.orchestrator))
+        config = uvicorn.Config(
+            create_app(self.orchestrator),
+            log_config=None,  # keep the bot's logging setup
+            log_level="warning",
+            access_log=False,
+            lifespan="off",
+        )
+        self._server = _EmbeddedServer(config)
+        self._task = asyncio.create_task(self._server.serve(sockets=[sock]), name="status-server")
+        while not self._server.started and not self._task.done():
+            await asyncio.sleep(0.01)
+        if self._task.done():
+            logger.error("Status server failed to start: %r", self._task.exception())
+            metrics.unregister_collector(self._collector)
+            self._server, self._task, self._collector = None, None, None
+            return
+        logger.info("Status server listening on http://%s:%s (/metrics, /status)", self.host, self.port)
+
+    async def close(self) -> None:
+        if self._collector is not None:
+            metrics.unregister_collector(self._collector)
+            self._collector = None
+        if self._server is None or self._task is None:
+            return
+        self._server.should_exit = True
+        try:
+            await asyncio.wait_for(self._task, timeout=5.0)
+        except asyncio.TimeoutError:
+            self._task.cancel()
+        except Exception as e:
+            logger.warning("Status server stopped with an error: %s", e)
+        self._server = None
+        self._task = None
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Manual tests for AsyncTTLCache request coalescing.
+
+A fake fetch blocks until released, so many callers are waiting on the same
+missing key at once.
+
+Usage:
+    python3 test_cache.py
+    # or: python -m pytest -q test_cache.py
+"""
+
+import sys
+import os
+import asyncio
+from typing import Any, Dict
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from value_bets_new.cache import AsyncTTLCache
+
+
+class GatedFetch:
+    """Counts calls; each call waits for `release` before returning its payload."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.entered = asyncio.Event()
+        self.release = asyncio.Event()
+
+    async def __call__(self) -> Dict[str, Any]:
+        self.calls += 1
+        self.entered.set()
+        await self.release.wait()
+        return {"slug": "nba-bos-nyk", "fetch": self.calls}
+
+
+async def _test_concurrent_gets_share_one_fetch() -> None:
+    cache = AsyncTTLCache(ttl_s=30.0)
+    fetch = GatedFetch()
+    callers = [asyncio.create_task(cache.get_or_fetch("nba-bos-nyk", fetch)) for _ in range(10)]
+    await fetch.entered.wait()
+    await asyncio.sleep(0)
+    fetch.release.set()
+    results = await asyncio.gather(*callers)
+
+    assert fetch.calls == 1
+    assert all(result is results[0] for result in results)
+    assert cache.stats() == {"entries": 1, "hits": 0, "misses": 1, "coalesced": 9}
+    # Later lookups are served from the cache
+    assert await cache.get_or_fetch("nba-bos-nyk", fetch) is results[0]
+    assert fetch.calls == 1
+    assert cache.stats()["hits"] == 1
+    print("test_concurrent_gets_share_one_fetch: OK")
+
+
+async def _test_cancelled_fetcher_does_not_cancel_waiters() -> None:
+    cache = AsyncTTLCache(ttl_s=30.0)
+    fetch = GatedFetch()
+    first = asyncio.create_task(cache.get_or_fetch("nba-bos-nyk", fetch))
+    await fetch.entered.wait()
+    waiters = [asyncio.create_task(cache.get_or_fetch("nba-bos-nyk", fetch)) for _ in range(3)]
+    await asyncio.sleep(0)
+    assert cache.stats()["coalesced"] == 3
+
+    # Cancel the caller running the fetch while the others wait on it
+    first.cancel()
+    await asyncio.sleep(0)
+    fetch.release.set()
+    results = await asyncio.gather(*waiters)
+
+    assert first.cancelled()
+    # One waiter took the fetch over; the rest joined it
+    assert fetch.calls == 2
+    assert all(result == {"slug": "nba-bos-nyk", "fetch": 2} for result in results)
+    assert cache.get("nba-bos-nyk") == {"slug": "nba-bos-nyk", "fetch": 2}
+    assert not cache._in_flight
+    print("test_cancelled_fetcher_does_not_cancel_waiters: OK")
+
+
+def test_concurrent_gets_share_one_fetch() -> None:
+    asyncio.run(_test_concurrent_gets_share_one_fetch())
+
+
+def test_cancelled_fetcher_does_not_cancel_waiters() -> None:
+    asyncio.run(_test_cancelled_fetcher_does_not_cancel_waiters())
+
+
+def main() -> int:
+    test_concurrent_gets_share_one_fetch()
+    test_cancelled_fetcher_does_not_cancel_waiters()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
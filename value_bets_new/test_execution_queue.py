@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Manual tests for the order execution queue.
+
+Drives `ExecutionQueue.run()` with a fake executor that records (and can hold)
+the requests it is given, so no trader or network access is needed.
+
+Usage:
+    python3 test_execution_queue.py
+    # or: python -m pytest -q test_execution_queue.py
+"""
+
+import sys
+import os
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from value_bets_new.execution_queue import ExecutionQueue, ExecutionRequest
+from value_bets_new.input_fingerprints import InputFingerprints
+
+
+@dataclass
+class FakePayload:
+    name: str
+    fingerprint_key: tuple
+
+
+class FakeExecutor:
+    """Records executed requests; a request whose payload is in `hold` waits for `release`."""
+
+    def __init__(self) -> None:
+        self.executed: List[str] = []
+        self.started: List[str] = []
+        self.hold: Dict[str, asyncio.Event] = {}
+
+    async def __call__(self, request: ExecutionRequest) -> None:
+        self.started.append(request.payload.name)
+        gate = self.hold.get(request.payload.name)
+        if gate is not None:
+            await gate.wait()
+        self.executed.append(request.payload.name)
+
+
+def _request(key: tuple, name: str, expected_payout_per_1: float = 1.05) -> ExecutionRequest:
+    return ExecutionRequest(key, expected_payout_per_1, None, FakePayload(name, key))
+
+
+async def _wait_for(condition: Callable[[], bool], timeout_s: float = 2.0) -> None:
+    deadline = time.monotonic() + timeout_s
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("timed out waiting for the queue")
+        await asyncio.sleep(0.005)
+
+
+def _queue_with_fingerprints(executor: FakeExecutor, fingerprints: InputFingerprints, **kwargs) -> ExecutionQueue:
+    # Same drop hook as the orchestrator: the next cycle re-evaluates the outcome
+    return ExecutionQueue(
+        executor,
+        on_drop=lambda request: fingerprints.invalidate(request.payload.fingerprint_key),
+        **kwargs,
+    )
+
+
+async def _test_resubmitted_key_supersedes_queued_request() -> None:
+    executor = FakeExecutor()
+    queue = ExecutionQueue(executor)
+    key = ("nba-bos-nyk", "Celtics")
+    await queue.submit(_request(key, "first"))
+    await queue.submit(_request(key, "second"))
+    await queue.submit(_request(("nba-lal-gsw", "Lakers"), "other"))
+
+    runner = asyncio.create_task(queue.run())
+    await _wait_for(lambda: len(executor.executed) == 2)
+    await asyncio.sleep(0.02)
+    runner.cancel()
+
+    assert sorted(executor.executed) == ["other", "second"]
+    stats = queue.stats()
+    assert stats["submitted"] == 3
+    assert stats["superseded"] == 1
+    assert stats["executed"] == 2
+    assert stats["queued"] == 0
+    print("test_resubmitted_key_supersedes_queued_request: OK")
+
+
+async def _test_stale_requests_dropped_and_invalidated() -> None:
+    executor = FakeExecutor()
+    fingerprints = InputFingerprints()
+    queue = _queue_with_fingerprints(executor, fingerprints)
+    stale_key = ("nba-bos-nyk", "Celtics", None)
+    fresh_key = ("nba-lal-gsw", "Lakers", None)
+    for key in (stale_key, fresh_key):
+        assert fingerprints.update(key, (0.45, 1.2))
+
+    stale = _request(stale_key, "stale")
+    stale.spotted_at = time.monotonic() - (ExecutionQueue.MAX_AGE_S + 1.0)
+    await queue.submit(stale)
+    await queue.submit(_request(fresh_key, "fresh"))
+
+    runner = asyncio.create_task(queue.run())
+    await _wait_for(lambda: queue.stats()["dropped_stale"] == 1 and executor.executed == ["fresh"])
+    runner.cancel()
+
+    assert executor.started == ["fresh"]
+    # The dropped outcome is re-evaluated next cycle even with unchanged inputs...
+    assert fingerprints.update(stale_key, (0.45, 1.2))
+    # ...while the executed one is still deduplicated
+    assert not fingerprints.update(fresh_key, (0.45, 1.2))
+    print("test_stale_requests_dropped_and_invalidated: OK")
+
+
+async def _test_in_flight_key_skipped() -> None:
+    executor = FakeExecutor()
+    fingerprints = InputFingerprints()
+    queue = _queue_with_fingerprints(executor, fingerprints, concurrency=2)
+    key = ("nba-bos-nyk", "Celtics", None)
+    fingerprints.update(key, (0.45, 1.2))
+    release = executor.hold["first"] = asyncio.Event()
+
+    runner = asyncio.create_task(queue.run())
+    await queue.submit(_request(key, "first"))
+    await _wait_for(lambda: executor.started == ["first"])
+
+    # Same key while the first order is still being placed: the free worker must not duplicate it
+    await queue.submit(_request(key, "second"))
+    await _wait_for(lambda: queue.stats()["skipped_in_flight"] == 1)
+    assert executor.started == ["first"]
+    assert queue.stats()["executing"] == 1
+    assert fingerprints.update(key, (0.45, 1.2)), "a skipped request should invalidate its fingerprint"
+
+    release.set()
+    await _wait_for(lambda: executor.executed == ["first"])
+    # Once the first order completes the key can be traded again
+    await queue.submit(_request(key, "third"))
+    await _wait_for(lambda: executor.executed == ["first", "third"])
+    runner.cancel()
+
+    stats = queue.stats()
+    assert stats["executed"] == 2
+    assert stats["superseded"] == 0
+    assert stats["executing"] == 0
+    print("test_in_flight_key_skipped: OK")
+
+
+def test_resubmitted_key_supersedes_queued_request() -> None:
+    asyncio.run(_test_resubmitted_key_supersedes_queued_request())
+
+
+def test_stale_requests_dropped_and_invalidated() -> None:
+    asyncio.run(_test_stale_requests_dropped_and_invalidated())
+
+
+def test_in_flight_key_skipped() -> None:
+    asyncio.run(_test_in_flight_key_skipped())
+
+
+def main() -> int:
+    test_resubmitted_key_supersedes_queued_request()
+    test_stale_requests_dropped_and_invalidated()
+    test_in_flight_key_skipped()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+Manual tests for the CLOB market websocket stream.
+
+Runs `MarketStream` (and the orchestrator's streaming callback) against a local
+aiohttp websocket server standing in for the Polymarket market channel, so no
+network access or credentials are needed.
+
+Usage:
+    python3 test_market_stream.py
+    # or: python -m pytest -q test_market_stream.py
+"""
+
+import sys
+import os
+import asyncio
+import json
+import tempfile
+from datetime import date
+from typing import Any, Dict, List
+
+from aiohttp import web
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from value_bets_new.constants import MarketOdds, MarketType, Sport, SportsbookOdds
+from value_bets_new.http_client import AsyncHttpClient
+from value_bets_new.market_stream import MarketStream
+from value_bets_new.order_book import TopOfBook
+from value_bets_new.polymarket import PolymarketEvent
+from value_bets_new.value_bets_orchestrator import ValueBetsOrchestrator
+from value_bets.trade_store import TradeStore
+
+
+class LocalMarketChannel:
+    """Local stand-in for the CLOB market websocket."""
+
+    def __init__(self) -> None:
+        self.received: List[Any] = []
+        self.sockets: List[web.WebSocketResponse] = []
+        self.connected = asyncio.Event()
+        self._runner: web.AppRunner = None  # type: ignore[assignment]
+        self.url = ""
+
+    async def start(self) -> None:
+        app = web.Application()
+        app.router.add_get("/ws/market", self._handle)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]  # type: ignore[union-attr]
+        self.url = f"http://127.0.0.1:{port}/ws/market"
+
+    async def stop(self) -> None:
+        await self._runner.cleanup()
+
+    async def _handle(self, request: web.Request) -> web.WebSocketResponse:
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        self.sockets.append(ws)
+        self.connected.set()
+        async for msg in ws:
+            if msg.data == "PING":
+                await ws.send_str("PONG")
+                continue
+            self.received.append(json.loads(msg.data))
+        return ws
+
+    async def send(self, payload: Any) -> None:
+        await self.sockets[-1].send_str(json.dumps(payload))
+
+    async def drop_connection(self) -> None:
+        await self.sockets[-1].close()
+
+
+def _book(token_id: str, bids: List[tuple], asks: List[tuple]) -> Dict[str, Any]:
+    return {
+        "event_type": "book",
+        "asset_id": token_id,
+        "bids": [{"price": str(p), "size": str(s)} for p, s in bids],
+        "asks": [{"price": str(p), "size": str(s)} for p, s in asks],
+    }
+
+
+def _price_change(token_id: str, side: str, price: float, size: float) -> Dict[str, Any]:
+    return {
+        "event_type": "price_change",
+        "price_changes": [{"asset_id": token_id, "side": side, "price": str(price), "size": str(size)}],
+    }
+
+
+async def _wait_for(predicate, timeout_s: float = 2.0) -> None:
+    deadline = asyncio.get_running_loop().time() + timeout_s
+    while not predicate():
+        if asyncio.get_running_loop().time() > deadline:
+            raise AssertionError("timed out waiting for condition")
+        await asyncio.sleep(0.01)
+
+
+async def _test_book_snapshot_and_price_changes() -> None:
+    server = LocalMarketChannel()
+    await server.start()
+    http = AsyncHttpClient()
+    updates: List[tuple] = []
+
+    async def on_change(token_id: str, tob: TopOfBook) -> None:
+        updates.append((token_id, tob.best_ask, tob.ask_volume))
+
+    stream = MarketStream(http, on_best_ask_change=on_change, url=server.url)
+    task = asyncio.create_task(stream.run())
+    try:
+        await stream.subscribe(["t1"])
+        await asyncio.wait_for(server.connected.wait(), 2.0)
+        await _wait_for(lambda: server.received)
+        assert server.received[0] == {"assets_ids": ["t1"], "type": "market"}, server.received
+
+        # Levels arrive unsorted; best ask is the minimum.
+        await server.send([_book("t1", bids=[(0.40, 10), (0.42, 5)], asks=[(0.50, 3), (0.47, 8)])])
+        await _wait_for(lambda: len(updates) == 1)
+        assert updates[-1] == ("t1", 0.47, 8.0), updates
+
+        # A bid-side change leaves the best ask alone: no callback.
+        await server.send(_price_change("t1", "BUY", 0.43, 2))
+        await asyncio.sleep(0.1)
+        assert len(updates) == 1, updates
+        assert stream.top_of_book("t1").best_bid == 0.43
+
+        # Removing the best ask level moves the best ask up.
+        await server.send(_price_change("t1", "SELL", 0.47, 0))
+        await _wait_for(lambda: len(updates) == 2)
+        assert updates[-1] == ("t1", 0.50, 3.0), updates
+
+        # Tokens added later are subscribed on the open connection.
+        await stream.subscribe(["t1", "t2"])
+        await _wait_for(lambda: len(server.received) == 2)
+        assert server.received[1] == {"assets_ids": ["t2"], "operation": "subscribe"}, server.received
+    finally:
+        await stream.close()
+        task.cancel()
+        await http.close()
+        await server.stop()
+    print("test_book_snapshot_and_price_changes: OK")
+
+
+async def _test_reconnect_resubscribes_all_tokens() -> None:
+    server = LocalMarketChannel()
+    await server.start()
+    http = AsyncHttpClient()
+
+    async def on_change(token_id: str, tob: TopOfBook) -> None:
+        pass
+
+    stream = MarketStream(http, on_best_ask_change=on_change, url=server.url)
+    stream.RECONNECT_DELAY_S = 0.05
+    task = asyncio.create_task(stream.run())
+    try:
+        await stream.subscribe(["a", "b"])
+        await _wait_for(lambda: server.received)
+        await server.send(_book("a", bids=[(0.1, 1)], asks=[(0.2, 1)]))
+        await _wait_for(lambda: stream.top_of_book("a") is not None)
+
+        await server.drop_connection()
+        await _wait_for(lambda: len(server.sockets) == 2 and len(server.received) == 2)
+        assert server.received[1] == {"assets_ids": ["a", "b"], "type": "market"}, server.received
+        # Books from the dropped connection are discarded until a fresh snapshot arrives.
+        assert stream.top_of_book("a") is None
+    finally:
+        await stream.close()
+        task.cancel()
+        await http.close()
+        await server.stop()
+    print("test_reconnect_resubscribes_all_tokens: OK")
+
+
+class _RecordingTradeExecutor:
+    def __init__(self) -> None:
+        self.value_bets: List[Any] = []
+
+    def execute_value_bet(self, value_bet, *, game_str=None, min_expected_payout_per_1=None):
+        self.value_bets.append(value_bet)
+        return None
+
+
+async def _test_orchestrator_reevaluates_on_best_ask_change() -> None:
+    server = LocalMarketChannel()
+    await server.start()
+    # Nothing may touch the live bot's trade, redemption or match databases
+    state_dir = tempfile.TemporaryDirectory()
+    orchestrator = ValueBetsOrchestrator(
+        stream=True,
+        trade_store=TradeStore(":memory:"),
+        redemptions_db=":memory:",
+        match_db=os.path.join(state_dir.name, "event_matches.sqlite3"),
+    )
+    orchestrator.market_stream.url = server.url
+    executor = _RecordingTradeExecutor()
+    orchestrator.trade_executor = executor
+    task = asyncio.create_task(orchestrator.market_stream.run())
+    queue_task = asyncio.create_task(orchestrator.execution_queue.run())
+    try:
+        event = PolymarketEvent(
+            event_slug="nba-bos-mia-2026-01-15",
+            away_team="Celtics",
+            home_team="Heat",
+            play_date=date(2026, 1, 15),
+            market_slugs_by_event={MarketType.MONEYLINE: ["nba-bos-mia-2026-01-15"]},
+        )
+        market_odds = MarketOdds(
+            token_id="celtics",
+            team_name="Celtics",
+            best_bid=0.58,
+            bid_volume=100.0,
+            best_ask=0.60,
+            ask_volume=100.0,
+            spread=0.02,
+        )
+        # Fair price ~0.55 after devig: no value at 0.60.
+        sportsbook_odds = SportsbookOdds(
+            outcome_1="Celtics",
+            outcome_2="Heat",
+            outcome_1_cost_to_win_1=0.57,
+            outcome_2_cost_to_win_1=0.47,
+        )
+        await orchestrator._process_single_odds(
+            Sport.BASKETBALL, event, MarketType.MONEYLINE, event.event_slug, market_odds, sportsbook_odds
+        )
+        assert executor.value_bets == []
+        await orchestrator.market_stream.subscribe(["celtics"])
+        await _wait_for(lambda: server.received)
+
+        # The ask drops to 0.52 on the stream: now a value bet at the live price.
+        await server.send(_book("celtics", bids=[(0.50, 10)], asks=[(0.52, 25)]))
+        await _wait_for(lambda: len(executor.value_bets) == 1)
+        assert executor.value_bets[0].polymarket_best_ask == 0.52, executor.value_bets
+    finally:
+        await orchestrator.market_stream.close()
+        task.cancel()
+        queue_task.cancel()
+        await orchestrator.http.close()
+        await server.stop()
+        orchestrator.match_store.close()
+        orchestrator.redemptions.close()
+        orchestrator.trade_store.close()
+        state_dir.cleanup()
+    print("test_orchestrator_reevaluates_on_best_ask_change: OK")
+
+
+def test_book_snapshot_and_price_changes() -> None:
+    asyncio.run(_test_book_snapshot_and_price_changes())
+
+
+def test_reconnect_resubscribes_all_tokens() -> None:
+    asyncio.run(_test_reconnect_resubscribes_all_tokens())
+
+
+def test_orchestrator_reevaluates_on_best_ask_change() -> None:
+    asyncio.run(_test_orchestrator_reevaluates_on_best_ask_change())
+
+
+def main() -> int:
+    test_book_snapshot_and_price_changes()
+    test_reconnect_resubscribes_all_tokens()
+    test_orchestrator_reevaluates_on_best_ask_change()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
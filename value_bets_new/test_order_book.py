@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Manual tests for depth-aware order sizing.
+
+Table tests for `max_profitable_fill` and `TradeExecutorService._size_against_depth`
+over small ask ladders, with a fake trader so no credentials or network are needed.
+
+Usage:
+    python3 test_order_book.py
+    # or: python -m pytest -q test_order_book.py
+"""
+
+import sys
+import os
+import math
+from typing import Optional, Tuple
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from value_bets_new.constants import ValueBet
+from value_bets_new.order_book import max_profitable_fill
+from value_bets_new.trade_executor.trade_executor_service import TradeExecutorService
+
+
+class FakeTrader:
+    """Just enough of PolymarketTrader for the service's bankroll ledger."""
+
+    def get_usdc_balance(self) -> float:
+        return 1000.0
+
+
+def _close(a: float, b: float) -> bool:
+    return math.isclose(a, b, rel_tol=1e-9, abs_tol=1e-9)
+
+
+# (name, ask_levels, true_prob, min_expected_payout_per_1, max_cost, expected (size, vwap, limit_price) or None)
+MAX_PROFITABLE_FILL_CASES = [
+    # Both bounds slack within the first level: the cost bound sets the size
+    ("single level, cost bound", ((0.40, 100.0),), 0.5, 1.02, 10.0, (25.0, 0.40, 0.40)),
+    # Whole first level, then the cost bound binds partway through the second
+    ("cost bound in second level", ((0.40, 10.0), (0.45, 100.0)), 0.5, 1.02, 8.5, (20.0, 0.425, 0.45)),
+    # Second level is above max_vwap (0.5 / 1.12): take just enough that the VWAP lands on it
+    ("payout bound in second level", ((0.40, 10.0), (0.50, 10.0)), 0.5, 1.12, 100.0, (18.0 + 2.0 / 3.0, 0.5 / 1.12, 0.50)),
+    # Whole ladder clears both bounds: take all of it
+    ("whole ladder", ((0.30, 5.0), (0.35, 5.0)), 0.5, 1.02, 100.0, (10.0, 0.325, 0.35)),
+    # Empty levels are skipped
+    ("empty level skipped", ((0.38, 0.0), (0.40, 10.0)), 0.5, 1.02, 100.0, (10.0, 0.40, 0.40)),
+    # Best ask already below the payout floor
+    ("first level unprofitable", ((0.50, 100.0),), 0.5, 1.02, 100.0, None),
+    ("no levels", (), 0.5, 1.02, 100.0, None),
+    ("no budget", ((0.40, 100.0),), 0.5, 1.02, 0.0, None),
+]
+
+
+def test_max_profitable_fill_table() -> None:
+    for name, levels, true_prob, min_payout, max_cost, expected in MAX_PROFITABLE_FILL_CASES:
+        fill = max_profitable_fill(
+            levels, true_prob=true_prob, min_expected_payout_per_1=min_payout, max_cost=max_cost
+        )
+        if expected is None:
+            assert fill is None, f"{name}: expected no fill, got {fill}"
+            continue
+        size, vwap, limit_price = expected
+        assert fill is not None, f"{name}: expected a fill"
+        assert _close(fill.size, size), f"{name}: size {fill.size} != {size}"
+        assert _close(fill.vwap, vwap), f"{name}: vwap {fill.vwap} != {vwap}"
+        assert fill.limit_price == limit_price, f"{name}: limit {fill.limit_price} != {limit_price}"
+        assert fill.cost <= max_cost + 1e-9, f"{name}: cost {fill.cost} over budget {max_cost}"
+        # Payout floor holds at the fill's average price
+        assert fill.expected_payout_per_1(true_prob) >= min_payout - 1e-9, f"{name}: below payout floor"
+    print("test_max_profitable_fill_table: OK")
+
+
+# (name, ask_levels, true_prob, bet_size, min_expected_payout_per_1, expected (num_tokens, limit_price, vwap) or None)
+SIZE_AGAINST_DEPTH_CASES = [
+    # 5 / 0.37 = 13.5135... tokens, floored to the cent
+    ("floored to cents", ((0.37, 100.0),), 0.5, 5.0, 1.02, (13.51, 0.37, 0.37)),
+    # Payout bound stops at 18.666... tokens
+    ("payout bound floored", ((0.40, 10.0), (0.50, 10.0)), 0.5, 100.0, 1.12, (18.66, 0.50, 0.5 / 1.12)),
+    # Profitable depth only costs $0.625 however large the Kelly bet
+    ("thin profitable depth", ((0.40, 1.0), (0.60, 100.0)), 0.5, 50.0, 1.10, None),
+    # Bet size itself below MIN_BET_SIZE
+    ("bet below minimum", ((0.40, 100.0),), 0.5, 0.9, 1.02, None),
+    ("no profitable depth", ((0.50, 100.0),), 0.5, 50.0, 1.02, None),
+]
+
+
+def test_size_against_depth_table() -> None:
+    service = TradeExecutorService(trader=FakeTrader())  # type: ignore[arg-type]
+    try:
+        for name, levels, true_prob, bet_size, min_payout, expected in SIZE_AGAINST_DEPTH_CASES:
+            value_bet = ValueBet(
+                team="Celtics",
+                token_id="token",
+                true_prob=true_prob,
+                polymarket_best_ask=levels[0][0],
+                expected_payout_per_1=true_prob / levels[0][0],
+                ask_levels=levels,
+            )
+            sized: Optional[Tuple[float, float, float]] = service._size_against_depth(value_bet, bet_size, min_payout)
+            if expected is None:
+                assert sized is None, f"{name}: expected rejection, got {sized}"
+                continue
+            assert sized is not None, f"{name}: expected a size"
+            num_tokens, limit_price, vwap = sized
+            assert num_tokens == expected[0], f"{name}: num_tokens {num_tokens} != {expected[0]}"
+            assert limit_price == expected[1], f"{name}: limit {limit_price} != {expected[1]}"
+            assert _close(vwap, expected[2]), f"{name}: vwap {vwap} != {expected[2]}"
+            assert num_tokens * vwap >= TradeExecutorService.MIN_BET_SIZE
+    finally:
+        service.ledger.stop()
+    print("test_size_against_depth_table: OK")
+
+
+def main() -> int:
+    test_max_profitable_fill_table()
+    test_size_against_depth_table()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
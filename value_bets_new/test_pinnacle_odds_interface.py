@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Manual tests for stored event matches in PinnacleSportsbookOddsInterface.
+
+The Pinnacle service is replaced by a fake serving one fixed game, and the match
+store is in memory, so no network calls are made and no database is touched.
+
+Usage:
+    python3 test_pinnacle_odds_interface.py
+    # or: python -m pytest -q test_pinnacle_odds_interface.py
+"""
+
+import sys
+import os
+import asyncio
+from datetime import date
+from types import SimpleNamespace
+from typing import Any, Optional
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from value_bets_new.constants import Sport
+from value_bets_new.pinnacle_odds_interface import PinnacleSportsbookOddsInterface
+from value_bets.pinnacle_scraper.match_store import EventMatch, MatchStore
+from value_bets.pinnacle_scraper.team_name_index import CONFIDENCE_ALIAS, TeamNameIndex
+
+
+class CountingMatchStore(MatchStore):
+    """MatchStore that counts the writes (each one is a SQLite commit)."""
+
+    def __init__(self, path: str) -> None:
+        super().__init__(path)
+        self.puts = 0
+        self.deletes = 0
+
+    def put(self, event_slug: str, matchup_id: int, *, swapped: bool, confidence: float) -> EventMatch:
+        self.puts += 1
+        return super().put(event_slug, matchup_id, swapped=swapped, confidence=confidence)
+
+    def delete(self, event_slug: str) -> bool:
+        self.deletes += 1
+        return super().delete(event_slug)
+
+
+class FakeOddsService:
+    """Per-sport service stand-in listing one game on every date, with no markets."""
+
+    def __init__(self, game: Any) -> None:
+        self.game = game
+        self.index = TeamNameIndex([game])
+
+    async def team_index_for_date_async(self, local_date) -> TeamNameIndex:
+        return self.index
+
+    async def game_by_matchup_id_async(self, matchup_id: int, local_date) -> Optional[Any]:
+        return self.game if int(matchup_id) == self.game.matchup_id else None
+
+    async def get_game_odds_async(self, matchup_id: int, *, game_info: Optional[Any] = None) -> Any:
+        return SimpleNamespace(markets=[])
+
+
+async def _test_alias_match_is_reused() -> None:
+    store = CountingMatchStore(":memory:")
+    interface = PinnacleSportsbookOddsInterface(Sport.BASKETBALL, http=object(), match_store=store)  # type: ignore[arg-type]
+    game = SimpleNamespace(matchup_id=101, away_team="Oklahoma City Thunder", home_team="Los Angeles Lakers")
+    interface._svc = FakeOddsService(game)  # type: ignore[assignment]
+
+    # "OKC" only matches "Oklahoma City Thunder" once aliases are expanded
+    for _ in range(3):
+        found = await interface._find_game_and_rows("OKC", "Lakers", date(2026, 1, 5), event_slug="nba-okc-lal-2026-01-05")
+        assert found == ("Oklahoma City Thunder", "Los Angeles Lakers", [])
+
+    assert store.get("nba-okc-lal-2026-01-05").confidence == CONFIDENCE_ALIAS
+    assert store.puts == 1, "stored alias match should be reused, not re-matched"
+    assert store.deletes == 0
+    store.close()
+    print("test_alias_match_is_reused: OK")
+
+
+def test_alias_match_is_reused() -> None:
+    asyncio.run(_test_alias_match_is_reused())
+
+
+def main() -> int:
+    test_alias_match_is_reused()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
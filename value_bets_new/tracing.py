@@ -0,0 +1,322 @@
+#!/usr/bin/env python3
+"""
+Lightweight span tracing for the orchestrator's cycle.
+
+Spans nest through a context variable, so they follow the code across awaits,
+`asyncio.gather` children and `asyncio.to_thread` workers without being passed
+around:
+
+  cycle -> game -> polymarket_odds / market -> market_slug -> pinnacle_lookup
+        -> single_odds;  execute -> execute_value_bet -> sign_order / post_order
+
+HTTP requests are spans too (`http_span`); their time is added, per host, to
+every open span above them, so a slow stage shows how much of it was Gamma, the
+CLOB or Arcadia. Time under concurrent requests is summed, so it can exceed the
+span's wall time.
+
+Tracing is off by default and `span()` then returns a shared no-op context. When
+enabled, finished spans are kept in a bounded buffer for `export_chrome_trace`
+(chrome://tracing / Perfetto) and every stage keeps a rolling window of durations
+for `summary()` (p50/p99).
+
+Typical usage:
+  tracing.enable()
+  with tracing.span("game", event_slug=slug):
+      ...
+
+  @tracing.traced("market")
+  async def _process_market(self, ...):
+      tracing.annotate(market=market.value)
+
+  tracing.export_chrome_trace("trace.json")
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import inspect
+import itertools
+import json
+import logging
+import os
+import threading
+import time
+import weakref
+from collections import OrderedDict, deque
+from contextvars import ContextVar, Token
+from typing import Any, Callable, Deque, Dict, List, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class Span:
+    __slots__ = ("name", "span_id", "parent", "parent_id", "start", "end", "tid", "attrs", "http_s", "error")
+
+    def __init__(self, name: str, span_id: int, parent: Optional["Span"], tid: int, attrs: Dict[str, Any]) -> None:
+        self.name = name
+        self.span_id = span_id
+        # Kept only while open, to attribute HTTP time to ancestors
+        self.parent = parent
+        self.parent_id = parent.span_id if parent is not None else None
+        self.start = time.perf_counter()
+        self.end: Optional[float] = None
+        self.tid = tid
+        self.attrs = attrs
+        # host -> summed time of HTTP requests made under this span
+        self.http_s: Dict[str, float] = {}
+        self.error: Optional[str] = None
+
+    @property
+    def duration_s(self) -> float:
+        return (self.end if self.end is not None else time.perf_counter()) - self.start
+
+
+_current_span: ContextVar[Optional[Span]] = ContextVar("value_bets_current_span", default=None)
+
+
+class _NoopSpan:
+    """Returned by `span()` while tracing is disabled."""
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *exc: Any) -> bool:
+        return False
+
+
+_NOOP = _NoopSpan()
+_UNSET: Any = object()
+
+
+class _SpanContext:
+    __slots__ = ("_tracer", "_name", "_parent", "_attrs", "_http_host", "_span", "_token")
+
+    def __init__(self, tracer: "Tracer", name: str, parent: Any, attrs: Dict[str, Any], http_host: Optional[str]) -> None:
+        self._tracer = tracer
+        self._name = name
+        self._parent = parent
+        self._attrs = attrs
+        self._http_host = http_host
+        self._span: Optional[Span] = None
+        self._token: Optional[Token] = None
+
+    def __enter__(self) -> Span:
+        parent = _current_span.get() if self._parent is _UNSET else self._parent
+        self._span = Span(self._name, next(self._tracer._ids), parent, self._tracer._tid(), self._attrs)
+        self._token = _current_span.set(self._span)
+        return self._span
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> bool:
+        span = self._span
+        assert span is not None and self._token is not None
+        span.end = time.perf_counter()
+        _current_span.reset(self._token)
+        if exc_type is not None:
+            span.error = exc_type.__name__
+        if self._http_host is not None:
+            elapsed = span.end - span.start
+            ancestor = span.parent
+            while ancestor is not None:
+                # A cross-task parent (e.g. the cycle that queued a bet) may have finished already
+                if ancestor.end is None:
+                    ancestor.http_s[self._http_host] = ancestor.http_s.get(self._http_host, 0.0) + elapsed
+                ancestor = ancestor.parent
+        span.parent = None
+        self._tracer._finish(span, f"http:{self._http_host}" if self._http_host is not None else span.name)
+        return False
+
+
+class Tracer:
+    # Finished spans kept for export (oldest dropped first)
+    MAX_SPANS = 200_000
+    # Durations per stage kept for the rolling p50/p99
+    STAGE_WINDOW = 2_000
+    # Lane names kept for export
+    MAX_LANES = 10_000
+
+    def __init__(
+        self, *, max_spans: int = MAX_SPANS, stage_window: int = STAGE_WINDOW, max_lanes: int = MAX_LANES
+    ) -> None:
+        self.enabled = False
+        self._epoch = time.perf_counter()
+        self._ids = itertools.count(1)
+        self._spans: Deque[Span] = deque(maxlen=max_spans)
+        self._stage_window = stage_window
+        self._stages: Dict[str, Deque[float]] = {}
+        self._stage_counts: Dict[str, int] = {}
+        # asyncio task (or thread) -> small trace tid; entries go away with the task,
+        # so short-lived tasks don't accumulate and a reused id() never inherits a lane
+        self._tids: "weakref.WeakKeyDictionary[Any, int]" = weakref.WeakKeyDictionary()
+        self._tid_seq = itertools.count(1)
+        # tid -> display name, oldest dropped past max_lanes (spans may outlive their task)
+        self._tid_names: "OrderedDict[int, str]" = OrderedDict()
+        self._max_lanes = max_lanes
+        self._tid_lock = threading.Lock()
+
+    def _tid(self) -> int:
+        """One lane per asyncio task (or thread, off the loop): spans within one are properly nested."""
+        try:
+            task = asyncio.current_task()
+        except RuntimeError:
+            task = None
+        owner = task if task is not None else threading.current_thread()
+        tid = self._tids.get(owner)
+        if tid is None:
+            with self._tid_lock:
+                tid = self._tids.get(owner)
+                if tid is None:
+                    tid = self._tids[owner] = next(self._tid_seq)
+                    self._tid_names[tid] = task.get_name() if task is not None else owner.name
+                    while len(self._tid_names) > self._max_lanes:
+                        self._tid_names.popitem(last=False)
+        return tid
+
+    def _finish(self, span: Span, stage: str) -> None:
+        self._spans.append(span)
+        window = self._stages.get(stage)
+        if window is None:
+            window = self._stages.setdefault(stage, deque(maxlen=self._stage_window))
+        window.append(span.end - span.start)  # type: ignore[operator]
+        self._stage_counts[stage] = self._stage_counts.get(stage, 0) + 1
+
+    def span(self, name: str, *, parent: Any = _UNSET, **attrs: Any):
+        """Context manager timing one stage. `parent` overrides the context's current span."""
+        if not self.enabled:
+            return _NOOP
+        return _SpanContext(self, name, parent, attrs, None)
+
+    def http_span(self, host: str, method: str, path: str):
+        """Span for one HTTP request; its time is attributed to `host` on every open ancestor."""
+        if not self.enabled:
+            return _NOOP
+        return _SpanContext(self, "http", _UNSET, {"host": host, "method": method, "path": path}, host)
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """stage -> count (all time) and p50/p99/max in ms over the rolling window."""
+        out: Dict[str, Dict[str, float]] = {}
+        for stage, window in list(self._stages.items()):
+            ordered = sorted(window)
+            if not ordered:
+                continue
+            out[stage] = {
+                "count": self._stage_counts.get(stage, len(ordered)),
+                "p50_ms": round(ordered[len(ordered) // 2] * 1000, 2),
+                "p99_ms": round(ordered[min(len(ordered) - 1, int(0.99 * len(ordered)))] * 1000, 2),
+                "max_ms": round(ordered[-1] * 1000, 2),
+            }
+        return out
+
+    def chrome_trace_events(self) -> List[Dict[str, Any]]:
+        pid = os.getpid()
+        events: List[Dict[str, Any]] = [
+            {"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": name}}
+            for tid, name in list(self._tid_names.items())
+        ]
+        for span in list(self._spans):
+            args: Dict[str, Any] = {"span_id": span.span_id, "parent_id": span.parent_id}
+            args.update(span.attrs)
+            if span.http_s:
+                args["http_ms"] = {host: round(s * 1000, 3) for host, s in span.http_s.items()}
+            if span.error:
+                args["error"] = span.error
+            events.append({
+                "name": span.name if span.name != "http" else f"http {span.attrs.get('host')}",
+                "cat": span.name,
+                "ph": "X",
+                "ts": round((span.start - self._epoch) * 1e6, 1),
+                "dur": round((span.end - span.start) * 1e6, 1),  # type: ignore[operator]
+                "pid": pid,
+                "tid": span.tid,
+                "args": args,
+            })
+        return events
+
+    def export_chrome_trace(self, path: str) -> int:
+        """Write finished spans as Chrome trace-event JSON. Returns the number of spans written."""
+        events = self.chrome_trace_events()
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f, default=str)
+        return sum(1 for e in events if e["ph"] == "X")
+
+    def clear(self) -> None:
+        self._spans.clear()
+        self._stages.clear()
+        self._stage_counts.clear()
+
+
+_tracer = Tracer()
+
+
+def get_tracer() -> Tracer:
+    return _tracer
+
+
+def enable(enabled: bool = True) -> None:
+    _tracer.enabled = enabled
+
+
+def is_enabled() -> bool:
+    return _tracer.enabled
+
+
+def span(name: str, *, parent: Any = _UNSET, **attrs: Any):
+    return _tracer.span(name, parent=parent, **attrs)
+
+
+def http_span(host: str, method: str, path: str):
+    return _tracer.http_span(host, method, path)
+
+
+def current_span() -> Optional[Span]:
+    return _current_span.get()
+
+
+def annotate(**attrs: Any) -> None:
+    """Add attributes to the current span (no-op when tracing is off)."""
+    if _tracer.enabled:
+        current = _current_span.get()
+        if current is not None:
+            current.attrs.update(attrs)
+
+
+def traced(name: str) -> Callable[[F], F]:
+    """Decorator running each call of a function or coroutine function in a span."""
+    def decorate(fn: F) -> F:
+        if inspect.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                if not _tracer.enabled:
+                    return await fn(*args, **kwargs)
+                with _tracer.span(name):
+                    return await fn(*args, **kwargs)
+            return async_wrapper  # type: ignore[return-value]
+
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not _tracer.enabled:
+                return fn(*args, **kwargs)
+            with _tracer.span(name):
+                return fn(*args, **kwargs)
+        return wrapper  # type: ignore[return-value]
+    return decorate
+
+
+def summary() -> Dict[str, Dict[str, float]]:
+    return _tracer.summary()
+
+
+def format_summary(stats: Optional[Dict[str, Dict[str, float]]] = None) -> str:
+    """One line per stage, slowest p99 first."""
+    stats = summary() if stats is None else stats
+    rows = sorted(stats.items(), key=lambda kv: kv[1]["p99_ms"], reverse=True)
+    return "\n".join(
+        f"  {stage:<40} n={int(s['count']):>7}  p50 {s['p50_ms']:>9.2f}ms  p99 {s['p99_ms']:>9.2f}ms  max {s['max_ms']:>9.2f}ms"
+        for stage, s in rows
+    )
+
+
+def export_chrome_trace(path: str) -> int:
+    return _tracer.export_chrome_trace(path)
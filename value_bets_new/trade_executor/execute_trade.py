@@ -3,7 +3,16 @@ from py_clob_client.clob_types import OrderArgs, OrderType
 from py_clob_client.order_builder.constants import BUY, SELL
 import requests
 import json
+import logging
 import os
+import threading
+import time
+from typing import Dict, Iterable, Optional
+from urllib.parse import urlsplit
+
+from value_bets_new import tracing
+
+logger = logging.getLogger(__name__)
 
 # Load .env file if it exists
 try:
@@ -31,7 +40,24 @@ class PolymarketTrader:
     """
     A class for executing trades on Polymarket.
     Initializes the client and sets API credentials upon instantiation.
+
+    API credentials are derived once per process and reused by every instance;
+    `shared()` returns one process-wide trader. `prewarm(token_ids)` caches the
+    per-token tick size / neg-risk / fee rate lookups that `create_order` would
+    otherwise make over the network, so placing an order is local signing plus
+    one POST. Warmed tokens are re-warmed once the client's tick size cache expires.
     """
+
+    # ClobClient's own tick size cache TTL (its default). Kept short on purpose: Polymarket
+    # narrows a market's tick size as the price nears 0/1, so a long-lived cached tick would
+    # round orders to the wrong increment. Callers re-prewarm tokens after it expires.
+    TICK_SIZE_TTL_S = 300.0
+
+    # Derived once per process: create_or_derive_api_creds is a signed network round-trip
+    _api_creds = None
+    _creds_lock = threading.Lock()
+    _shared: Optional["PolymarketTrader"] = None
+    _shared_lock = threading.Lock()
     
     def __init__(self):
         """Initialize the Polymarket client and set API credentials."""
@@ -50,7 +76,64 @@ class PolymarketTrader:
         )
         
         # Set API credentials
-        self.client.set_api_creds(self.client.create_or_derive_api_creds())
+        self.client.set_api_creds(self._get_api_creds(self.client))
+        # token_id -> monotonic time its order parameters were cached in self.client
+        # (taken before the fetch, so it never outlives the client's own entry)
+        self._warmed: Dict[str, float] = {}
+        # Order posts are traced as HTTP to this host
+        self._clob_host = urlsplit(host).hostname or ""
+
+    @classmethod
+    def _get_api_creds(cls, client: ClobClient):
+        with cls._creds_lock:
+            if cls._api_creds is None:
+                cls._api_creds = client.create_or_derive_api_creds()
+            return cls._api_creds
+
+    @classmethod
+    def shared(cls) -> "PolymarketTrader":
+        """Process-wide trader (created on first use)."""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    def is_prewarmed(self, token_id: str) -> bool:
+        """True while the client still holds this token's cached tick size."""
+        warmed_at = self._warmed.get(token_id)
+        return warmed_at is not None and time.monotonic() - warmed_at < self.TICK_SIZE_TTL_S
+
+    def prewarm(self, token_ids: Iterable[str]) -> int:
+        """
+        Cache tick size, neg-risk flag and fee rate for tokens we may trade.
+        Blocking; run it off the event loop. Returns how many tokens were newly
+        (or, after expiry, re-) warmed.
+        """
+        warmed = 0
+        for token_id in token_ids:
+            if not token_id or self.is_prewarmed(token_id):
+                continue
+            started = time.monotonic()
+            try:
+                self.client.get_tick_size(token_id)
+                self.client.get_neg_risk(token_id)
+                self.client.get_fee_rate_bps(token_id)
+            except Exception as e:
+                logger.warning("Prewarm failed for %s: %s", token_id, e)
+                continue
+            self._warmed[token_id] = started
+            warmed += 1
+        return warmed
+
+    def sign_order(self, side, price, size, token_id):
+        """Build and EIP-712 sign an order. Local work only once the token is prewarmed."""
+        order_args = OrderArgs(
+            price=price,
+            size=size,
+            side=side,
+            token_id=token_id,
+        )
+        return self.client.create_order(order_args)
     
     
     def execute_trade(self, side, price, size, token_id, order_type):
@@ -70,19 +153,21 @@ class PolymarketTrader:
         Returns:
             The response from posting the order
         """
-        # Create order arguments
-        order_args = OrderArgs(
-            price=price,
-            size=size,
-            side=side,
-            token_id=token_id,
-        )
-        
+        prewarmed = self.is_prewarmed(token_id)
+        started = time.perf_counter()
         # Create and sign the order
-        signed_order = self.client.create_order(order_args)
+        with tracing.span("sign_order", prewarmed=prewarmed):
+            signed_order = self.sign_order(side, price, size, token_id)
+        signed = time.perf_counter()
 
         # Post the order with the specified order type
-        resp = self.client.post_order(signed_order, order_type)
+        with tracing.http_span(self._clob_host, "POST", "/order"):
+            resp = self.client.post_order(signed_order, order_type)
+        posted = time.perf_counter()
+        logger.info(
+            "Order for %s: sign %.1fms (prewarmed=%s), post %.1fms",
+            token_id, (signed - started) * 1000, prewarmed, (posted - signed) * 1000,
+        )
         
         return resp
 
@@ -15,15 +15,20 @@ Credentials are read from `config_local.py` (optional) or env vars:
 from __future__ import annotations
 
 import math
-import traceback
+import logging
 from dataclasses import dataclass
-from typing import Any, Optional, Tuple
+from typing import Any, List, Optional, Tuple
 
 from py_clob_client.clob_types import OrderType
 from py_clob_client.order_builder.constants import BUY, SELL
 
+from value_bets.trade_executor.bankroll_ledger import BankrollLedger
+from value_bets_new import tracing
 from value_bets_new.trade_executor.execute_trade import PolymarketTrader
 from value_bets_new.constants import ValueBet
+from value_bets_new.order_book import max_profitable_fill
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass(frozen=True)
@@ -58,6 +63,8 @@ class TradeExecutorService:
     # Kelly fraction: use fractional Kelly for safety (1.0 = full Kelly)
     KELLY_FRACTION = 1.0
     MIN_BET_SIZE = 1.0  # Minimum bet in USDC
+    # Payout floor for depth-walked fills when the caller doesn't pass one (matches EventProcessor)
+    MIN_EXPECTED_PAYOUT_PER_1 = 1.02
     
     def __init__(self, trader: Optional[PolymarketTrader] = None) -> None:
         # Don't raise on init; keep it safe for callers.
@@ -65,12 +72,20 @@ class TradeExecutorService:
         self._init_error: Optional[str] = None
         if trader is None:
             try:
-                self._trader = PolymarketTrader()
-                print(f"[DEBUG] [TradeExecutor] Trader initialized successfully")
+                self._trader = PolymarketTrader.shared()
+                logger.info("Trader initialized successfully")
             except Exception as e:
                 self._trader = None
                 self._init_error = str(e)
-                print(f"[DEBUG] [TradeExecutor] Trader initialization failed: {e}")
+                logger.error("Trader initialization failed: %s", e)
+        # Local bankroll: fills debit/credit it, a background thread reconciles with the API
+        self.ledger = BankrollLedger(self._fetch_usdc_balance)
+        if self._trader is not None:
+            self.ledger.start()
+
+    @property
+    def trader(self) -> Optional[PolymarketTrader]:
+        return self._trader
 
     @staticmethod
     def kelly_criterion(true_prob: float, price: float) -> float:
@@ -109,31 +124,74 @@ class TradeExecutorService:
         Returns:
             Tuple of (bet_size, bankroll) or (0, 0) if can't bet
         """
-        print(f"[DEBUG] [TradeExecutor] calculate_bet_size: true_prob={true_prob:.4f}, price={price:.4f}")
+        logger.debug("calculate_bet_size: true_prob=%.4f, price=%.4f", true_prob, price)
         bankroll = self.get_usdc_balance()
-        print(f"[DEBUG] [TradeExecutor] Bankroll: {bankroll}")
+        logger.debug("Bankroll: %s", bankroll)
         if bankroll is None or bankroll <= 0:
-            print(f"[DEBUG] [TradeExecutor] Bankroll is None or <= 0, returning (0, 0)")
+            logger.debug("Bankroll is None or <= 0, returning (0, 0)")
             return 0.0, 0.0
         
         full_kelly = self.kelly_criterion(true_prob, price)
-        print(f"[DEBUG] [TradeExecutor] Full Kelly: {full_kelly:.4f}")
+        logger.debug("Full Kelly: %.4f", full_kelly)
         kelly_fraction = full_kelly * self.KELLY_FRACTION  # Use fractional Kelly
-        print(f"[DEBUG] [TradeExecutor] Kelly fraction (after KELLY_FRACTION={self.KELLY_FRACTION}): {kelly_fraction:.4f}")
+        logger.debug("Kelly fraction (after KELLY_FRACTION=%s): %.4f", self.KELLY_FRACTION, kelly_fraction)
         
         # Calculate bet size based on Kelly
         kelly_bet = bankroll * kelly_fraction
-        print(f"[DEBUG] [TradeExecutor] kelly_bet: {kelly_bet:.4f}")
+        logger.debug("kelly_bet: %.4f", kelly_bet)
         
         # Apply minimum bet size constraint
         bet_size = max(kelly_bet, self.MIN_BET_SIZE) if kelly_bet >= self.MIN_BET_SIZE else 0
-        print(f"[DEBUG] [TradeExecutor] Final bet_size (after MIN_BET_SIZE={self.MIN_BET_SIZE} constraint): {bet_size:.4f}")
+        logger.debug("Final bet_size (after MIN_BET_SIZE=%s constraint): %.4f", self.MIN_BET_SIZE, bet_size)
         
         return bet_size, bankroll
 
+    def _size_against_depth(
+        self,
+        value_bet: ValueBet,
+        bet_size: float,
+        min_expected_payout_per_1: float,
+    ) -> Optional[Tuple[float, float, float]]:
+        """(num_tokens, limit_price, vwap) for the largest profitable fill within bet_size, or None."""
+        fill = max_profitable_fill(
+            value_bet.ask_levels,
+            true_prob=value_bet.true_prob,
+            min_expected_payout_per_1=min_expected_payout_per_1,
+            max_cost=bet_size,
+        )
+        if fill is None:
+            logger.debug("REJECTED: no depth clears expected payout %.4f", min_expected_payout_per_1)
+            return None
+        # Round down so the order never asks for more than the walked levels hold
+        num_tokens = math.floor(fill.size * 100) / 100
+        cost = fill.vwap * num_tokens
+        logger.debug(
+            "Depth sizing: %.2f tokens, vwap=%.4f, limit=%.4f, expected_payout=%.4f",
+            num_tokens, fill.vwap, fill.limit_price, fill.expected_payout_per_1(value_bet.true_prob),
+        )
+        if cost < self.MIN_BET_SIZE:
+            logger.debug("REJECTED: profitable depth ($%.2f) < MIN_BET_SIZE (%s)", cost, self.MIN_BET_SIZE)
+            return None
+        return num_tokens, round(fill.limit_price, 4), fill.vwap
+
+    def prewarm_tokens(self, token_ids: List[str]) -> int:
+        """Cache order parameters for tokens we may trade (blocking). Returns tokens newly warmed."""
+        if self._trader is None:
+            return 0
+        return self._trader.prewarm(token_ids)
+
     def get_usdc_balance(self) -> Optional[float]:
         """
-        Best-effort fetch of current collateral (USDC) balance.
+        Current collateral (USDC) balance from the local ledger (no network call
+        once the ledger has loaded). Returns None if unavailable.
+        """
+        if self._trader is None:
+            return None
+        return self.ledger.balance()
+
+    def _fetch_usdc_balance(self) -> Optional[float]:
+        """
+        Best-effort fetch of current collateral (USDC) balance from the API.
         Returns None if unavailable.
         """
         if self._trader is None:
@@ -156,32 +214,35 @@ class TradeExecutorService:
         game: Optional[str] = None,
         expected_payout_per_1: Optional[float] = None,
         condition_id: Optional[str] = None,
+        fill_price: Optional[float] = None,
     ) -> Optional[TradeExecutionResult]:
         """
         Execute an order on Polymarket CLOB.
 
         This method does not refetch any event/market info; it requires `token_id`.
+        `fill_price` is the expected average fill price (e.g. the VWAP of the walked
+        ask levels) used to book the fill in the ledger; it defaults to `price`.
         """
-        print(f"[DEBUG] [TradeExecutor] execute_trade called: token_id={token_id}, side={side}, price={price:.4f}, size={size:.4f}")
+        logger.debug("execute_trade called: token_id=%s, side=%s, price=%.4f, size=%.4f", token_id, side, price, size)
         
         if self._trader is None:
-            print(f"[DEBUG] [TradeExecutor] execute_trade REJECTED: trader is None")
+            logger.debug("execute_trade REJECTED: trader is None")
             return None
         if side not in (BUY, SELL):
-            print(f"[DEBUG] [TradeExecutor] execute_trade REJECTED: side ({side}) not in (BUY, SELL)")
+            logger.debug("execute_trade REJECTED: side (%s) not in (BUY, SELL)", side)
             return None
         if not token_id:
-            print(f"[DEBUG] [TradeExecutor] execute_trade REJECTED: token_id is empty")
+            logger.debug("execute_trade REJECTED: token_id is empty")
             return None
         if price <= 0:
-            print(f"[DEBUG] [TradeExecutor] execute_trade REJECTED: price ({price:.4f}) <= 0")
+            logger.debug("execute_trade REJECTED: price (%.4f) <= 0", price)
             return None
         if size <= 0:
-            print(f"[DEBUG] [TradeExecutor] execute_trade REJECTED: size ({size:.4f}) <= 0")
+            logger.debug("execute_trade REJECTED: size (%.4f) <= 0", size)
             return None
 
         try:
-            print(f"[DEBUG] [TradeExecutor] Calling trader.execute_trade...")
+            logger.debug("Calling trader.execute_trade...")
             resp = self._trader.execute_trade(
                 side=side,
                 price=price,
@@ -189,7 +250,7 @@ class TradeExecutorService:
                 token_id=token_id,
                 order_type=order_type,
             )
-            print(f"[DEBUG] [TradeExecutor] Trade response: {resp}")
+            logger.debug("Trade response: %s", resp)
             
             # Extract filled size from response (for FAK partial fills)
             filled_size: Optional[float] = None
@@ -206,7 +267,14 @@ class TradeExecutorService:
                 if filled_size is None and resp.get("status") == "matched":
                     filled_size = size
                 
-                print(f"[DEBUG] [TradeExecutor] Extracted filled_size: {filled_size}, status: {resp.get('status')}")
+                logger.debug("Extracted filled_size: %s, status: %s", filled_size, resp.get('status'))
+
+            # Unknown fill is booked as the full size; the next reconcile corrects it
+            notional = (price if fill_price is None else fill_price) * (filled_size if filled_size is not None else size)
+            if side == BUY:
+                self.ledger.debit(notional)
+            else:
+                self.ledger.credit(notional)
             
             result = TradeExecutionResult(
                 token_id=token_id,
@@ -220,64 +288,82 @@ class TradeExecutorService:
                 filled_size=filled_size,
                 condition_id=condition_id,
             )
-            print(f"[DEBUG] [TradeExecutor] Created TradeExecutionResult successfully")
+            logger.debug("Created TradeExecutionResult successfully")
             return result
         except Exception as e:
-            print(f"[DEBUG] [TradeExecutor] Exception during trade execution: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Exception during trade execution: %s", e)
             return None
 
+    @tracing.traced("execute_value_bet")
     def execute_value_bet(
         self,
         value_bet: ValueBet,
         game_str: Optional[str] = None,
+        min_expected_payout_per_1: Optional[float] = None,
     ) -> Optional[TradeExecutionResult]:
         """
         Execute a value bet using Kelly Criterion sizing.
+
+        When the value bet carries ask depth, the Kelly stake is capped to the
+        largest size whose VWAP still clears `min_expected_payout_per_1`, and the
+        FAK order is sent for exactly that size with a limit at the deepest level it
+        needs, so it fills in one shot against the book that was evaluated.
         
         Args:
             value_bet: The value bet to execute
             game_str: Optional game string (e.g., "Team A @ Team B") for logging
+            min_expected_payout_per_1: Payout floor for the depth-walked fill
+                (defaults to MIN_EXPECTED_PAYOUT_PER_1)
             
         Returns:
             TradeExecutionResult if trade was attempted, None if skipped
         """
-        print(f"[DEBUG] [TradeExecutor] execute_value_bet called for team: {value_bet.team}")
-        print(f"[DEBUG] [TradeExecutor] Value bet details: true_prob={value_bet.true_prob:.4f}, best_ask={value_bet.polymarket_best_ask:.4f}, expected_payout={value_bet.expected_payout_per_1:.4f}")
+        logger.debug("execute_value_bet called for team: %s", value_bet.team)
+        logger.debug("Value bet details: true_prob=%.4f, best_ask=%.4f, expected_payout=%.4f", value_bet.true_prob, value_bet.polymarket_best_ask, value_bet.expected_payout_per_1)
         
         # Check if trader is initialized
         if self._trader is None:
-            print(f"[DEBUG] [TradeExecutor] REJECTED: trader is None (init_error: {self._init_error})")
+            logger.debug("REJECTED: trader is None (init_error: %s)", self._init_error)
             return None
         
         # Calculate Kelly bet size
-        print(f"[DEBUG] [TradeExecutor] Calculating bet size using Kelly Criterion...")
+        logger.debug("Calculating bet size using Kelly Criterion...")
         bet_size, bankroll = self.calculate_bet_size(
             value_bet.true_prob,
             value_bet.polymarket_best_ask
         )
-        print(f"[DEBUG] [TradeExecutor] Calculated bet_size: {bet_size:.4f}, bankroll: {bankroll:.4f}")
+        logger.debug("Calculated bet_size: %.4f, bankroll: %.4f", bet_size, bankroll)
         
         if bet_size <= 0:
-            print(f"[DEBUG] [TradeExecutor] REJECTED: bet_size ({bet_size:.4f}) <= 0")
+            logger.debug("REJECTED: bet_size (%.4f) <= 0", bet_size)
             return None
         
         if bankroll <= 0:
-            print(f"[DEBUG] [TradeExecutor] REJECTED: bankroll ({bankroll:.4f}) <= 0")
+            logger.debug("REJECTED: bankroll (%.4f) <= 0", bankroll)
             return None
         
-        # Calculate number of tokens to buy
-        num_tokens = math.floor(bet_size / value_bet.polymarket_best_ask) + 1
-        price = round(value_bet.polymarket_best_ask, 4)
-        print(f"[DEBUG] [TradeExecutor] Calculated num_tokens: {num_tokens:.4f}, price: {price:.4f}")
+        if value_bet.ask_levels:
+            sized = self._size_against_depth(
+                value_bet,
+                bet_size,
+                self.MIN_EXPECTED_PAYOUT_PER_1 if min_expected_payout_per_1 is None else min_expected_payout_per_1,
+            )
+            if sized is None:
+                return None
+            num_tokens, price, vwap = sized
+        else:
+            # No depth available: size off the top of book
+            num_tokens = math.floor(bet_size / value_bet.polymarket_best_ask) + 1
+            price = round(value_bet.polymarket_best_ask, 4)
+            vwap = price
+        logger.debug("Calculated num_tokens: %.4f, price: %.4f", num_tokens, price)
         
         if num_tokens < 0.01:
-            print(f"[DEBUG] [TradeExecutor] REJECTED: num_tokens ({num_tokens:.4f}) < 0.01")
+            logger.debug("REJECTED: num_tokens (%.4f) < 0.01", num_tokens)
             return None
         
         # Execute the trade
-        print(f"[DEBUG] [TradeExecutor] Executing trade: token_id={value_bet.token_id}, side=BUY, price={price:.4f}, size={num_tokens:.4f}, order_type=FAK")
+        logger.debug("Executing trade: token_id=%s, side=BUY, price=%.4f, size=%.4f, order_type=FAK", value_bet.token_id, price, num_tokens)
         trade_result = self.execute_trade(
             token_id=value_bet.token_id,
             side=BUY,
@@ -288,11 +374,12 @@ class TradeExecutorService:
             game=game_str,
             expected_payout_per_1=value_bet.expected_payout_per_1,
             condition_id=value_bet.condition_id,
+            fill_price=vwap,
         )
         
         if trade_result is None:
-            print(f"[DEBUG] [TradeExecutor] Trade execution returned None")
+            logger.warning("Trade execution returned None")
         else:
-            print(f"[DEBUG] [TradeExecutor] Trade execution successful: size={trade_result.size:.4f}, price={trade_result.price:.4f}, filled_size={trade_result.filled_size}")
+            logger.info("Trade execution successful: size=%.4f, price=%.4f, filled_size=%s", trade_result.size, trade_result.price, trade_result.filled_size)
         
         return trade_result
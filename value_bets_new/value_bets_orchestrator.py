@@ -6,7 +6,7 @@ This orchestrator:
 1. Loops through all configured sports
 2. For each sport, continuously:
    - Fetches Pinnacle games
-   - Fetches Polymarket games
+   - Fetches Polymarket games (from one Gamma scan shared by all sports)
    - Fetches market slugs
    - Matches games between the two platforms
    - Evaluates value bets for each matched game and market
@@ -15,26 +15,60 @@ This orchestrator:
 
 from __future__ import annotations
 
-import csv
+import argparse
+import logging
 import os
 import sys
+import time
 import asyncio
+from collections import deque
+from dataclasses import dataclass, replace
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Any, Optional
 
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from value_bets_new.constants import MarketType, Sport, SportsbookOdds, ValueBet, HandicapOdds, TotalOdds
+from value_bets_new.constants import MarketOdds, MarketType, Sport, SportsbookOdds, ValueBet, HandicapOdds, TotalOdds
+from value_bets_new.event_scanner import GammaEventScanner
+from value_bets_new.execution_queue import ExecutionQueue, ExecutionRequest
+from value_bets_new.http_client import AsyncHttpClient
+from value_bets_new import clock, metrics, tracing
+from value_bets_new.http_replay import HttpRecorder, ReplayCorpus, ReplayServer, ReplayTrader
+from value_bets_new.input_fingerprints import InputFingerprints, evaluation_fingerprint
+from value_bets_new.loop_monitor import LoopMonitor
+from value_bets_new.log_config import DEFAULT_LOG_DIR, configure_logging, parse_module_levels, shutdown_logging
+from value_bets_new.market_stream import MarketStream
+from value_bets_new.order_book import TopOfBook
 from value_bets_new.polymarket import PolymarketInterface, PolymarketEvent
 from value_bets_new.pinnacle_odds_service import PinnacleInterface
 from value_bets_new.event_processor import EventProcessor
+from value_bets.pinnacle_scraper.match_store import MatchStore
+from value_bets.trade_store import TradeStore, default_trade_store
 from value_bets_new.pinnacle_odds_interface import PinnacleSportsbookOddsInterface
+from value_bets_new.trade_executor.execute_trade import PolymarketTrader
 from value_bets_new.trade_executor.trade_executor_service import TradeExecutorService, TradeExecutionResult
-from value_bets_new.redeem_positions import redeem_position, Position
+from value_bets_new.redeem_positions import Position, RedemptionManager
+from value_bets_new.status_server import StatusServer
 
-_SUCCESSFUL_TRADES_CSV = os.path.join(os.path.dirname(os.path.abspath(__file__)), "successful_trades.csv")
+logger = logging.getLogger(__name__)
+
+_EVENT_MATCHES_DB = os.path.join(os.path.dirname(os.path.abspath(__file__)), "event_matches.sqlite3")
+_PENDING_REDEMPTIONS_DB = os.path.join(os.path.dirname(os.path.abspath(__file__)), "pending_redemptions.sqlite3")
+
+_CYCLE_DURATION = metrics.histogram(
+    "value_bets_cycle_duration_seconds",
+    "Wall time to process every event of one Gamma scan",
+    ("sport",),
+    buckets=metrics.CYCLE_BUCKETS_S,
+)
+_EVALUATIONS = metrics.counter(
+    "value_bets_evaluations_total",
+    "Outcomes evaluated against sportsbook odds (value_bet, no_value, or unpriced when the team or odds didn't match)",
+    ("sport", "market", "result"),
+)
+_TRADES = metrics.counter("value_bets_trades_total", "Orders placed for value bets by result", ("sport", "market", "result"))
 
 
 def _extract_line_from_market_slug(market_slug: str) -> Optional[float]:
@@ -142,22 +176,157 @@ def _successful_trades_row(
     ]
 
 
+@dataclass
+class _StreamPairing:
+    """A Polymarket outcome matched to sportsbook odds, re-evaluated on live book updates."""
+    sport: Sport
+    polymarket_event: PolymarketEvent
+    market: MarketType
+    market_slug: str
+    market_odds: MarketOdds
+    sportsbook_odds: SportsbookOdds
+    registered_at: float
+
+
+@dataclass
+class _CycleState:
+    """Where one sport worker is in its loop, for the status server."""
+    status: str = "starting"  # waiting_for_scan | processing | idle | error
+    iteration: int = 0
+    scan_version: int = 0
+    events: int = 0
+    cycles: int = 0
+    last_cycle_ms: Optional[float] = None
+    last_cycle_at: Optional[float] = None  # epoch seconds
+    last_error: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class _EvaluatedEdge:
+    """One priced outcome: the sportsbook's fair probability against the Polymarket ask."""
+    at: float  # epoch seconds
+    sport: str
+    market: str
+    market_slug: str
+    team: str
+    best_ask: float
+    true_prob: float
+    expected_payout_per_1: float
+    value_bet: bool
+    from_stream: bool
+
+
+@dataclass
+class _Candidate:
+    """A (Polymarket outcome, sportsbook odds) pair that passed the pre-checks and awaits pricing."""
+    sport: Sport
+    polymarket_event: PolymarketEvent
+    market: MarketType
+    market_slug: str
+    market_odds: MarketOdds
+    sportsbook_odds: SportsbookOdds
+    fingerprint_key: tuple
+    trade_key: tuple
+    from_stream: bool
+
+
+@dataclass
+class _QueuedBet:
+    """What the execution stage needs to place and record one value bet."""
+    sport: Sport
+    polymarket_event: PolymarketEvent
+    market: MarketType
+    market_slug: str
+    value_bet: ValueBet
+    fingerprint_key: tuple
+    # Span that queued the bet, so the execution span joins its trace
+    trace_parent: Optional[tracing.Span] = None
+
+
 class ValueBetsOrchestrator:
-    def __init__(self):
-        self.polymarket_interface = PolymarketInterface()
-        self.pinnacle_interface = PinnacleInterface()
+    # Pairings are only re-evaluated while their sportsbook odds are this fresh;
+    # the polling loop re-registers them every cycle.
+    STREAM_PAIRING_MAX_AGE_S = 120.0
+    # Latest priced outcomes kept for the status server
+    RECENT_EDGES_MAX = 500
+    # Tokens still being traded are queued for prewarming again once the trader's cache expires
+    PREWARM_REFRESH_S = PolymarketTrader.TICK_SIZE_TTL_S
+
+    def __init__(
+        self,
+        stream: bool = False,
+        *,
+        http: Optional[AsyncHttpClient] = None,
+        trader: Optional[Any] = None,
+        trade_store: Optional[TradeStore] = None,
+        redemptions_db: str = _PENDING_REDEMPTIONS_DB,
+        match_db: str = _EVENT_MATCHES_DB,
+        block_threshold_s: float = LoopMonitor.BLOCK_THRESHOLD_S,
+        status_port: Optional[int] = None,
+        status_host: str = "127.0.0.1",
+    ):
+        # One pooled HTTP client shared by the Gamma, CLOB and Arcadia clients
+        self.http = http if http is not None else AsyncHttpClient()
+        self.polymarket_interface = PolymarketInterface(http=self.http)
+        self.pinnacle_interface = PinnacleInterface(http=self.http)
         self.event_processor = EventProcessor()
-        self.trade_executor = TradeExecutorService()
+        self.trade_executor = TradeExecutorService(trader=trader)
         # Create a map of PinnacleSportsbookOddsInterface instances for each sport we support
         supported_sports = [Sport.BASKETBALL, Sport.HOCKEY, Sport.UFC, Sport.TENNIS, Sport.SOCCER]
+        # Executed trades (and the dedupe lookups across restarts), shared with the legacy bots
+        self.trade_store = trade_store if trade_store is not None else default_trade_store()
+        # event_slug -> Pinnacle matchup_id, persisted so restarts skip re-matching
+        self.match_store = MatchStore(match_db)
+        logger.info("Loaded %s stored event matches", len(self.match_store))
         self.pinnacle_odds_interfaces = {
-            sport: PinnacleSportsbookOddsInterface(sport=sport)
+            sport: PinnacleSportsbookOddsInterface(sport=sport, http=self.http, match_store=self.match_store)
             for sport in supported_sports
         }
         # Thread-safe tracking of traded (market_slug, team) tuples
         self._traded_combinations: set[tuple[str, str]] = set()
         self._traded_lock: Optional[asyncio.Lock] = None
-        self._log_lock: Optional[asyncio.Lock] = None
+        # One Gamma listing scan per cycle, shared by every sport worker
+        self.event_scanner = GammaEventScanner(
+            self.polymarket_interface,
+            prefixes_by_sport=self.sports_to_whitelisted_prefixes,
+            markets_by_sport=self.sports_to_markets,
+        )
+        # Streaming mode: live books from the CLOB websocket trigger re-evaluation
+        self.market_stream: Optional[MarketStream] = (
+            MarketStream(self.http, on_best_ask_change=self._on_best_ask_change) if stream else None
+        )
+        # (market_slug, outcome, line) -> last evaluated inputs
+        self.input_fingerprints = InputFingerprints()
+        # Value bets are traded by a separate worker pool, best expected payout first
+        self.execution_queue = ExecutionQueue(
+            self._execute_queued_bet,
+            on_drop=lambda request: self.input_fingerprints.invalidate(request.payload.fingerprint_key),
+        )
+        # Filled positions waiting to be sold at $0.999, persisted across restarts
+        self.redemptions = RedemptionManager(
+            self.polymarket_interface,
+            db_path=redemptions_db,
+            ledger=self.trade_executor.ledger,
+            trader=self.trade_executor.trader,
+        )
+        # Tokens whose order parameters (tick size, neg risk, fee rate) are warmed or queued
+        # token_id -> monotonic time it was last queued for prewarming
+        self._prewarm_seen: dict[str, float] = {}
+        self._prewarm_pending: list[str] = []
+        self._prewarm_task: Optional[asyncio.Task] = None
+        # Loop lag, and blocking calls attributed to the module that made them
+        self.loop_monitor = LoopMonitor(block_threshold_s=block_threshold_s)
+        # sport -> wall time of each processed cycle (all games of one scan)
+        self.cycle_times_s: dict[Sport, list[float]] = {}
+        self.cycle_state: dict[Sport, _CycleState] = {sport: _CycleState() for sport in self.sports_to_markets}
+        self.recent_edges: deque[_EvaluatedEdge] = deque(maxlen=self.RECENT_EDGES_MAX)
+        self.started_at = time.time()
+        # Optional embedded HTTP server with /metrics and JSON status views
+        self.status_server: Optional[StatusServer] = (
+            StatusServer(self, host=status_host, port=status_port) if status_port is not None else None
+        )
+        # token_id -> {(market_slug, sportsbook_odds): pairing}
+        self._stream_pairings: dict[str, dict[tuple[str, SportsbookOdds], _StreamPairing]] = {}
     
     def _get_traded_lock(self) -> asyncio.Lock:
         """Get or create the traded lock in the current event loop."""
@@ -167,14 +336,6 @@ class ValueBetsOrchestrator:
             self._traded_lock = asyncio.Lock()
         return self._traded_lock
     
-    def _get_log_lock(self) -> asyncio.Lock:
-        """Get or create the log lock in the current event loop."""
-        if self._log_lock is None:
-            # Create lock in the current running event loop context
-            # This ensures the lock is associated with the correct event loop
-            self._log_lock = asyncio.Lock()
-        return self._log_lock
-    
     sports_to_markets = {
         Sport.BASKETBALL: [MarketType.MONEYLINE, MarketType.SPREADS, MarketType.TOTALS],
         Sport.HOCKEY: [MarketType.MONEYLINE, MarketType.SPREADS, MarketType.TOTALS],
@@ -192,147 +353,265 @@ class ValueBetsOrchestrator:
     }
 
     async def run(self) -> None:
-        print("[DEBUG] Starting orchestrator...")
-        tasks = []
+        logger.info("Starting orchestrator...")
+        self.loop_monitor.start()
+        if self.status_server is not None:
+            await self.status_server.start()
+        tasks = [
+            asyncio.create_task(self.event_scanner.run()),
+            asyncio.create_task(self.execution_queue.run()),
+            asyncio.create_task(self.redemptions.run()),
+        ]
         for sport, markets in self.sports_to_markets.items():
-            print(f"[DEBUG] Creating task for sport: {sport.value} with markets: {[m.value for m in markets]}")
+            logger.debug("Creating task for sport: %s with markets: %s", sport.value, [m.value for m in markets])
             task = asyncio.create_task(self._process_sport(sport, markets))
             tasks.append(task)
+        if self.market_stream is not None:
+            logger.debug("Creating task for market stream")
+            tasks.append(asyncio.create_task(self.market_stream.run()))
+            # Restored positions get live book updates too
+            await self.market_stream.subscribe(self.redemptions.token_ids())
         
-        await asyncio.gather(*tasks)
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            self.loop_monitor.stop()
+            if self.status_server is not None:
+                await self.status_server.close()
+            if self.market_stream is not None:
+                await self.market_stream.close()
+            # No-ops while they share self.http, but they own the loop's Arcadia fallback otherwise
+            await self.pinnacle_interface.close()
+            for interface in self.pinnacle_odds_interfaces.values():
+                await interface.close()
+            await self.http.close()
+            self.match_store.close()
+            self.redemptions.close()
+            self.trade_store.flush()
     
     async def _process_sport(self, sport: Sport, markets: list[MarketType]) -> None:
-        print(f"[DEBUG] Starting to process sport: {sport.value}")
+        logger.debug("Starting to process sport: %s", sport.value)
         iteration = 0
+        scan_version = 0
+        state = self.cycle_state[sport]
         while True:
             try:
                 iteration += 1
-                print(f"[DEBUG] [{sport.value}] Iteration {iteration}: Fetching polymarket events...")
-                polymarket_events = self.polymarket_interface.fetch_polymarket_events(
-                    whitelisted_prefixes=self.sports_to_whitelisted_prefixes[sport],
-                    markets=markets,
-                )
-                print(f"[DEBUG] [{sport.value}] Found {len(polymarket_events)} polymarket events")
+                state.iteration = iteration
+                state.status = "waiting_for_scan"
+                logger.debug("[%s] Iteration %s: Waiting for polymarket events scan...", sport.value, iteration)
+                # Blocks until a scan newer than the one we last processed is published,
+                # which also paces this loop.
+                scan_version, polymarket_events = await self.event_scanner.next_events(sport, scan_version)
+                logger.info("[%s] Found %s polymarket events (scan %s)", sport.value, len(polymarket_events), scan_version)
+                state.scan_version = scan_version
+                state.events = len(polymarket_events)
 
                 if len(polymarket_events) == 0:
-                    print(f"[DEBUG] [{sport.value}] No events found, continuing...")
-                    await asyncio.sleep(5 * 60)
+                    logger.debug("[%s] No events found, continuing...", sport.value)
                     continue
                 
-                await asyncio.gather(*[
-                    self._process_game(sport, polymarket_event)
-                    for polymarket_event in polymarket_events
-                ])
+                state.status = "processing"
+                cycle_started = time.perf_counter()
+                with tracing.span("cycle", sport=sport.value, scan=scan_version, events=len(polymarket_events)):
+                    await asyncio.gather(*[
+                        self._process_game(sport, polymarket_event)
+                        for polymarket_event in polymarket_events
+                    ])
+                cycle_s = time.perf_counter() - cycle_started
+                self.cycle_times_s.setdefault(sport, []).append(cycle_s)
+                _CYCLE_DURATION.observe(cycle_s, sport=sport.value)
+                state.status = "idle"
+                state.cycles += 1
+                state.last_cycle_ms = round(cycle_s * 1000, 1)
+                state.last_cycle_at = time.time()
+                logger.info("[%s] Cycle %s: %s events in %.1fms", sport.value, iteration, len(polymarket_events), cycle_s * 1000)
                 
-                # Small delay between iterations to prevent tight looping
-                await asyncio.sleep(10)
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("[%s] Gamma event cache: %s", sport.value, self.polymarket_interface.event_cache_stats())
+                    logger.info("[%s] Evaluation inputs: %s", sport.value, self.input_fingerprints.stats())
+                    logger.info("[%s] Execution queue: %s", sport.value, self.execution_queue.stats())
+                    logger.info("[%s] Event loop: %s", sport.value, self.loop_monitor.stats())
+                    if tracing.is_enabled():
+                        logger.info("[%s] Stage latency (rolling):\n%s", sport.value, tracing.format_summary())
             except Exception as e:
-                print(f"[ERROR] [{sport.value}] Exception in _process_sport iteration {iteration}: {e}")
-                import traceback
-                traceback.print_exc()
+                logger.exception("[%s] Exception in _process_sport iteration %s: %s", sport.value, iteration, e)
+                state.status = "error"
+                state.last_error = f"{type(e).__name__}: {e}"
                 # Wait before retrying to avoid rapid error loops
                 await asyncio.sleep(60)
                     
+    @tracing.traced("game")
     async def _process_game(self, sport: Sport, polymarket_event: PolymarketEvent) -> None:
+        tracing.annotate(event_slug=polymarket_event.event_slug)
         game_str = f"{polymarket_event.away_team} @ {polymarket_event.home_team}"
-        print(f"[DEBUG] [{sport.value}] Processing game: {game_str} (event_slug: {polymarket_event.event_slug})")
-        print(f"[DEBUG] [{sport.value}] Game has {len(polymarket_event.market_slugs_by_event)} markets")
+        logger.debug("[%s] Processing game: %s (event_slug: %s)", sport.value, game_str, polymarket_event.event_slug)
+        logger.debug("[%s] Game has %s markets", sport.value, len(polymarket_event.market_slugs_by_event))
+
+        # Price every market of the event with a single batch book request
+        all_market_slugs = list(dict.fromkeys(
+            market_slug
+            for market_slugs in polymarket_event.market_slugs_by_event.values()
+            for market_slug in market_slugs
+        ))
+        try:
+            with tracing.span("polymarket_odds", market_slugs=len(all_market_slugs)):
+                odds_by_slug = await self.polymarket_interface.retrieve_polymarket_event_odds(polymarket_event.event_slug, all_market_slugs)
+        except Exception as e:
+            logger.warning("[%s] Error retrieving polymarket odds for %s: %s", sport.value, polymarket_event.event_slug, e)
+            return
+
+        token_ids = [
+            market_odds.token_id
+            for odds_list in odds_by_slug.values()
+            for market_odds in odds_list
+        ]
+        self._schedule_prewarm(token_ids)
+        if self.market_stream is not None:
+            await self.market_stream.subscribe(token_ids)
+
+        # Markets only gather candidates; the whole game is then priced in one batch
+        candidates: list[_Candidate] = []
         await asyncio.gather(*[
-            self._process_market(sport, polymarket_event, market, event_slugs)
+            self._process_market(sport, polymarket_event, market, event_slugs, odds_by_slug, candidates)
             for market, event_slugs in polymarket_event.market_slugs_by_event.items()
         ])
+        await self._evaluate_candidates(candidates)
     
-    async def _process_market(self, sport: Sport, polymarket_event: PolymarketEvent, market: MarketType, event_slugs: list[str]) -> None:
+    def _schedule_prewarm(self, token_ids: list[str]) -> None:
+        """Warm order parameters for new (or expired) tokens in the background, one batch at a time."""
+        now = time.monotonic()
+        cutoff = now - self.PREWARM_REFRESH_S
+        due = [t for t in token_ids if self._prewarm_seen.get(t, cutoff) <= cutoff]
+        if not due:
+            return
+        for token_id in due:
+            self._prewarm_seen[token_id] = now
+        self._prewarm_pending.extend(due)
+        if self._prewarm_task is None or self._prewarm_task.done():
+            self._prewarm_task = asyncio.create_task(self._drain_prewarm())
+
+    async def _drain_prewarm(self) -> None:
+        while self._prewarm_pending:
+            batch, self._prewarm_pending = self._prewarm_pending, []
+            warmed = await asyncio.to_thread(self.trade_executor.prewarm_tokens, batch)
+            logger.debug("Prewarmed order parameters for %s/%s tokens", warmed, len(batch))
+
+    @tracing.traced("market")
+    async def _process_market(
+        self,
+        sport: Sport,
+        polymarket_event: PolymarketEvent,
+        market: MarketType,
+        event_slugs: list[str],
+        odds_by_slug: dict[str, list[MarketOdds]],
+        candidates: list[_Candidate],
+    ) -> None:
+        tracing.annotate(market=market.value)
         game_str = f"{polymarket_event.away_team} @ {polymarket_event.home_team}"
-        print(f"[DEBUG] [{sport.value}] Processing market: {market.value} for {game_str} with {len(event_slugs)} market slugs")
-        for market_slug in event_slugs:
-            print(f"[DEBUG] [{sport.value}] Processing market_slug: {market_slug}")
-            try:
-                polymarket_odds_list = self.polymarket_interface.retrieve_polymarket_odds(polymarket_event.event_slug, market_slug)
-                print(f"[DEBUG] [{sport.value}] Retrieved {len(polymarket_odds_list)} polymarket odds for {market_slug}")
-            except Exception as e:
-                print(f"[DEBUG] [{sport.value}] Error retrieving polymarket odds for {market_slug}: {e}")
-                continue
+        logger.debug("[%s] Processing market: %s for %s with %s market slugs", sport.value, market.value, game_str, len(event_slugs))
+        await asyncio.gather(*[
+            self._process_market_slug(sport, polymarket_event, market, market_slug, odds_by_slug[market_slug], candidates)
+            for market_slug in event_slugs
+            if market_slug in odds_by_slug
+        ])
 
-            print(f"[DEBUG] [{sport.value}] Fetching sportsbook odds for {game_str} on {polymarket_event.play_date}")
+    @tracing.traced("market_slug")
+    async def _process_market_slug(
+        self,
+        sport: Sport,
+        polymarket_event: PolymarketEvent,
+        market: MarketType,
+        market_slug: str,
+        polymarket_odds_list: list[MarketOdds],
+        candidates: list[_Candidate],
+    ) -> None:
+        tracing.annotate(market_slug=market_slug)
+        game_str = f"{polymarket_event.away_team} @ {polymarket_event.home_team}"
+        logger.debug("[%s] Processing market_slug: %s", sport.value, market_slug)
+        logger.debug("[%s] Retrieved %s polymarket odds for %s", sport.value, len(polymarket_odds_list), market_slug)
+
+        logger.debug("[%s] Fetching sportsbook odds for %s on %s", sport.value, game_str, polymarket_event.play_date)
+        
+        # Fetch the appropriate odds based on market type
+        if market == MarketType.MONEYLINE:
+            sportsbook_odds = await self.pinnacle_odds_interfaces[sport].get_moneyline_odds(polymarket_event.away_team, polymarket_event.home_team, polymarket_event.play_date, event_slug=polymarket_event.event_slug)
+            if sportsbook_odds is None:
+                logger.debug("[%s] No moneyline odds found for %s", sport.value, game_str)
+                return
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("[%s] Moneyline odds found: %s", sport.value, sportsbook_odds.to_string())
+            # Process all market_odds with the single moneyline odds
+            for market_odds in polymarket_odds_list:
+                await self._process_single_odds(sport, polymarket_event, market, market_slug, market_odds, sportsbook_odds, candidates=candidates)
+        elif market == MarketType.SPREADS:
+            spreads_odds_list = await self.pinnacle_odds_interfaces[sport].get_spread_odds(polymarket_event.away_team, polymarket_event.home_team, polymarket_event.play_date, event_slug=polymarket_event.event_slug)
+            if spreads_odds_list is None or len(spreads_odds_list) == 0:
+                logger.debug("[%s] No spread odds found for %s", sport.value, game_str)
+                return
+            logger.debug("[%s] Found %s spread lines", sport.value, len(spreads_odds_list))
+            # Extract line value from market slug
+            polymarket_line = _extract_line_from_market_slug(market_slug)
+            if polymarket_line is None:
+                logger.debug("[%s] Could not extract line from market_slug: %s", sport.value, market_slug)
+                return
+            logger.debug("[%s] Extracted line from market_slug: %s", sport.value, polymarket_line)
+            # For spreads, match by line value (use absolute value since direction doesn't matter for matching)
+            for market_odds in polymarket_odds_list:
+                matching_spread = None
+                for spread_odds in spreads_odds_list:
+                    if spread_odds.point is not None:
+                        # Match by absolute value (spread can be positive or negative)
+                        if abs(abs(spread_odds.point) - abs(polymarket_line)) < 0.1:
+                            matching_spread = spread_odds
+                            logger.debug("[%s] Matched spread line: Polymarket %s to Pinnacle %s", sport.value, polymarket_line, spread_odds.point)
+                            break
+                if matching_spread is not None:
+                    await self._process_single_odds(sport, polymarket_event, market, market_slug, market_odds, matching_spread, candidates=candidates)
+                else:
+                    logger.debug("[%s] No matching spread found for line %s", sport.value, polymarket_line)
+        elif market in (MarketType.TOTALS, MarketType.TOTALS_GAMES, MarketType.TOTALS_SETS):
+            # Fetch totals odds (returns list of TotalOdds, one per line)
+            if market == MarketType.TOTALS:
+                totals_odds_list = await self.pinnacle_odds_interfaces[sport].get_totals_odds(polymarket_event.away_team, polymarket_event.home_team, polymarket_event.play_date, event_slug=polymarket_event.event_slug)
+            elif market == MarketType.TOTALS_GAMES:
+                totals_odds_list = await self.pinnacle_odds_interfaces[sport].get_totals_games_odds(polymarket_event.away_team, polymarket_event.home_team, polymarket_event.play_date, event_slug=polymarket_event.event_slug)
+            else:  # TOTALS_SETS
+                totals_odds_list = await self.pinnacle_odds_interfaces[sport].get_totals_sets_odds(polymarket_event.away_team, polymarket_event.home_team, polymarket_event.play_date, event_slug=polymarket_event.event_slug)
             
-            # Fetch the appropriate odds based on market type
-            if market == MarketType.MONEYLINE:
-                sportsbook_odds = self.pinnacle_odds_interfaces[sport].get_moneyline_odds(polymarket_event.away_team, polymarket_event.home_team, polymarket_event.play_date)
-                if sportsbook_odds is None:
-                    print(f"[DEBUG] [{sport.value}] No moneyline odds found for {game_str}")
-                    continue
-                print(f"[DEBUG] [{sport.value}] Moneyline odds found: {sportsbook_odds.to_string()}")
-                # Process all market_odds with the single moneyline odds
-                for market_odds in polymarket_odds_list:
-                    await self._process_single_odds(sport, polymarket_event, market, market_slug, market_odds, sportsbook_odds)
-            elif market == MarketType.SPREADS:
-                spreads_odds_list = self.pinnacle_odds_interfaces[sport].get_spread_odds(polymarket_event.away_team, polymarket_event.home_team, polymarket_event.play_date)
-                if spreads_odds_list is None or len(spreads_odds_list) == 0:
-                    print(f"[DEBUG] [{sport.value}] No spread odds found for {game_str}")
-                    continue
-                print(f"[DEBUG] [{sport.value}] Found {len(spreads_odds_list)} spread lines")
-                # Extract line value from market slug
-                polymarket_line = _extract_line_from_market_slug(market_slug)
-                if polymarket_line is None:
-                    print(f"[DEBUG] [{sport.value}] Could not extract line from market_slug: {market_slug}")
-                    continue
-                print(f"[DEBUG] [{sport.value}] Extracted line from market_slug: {polymarket_line}")
-                # For spreads, match by line value (use absolute value since direction doesn't matter for matching)
+            if totals_odds_list is None or len(totals_odds_list) == 0:
+                logger.debug("[%s] No totals odds found for %s", sport.value, game_str)
+                return
+            logger.debug("[%s] Found %s totals lines", sport.value, len(totals_odds_list))
+            
+            # Extract line value from market slug
+            polymarket_line = _extract_line_from_market_slug(market_slug)
+            if polymarket_line is None:
+                logger.debug("[%s] Could not extract line from market_slug: %s, trying all lines", sport.value, market_slug)
+                # Fallback: try all lines if we can't extract
                 for market_odds in polymarket_odds_list:
-                    matching_spread = None
-                    for spread_odds in spreads_odds_list:
-                        if spread_odds.point is not None:
-                            # Match by absolute value (spread can be positive or negative)
-                            if abs(abs(spread_odds.point) - abs(polymarket_line)) < 0.1:
-                                matching_spread = spread_odds
-                                print(f"[DEBUG] [{sport.value}] Matched spread line: Polymarket {polymarket_line} to Pinnacle {spread_odds.point}")
-                                break
-                    if matching_spread is not None:
-                        await self._process_single_odds(sport, polymarket_event, market, market_slug, market_odds, matching_spread)
-                    else:
-                        print(f"[DEBUG] [{sport.value}] No matching spread found for line {polymarket_line}")
-            elif market in (MarketType.TOTALS, MarketType.TOTALS_GAMES, MarketType.TOTALS_SETS):
-                # Fetch totals odds (returns list of TotalOdds, one per line)
-                if market == MarketType.TOTALS:
-                    totals_odds_list = self.pinnacle_odds_interfaces[sport].get_totals_odds(polymarket_event.away_team, polymarket_event.home_team, polymarket_event.play_date)
-                elif market == MarketType.TOTALS_GAMES:
-                    totals_odds_list = self.pinnacle_odds_interfaces[sport].get_totals_games_odds(polymarket_event.away_team, polymarket_event.home_team, polymarket_event.play_date)
-                else:  # TOTALS_SETS
-                    totals_odds_list = self.pinnacle_odds_interfaces[sport].get_totals_sets_odds(polymarket_event.away_team, polymarket_event.home_team, polymarket_event.play_date)
-                
-                if totals_odds_list is None or len(totals_odds_list) == 0:
-                    print(f"[DEBUG] [{sport.value}] No totals odds found for {game_str}")
-                    continue
-                print(f"[DEBUG] [{sport.value}] Found {len(totals_odds_list)} totals lines")
+                    for totals_odds in totals_odds_list:
+                        await self._process_single_odds(sport, polymarket_event, market, market_slug, market_odds, totals_odds, candidates=candidates)
+            else:
+                logger.debug("[%s] Extracted line from market_slug: %s", sport.value, polymarket_line)
+                # For totals, match by line value
+                matching_totals = None
+                for totals_odds in totals_odds_list:
+                    if totals_odds.point is not None and abs(totals_odds.point - polymarket_line) < 0.1:
+                        matching_totals = totals_odds
+                        logger.debug("[%s] Matched totals line: Polymarket %s to Pinnacle %s", sport.value, polymarket_line, totals_odds.point)
+                        break
                 
-                # Extract line value from market slug
-                polymarket_line = _extract_line_from_market_slug(market_slug)
-                if polymarket_line is None:
-                    print(f"[DEBUG] [{sport.value}] Could not extract line from market_slug: {market_slug}, trying all lines")
-                    # Fallback: try all lines if we can't extract
+                if matching_totals is not None:
                     for market_odds in polymarket_odds_list:
-                        for totals_odds in totals_odds_list:
-                            await self._process_single_odds(sport, polymarket_event, market, market_slug, market_odds, totals_odds)
+                        await self._process_single_odds(sport, polymarket_event, market, market_slug, market_odds, matching_totals, candidates=candidates)
                 else:
-                    print(f"[DEBUG] [{sport.value}] Extracted line from market_slug: {polymarket_line}")
-                    # For totals, match by line value
-                    matching_totals = None
-                    for totals_odds in totals_odds_list:
-                        if totals_odds.point is not None and abs(totals_odds.point - polymarket_line) < 0.1:
-                            matching_totals = totals_odds
-                            print(f"[DEBUG] [{sport.value}] Matched totals line: Polymarket {polymarket_line} to Pinnacle {totals_odds.point}")
-                            break
-                    
-                    if matching_totals is not None:
-                        for market_odds in polymarket_odds_list:
-                            await self._process_single_odds(sport, polymarket_event, market, market_slug, market_odds, matching_totals)
-                    else:
-                        print(f"[DEBUG] [{sport.value}] No matching totals found for line {polymarket_line}")
-            else:
-                print(f"[DEBUG] [{sport.value}] Unknown market type: {market}")
-                continue
-    
+                    logger.debug("[%s] No matching totals found for line %s", sport.value, polymarket_line)
+        else:
+            logger.debug("[%s] Unknown market type: %s", sport.value, market)
+            return
+
+    @tracing.traced("single_odds")
     async def _process_single_odds(
         self,
         sport: Sport,
@@ -341,76 +620,247 @@ class ValueBetsOrchestrator:
         market_slug: str,
         market_odds,
         sportsbook_odds: SportsbookOdds,
+        from_stream: bool = False,
+        candidates: Optional[list[_Candidate]] = None,
     ) -> None:
-        game_str = f"{polymarket_event.away_team} @ {polymarket_event.home_team}"
+        """
+        Pre-check one pairing. With `candidates` it is appended there for the
+        caller to price in a batch; without, it is priced right away.
+        """
+        if self.market_stream is not None and not from_stream:
+            self._register_stream_pairing(sport, polymarket_event, market, market_slug, market_odds, sportsbook_odds)
+
+        # Skip evaluation (and its logging) until the book top or the Pinnacle prices move
+        fingerprint_key = (market_slug, market_odds.team_name, sportsbook_odds.point)
+        if not self.input_fingerprints.update(fingerprint_key, evaluation_fingerprint(market_odds, sportsbook_odds)):
+            return
         
-        print(f"[DEBUG] [{sport.value}] ========== Checking market_odds ==========")
-        print(f"[DEBUG] [{sport.value}] Team: {market_odds.team_name}")
-        print(f"[DEBUG] [{sport.value}] Polymarket best_bid: {market_odds.best_bid}")
-        print(f"[DEBUG] [{sport.value}] Polymarket best_ask: {market_odds.best_ask}")
-        print(f"[DEBUG] [{sport.value}] Polymarket token_id: {market_odds.token_id}")
-        print(f"[DEBUG] [{sport.value}] Sportsbook outcome_1: {sportsbook_odds.outcome_1} (cost_to_win_1: {sportsbook_odds.outcome_1_cost_to_win_1})")
-        print(f"[DEBUG] [{sport.value}] Sportsbook outcome_2: {sportsbook_odds.outcome_2} (cost_to_win_1: {sportsbook_odds.outcome_2_cost_to_win_1})")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[%s] ========== Checking market_odds ==========", sport.value)
+            logger.debug("[%s] Team: %s", sport.value, market_odds.team_name)
+            logger.debug("[%s] Polymarket best_bid: %s", sport.value, market_odds.best_bid)
+            logger.debug("[%s] Polymarket best_ask: %s", sport.value, market_odds.best_ask)
+            logger.debug("[%s] Polymarket token_id: %s", sport.value, market_odds.token_id)
+            logger.debug("[%s] Sportsbook outcome_1: %s (cost_to_win_1: %s)", sport.value, sportsbook_odds.outcome_1, sportsbook_odds.outcome_1_cost_to_win_1)
+            logger.debug("[%s] Sportsbook outcome_2: %s (cost_to_win_1: %s)", sport.value, sportsbook_odds.outcome_2, sportsbook_odds.outcome_2_cost_to_win_1)
         
         # Check if we've already traded on this (market_slug, team) combination
         trade_key = (market_slug, market_odds.team_name)
         async with self._get_traded_lock():
             if trade_key in self._traded_combinations:
-                print(f"[DEBUG] [{sport.value}] Already traded on {trade_key}, skipping")
+                logger.debug("[%s] Already traded on %s, skipping", sport.value, trade_key)
                 return
-        
-        print(f"[DEBUG] [{sport.value}] Processing value bet evaluation for {market_odds.team_name}")
-        value_bet = self.event_processor.process_two_outcome_event(market_odds.team_name, market_odds, sportsbook_odds)
-        if value_bet is not None:
-            print(f"[DEBUG] [{sport.value}] ========== VALUE BET FOUND! ==========")
-            print(f"[DEBUG] [{sport.value}] Team: {value_bet.team}")
-            print(f"[DEBUG] [{sport.value}] True probability: {value_bet.true_prob:.4f}")
-            print(f"[DEBUG] [{sport.value}] Polymarket best_ask: {value_bet.polymarket_best_ask:.4f}")
-            print(f"[DEBUG] [{sport.value}] Expected payout per $1: {value_bet.expected_payout_per_1:.4f}")
-            print(f"[DEBUG] [{sport.value}] Token ID: {value_bet.token_id}")
+
+        candidate = _Candidate(
+            sport=sport,
+            polymarket_event=polymarket_event,
+            market=market,
+            market_slug=market_slug,
+            market_odds=market_odds,
+            sportsbook_odds=sportsbook_odds,
+            fingerprint_key=fingerprint_key,
+            trade_key=trade_key,
+            from_stream=from_stream,
+        )
+        if candidates is not None:
+            candidates.append(candidate)
+        else:
+            await self._evaluate_candidates([candidate])
+
+    @tracing.traced("evaluate")
+    async def _evaluate_candidates(self, candidates: list[_Candidate]) -> None:
+        """Price candidates (vectorized when there are several), record the edges and queue value bets."""
+        if not candidates:
+            return
+        tracing.annotate(candidates=len(candidates))
+        if len(candidates) == 1:
+            # A lone stream tick: the scalar path is cheaper than building arrays
+            c = candidates[0]
+            priced = self.event_processor.price_two_outcome_event(c.market_odds.team_name, c.market_odds, c.sportsbook_odds)
+            value_bet = None
+            if priced is not None:
+                value_bet = self.event_processor.accept_priced_event(c.market_odds.team_name, c.market_odds, *priced)
+            results = [(priced, value_bet)]
         else:
-            print(f"[DEBUG] [{sport.value}] ========== No value bet found ==========")
-            print(f"[DEBUG] [{sport.value}] Team: {market_odds.team_name}")
-            print(f"[DEBUG] [{sport.value}] Polymarket best_bid: {market_odds.best_bid}, best_ask: {market_odds.best_ask}")
-            print(f"[DEBUG] [{sport.value}] Sportsbook outcome_1_cost: {sportsbook_odds.outcome_1_cost_to_win_1:.4f}, outcome_2_cost: {sportsbook_odds.outcome_2_cost_to_win_1:.4f}")
+            results = self.event_processor.evaluate_two_outcome_events(
+                [(c.market_odds.team_name, c.market_odds, c.sportsbook_odds) for c in candidates]
+            )
+
+        for c, (priced, value_bet) in zip(candidates, results):
+            sport, market_odds, sportsbook_odds = c.sport, c.market_odds, c.sportsbook_odds
+            if priced is not None:
+                p_true, expected_payout = priced
+                self.recent_edges.append(_EvaluatedEdge(
+                    at=time.time(),
+                    sport=sport.value,
+                    market=c.market.value,
+                    market_slug=c.market_slug,
+                    team=market_odds.team_name,
+                    best_ask=market_odds.best_ask,
+                    true_prob=p_true,
+                    expected_payout_per_1=expected_payout,
+                    value_bet=value_bet is not None,
+                    from_stream=c.from_stream,
+                ))
+            _EVALUATIONS.inc(
+                sport=sport.value,
+                market=c.market.value,
+                result="unpriced" if priced is None else "value_bet" if value_bet is not None else "no_value",
+            )
+            if value_bet is None:
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("[%s] ========== No value bet found ==========", sport.value)
+                    logger.debug("[%s] Team: %s", sport.value, market_odds.team_name)
+                    logger.debug("[%s] Polymarket best_bid: %s, best_ask: %s", sport.value, market_odds.best_bid, market_odds.best_ask)
+                    logger.debug("[%s] Sportsbook outcome_1_cost: %.4f, outcome_2_cost: %.4f", sport.value, sportsbook_odds.outcome_1_cost_to_win_1, sportsbook_odds.outcome_2_cost_to_win_1)
+                continue
+
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("[%s] ========== VALUE BET FOUND! ==========", sport.value)
+                logger.debug("[%s] Team: %s", sport.value, value_bet.team)
+                logger.debug("[%s] True probability: %.4f", sport.value, value_bet.true_prob)
+                logger.debug("[%s] Polymarket best_ask: %.4f", sport.value, value_bet.polymarket_best_ask)
+                logger.debug("[%s] Expected payout per $1: %.4f", sport.value, value_bet.expected_payout_per_1)
+                logger.debug("[%s] Token ID: %s", sport.value, value_bet.token_id)
+            logger.info("[%s] Queueing value bet for execution (expected payout %.4f)", sport.value, value_bet.expected_payout_per_1)
+            await self.execution_queue.submit(ExecutionRequest(
+                key=c.trade_key,
+                expected_payout_per_1=value_bet.expected_payout_per_1,
+                start_time=c.polymarket_event.start_time,
+                payload=_QueuedBet(
+                    sport=sport,
+                    polymarket_event=c.polymarket_event,
+                    market=c.market,
+                    market_slug=c.market_slug,
+                    value_bet=value_bet,
+                    fingerprint_key=c.fingerprint_key,
+                    trace_parent=tracing.current_span(),
+                ),
+            ))
+
+    async def _execute_queued_bet(self, request: ExecutionRequest) -> None:
+        """ExecutionQueue worker callback: place the order for one queued value bet."""
+        queued: _QueuedBet = request.payload
+        with tracing.span("execute", parent=queued.trace_parent, queued_ms=round(request.age_s * 1000, 1)):
+            try:
+                await self._execute_bet(request, queued)
+            except Exception:
+                # Same as a failed fill: retry on the next cycle even if the inputs haven't moved
+                self.input_fingerprints.invalidate(queued.fingerprint_key)
+                raise
+
+    async def _execute_bet(self, request: ExecutionRequest, queued: _QueuedBet) -> None:
+        sport = queued.sport
+        market = queued.market
+        market_slug = queued.market_slug
+        value_bet = queued.value_bet
+        fingerprint_key = queued.fingerprint_key
+        trade_key = request.key
+        game_str = f"{queued.polymarket_event.away_team} @ {queued.polymarket_event.home_team}"
+        async with self._get_traded_lock():
+            if trade_key in self._traded_combinations:
+                logger.debug("[%s] Already traded on %s, skipping queued bet", sport.value, trade_key)
+                return
+        # Trades from before a restart are only in the store (indexed on market_slug, team)
+        if await asyncio.to_thread(self.trade_store.has_traded, market_slug, value_bet.team):
+            async with self._get_traded_lock():
+                self._traded_combinations.add(trade_key)
+            logger.debug("[%s] Already traded on %s (trade store), skipping queued bet", sport.value, trade_key)
+            return
+        logger.debug("[%s] Executing queued value bet after %.0fms in queue", sport.value, request.age_s * 1000)
+        logger.debug("[%s] Attempting to execute trade for value bet...", sport.value)
+        logger.debug("[%s] Value bet details: team=%s, token_id=%s, expected_payout=%.4f", sport.value, value_bet.team, value_bet.token_id, value_bet.expected_payout_per_1)
+        # Order signing/posting is blocking; keep it off the event loop
+        trade_result = await asyncio.to_thread(
+            self.trade_executor.execute_value_bet,
+            value_bet,
+            game_str=game_str,
+            min_expected_payout_per_1=self.event_processor.min_expected_payout_per_1,
+        )
+        _TRADES.inc(sport=sport.value, market=market.value, result="filled" if trade_result is not None else "failed")
+        if trade_result is not None:
+            logger.debug("[%s] Trade execution successful!", sport.value)
+            logger.debug("[%s] Trade result: size=%.2f, price=%.4f, token_id=%s", sport.value, trade_result.size, trade_result.price, trade_result.token_id)
+        else:
+            logger.warning("[%s] Trade execution failed - trade_result is None", sport.value)
+            # Retry on the next cycle even if the inputs haven't moved
+            self.input_fingerprints.invalidate(fingerprint_key)
         
-        if value_bet is not None:
-            print(f"[DEBUG] [{sport.value}] Attempting to execute trade for value bet...")
-            print(f"[DEBUG] [{sport.value}] Value bet details: team={value_bet.team}, token_id={value_bet.token_id}, expected_payout={value_bet.expected_payout_per_1:.4f}")
-            trade_result = self.trade_executor.execute_value_bet(
-                value_bet,
+        if trade_result is not None:
+            # Mark this combination as traded
+            async with self._get_traded_lock():
+                self._traded_combinations.add(trade_key)
+            self._log_successful_trade(
+                sport=sport,
+                market=market,
+                market_slug=market_slug,
+                value_bet=value_bet,
                 game_str=game_str,
+                trade_result=trade_result,
             )
-            if trade_result is not None:
-                print(f"[DEBUG] [{sport.value}] Trade execution successful!")
-                print(f"[DEBUG] [{sport.value}] Trade result: size={trade_result.size:.2f}, price={trade_result.price:.4f}, token_id={trade_result.token_id}")
-            else:
-                print(f"[DEBUG] [{sport.value}] Trade execution failed - trade_result is None")
+            logger.info("Trade executed: %s @ %s - $%.2f (%.2f tokens @ $%.4f) - Expected payout: %.4f", value_bet.team, game_str, trade_result.size * trade_result.price, trade_result.size, trade_result.price, value_bet.expected_payout_per_1)
             
-            if trade_result is not None:
-                # Mark this combination as traded
-                async with self._get_traded_lock():
-                    self._traded_combinations.add(trade_key)
-                await self._log_successful_trade(
-                    sport=sport,
-                    market=market,
-                    market_slug=market_slug,
-                    value_bet=value_bet,
-                    game_str=game_str,
-                    trade_result=trade_result,
-                )
-                print(f"[SUCCESS] Trade executed: {value_bet.team} @ {game_str} - ${trade_result.size * trade_result.price:.2f} ({trade_result.size:.2f} tokens @ ${trade_result.price:.4f}) - Expected payout: {value_bet.expected_payout_per_1:.4f}")
-                
-                # Redeem the position in the background (don't await - let it run independently)
-                position = Position(
-                    token_id=trade_result.token_id,
-                    number_of_shares=trade_result.size
-                )
-                asyncio.create_task(redeem_position(position))
-                
+            # Queue the position for redemption by the shared manager
+            await self.redemptions.add(Position(
+                token_id=trade_result.token_id,
+                number_of_shares=trade_result.size
+            ))
 
+    def _register_stream_pairing(
+        self,
+        sport: Sport,
+        polymarket_event: PolymarketEvent,
+        market: MarketType,
+        market_slug: str,
+        market_odds: MarketOdds,
+        sportsbook_odds: SportsbookOdds,
+    ) -> None:
+        pairings = self._stream_pairings.setdefault(market_odds.token_id, {})
+        pairings[(market_slug, sportsbook_odds)] = _StreamPairing(
+            sport=sport,
+            polymarket_event=polymarket_event,
+            market=market,
+            market_slug=market_slug,
+            market_odds=market_odds,
+            sportsbook_odds=sportsbook_odds,
+            registered_at=time.monotonic(),
+        )
+
+    async def _on_best_ask_change(self, token_id: str, tob: TopOfBook) -> None:
+        """MarketStream callback: re-evaluate every fresh pairing for this token at the live price."""
+        self.redemptions.on_book(token_id, tob)
+        pairings = self._stream_pairings.get(token_id)
+        if not pairings:
+            return
+        cutoff = time.monotonic() - self.STREAM_PAIRING_MAX_AGE_S
+        for key in [k for k, p in pairings.items() if p.registered_at < cutoff]:
+            del pairings[key]
+        if not pairings:
+            del self._stream_pairings[token_id]
+            return
+
+        for pairing in list(pairings.values()):
+            market_odds = replace(
+                pairing.market_odds,
+                best_bid=tob.best_bid,
+                bid_volume=tob.bid_volume,
+                best_ask=tob.best_ask,
+                ask_volume=tob.ask_volume,
+                spread=tob.spread,
+                ask_levels=tob.ask_levels,
+            )
+            logger.debug("[%s] [stream] Best ask for %s (%s) -> %s", pairing.sport.value, pairing.market_slug, market_odds.team_name, tob.best_ask)
+            await self._process_single_odds(
+                pairing.sport,
+                pairing.polymarket_event,
+                pairing.market,
+                pairing.market_slug,
+                market_odds,
+                pairing.sportsbook_odds,
+                from_stream=True,
+            )
 
-    async def _log_successful_trade(
+    def _log_successful_trade(
         self,
         sport: Sport,
         market: MarketType,
@@ -419,56 +869,185 @@ class ValueBetsOrchestrator:
         game_str: str,
         trade_result: TradeExecutionResult,
     ) -> None:
-        row = _successful_trades_row(
+        """Record the trade in the trade store (buffered; written by its background thread)."""
+        row = dict(zip(_successful_trades_headers(), _successful_trades_row(
             sport=sport,
             market=market,
             market_slug=market_slug,
             value_bet=value_bet,
             game_str=game_str,
             trade_result=trade_result,
+        )))
+        self.trade_store.add_trade(
+            source="value_bets_new",
+            ts=row["bet_time"],
+            sport=sport.value,
+            market=market.value,
+            market_slug=market_slug,
+            token_id=trade_result.token_id,
+            condition_id=value_bet.condition_id,
+            team=value_bet.team,
+            side="BUY",
+            price=trade_result.price,
+            size=trade_result.size,
+            cost=trade_result.size * trade_result.price,
+            expected_payout_per_1=value_bet.expected_payout_per_1,
+            data=row,
         )
-        async with self._get_log_lock():
-            await asyncio.to_thread(self._write_csv_row, row)
-    
-    def _write_csv_row(self, row: list[str]) -> None:
-        """Thread-safe CSV writing helper function."""
-        write_headers = not os.path.exists(_SUCCESSFUL_TRADES_CSV) or (
-            os.path.getsize(_SUCCESSFUL_TRADES_CSV) == 0
-        )
-        with open(_SUCCESSFUL_TRADES_CSV, "a", newline="", encoding="utf-8") as f:
-            writer = csv.writer(f)
-            if write_headers:
-                writer.writerow(_successful_trades_headers())
-            writer.writerow(row)
 
     async def _retrieve_sportsbook_odds(self, sport: Sport, polymarket_event: PolymarketEvent, market_type: MarketType) -> Optional[SportsbookOdds]:
         if market_type == MarketType.MONEYLINE:
-            return self.pinnacle_odds_interfaces[sport].get_moneyline_odds(polymarket_event.away_team, polymarket_event.home_team, polymarket_event.play_date)
+            return await self.pinnacle_odds_interfaces[sport].get_moneyline_odds(polymarket_event.away_team, polymarket_event.home_team, polymarket_event.play_date, event_slug=polymarket_event.event_slug)
         elif market_type == MarketType.SPREADS:
-            return self.pinnacle_odds_interfaces[sport].get_spread_odds(polymarket_event.away_team, polymarket_event.home_team, polymarket_event.play_date)
+            return await self.pinnacle_odds_interfaces[sport].get_spread_odds(polymarket_event.away_team, polymarket_event.home_team, polymarket_event.play_date, event_slug=polymarket_event.event_slug)
         elif market_type == MarketType.TOTALS:
-            return self.pinnacle_odds_interfaces[sport].get_totals_odds(polymarket_event.away_team, polymarket_event.home_team, polymarket_event.play_date)
+            return await self.pinnacle_odds_interfaces[sport].get_totals_odds(polymarket_event.away_team, polymarket_event.home_team, polymarket_event.play_date, event_slug=polymarket_event.event_slug)
         elif market_type == MarketType.TOTALS_GAMES:
-            return self.pinnacle_odds_interfaces[sport].get_totals_games_odds(polymarket_event.away_team, polymarket_event.home_team, polymarket_event.play_date)
+            return await self.pinnacle_odds_interfaces[sport].get_totals_games_odds(polymarket_event.away_team, polymarket_event.home_team, polymarket_event.play_date, event_slug=polymarket_event.event_slug)
         elif market_type == MarketType.TOTALS_SETS:
-            return self.pinnacle_odds_interfaces[sport].get_totals_sets_odds(polymarket_event.away_team, polymarket_event.home_team, polymarket_event.play_date)
+            return await self.pinnacle_odds_interfaces[sport].get_totals_sets_odds(polymarket_event.away_team, polymarket_event.home_team, polymarket_event.play_date, event_slug=polymarket_event.event_slug)
         else:
             raise ValueError(f"Invalid market type: {market_type}")
 
 
+async def _run(args: argparse.Namespace) -> int:
+    """
+    Run the orchestrator, optionally recording its HTTP traffic or replaying a recording
+    offline. Returns the exit code (1 with --fail-on-block when the event loop was blocked).
+    """
+    recorder: Optional[HttpRecorder] = None
+    server: Optional[ReplayServer] = None
+    orchestrator_kwargs: dict[str, Any] = {}
+    if args.trace:
+        tracing.enable()
+    if args.record:
+        recorder = HttpRecorder(args.record)
+        orchestrator_kwargs["http"] = AsyncHttpClient(on_response=recorder.record)
+    if args.replay:
+        corpus = ReplayCorpus.load(args.replay)
+        if corpus.recorded_at is not None:
+            # Time-window filters see the recording's wall time, not today's
+            clock.set_offset(corpus.recorded_at - time.time())
+        server = ReplayServer(corpus, speed=args.replay_speed)
+        await server.start()
+        # Offline: dry-run fills, and nothing persisted next to the live bot's state
+        orchestrator_kwargs.update(
+            http=AsyncHttpClient(rewrite_url=server.rewrite_url),
+            trader=ReplayTrader(),
+            trade_store=TradeStore(":memory:"),
+            redemptions_db=":memory:",
+            match_db=":memory:",
+        )
+    orchestrator = ValueBetsOrchestrator(
+        stream=args.stream,
+        block_threshold_s=args.block_threshold_ms / 1000,
+        status_port=args.status_port,
+        status_host=args.status_host,
+        **orchestrator_kwargs,
+    )
+    try:
+        if args.duration is not None:
+            try:
+                await asyncio.wait_for(orchestrator.run(), timeout=args.duration)
+            except asyncio.TimeoutError:
+                pass
+        else:
+            await orchestrator.run()
+    finally:
+        logger.info("Event loop: %s", orchestrator.loop_monitor.stats())
+        for sport, times in orchestrator.cycle_times_s.items():
+            ordered = sorted(times)
+            logger.info(
+                "[%s] %s cycles: p50 %.1fms, p99 %.1fms, max %.1fms",
+                sport.value, len(ordered), ordered[len(ordered) // 2] * 1000,
+                ordered[min(len(ordered) - 1, int(0.99 * len(ordered)))] * 1000, ordered[-1] * 1000,
+            )
+        if args.trace:
+            logger.info("Stage latency:\n%s", tracing.format_summary())
+            logger.info("Wrote %s spans to %s", tracing.export_chrome_trace(args.trace), args.trace)
+        if server is not None:
+            logger.info("Replay server: %s", server.stats())
+            await server.close()
+            orchestrator.trade_store.close()
+        if recorder is not None:
+            recorder.close()
+    if args.fail_on_block and orchestrator.loop_monitor.block_count:
+        logger.error("Event loop was blocked %s time(s)", orchestrator.loop_monitor.block_count)
+        return 1
+    return 0
+
+
 def main() -> int:
     """Main entry point."""
-    orchestrator = ValueBetsOrchestrator()
-    
+    parser = argparse.ArgumentParser(description="Polymarket vs Pinnacle value bets orchestrator")
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Re-evaluate matched markets on live CLOB websocket book updates between polling cycles",
+    )
+    parser.add_argument("--record", metavar="PATH", help="Record every HTTP response to a replay corpus (gzip JSONL)")
+    parser.add_argument(
+        "--replay",
+        metavar="PATH",
+        help="Run offline against a recorded corpus via a local stand-in server; orders go to a dry-run trader",
+    )
+    parser.add_argument(
+        "--replay-speed",
+        type=float,
+        default=1.0,
+        help="Replay clock multiplier (default 1.0); 0 serves recordings in order with no delays",
+    )
+    parser.add_argument("--duration", type=float, default=None, help="Stop after this many seconds")
+    parser.add_argument(
+        "--trace",
+        metavar="PATH",
+        help="Trace every cycle's stages and HTTP calls; write a Chrome trace-event JSON here on exit",
+    )
+    parser.add_argument(
+        "--block-threshold-ms",
+        type=float,
+        default=LoopMonitor.BLOCK_THRESHOLD_S * 1000,
+        help="Log a blocking call (with its stack) when the event loop stalls this long (default 100)",
+    )
+    parser.add_argument(
+        "--fail-on-block",
+        action="store_true",
+        help="Exit 1 if the event loop was blocked at all (e.g. a replay run guarding against regressions)",
+    )
+    parser.add_argument(
+        "--status-port",
+        type=int,
+        default=None,
+        help="Serve Prometheus /metrics and JSON /status views on this port (off by default)",
+    )
+    parser.add_argument("--status-host", default="127.0.0.1", help="Status server bind address (default 127.0.0.1)")
+    parser.add_argument("--log-level", default="INFO", help="Root log level (default: INFO)")
+    parser.add_argument(
+        "--log-module-level",
+        action="append",
+        default=[],
+        metavar="LOGGER=LEVEL",
+        help="Per-module level, e.g. value_bets_new.event_processor=DEBUG (repeatable)",
+    )
+    parser.add_argument("--log-dir", default=DEFAULT_LOG_DIR, help="Directory for the rotated JSONL log")
+    args = parser.parse_args()
+    if args.replay and (args.record or args.stream):
+        parser.error("--replay cannot be combined with --record or --stream (websocket traffic is not recorded)")
+
+    configure_logging(
+        args.log_level,
+        module_levels=parse_module_levels(",".join(args.log_module_level)),
+        log_dir=args.log_dir,
+    )
     try:
-        asyncio.run(orchestrator.run())
-        return 0
+        return asyncio.run(_run(args))
     except KeyboardInterrupt:
         return 0
-    except Exception as e:
-        import traceback
-        traceback.print_exc()
+    except Exception:
+        logger.exception("Orchestrator failed")
         return 1
+    finally:
+        shutdown_logging()
 
 
 if __name__ == "__main__":